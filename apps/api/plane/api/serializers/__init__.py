@@ -8,6 +8,7 @@ from .project import (
 )
 from .issue import (
     IssueSerializer,
+    IssueBulkCreateSerializer,
     LabelCreateUpdateSerializer,
     LabelSerializer,
     IssueLinkSerializer,
@@ -1,4 +1,5 @@
 # Django imports
+from django.conf import settings
 from django.utils import timezone
 from lxml import html
 from django.db import IntegrityError
@@ -26,6 +27,7 @@ from plane.utils.content_validator import (
     validate_html_content,
     validate_binary_data,
 )
+from plane.utils.issue_bulk_create import validate_bulk_issues
 
 from .base import BaseSerializer
 from .cycle import CycleLiteSerializer, CycleSerializer
@@ -315,6 +317,74 @@ class IssueSerializer(BaseSerializer):
         return data
 
 
+class IssueBulkCreateItemSerializer(BaseSerializer):
+    """
+    Work item of a bulk create request.
+
+    Takes the fields of the work item create, with the related ids checked
+    for all the work items of the request at once.
+    """
+
+    state = serializers.UUIDField(source="state_id", required=False, allow_null=True)
+    parent = serializers.UUIDField(source="parent_id", required=False, allow_null=True)
+    estimate_point = serializers.UUIDField(source="estimate_point_id", required=False, allow_null=True)
+    assignees = serializers.ListField(child=serializers.UUIDField(), source="assignee_ids", required=False)
+    labels = serializers.ListField(child=serializers.UUIDField(), source="label_ids", required=False)
+
+    class Meta:
+        model = Issue
+        fields = [
+            "name",
+            "description_html",
+            "priority",
+            "start_date",
+            "target_date",
+            "external_source",
+            "external_id",
+            "state",
+            "parent",
+            "estimate_point",
+            "assignees",
+            "labels",
+        ]
+
+    def validate(self, data):
+        if (
+            data.get("start_date", None) is not None
+            and data.get("target_date", None) is not None
+            and data.get("start_date", None) > data.get("target_date", None)
+        ):
+            raise serializers.ValidationError("Start date cannot exceed target date")
+
+        # Validate description content for security
+        if data.get("description_html"):
+            is_valid, error_msg, sanitized_html = validate_html_content(data["description_html"])
+            if not is_valid:
+                raise serializers.ValidationError({"error": "html content is not valid"})
+            if sanitized_html is not None:
+                data["description_html"] = sanitized_html
+        return data
+
+
+class IssueBulkCreateSerializer(serializers.Serializer):
+    """
+    Serializer for creating work items in bulk.
+
+    Validates up to ISSUE_BULK_CREATE_MAX_ISSUES work items, rejecting the
+    request when a state, parent or estimate point is not from the project.
+    """
+
+    issues = IssueBulkCreateItemSerializer(
+        many=True, allow_empty=False, max_length=settings.ISSUE_BULK_CREATE_MAX_ISSUES
+    )
+
+    def validate_issues(self, issues):
+        errors = validate_bulk_issues(self.context["project_id"], issues)
+        if errors:
+            raise serializers.ValidationError({index: [error] for index, error in errors.items()})
+        return issues
+
+
 class IssueLiteSerializer(BaseSerializer):
     """
     Lightweight work item serializer for minimal data transfer.
@@ -2,6 +2,7 @@ from django.urls import path
 
 from plane.api.views import (
     IssueListCreateAPIEndpoint,
+    IssueBulkCreateAPIEndpoint,
     IssueDetailAPIEndpoint,
     IssueLinkListCreateAPIEndpoint,
     IssueLinkDetailAPIEndpoint,
@@ -114,6 +115,11 @@ new_url_patterns = [
         IssueListCreateAPIEndpoint.as_view(http_method_names=["get", "post"]),
         name="work-item-list",
     ),
+    path(
+        "workspaces/<str:slug>/projects/<uuid:project_id>/work-items/bulk-create/",
+        IssueBulkCreateAPIEndpoint.as_view(http_method_names=["post"]),
+        name="work-item-bulk-create",
+    ),
     path(
         "workspaces/<str:slug>/projects/<uuid:project_id>/work-items/<uuid:pk>/",
         IssueDetailAPIEndpoint.as_view(http_method_names=["get", "patch", "delete"]),
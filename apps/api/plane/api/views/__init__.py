@@ -12,6 +12,7 @@ from .state import (
 from .issue import (
     WorkspaceIssueAPIEndpoint,
     IssueListCreateAPIEndpoint,
+    IssueBulkCreateAPIEndpoint,
     IssueDetailAPIEndpoint,
     LabelListCreateAPIEndpoint,
     LabelDetailAPIEndpoint,
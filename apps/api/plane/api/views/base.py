@@ -18,7 +18,7 @@ from rest_framework.exceptions import APIException
 from rest_framework.generics import GenericAPIView
 
 # Module imports
-from plane.db.models.api import APIToken
+from plane.utils.api_token_cache import get_valid_api_token
 from plane.api.middleware.api_authentication import APIKeyAuthentication
 from plane.api.rate_limit import ApiKeyRateThrottle, ServiceTokenRateThrottle
 from plane.utils.exception_logger import log_exception
@@ -60,9 +60,9 @@ class BaseAPIView(TimezoneMixin, GenericAPIView, ReadReplicaControlMixin, BasePa
         api_key = self.request.headers.get("X-Api-Key")
 
         if api_key:
-            service_token = APIToken.objects.filter(token=api_key, is_service=True).first()
+            api_token = get_valid_api_token(api_key)
 
-            if service_token:
+            if api_token and api_token["is_service"]:
                 throttle_classes.append(ServiceTokenRateThrottle())
                 return throttle_classes
 
@@ -5,11 +5,10 @@ import json
 from django.core import serializers
 from django.utils import timezone
 from django.core.serializers.json import DjangoJSONEncoder
+from django.db import transaction
 from django.db.models import (
     Count,
     F,
-    Func,
-    OuterRef,
     Q,
     Sum,
 )
@@ -36,13 +35,13 @@ from plane.db.models import (
     CycleIssue,
     Issue,
     Project,
-    FileAsset,
-    IssueLink,
     ProjectMember,
     UserFavorite,
+    refresh_issue_counters,
 )
 from plane.utils.cycle_transfer_issues import transfer_cycle_issues
 from plane.utils.host import base_host
+from plane.utils.issue_counters import issue_counter_annotations
 from .base import BaseAPIView
 from plane.bgtasks.webhook_task import model_activity
 from plane.utils.openapi.decorators import cycle_docs
@@ -802,12 +801,7 @@ class CycleIssueListCreateAPIEndpoint(BaseAPIView):
 
     def get_queryset(self):
         return (
-            CycleIssue.objects.annotate(
-                sub_issues_count=Issue.issue_objects.filter(parent=OuterRef("issue_id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
+            CycleIssue.objects.annotate(**issue_counter_annotations("sub_issues_count", issue="issue_id"))
             .filter(workspace__slug=self.kwargs.get("slug"))
             .filter(project_id=self.kwargs.get("project_id"))
             .filter(
@@ -849,12 +843,7 @@ class CycleIssueListCreateAPIEndpoint(BaseAPIView):
         order_by = request.GET.get("order_by", "created_at")
         issues = (
             Issue.issue_objects.filter(issue_cycle__cycle_id=cycle_id, issue_cycle__deleted_at__isnull=True)
-            .annotate(
-                sub_issues_count=Issue.issue_objects.filter(parent=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
+            .annotate(**issue_counter_annotations("sub_issues_count"))
             .annotate(bridge_id=F("issue_cycle__id"))
             .filter(project_id=project_id)
             .filter(workspace__slug=slug)
@@ -865,21 +854,7 @@ class CycleIssueListCreateAPIEndpoint(BaseAPIView):
             .prefetch_related("assignees")
             .prefetch_related("labels")
             .order_by(order_by)
-            .annotate(
-                link_count=IssueLink.objects.filter(issue=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
-            .annotate(
-                attachment_count=FileAsset.objects.filter(
-                    issue_id=OuterRef("id"),
-                    entity_type=FileAsset.EntityTypeContext.ISSUE_ATTACHMENT,
-                )
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
+            .annotate(**issue_counter_annotations("link_count", "attachment_count"))
         )
 
         return self.paginate(
@@ -937,21 +912,6 @@ class CycleIssueListCreateAPIEndpoint(BaseAPIView):
         ]
         new_issues = list(set(issues) - set(existing_issues))
 
-        # New issues to create
-        created_records = CycleIssue.objects.bulk_create(
-            [
-                CycleIssue(
-                    project_id=project_id,
-                    workspace_id=cycle.workspace_id,
-                    cycle_id=cycle_id,
-                    issue_id=issue,
-                )
-                for issue in new_issues
-            ],
-            ignore_conflicts=True,
-            batch_size=10,
-        )
-
         # Updated Issues
         updated_records = []
         update_cycle_issue_activity = []
@@ -971,8 +931,25 @@ class CycleIssueListCreateAPIEndpoint(BaseAPIView):
                 }
             )
 
-        # Update the cycle issues
-        CycleIssue.objects.bulk_update(updated_records, ["cycle_id"], batch_size=100)
+        with transaction.atomic():
+            # New issues to create
+            created_records = CycleIssue.objects.bulk_create(
+                [
+                    CycleIssue(
+                        project_id=project_id,
+                        workspace_id=cycle.workspace_id,
+                        cycle_id=cycle_id,
+                        issue_id=issue,
+                    )
+                    for issue in new_issues
+                ],
+                ignore_conflicts=True,
+                batch_size=10,
+            )
+
+            # Update the cycle issues
+            CycleIssue.objects.bulk_update(updated_records, ["cycle_id"], batch_size=100)
+            refresh_issue_counters(issues)
 
         # Capture Issue Activity
         issue_activity.delay(
@@ -1014,12 +991,7 @@ class CycleIssueDetailAPIEndpoint(BaseAPIView):
 
     def get_queryset(self):
         return (
-            CycleIssue.objects.annotate(
-                sub_issues_count=Issue.issue_objects.filter(parent=OuterRef("issue_id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
+            CycleIssue.objects.annotate(**issue_counter_annotations("sub_issues_count", issue="issue_id"))
             .filter(workspace__slug=self.kwargs.get("slug"))
             .filter(project_id=self.kwargs.get("project_id"))
             .filter(
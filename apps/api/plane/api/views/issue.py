@@ -11,14 +11,10 @@ from django.db.models import (
     Case,
     CharField,
     Exists,
-    F,
-    Func,
     Max,
-    OuterRef,
     Q,
     Value,
     When,
-    Subquery,
 )
 from django.utils import timezone
 from django.conf import settings
@@ -38,6 +34,8 @@ from drf_spectacular.utils import (
 # Module imports
 from plane.api.serializers import (
     IssueAttachmentSerializer,
+    IssueBulkCreateSerializer,
+    IssueLiteSerializer,
     IssueActivitySerializer,
     IssueCommentSerializer,
     IssueLinkSerializer,
@@ -59,19 +57,21 @@ from plane.bgtasks.issue_activities_task import issue_activity
 from plane.db.models import (
     Issue,
     IssueActivity,
+    IssueType,
     FileAsset,
     IssueComment,
     IssueLink,
     Label,
     Project,
     ProjectMember,
-    CycleIssue,
     Workspace,
 )
 from plane.settings.storage import S3Storage
 from plane.bgtasks.storage_metadata_task import get_asset_object_metadata
 from .base import BaseAPIView
 from plane.utils.host import base_host
+from plane.utils.issue_bulk_create import bulk_create_issues
+from plane.utils.issue_counters import issue_counter_annotations
 from plane.bgtasks.webhook_task import model_activity
 from plane.app.permissions import ROLE
 from plane.utils.openapi import (
@@ -176,12 +176,7 @@ class WorkspaceIssueAPIEndpoint(BaseAPIView):
 
     def get_queryset(self):
         return (
-            Issue.issue_objects.annotate(
-                sub_issues_count=Issue.issue_objects.filter(parent=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
+            Issue.issue_objects.annotate(**issue_counter_annotations("sub_issues_count"))
             .filter(workspace__slug=self.kwargs.get("slug"))
             .filter(project__identifier=self.kwargs.get("project_identifier"))
             .select_related("project")
@@ -219,12 +214,7 @@ class WorkspaceIssueAPIEndpoint(BaseAPIView):
         This endpoint provides workspace-level access to work items.
         """
         if issue_identifier and project_identifier:
-            issue = Issue.issue_objects.annotate(
-                sub_issues_count=Issue.issue_objects.filter(parent=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            ).get(
+            issue = Issue.issue_objects.annotate(**issue_counter_annotations("sub_issues_count")).get(
                 workspace__slug=slug,
                 project__identifier=project_identifier,
                 sequence_id=issue_identifier,
@@ -248,12 +238,7 @@ class IssueListCreateAPIEndpoint(BaseAPIView):
 
     def get_queryset(self):
         return (
-            Issue.issue_objects.annotate(
-                sub_issues_count=Issue.issue_objects.filter(parent=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
+            Issue.issue_objects.annotate(**issue_counter_annotations("sub_issues_count"))
             .filter(project_id=self.kwargs.get("project_id"))
             .filter(workspace__slug=self.kwargs.get("slug"))
             .select_related("project")
@@ -317,28 +302,8 @@ class IssueListCreateAPIEndpoint(BaseAPIView):
 
         order_by_param = request.GET.get("order_by", "-created_at")
 
-        issue_queryset = (
-            self.get_queryset()
-            .annotate(
-                cycle_id=Subquery(
-                    CycleIssue.objects.filter(issue=OuterRef("id"), deleted_at__isnull=True).values("cycle_id")[:1]
-                )
-            )
-            .annotate(
-                link_count=IssueLink.objects.filter(issue=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
-            .annotate(
-                attachment_count=FileAsset.objects.filter(
-                    issue_id=OuterRef("id"),
-                    entity_type=FileAsset.EntityTypeContext.ISSUE_ATTACHMENT,
-                )
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
+        issue_queryset = self.get_queryset().annotate(
+            **issue_counter_annotations("cycle_id", "link_count", "attachment_count")
         )
 
         total_issue_queryset = Issue.issue_objects.filter(project_id=project_id, workspace__slug=slug)
@@ -352,6 +317,7 @@ class IssueListCreateAPIEndpoint(BaseAPIView):
                     output_field=CharField(),
                 )
             ).order_by("priority_order")
+            order_by_param = "priority_order"
 
         # State Ordering
         elif order_by_param in [
@@ -368,6 +334,7 @@ class IssueListCreateAPIEndpoint(BaseAPIView):
                     output_field=CharField(),
                 )
             ).order_by("state_order")
+            order_by_param = "state_order"
         # assignee and label ordering
         elif order_by_param in [
             "labels__name",
@@ -378,14 +345,18 @@ class IssueListCreateAPIEndpoint(BaseAPIView):
             issue_queryset = issue_queryset.annotate(
                 max_values=Max(order_by_param[1::] if order_by_param.startswith("-") else order_by_param)
             ).order_by("-max_values" if order_by_param.startswith("-") else "max_values")
+            order_by_param = "-max_values" if order_by_param.startswith("-") else "max_values"
         else:
             issue_queryset = issue_queryset.order_by(order_by_param)
 
         return self.paginate(
             request=request,
             queryset=(issue_queryset),
+            # Offset pages keep the ordering of the queryset
+            order_by=order_by_param if self.is_keyset_pagination(request) else None,
             total_count_queryset=total_issue_queryset,
             on_results=lambda issues: IssueSerializer(issues, many=True, fields=self.fields, expand=self.expand).data,
+            allow_keyset=True,
         )
 
     @work_item_docs(
@@ -481,6 +452,75 @@ class IssueListCreateAPIEndpoint(BaseAPIView):
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
 
+class IssueBulkCreateAPIEndpoint(BaseAPIView):
+    """Bulk Work Item Create Endpoint"""
+
+    model = Issue
+    permission_classes = [ProjectEntityPermission]
+
+    @work_item_docs(
+        operation_id="bulk_create_work_items",
+        summary="Create work items in bulk",
+        description="Create up to a thousand work items in the specified project in a single request.",
+        request=OpenApiRequest(request=IssueBulkCreateSerializer),
+        responses={
+            201: OpenApiResponse(
+                description="Work items created successfully",
+                response=IssueLiteSerializer(many=True),
+            ),
+            400: INVALID_REQUEST_RESPONSE,
+            404: PROJECT_NOT_FOUND_RESPONSE,
+            409: EXTERNAL_ID_EXISTS_RESPONSE,
+        },
+    )
+    def post(self, request, slug, project_id):
+        """Create work items in bulk
+
+        Create the work items of the request in the specified project at once, for importers
+        and integrations. The sequence ids are given as one range in the order of the request,
+        and the created activity of each work item is recorded without notifications.
+        """
+        project = Project.objects.get(pk=project_id, workspace__slug=slug)
+
+        serializer = IssueBulkCreateSerializer(data=request.data, context={"project_id": project_id})
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+        rows = serializer.validated_data["issues"]
+
+        external_ids = {
+            (row["external_source"], row["external_id"])
+            for row in rows
+            if row.get("external_id") and row.get("external_source")
+        }
+        if external_ids:
+            existing = [
+                str(issue_id)
+                for issue_id, external_source, external_id in Issue.objects.filter(
+                    project_id=project_id,
+                    external_source__in={external_source for external_source, _ in external_ids},
+                    external_id__in={external_id for _, external_id in external_ids},
+                ).values_list("id", "external_source", "external_id")
+                if (external_source, external_id) in external_ids
+            ]
+            if existing:
+                return Response(
+                    {
+                        "error": "Issues with the same external id and external source already exist",
+                        "ids": existing,
+                    },
+                    status=status.HTTP_409_CONFLICT,
+                )
+
+        issue_type = IssueType.objects.filter(project_issue_types__project_id=project_id, is_default=True).first()
+        if issue_type is not None:
+            rows = [{**row, "type_id": issue_type.id} for row in rows]
+
+        issues = bulk_create_issues(
+            project, rows, actor_id=request.user.id, origin=base_host(request=request, is_app=True)
+        )
+        return Response(IssueLiteSerializer(issues, many=True).data, status=status.HTTP_201_CREATED)
+
+
 class IssueDetailAPIEndpoint(BaseAPIView):
     """Issue Detail Endpoint"""
 
@@ -492,12 +532,7 @@ class IssueDetailAPIEndpoint(BaseAPIView):
 
     def get_queryset(self):
         return (
-            Issue.issue_objects.annotate(
-                sub_issues_count=Issue.issue_objects.filter(parent=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
+            Issue.issue_objects.annotate(**issue_counter_annotations("sub_issues_count"))
             .filter(project_id=self.kwargs.get("project_id"))
             .filter(workspace__slug=self.kwargs.get("slug"))
             .select_related("project")
@@ -538,12 +573,9 @@ class IssueDetailAPIEndpoint(BaseAPIView):
         Supports filtering, ordering, and field selection through query parameters.
         """
 
-        issue = Issue.issue_objects.annotate(
-            sub_issues_count=Issue.issue_objects.filter(parent=OuterRef("id"))
-            .order_by()
-            .annotate(count=Func(F("id"), function="Count"))
-            .values("count")
-        ).get(workspace__slug=slug, project_id=project_id, pk=pk)
+        issue = Issue.issue_objects.annotate(**issue_counter_annotations("sub_issues_count")).get(
+            workspace__slug=slug, project_id=project_id, pk=pk
+        )
         return Response(
             IssueSerializer(issue, fields=self.fields, expand=self.expand).data,
             status=status.HTTP_200_OK,
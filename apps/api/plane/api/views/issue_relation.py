@@ -4,7 +4,7 @@ import json
 # Django imports
 from django.utils import timezone
 from django.core.serializers.json import DjangoJSONEncoder
-from django.db.models import Q, OuterRef, Func, F, Value, CharField, UUIDField, Subquery
+from django.db.models import Q, Value, CharField, UUIDField
 from django.contrib.postgres.aggregates import ArrayAgg
 from django.contrib.postgres.fields import ArrayField
 
@@ -19,13 +19,11 @@ from plane.db.models import (
     Project,
     IssueRelation,
     Issue,
-    IssueLink,
-    FileAsset,
-    CycleIssue,
 )
 from plane.bgtasks.issue_activities_task import issue_activity
 from plane.utils.issue_relation_mapper import get_actual_relation
 from plane.utils.host import base_host
+from plane.utils.issue_counters import issue_counter_annotations
 
 
 class IssueRelationListAPIEndpoint(BaseAPIView):
@@ -99,32 +97,7 @@ class IssueRelationListAPIEndpoint(BaseAPIView):
             Issue.issue_objects.filter(workspace__slug=slug)
             .select_related("workspace", "project", "state", "parent")
             .prefetch_related("assignees", "labels")
-            .annotate(
-                cycle_id=Subquery(
-                    CycleIssue.objects.filter(issue=OuterRef("id"), deleted_at__isnull=True).values("cycle_id")[:1]
-                )
-            )
-            .annotate(
-                link_count=IssueLink.objects.filter(issue=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
-            .annotate(
-                attachment_count=FileAsset.objects.filter(
-                    issue_id=OuterRef("id"),
-                    entity_type=FileAsset.EntityTypeContext.ISSUE_ATTACHMENT,
-                )
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
-            .annotate(
-                sub_issues_count=Issue.issue_objects.filter(parent=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
+            .annotate(**issue_counter_annotations())
             .annotate(
                 label_ids=Coalesce(
                     ArrayAgg(
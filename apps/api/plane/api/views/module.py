@@ -3,7 +3,7 @@ import json
 
 # Django imports
 from django.core import serializers
-from django.db.models import Count, F, Func, OuterRef, Prefetch, Q
+from django.db.models import Count, F, Prefetch, Q
 from django.utils import timezone
 from django.core.serializers.json import DjangoJSONEncoder
 
@@ -25,8 +25,6 @@ from plane.app.permissions import ProjectEntityPermission
 from plane.bgtasks.issue_activities_task import issue_activity
 from plane.db.models import (
     Issue,
-    FileAsset,
-    IssueLink,
     Module,
     ModuleIssue,
     ModuleLink,
@@ -38,6 +36,7 @@ from plane.db.models import (
 from .base import BaseAPIView
 from plane.bgtasks.webhook_task import model_activity
 from plane.utils.host import base_host
+from plane.utils.issue_counters import issue_counter_annotations
 from plane.utils.openapi import (
     module_docs,
     module_issue_docs,
@@ -540,12 +539,7 @@ class ModuleIssueListCreateAPIEndpoint(BaseAPIView):
 
     def get_queryset(self):
         return (
-            ModuleIssue.objects.annotate(
-                sub_issues_count=Issue.issue_objects.filter(parent=OuterRef("issue"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
+            ModuleIssue.objects.annotate(**issue_counter_annotations("sub_issues_count", issue="issue"))
             .filter(workspace__slug=self.kwargs.get("slug"))
             .filter(project_id=self.kwargs.get("project_id"))
             .filter(module_id=self.kwargs.get("module_id"))
@@ -596,12 +590,7 @@ class ModuleIssueListCreateAPIEndpoint(BaseAPIView):
         order_by = request.GET.get("order_by", "created_at")
         issues = (
             Issue.issue_objects.filter(issue_module__module_id=module_id, issue_module__deleted_at__isnull=True)
-            .annotate(
-                sub_issues_count=Issue.issue_objects.filter(parent=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
+            .annotate(**issue_counter_annotations("sub_issues_count"))
             .annotate(bridge_id=F("issue_module__id"))
             .filter(project_id=project_id)
             .filter(workspace__slug=slug)
@@ -612,21 +601,7 @@ class ModuleIssueListCreateAPIEndpoint(BaseAPIView):
             .prefetch_related("assignees")
             .prefetch_related("labels")
             .order_by(order_by)
-            .annotate(
-                link_count=IssueLink.objects.filter(issue=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
-            .annotate(
-                attachment_count=FileAsset.objects.filter(
-                    issue_id=OuterRef("id"),
-                    entity_type=FileAsset.EntityTypeContext.ISSUE_ATTACHMENT,
-                )
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
+            .annotate(**issue_counter_annotations("link_count", "attachment_count"))
         )
         return self.paginate(
             request=request,
@@ -746,12 +721,7 @@ class ModuleIssueDetailAPIEndpoint(BaseAPIView):
 
     def get_queryset(self):
         return (
-            ModuleIssue.objects.annotate(
-                sub_issues_count=Issue.issue_objects.filter(parent=OuterRef("issue"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
+            ModuleIssue.objects.annotate(**issue_counter_annotations("sub_issues_count", issue="issue"))
             .filter(workspace__slug=self.kwargs.get("slug"))
             .filter(project_id=self.kwargs.get("project_id"))
             .filter(module_id=self.kwargs.get("module_id"))
@@ -806,12 +776,7 @@ class ModuleIssueDetailAPIEndpoint(BaseAPIView):
                 issue_module__deleted_at__isnull=True,
                 pk=issue_id,
             )
-            .annotate(
-                sub_issues_count=Issue.issue_objects.filter(parent=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
+            .annotate(**issue_counter_annotations("sub_issues_count"))
             .annotate(bridge_id=F("issue_module__id"))
             .filter(project_id=project_id)
             .filter(workspace__slug=slug)
@@ -822,21 +787,7 @@ class ModuleIssueDetailAPIEndpoint(BaseAPIView):
             .prefetch_related("assignees")
             .prefetch_related("labels")
             .order_by(order_by)
-            .annotate(
-                link_count=IssueLink.objects.filter(issue=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
-            .annotate(
-                attachment_count=FileAsset.objects.filter(
-                    issue_id=OuterRef("id"),
-                    entity_type=FileAsset.EntityTypeContext.ISSUE_ATTACHMENT,
-                )
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
+            .annotate(**issue_counter_annotations("link_count", "attachment_count"))
         )
         return self.paginate(
             request=request,
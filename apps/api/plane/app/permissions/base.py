@@ -1,4 +1,4 @@
-from plane.db.models import WorkspaceMember, ProjectMember
+from plane.utils.member_roles import get_member_roles
 from functools import wraps
 from rest_framework.response import Response
 from rest_framework import status
@@ -25,41 +25,18 @@ def allow_permission(allowed_roles, level="PROJECT", creator=False, model=None):
             # Convert allowed_roles to their values if they are enum members
             allowed_role_values = [role.value if isinstance(role, ROLE) else role for role in allowed_roles]
 
-            # Check role permissions
+            # Check role permissions, the roles are loaded once per request
+            member_roles = get_member_roles(request, kwargs["slug"])
             if level == "WORKSPACE":
-                if WorkspaceMember.objects.filter(
-                    member=request.user,
-                    workspace__slug=kwargs["slug"],
-                    role__in=allowed_role_values,
-                    is_active=True,
-                ).exists():
+                if member_roles.workspace_role in allowed_role_values:
                     return view_func(instance, request, *args, **kwargs)
             else:
-                is_user_has_allowed_role = ProjectMember.objects.filter(
-                    member=request.user,
-                    workspace__slug=kwargs["slug"],
-                    project_id=kwargs["project_id"],
-                    role__in=allowed_role_values,
-                    is_active=True,
-                ).exists()
+                project_role = member_roles.project_role(kwargs["project_id"])
 
                 # Return if the user has the allowed role else if they are workspace admin and part of the project regardless of the role # noqa: E501
-                if is_user_has_allowed_role:
+                if project_role in allowed_role_values:
                     return view_func(instance, request, *args, **kwargs)
-                elif (
-                    ProjectMember.objects.filter(
-                        member=request.user,
-                        workspace__slug=kwargs["slug"],
-                        project_id=kwargs["project_id"],
-                        is_active=True,
-                    ).exists()
-                    and WorkspaceMember.objects.filter(
-                        member=request.user,
-                        workspace__slug=kwargs["slug"],
-                        role=ROLE.ADMIN.value,
-                        is_active=True,
-                    ).exists()
-                ):
+                elif project_role is not None and member_roles.workspace_role == ROLE.ADMIN.value:
                     return view_func(instance, request, *args, **kwargs)
 
             # Return permission denied if no conditions are met
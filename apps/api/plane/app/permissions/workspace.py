@@ -3,6 +3,7 @@ from rest_framework.permissions import BasePermission, SAFE_METHODS
 
 # Module imports
 from plane.db.models import WorkspaceMember
+from plane.utils.member_roles import get_member_roles
 
 
 # Permission Mappings
@@ -27,21 +28,11 @@ class WorkSpaceBasePermission(BasePermission):
 
         # allow only admins and owners to update the workspace settings
         if request.method in ["PUT", "PATCH"]:
-            return WorkspaceMember.objects.filter(
-                member=request.user,
-                workspace__slug=view.workspace_slug,
-                role__in=[Admin, Member],
-                is_active=True,
-            ).exists()
+            return get_member_roles(request, view.workspace_slug).workspace_role in [Admin, Member]
 
         # allow only owner to delete the workspace
         if request.method == "DELETE":
-            return WorkspaceMember.objects.filter(
-                member=request.user,
-                workspace__slug=view.workspace_slug,
-                role=Admin,
-                is_active=True,
-            ).exists()
+            return get_member_roles(request, view.workspace_slug).workspace_role == Admin
 
 
 class WorkspaceOwnerPermission(BasePermission):
@@ -59,12 +50,7 @@ class WorkSpaceAdminPermission(BasePermission):
         if request.user.is_anonymous:
             return False
 
-        return WorkspaceMember.objects.filter(
-            member=request.user,
-            workspace__slug=view.workspace_slug,
-            role__in=[Admin, Member],
-            is_active=True,
-        ).exists()
+        return get_member_roles(request, view.workspace_slug).workspace_role in [Admin, Member]
 
 
 class WorkspaceEntityPermission(BasePermission):
@@ -72,18 +58,13 @@ class WorkspaceEntityPermission(BasePermission):
         if request.user.is_anonymous:
             return False
 
+        workspace_role = get_member_roles(request, view.workspace_slug).workspace_role
+
         ## Safe Methods -> Handle the filtering logic in queryset
         if request.method in SAFE_METHODS:
-            return WorkspaceMember.objects.filter(
-                workspace__slug=view.workspace_slug, member=request.user, is_active=True
-            ).exists()
+            return workspace_role is not None
 
-        return WorkspaceMember.objects.filter(
-            member=request.user,
-            workspace__slug=view.workspace_slug,
-            role__in=[Admin, Member],
-            is_active=True,
-        ).exists()
+        return workspace_role in [Admin, Member]
 
 
 class WorkspaceViewerPermission(BasePermission):
@@ -91,9 +72,7 @@ class WorkspaceViewerPermission(BasePermission):
         if request.user.is_anonymous:
             return False
 
-        return WorkspaceMember.objects.filter(
-            member=request.user, workspace__slug=view.workspace_slug, is_active=True
-        ).exists()
+        return get_member_roles(request, view.workspace_slug).workspace_role is not None
 
 
 class WorkspaceUserPermission(BasePermission):
@@ -101,6 +80,4 @@ class WorkspaceUserPermission(BasePermission):
         if request.user.is_anonymous:
             return False
 
-        return WorkspaceMember.objects.filter(
-            member=request.user, workspace__slug=view.workspace_slug, is_active=True
-        ).exists()
+        return get_member_roles(request, view.workspace_slug).workspace_role is not None
@@ -50,6 +50,7 @@ from .cycle import (
 from .asset import FileAssetSerializer
 from .issue import (
     IssueCreateSerializer,
+    IssueBulkCreateSerializer,
     IssueActivitySerializer,
     IssueCommentSerializer,
     ProjectUserPropertySerializer,
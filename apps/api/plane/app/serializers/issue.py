@@ -1,4 +1,5 @@
 # Django imports
+from django.conf import settings
 from django.utils import timezone
 from django.core.validators import URLValidator
 from django.core.exceptions import ValidationError
@@ -43,6 +44,7 @@ from plane.utils.content_validator import (
     validate_html_content,
     validate_binary_data,
 )
+from plane.utils.issue_bulk_create import validate_bulk_issues
 
 
 class IssueFlatSerializer(BaseSerializer):
@@ -325,6 +327,62 @@ class IssueCreateSerializer(BaseSerializer):
         return super().update(instance, validated_data)
 
 
+class IssueBulkCreateItemSerializer(BaseSerializer):
+    """A work item of a bulk create, its related ids are checked for all the items at once"""
+
+    state_id = serializers.UUIDField(required=False, allow_null=True)
+    parent_id = serializers.UUIDField(required=False, allow_null=True)
+    estimate_point_id = serializers.UUIDField(required=False, allow_null=True)
+    label_ids = serializers.ListField(child=serializers.UUIDField(), required=False)
+    assignee_ids = serializers.ListField(child=serializers.UUIDField(), required=False)
+
+    class Meta:
+        model = Issue
+        fields = [
+            "name",
+            "description_html",
+            "priority",
+            "start_date",
+            "target_date",
+            "external_source",
+            "external_id",
+            "state_id",
+            "parent_id",
+            "estimate_point_id",
+            "label_ids",
+            "assignee_ids",
+        ]
+
+    def validate(self, attrs):
+        if (
+            attrs.get("start_date", None) is not None
+            and attrs.get("target_date", None) is not None
+            and attrs.get("start_date", None) > attrs.get("target_date", None)
+        ):
+            raise serializers.ValidationError("Start date cannot exceed target date")
+
+        # Validate description content for security
+        if attrs.get("description_html"):
+            is_valid, error_msg, sanitized_html = validate_html_content(attrs["description_html"])
+            if not is_valid:
+                raise serializers.ValidationError({"error": "html content is not valid"})
+            if sanitized_html is not None:
+                attrs["description_html"] = sanitized_html
+        return attrs
+
+
+class IssueBulkCreateSerializer(serializers.Serializer):
+    issues = IssueBulkCreateItemSerializer(
+        many=True, allow_empty=False, max_length=settings.ISSUE_BULK_CREATE_MAX_ISSUES
+    )
+
+    def validate_issues(self, issues):
+        errors = validate_bulk_issues(self.context["project_id"], issues)
+        if errors:
+            raise serializers.ValidationError({index: [error] for index, error in errors.items()})
+        return issues
+
+
 class IssueActivitySerializer(BaseSerializer):
     actor_detail = UserLiteSerializer(read_only=True, source="actor")
     issue_detail = IssueFlatSerializer(read_only=True, source="issue")
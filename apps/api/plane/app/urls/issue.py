@@ -2,6 +2,7 @@ from django.urls import path
 
 from plane.app.views import (
     BulkCreateIssueLabelsEndpoint,
+    BulkCreateIssuesEndpoint,
     BulkDeleteIssuesEndpoint,
     SubIssuesEndpoint,
     IssueLinkViewSet,
@@ -27,6 +28,8 @@ from plane.app.views import (
     WorkItemDescriptionVersionEndpoint,
     IssueMetaEndpoint,
     IssueDetailIdentifierEndpoint,
+    ProjectIssueChangeEndpoint,
+    WorkspaceIssueChangeEndpoint,
 )
 
 urlpatterns = [
@@ -52,6 +55,17 @@ urlpatterns = [
         IssuePaginatedViewSet.as_view({"get": "list"}),
         name="project-issues-paginated",
     ),
+    # change feeds of the issues
+    path(
+        "workspaces/<str:slug>/projects/<uuid:project_id>/issues/changes/",
+        ProjectIssueChangeEndpoint.as_view(),
+        name="project-issue-changes",
+    ),
+    path(
+        "workspaces/<str:slug>/issues/changes/",
+        WorkspaceIssueChangeEndpoint.as_view(),
+        name="workspace-issue-changes",
+    ),
     path(
         "workspaces/<str:slug>/projects/<uuid:project_id>/issues/<uuid:pk>/",
         IssueViewSet.as_view(
@@ -86,6 +100,11 @@ urlpatterns = [
         BulkCreateIssueLabelsEndpoint.as_view(),
         name="project-bulk-labels",
     ),
+    path(
+        "workspaces/<str:slug>/projects/<uuid:project_id>/bulk-create-issues/",
+        BulkCreateIssuesEndpoint.as_view(),
+        name="project-issues-bulk-create",
+    ),
     path(
         "workspaces/<str:slug>/projects/<uuid:project_id>/bulk-delete-issues/",
         BulkDeleteIssuesEndpoint.as_view(),
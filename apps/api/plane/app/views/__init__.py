@@ -115,6 +115,7 @@ from .issue.base import (
     IssueListEndpoint,
     IssueViewSet,
     ProjectUserDisplayPropertyEndpoint,
+    BulkCreateIssuesEndpoint,
     BulkDeleteIssuesEndpoint,
     DeletedIssuesListViewSet,
     IssuePaginatedViewSet,
@@ -126,6 +127,8 @@ from .issue.base import (
 
 from .issue.activity import IssueActivityEndpoint
 
+from .issue.change import ProjectIssueChangeEndpoint, WorkspaceIssueChangeEndpoint
+
 from .issue.archive import IssueArchiveViewSet, BulkArchiveIssuesEndpoint
 
 from .issue.attachment import (
@@ -1,7 +1,8 @@
 from rest_framework.response import Response
 from rest_framework import status
 from typing import Dict, List, Any
-from django.db.models import QuerySet, Q, Count
+from django.db.models import QuerySet, Q, Count, Sum
+from django.db.models.functions import Coalesce
 from django.http import HttpRequest
 from django.db.models.functions import TruncMonth
 from django.utils import timezone
@@ -11,6 +12,7 @@ from plane.db.models import (
     WorkspaceMember,
     Project,
     Issue,
+    IssueAnalyticsDimension,
     Cycle,
     Module,
     IssueView,
@@ -18,6 +20,14 @@ from plane.db.models import (
     Workspace,
     ProjectMember,
 )
+from plane.utils.analytics_rollup import (
+    count_fact_issues,
+    count_fact_issues_by_state_group,
+    get_analytics_facts,
+    get_fact_date_range,
+    get_fact_monthly_stats,
+    use_analytics_rollups,
+)
 from plane.utils.build_chart import build_analytics_chart
 from plane.utils.date_utils import (
     get_analytics_filters,
@@ -35,6 +45,16 @@ class AdvanceAnalyticsBaseView(BaseAPIView):
             project_ids=self.request.GET.get("project_ids", None),
         )
 
+    def get_facts(self, **filters) -> QuerySet:
+        # Issue facts of the projects of the filters, within the current analytics or chart period
+        facts = get_analytics_facts(**self.filters["base_filters"], **filters)
+        if self.filters["analytics_date_range"]:
+            facts = facts.filter(**get_fact_date_range(self.filters["analytics_date_range"]["current"]))
+        if self.filters["chart_period_range"]:
+            start_date, end_date = self.filters["chart_period_range"]
+            facts = facts.filter(date__gte=start_date, date__lte=end_date)
+        return facts
+
 
 class AdvanceAnalyticsEndpoint(AdvanceAnalyticsBaseView):
     def get_filtered_counts(self, queryset: QuerySet) -> Dict[str, int]:
@@ -77,7 +97,11 @@ class AdvanceAnalyticsEndpoint(AdvanceAnalyticsBaseView):
             "total_members": self.get_filtered_counts(members_query.filter(role=ROLE.MEMBER.value)),
             "total_guests": self.get_filtered_counts(members_query.filter(role=ROLE.GUEST.value)),
             "total_projects": self.get_filtered_counts(Project.objects.filter(**self.filters["project_filters"])),
-            "total_work_items": self.get_filtered_counts(Issue.issue_objects.filter(**self.filters["base_filters"])),
+            "total_work_items": (
+                {"count": count_fact_issues(self.get_facts())}
+                if use_analytics_rollups(self.request)
+                else self.get_filtered_counts(Issue.issue_objects.filter(**self.filters["base_filters"]))
+            ),
             "total_cycles": self.get_filtered_counts(Cycle.objects.filter(**self.filters["base_filters"])),
             "total_intake": self.get_filtered_counts(
                 Issue.objects.filter(**self.filters["base_filters"]).filter(
@@ -87,6 +111,16 @@ class AdvanceAnalyticsEndpoint(AdvanceAnalyticsBaseView):
         }
 
     def get_work_items_stats(self) -> Dict[str, Dict[str, int]]:
+        if use_analytics_rollups(self.request):
+            counts = count_fact_issues_by_state_group(self.get_facts(dimension=IssueAnalyticsDimension.NONE))
+            return {
+                "total_work_items": {"count": counts["total"]},
+                "started_work_items": {"count": counts["started"]},
+                "backlog_work_items": {"count": counts["backlog"]},
+                "un_started_work_items": {"count": counts["unstarted"]},
+                "completed_work_items": {"count": counts["completed"]},
+            }
+
         base_queryset = Issue.issue_objects.filter(**self.filters["base_filters"])
 
         return {
@@ -138,6 +172,20 @@ class AdvanceAnalyticsStatsEndpoint(AdvanceAnalyticsBaseView):
         )
 
     def get_work_items_stats(self) -> Dict[str, Dict[str, int]]:
+        if use_analytics_rollups(self.request):
+            return (
+                self.get_facts(dimension=IssueAnalyticsDimension.NONE)
+                .values("project_id", "project__name")
+                .annotate(
+                    cancelled_work_items=Coalesce(Sum("issue_count", filter=Q(state_group="cancelled")), 0),
+                    completed_work_items=Coalesce(Sum("issue_count", filter=Q(state_group="completed")), 0),
+                    backlog_work_items=Coalesce(Sum("issue_count", filter=Q(state_group="backlog")), 0),
+                    un_started_work_items=Coalesce(Sum("issue_count", filter=Q(state_group="unstarted")), 0),
+                    started_work_items=Coalesce(Sum("issue_count", filter=Q(state_group="started")), 0),
+                )
+                .order_by("project_id")
+            )
+
         base_queryset = Issue.issue_objects.filter(**self.filters["base_filters"])
         return (
             base_queryset.values("project_id", "project__name")
@@ -227,15 +275,18 @@ class AdvanceAnalyticsChartEndpoint(AdvanceAnalyticsBaseView):
             queryset = queryset.filter(created_at__date__gte=start_date, created_at__date__lte=end_date)
 
         # Annotate by month and count
-        monthly_stats = (
-            queryset.annotate(month=TruncMonth("created_at"))
-            .values("month")
-            .annotate(
-                created_count=Count("id"),
-                completed_count=Count("id", filter=Q(state__group="completed")),
+        if use_analytics_rollups(self.request):
+            monthly_stats = get_fact_monthly_stats(self.get_facts())
+        else:
+            monthly_stats = (
+                queryset.annotate(month=TruncMonth("created_at"))
+                .values("month")
+                .annotate(
+                    created_count=Count("id"),
+                    completed_count=Count("id", filter=Q(state__group="completed")),
+                )
+                .order_by("month")
             )
-            .order_by("month")
-        )
 
         # Create dictionary of month -> counts
         stats_dict = {
@@ -26,6 +26,13 @@ from plane.db.models import (
 )
 
 from plane.utils.analytics_plot import build_graph_plot
+from plane.utils.analytics_rollup import (
+    build_rollup_graph_plot,
+    count_fact_issues,
+    get_analytics_facts,
+    get_rollup_extras,
+    use_analytics_rollups,
+)
 from plane.utils.issue_filters import issue_filters
 from plane.app.permissions import allow_permission, ROLE
 
@@ -71,6 +78,20 @@ class AnalyticsEndpoint(BaseAPIView):
         # Additional filters that need to be applied
         filters = issue_filters(request.GET, "GET")
 
+        # Serve the axes kept in the analytics facts from them
+        if use_analytics_rollups(request, filters):
+            facts = get_analytics_facts(workspace__slug=slug)
+            distribution = build_rollup_graph_plot(facts, x_axis=x_axis, y_axis=y_axis, segment=segment)
+            if distribution is not None:
+                return Response(
+                    {
+                        "total": count_fact_issues(facts),
+                        "distribution": distribution,
+                        "extras": get_rollup_extras(distribution, x_axis=x_axis, segment=segment),
+                    },
+                    status=status.HTTP_200_OK,
+                )
+
         # Get the issues for the workspace with the additional filters applied
         queryset = Issue.issue_objects.filter(workspace__slug=slug, **filters)
 
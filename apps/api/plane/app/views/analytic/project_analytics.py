@@ -11,6 +11,7 @@ from plane.app.permissions import ROLE, allow_permission
 from plane.db.models import (
     Project,
     Issue,
+    IssueAnalyticsDimension,
     Cycle,
     Module,
     CycleIssue,
@@ -19,6 +20,13 @@ from plane.db.models import (
 from django.db import models
 from django.db.models import F, Case, When, Value
 from django.db.models.functions import Concat
+from plane.utils.analytics_rollup import (
+    count_fact_issues_by_state_group,
+    get_analytics_facts,
+    get_fact_date_range,
+    get_fact_monthly_stats,
+    use_analytics_rollups,
+)
 from plane.utils.build_chart import build_analytics_chart
 from plane.utils.date_utils import (
     get_analytics_filters,
@@ -36,6 +44,16 @@ class ProjectAdvanceAnalyticsBaseView(BaseAPIView):
             project_ids=self.request.GET.get("project_ids", None),
         )
 
+    def get_facts(self, **filters) -> QuerySet:
+        # Issue facts of the projects of the filters, within the current analytics or chart period
+        facts = get_analytics_facts(**self.filters["base_filters"], **filters)
+        if self.filters["analytics_date_range"]:
+            facts = facts.filter(**get_fact_date_range(self.filters["analytics_date_range"]["current"]))
+        if self.filters["chart_period_range"]:
+            start_date, end_date = self.filters["chart_period_range"]
+            facts = facts.filter(date__gte=start_date, date__lte=end_date)
+        return facts
+
 
 class ProjectAdvanceAnalyticsEndpoint(ProjectAdvanceAnalyticsBaseView):
     def get_filtered_counts(self, queryset: QuerySet) -> Dict[str, int]:
@@ -55,6 +73,22 @@ class ProjectAdvanceAnalyticsEndpoint(ProjectAdvanceAnalyticsBaseView):
         """
         Returns work item stats for the workspace, or filtered by cycle_id or module_id if provided.
         """
+        if use_analytics_rollups(self.request):
+            if cycle_id is not None:
+                facts = self.get_facts(dimension=IssueAnalyticsDimension.CYCLE, dimension_id=cycle_id)
+            elif module_id is not None:
+                facts = self.get_facts(dimension=IssueAnalyticsDimension.MODULE, dimension_id=module_id)
+            else:
+                facts = self.get_facts(project_id=project_id, dimension=IssueAnalyticsDimension.NONE)
+            counts = count_fact_issues_by_state_group(facts)
+            return {
+                "total_work_items": {"count": counts["total"]},
+                "started_work_items": {"count": counts["started"]},
+                "backlog_work_items": {"count": counts["backlog"]},
+                "un_started_work_items": {"count": counts["unstarted"]},
+                "completed_work_items": {"count": counts["completed"]},
+            }
+
         base_queryset = None
         if cycle_id is not None:
             cycle_issues = CycleIssue.objects.filter(**self.filters["base_filters"], cycle_id=cycle_id).values_list(
@@ -259,15 +293,18 @@ class ProjectAdvanceAnalyticsChartEndpoint(ProjectAdvanceAnalyticsBaseView):
                 queryset = queryset.filter(created_at__date__gte=start_date, created_at__date__lte=end_date)
 
             # Annotate by month and count
-            monthly_stats = (
-                queryset.annotate(month=TruncMonth("created_at"))
-                .values("month")
-                .annotate(
-                    created_count=Count("id"),
-                    completed_count=Count("id", filter=Q(state__group="completed")),
+            if use_analytics_rollups(self.request):
+                monthly_stats = get_fact_monthly_stats(self.get_facts(project_id=project_id))
+            else:
+                monthly_stats = (
+                    queryset.annotate(month=TruncMonth("created_at"))
+                    .values("month")
+                    .annotate(
+                        created_count=Count("id"),
+                        completed_count=Count("id", filter=Q(state__group="completed")),
+                    )
+                    .order_by("month")
                 )
-                .order_by("month")
-            )
 
             # Create dictionary of month -> counts
             stats_dict = {
@@ -49,6 +49,7 @@ from plane.db.models import (
     UserRecentVisit,
 )
 from plane.utils.analytics_plot import burndown_plot
+from plane.utils.progress_counters import get_progress_counters
 from plane.bgtasks.recent_visited_task import recent_visited_task
 from plane.utils.host import base_host
 from plane.utils.cycle_transfer_issues import transfer_cycle_issues
@@ -657,123 +658,30 @@ class CycleProgressEndpoint(BaseAPIView):
         cycle = Cycle.objects.filter(workspace__slug=slug, project_id=project_id, id=cycle_id).first()
         if not cycle:
             return Response({"error": "Cycle not found"}, status=status.HTTP_404_NOT_FOUND)
-        aggregate_estimates = (
-            Issue.issue_objects.filter(
-                estimate_point__estimate__type="points",
-                issue_cycle__cycle_id=cycle_id,
-                issue_cycle__deleted_at__isnull=True,
-                workspace__slug=slug,
-                project_id=project_id,
-            )
-            .annotate(value_as_float=Cast("estimate_point__value", FloatField()))
-            .aggregate(
-                backlog_estimate_point=Sum(
-                    Case(
-                        When(state__group="backlog", then="value_as_float"),
-                        default=Value(0),
-                        output_field=FloatField(),
-                    )
-                ),
-                unstarted_estimate_point=Sum(
-                    Case(
-                        When(state__group="unstarted", then="value_as_float"),
-                        default=Value(0),
-                        output_field=FloatField(),
-                    )
-                ),
-                started_estimate_point=Sum(
-                    Case(
-                        When(state__group="started", then="value_as_float"),
-                        default=Value(0),
-                        output_field=FloatField(),
-                    )
-                ),
-                cancelled_estimate_point=Sum(
-                    Case(
-                        When(state__group="cancelled", then="value_as_float"),
-                        default=Value(0),
-                        output_field=FloatField(),
-                    )
-                ),
-                completed_estimate_points=Sum(
-                    Case(
-                        When(state__group="completed", then="value_as_float"),
-                        default=Value(0),
-                        output_field=FloatField(),
-                    )
-                ),
-                total_estimate_points=Sum("value_as_float", default=Value(0), output_field=FloatField()),
-            )
-        )
+        # Issue counts and estimate points by state group, kept up to date by the issue activities
+        counters = get_progress_counters(cycle)
+        estimate_points = counters["estimate_points"]
         if cycle.progress_snapshot:
-            backlog_issues = cycle.progress_snapshot.get("backlog_issues", 0)
-            unstarted_issues = cycle.progress_snapshot.get("unstarted_issues", 0)
-            started_issues = cycle.progress_snapshot.get("started_issues", 0)
-            cancelled_issues = cycle.progress_snapshot.get("cancelled_issues", 0)
-            completed_issues = cycle.progress_snapshot.get("completed_issues", 0)
+            issue_counts = cycle.progress_snapshot
             total_issues = cycle.progress_snapshot.get("total_issues", 0)
         else:
-            backlog_issues = Issue.issue_objects.filter(
-                issue_cycle__cycle_id=cycle_id,
-                issue_cycle__deleted_at__isnull=True,
-                workspace__slug=slug,
-                project_id=project_id,
-                state__group="backlog",
-            ).count()
-
-            unstarted_issues = Issue.issue_objects.filter(
-                issue_cycle__cycle_id=cycle_id,
-                issue_cycle__deleted_at__isnull=True,
-                workspace__slug=slug,
-                project_id=project_id,
-                state__group="unstarted",
-            ).count()
-
-            started_issues = Issue.issue_objects.filter(
-                issue_cycle__cycle_id=cycle_id,
-                issue_cycle__deleted_at__isnull=True,
-                workspace__slug=slug,
-                project_id=project_id,
-                state__group="started",
-            ).count()
-
-            cancelled_issues = Issue.issue_objects.filter(
-                issue_cycle__cycle_id=cycle_id,
-                issue_cycle__deleted_at__isnull=True,
-                workspace__slug=slug,
-                project_id=project_id,
-                state__group="cancelled",
-            ).count()
-
-            completed_issues = Issue.issue_objects.filter(
-                issue_cycle__cycle_id=cycle_id,
-                issue_cycle__deleted_at__isnull=True,
-                workspace__slug=slug,
-                project_id=project_id,
-                state__group="completed",
-            ).count()
-
-            total_issues = Issue.issue_objects.filter(
-                issue_cycle__cycle_id=cycle_id,
-                issue_cycle__deleted_at__isnull=True,
-                workspace__slug=slug,
-                project_id=project_id,
-            ).count()
+            issue_counts = {f"{group}_issues": count for group, count in counters["issues"].items()}
+            total_issues = counters["total_issues"]
 
         return Response(
             {
-                "backlog_estimate_points": aggregate_estimates["backlog_estimate_point"] or 0,
-                "unstarted_estimate_points": aggregate_estimates["unstarted_estimate_point"] or 0,
-                "started_estimate_points": aggregate_estimates["started_estimate_point"] or 0,
-                "cancelled_estimate_points": aggregate_estimates["cancelled_estimate_point"] or 0,
-                "completed_estimate_points": aggregate_estimates["completed_estimate_points"] or 0,
-                "total_estimate_points": aggregate_estimates["total_estimate_points"],
-                "backlog_issues": backlog_issues,
+                "backlog_estimate_points": estimate_points["backlog"],
+                "unstarted_estimate_points": estimate_points["unstarted"],
+                "started_estimate_points": estimate_points["started"],
+                "cancelled_estimate_points": estimate_points["cancelled"],
+                "completed_estimate_points": estimate_points["completed"],
+                "total_estimate_points": sum(estimate_points.values()),
+                "backlog_issues": issue_counts.get("backlog_issues", 0),
                 "total_issues": total_issues,
-                "completed_issues": completed_issues,
-                "cancelled_issues": cancelled_issues,
-                "started_issues": started_issues,
-                "unstarted_issues": unstarted_issues,
+                "completed_issues": issue_counts.get("completed_issues", 0),
+                "cancelled_issues": issue_counts.get("cancelled_issues", 0),
+                "started_issues": issue_counts.get("started_issues", 0),
+                "unstarted_issues": issue_counts.get("unstarted_issues", 0),
             },
             status=status.HTTP_200_OK,
         )
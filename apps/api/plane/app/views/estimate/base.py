@@ -12,7 +12,7 @@ from rest_framework import status
 # Module imports
 from ..base import BaseViewSet, BaseAPIView
 from plane.app.permissions import ProjectEntityPermission, allow_permission, ROLE
-from plane.db.models import Project, Estimate, EstimatePoint, Issue
+from plane.db.models import Project, Estimate, EstimatePoint, Issue, record_issue_changes
 from plane.app.serializers import (
     EstimateSerializer,
     EstimatePointSerializer,
@@ -20,6 +20,7 @@ from plane.app.serializers import (
 )
 from plane.utils.cache import invalidate_cache
 from plane.bgtasks.issue_activities_task import issue_activity
+from plane.utils.progress_counters import get_issue_containers, refresh_containers_progress
 
 
 def generate_random_name(length=10):
@@ -184,6 +185,12 @@ class EstimatePointEndpoint(BaseViewSet):
         estimate_points = EstimatePoint.objects.filter(
             estimate_id=estimate_id, project_id=project_id, workspace__slug=slug
         )
+        # Read before the update, the issues are not filtered by the estimate point afterwards
+        issue_ids = list(
+            Issue.objects.filter(
+                project_id=project_id, workspace__slug=slug, estimate_point_id=estimate_point_id
+            ).values_list("id", flat=True)
+        )
         # update all the issues with the new estimate
         if new_estimate_id:
             issues = Issue.objects.filter(
@@ -204,6 +211,7 @@ class EstimatePointEndpoint(BaseViewSet):
                     epoch=int(timezone.now().timestamp()),
                 )
                 issues.update(estimate_point_id=new_estimate_id)
+            record_issue_changes(issue_ids)
         else:
             issues = Issue.objects.filter(
                 project_id=project_id,
@@ -222,6 +230,9 @@ class EstimatePointEndpoint(BaseViewSet):
                     ),
                     epoch=int(timezone.now().timestamp()),
                 )
+            # Cleared here rather than by the deletion of the point in the background, before the recount
+            issues.update(estimate_point_id=None)
+            record_issue_changes(issue_ids)
 
         # delete the estimate point
         old_estimate_point = EstimatePoint.objects.filter(pk=estimate_point_id).first()
@@ -237,6 +248,9 @@ class EstimatePointEndpoint(BaseViewSet):
 
         old_estimate_point.delete()
 
+        # The activities of the issues may be processed before the update, the points are recounted here
+        refresh_containers_progress(*get_issue_containers(issue_ids))
+
         return Response(
             EstimatePointSerializer(updated_estimate_points, many=True).data,
             status=status.HTTP_200_OK,
@@ -3,7 +3,7 @@ import json
 
 # Django import
 from django.utils import timezone
-from django.db.models import Q, Count, OuterRef, Func, F, Prefetch, Subquery
+from django.db.models import Q, Count, Prefetch
 from django.core.serializers.json import DjangoJSONEncoder
 from django.contrib.postgres.aggregates import ArrayAgg
 from django.contrib.postgres.fields import ArrayField
@@ -23,11 +23,8 @@ from plane.db.models import (
     Issue,
     State,
     StateGroup,
-    IssueLink,
-    FileAsset,
     Project,
     ProjectMember,
-    CycleIssue,
     IssueDescriptionVersion,
     WorkspaceMember,
 )
@@ -39,6 +36,7 @@ from plane.app.serializers import (
     IntakeIssueDetailSerializer,
     IssueDescriptionVersionDetailSerializer,
 )
+from plane.utils.issue_counters import issue_counter_annotations
 from plane.utils.issue_filters import issue_filters
 from plane.bgtasks.issue_activities_task import issue_activity
 from plane.bgtasks.issue_description_version_task import issue_description_version_task
@@ -107,32 +105,7 @@ class IntakeIssueViewSet(BaseViewSet):
                     queryset=IntakeIssue.objects.only("status", "duplicate_to", "snoozed_till", "source"),
                 )
             )
-            .annotate(
-                cycle_id=Subquery(
-                    CycleIssue.objects.filter(issue=OuterRef("id"), deleted_at__isnull=True).values("cycle_id")[:1]
-                )
-            )
-            .annotate(
-                link_count=IssueLink.objects.filter(issue=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
-            .annotate(
-                attachment_count=FileAsset.objects.filter(
-                    issue_id=OuterRef("id"),
-                    entity_type=FileAsset.EntityTypeContext.ISSUE_ATTACHMENT,
-                )
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
-            .annotate(
-                sub_issues_count=Issue.issue_objects.filter(parent=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
+            .annotate(**issue_counter_annotations())
             .annotate(
                 label_ids=Coalesce(
                     ArrayAgg(
@@ -594,7 +567,7 @@ class IntakeWorkItemDescriptionVersionEndpoint(BaseAPIView):
                 project_id=project_id,
                 issue_id=work_item_id,
                 pk=pk,
-            )
+            ).load_version_content()
 
             serializer = IssueDescriptionVersionDetailSerializer(issue_description_version)
             return Response(serializer.data, status=status.HTTP_200_OK)
@@ -4,7 +4,8 @@ import json
 
 # Django imports
 from django.core.serializers.json import DjangoJSONEncoder
-from django.db.models import OuterRef, Q, Prefetch, Exists, Subquery, Count
+from django.db import transaction
+from django.db.models import OuterRef, Q, Prefetch, Exists
 from django.utils import timezone
 from django.utils.decorators import method_decorator
 from django.views.decorators.gzip import gzip_page
@@ -19,20 +20,21 @@ from plane.app.serializers import (
     IssueSerializer,
     IssueDetailSerializer,
 )
-from plane.bgtasks.issue_activities_task import issue_activity
+from plane.bgtasks.issue_activities_task import batch_issue_activities, issue_activity, queue_issue_activity
 from plane.db.models import (
     Issue,
-    FileAsset,
     IssueLink,
     IssueSubscriber,
     IssueReaction,
-    CycleIssue,
+    record_issue_changes,
+    refresh_issue_counters,
 )
 from plane.utils.grouper import (
     issue_group_values,
     issue_on_results,
     issue_queryset_grouper,
 )
+from plane.utils.issue_counters import issue_counter_annotations
 from plane.utils.issue_filters import issue_filters
 from plane.utils.order_queryset import order_issue_queryset
 from plane.utils.paginator import GroupedOffsetPaginator, SubGroupedOffsetPaginator
@@ -54,40 +56,8 @@ class IssueArchiveViewSet(BaseViewSet):
     filterset_class = IssueFilterSet
 
     def apply_annotations(self, issues):
-        return (
-            issues.annotate(
-                cycle_id=Subquery(
-                    CycleIssue.objects.filter(issue=OuterRef("id"), deleted_at__isnull=True).values("cycle_id")[:1]
-                )
-            )
-            .annotate(
-                link_count=Subquery(
-                    IssueLink.objects.filter(issue=OuterRef("id"))
-                    .values("issue")
-                    .annotate(count=Count("id"))
-                    .values("count")
-                )
-            )
-            .annotate(
-                attachment_count=Subquery(
-                    FileAsset.objects.filter(
-                        issue_id=OuterRef("id"),
-                        entity_type=FileAsset.EntityTypeContext.ISSUE_ATTACHMENT,
-                    )
-                    .values("issue_id")
-                    .annotate(count=Count("id"))
-                    .values("count")
-                )
-            )
-            .annotate(
-                sub_issues_count=Subquery(
-                    Issue.issue_objects.filter(parent=OuterRef("id"))
-                    .values("parent")
-                    .annotate(count=Count("id"))
-                    .values("count")
-                )
-            )
-            .prefetch_related("assignees", "labels", "issue_module__module")
+        return issues.annotate(**issue_counter_annotations()).prefetch_related(
+            "assignees", "labels", "issue_module__module"
         )
 
     def get_queryset(self):
@@ -311,29 +281,36 @@ class BulkArchiveIssuesEndpoint(BaseAPIView):
         issues = Issue.objects.filter(workspace__slug=slug, project_id=project_id, pk__in=issue_ids).select_related(
             "state"
         )
+        # Checked before any activity is queued, a rejected request sends none
+        if any(issue.state.group not in ["completed", "cancelled"] for issue in issues):
+            return Response(
+                {
+                    "error_code": ERROR_CODES["INVALID_ARCHIVE_STATE_GROUP"],
+                    "error_message": "INVALID_ARCHIVE_STATE_GROUP",
+                },
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
         bulk_archive_issues = []
-        for issue in issues:
-            if issue.state.group not in ["completed", "cancelled"]:
-                return Response(
-                    {
-                        "error_code": ERROR_CODES["INVALID_ARCHIVE_STATE_GROUP"],
-                        "error_message": "INVALID_ARCHIVE_STATE_GROUP",
-                    },
-                    status=status.HTTP_400_BAD_REQUEST,
+        # Send the activities of all the issues in batches
+        with batch_issue_activities():
+            for issue in issues:
+                queue_issue_activity(
+                    type="issue.activity.updated",
+                    requested_data=json.dumps({"archived_at": str(timezone.now().date()), "automation": False}),
+                    actor_id=str(request.user.id),
+                    issue_id=str(issue.id),
+                    project_id=str(project_id),
+                    current_instance=json.dumps(IssueSerializer(issue).data, cls=DjangoJSONEncoder),
+                    epoch=int(timezone.now().timestamp()),
+                    notification=True,
+                    origin=base_host(request=request, is_app=True),
                 )
-            issue_activity.delay(
-                type="issue.activity.updated",
-                requested_data=json.dumps({"archived_at": str(timezone.now().date()), "automation": False}),
-                actor_id=str(request.user.id),
-                issue_id=str(issue.id),
-                project_id=str(project_id),
-                current_instance=json.dumps(IssueSerializer(issue).data, cls=DjangoJSONEncoder),
-                epoch=int(timezone.now().timestamp()),
-                notification=True,
-                origin=base_host(request=request, is_app=True),
-            )
-            issue.archived_at = timezone.now().date()
-            bulk_archive_issues.append(issue)
-        Issue.objects.bulk_update(bulk_archive_issues, ["archived_at"])
+                issue.archived_at = timezone.now().date()
+                bulk_archive_issues.append(issue)
+        with transaction.atomic():
+            Issue.objects.bulk_update(bulk_archive_issues, ["archived_at"])
+            refresh_issue_counters(issue.parent_id for issue in bulk_archive_issues)
+            record_issue_changes(issue.id for issue in bulk_archive_issues)
 
         return Response({"archived_at": str(timezone.now().date())}, status=status.HTTP_200_OK)
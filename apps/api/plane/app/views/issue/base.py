@@ -6,11 +6,9 @@ import json
 from django.contrib.postgres.aggregates import ArrayAgg
 from django.contrib.postgres.fields import ArrayField
 from django.core.serializers.json import DjangoJSONEncoder
+from django.db import transaction
 from django.db.models import (
-    Count,
     Exists,
-    F,
-    Func,
     OuterRef,
     Prefetch,
     Q,
@@ -30,19 +28,19 @@ from rest_framework.response import Response
 # Module imports
 from plane.app.permissions import ROLE, allow_permission
 from plane.app.serializers import (
+    IssueBulkCreateSerializer,
     IssueCreateSerializer,
     IssueDetailSerializer,
     IssueListDetailSerializer,
     IssueSerializer,
     ProjectUserPropertySerializer,
 )
-from plane.bgtasks.issue_activities_task import issue_activity
+from plane.bgtasks.issue_activities_task import batch_issue_activities, issue_activity, queue_issue_activity
 from plane.bgtasks.issue_description_version_task import issue_description_version_task
 from plane.bgtasks.recent_visited_task import recent_visited_task
 from plane.bgtasks.webhook_task import model_activity
 from plane.db.models import (
     CycleIssue,
-    FileAsset,
     IntakeIssue,
     Issue,
     IssueAssignee,
@@ -56,6 +54,8 @@ from plane.db.models import (
     Project,
     ProjectMember,
     UserRecentVisit,
+    record_issue_changes,
+    refresh_parent_issue_counters,
 )
 from plane.utils.filters import ComplexFilterBackend, IssueFilterSet
 from plane.utils.global_paginator import paginate
@@ -65,9 +65,12 @@ from plane.utils.grouper import (
     issue_queryset_grouper,
 )
 from plane.utils.host import base_host
+from plane.utils.issue_bulk_create import bulk_create_issues
+from plane.utils.issue_counters import issue_counter_annotations
 from plane.utils.issue_filters import issue_filters
 from plane.utils.order_queryset import order_issue_queryset
 from plane.utils.paginator import GroupedOffsetPaginator, SubGroupedOffsetPaginator
+from plane.utils.progress_counters import get_issue_containers, refresh_containers_progress
 from plane.utils.timezone_converter import user_timezone_converter
 
 from .. import BaseAPIView, BaseViewSet
@@ -103,35 +106,7 @@ class IssueListEndpoint(BaseAPIView):
             )
 
         # Add annotations
-        issue_queryset = (
-            issue_queryset.annotate(
-                cycle_id=Subquery(
-                    CycleIssue.objects.filter(issue=OuterRef("id"), deleted_at__isnull=True).values("cycle_id")[:1]
-                )
-            )
-            .annotate(
-                link_count=IssueLink.objects.filter(issue=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
-            .annotate(
-                attachment_count=FileAsset.objects.filter(
-                    issue_id=OuterRef("id"),
-                    entity_type=FileAsset.EntityTypeContext.ISSUE_ATTACHMENT,
-                )
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
-            .annotate(
-                sub_issues_count=Issue.issue_objects.filter(parent=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
-            .distinct()
-        )
+        issue_queryset = issue_queryset.annotate(**issue_counter_annotations()).distinct()
 
         order_by_param = request.GET.get("order_by", "-created_at")
         # Issue queryset
@@ -209,40 +184,7 @@ class IssueViewSet(BaseViewSet):
         return issues
 
     def apply_annotations(self, issues):
-        issues = (
-            issues.annotate(
-                cycle_id=Subquery(
-                    CycleIssue.objects.filter(issue=OuterRef("id"), deleted_at__isnull=True).values("cycle_id")[:1]
-                )
-            )
-            .annotate(
-                link_count=Subquery(
-                    IssueLink.objects.filter(issue=OuterRef("id"))
-                    .values("issue")
-                    .annotate(count=Count("id"))
-                    .values("count")
-                )
-            )
-            .annotate(
-                attachment_count=Subquery(
-                    FileAsset.objects.filter(
-                        issue_id=OuterRef("id"),
-                        entity_type=FileAsset.EntityTypeContext.ISSUE_ATTACHMENT,
-                    )
-                    .values("issue_id")
-                    .annotate(count=Count("id"))
-                    .values("count")
-                )
-            )
-            .annotate(
-                sub_issues_count=Subquery(
-                    Issue.issue_objects.filter(parent=OuterRef("id"))
-                    .values("parent")
-                    .annotate(count=Count("id"))
-                    .values("count")
-                )
-            )
-        )
+        issues = issues.annotate(**issue_counter_annotations())
 
         return issues
 
@@ -348,6 +290,7 @@ class IssueViewSet(BaseViewSet):
                             archived_at__isnull=True,
                             is_draft=False,
                         ),
+                        allow_keyset=True,
                     )
             else:
                 # Group paginate
@@ -376,6 +319,7 @@ class IssueViewSet(BaseViewSet):
                         archived_at__isnull=True,
                         is_draft=False,
                     ),
+                    allow_keyset=True,
                 )
         else:
             return self.paginate(
@@ -384,6 +328,7 @@ class IssueViewSet(BaseViewSet):
                 queryset=issue_queryset,
                 total_count_queryset=filtered_issue_queryset,
                 on_results=lambda issues: issue_on_results(group_by=group_by, issues=issues, sub_group_by=sub_group_by),
+                allow_keyset=True,
             )
 
     @allow_permission([ROLE.ADMIN, ROLE.MEMBER])
@@ -485,34 +430,7 @@ class IssueViewSet(BaseViewSet):
                 pk=pk,
             )
             .select_related("state")
-            .annotate(cycle_id=Subquery(CycleIssue.objects.filter(issue=OuterRef("id")).values("cycle_id")[:1]))
-            .annotate(
-                link_count=Subquery(
-                    IssueLink.objects.filter(issue=OuterRef("id"))
-                    .values("issue")
-                    .annotate(count=Count("id"))
-                    .values("count")
-                )
-            )
-            .annotate(
-                attachment_count=Subquery(
-                    FileAsset.objects.filter(
-                        issue_id=OuterRef("id"),
-                        entity_type=FileAsset.EntityTypeContext.ISSUE_ATTACHMENT,
-                    )
-                    .values("issue_id")
-                    .annotate(count=Count("id"))
-                    .values("count")
-                )
-            )
-            .annotate(
-                sub_issues_count=Subquery(
-                    Issue.issue_objects.filter(parent=OuterRef("id"))
-                    .values("parent")
-                    .annotate(count=Count("id"))
-                    .values("count")
-                )
-            )
+            .annotate(**issue_counter_annotations())
             .annotate(
                 label_ids=Coalesce(
                     Subquery(
@@ -755,6 +673,36 @@ class ProjectUserDisplayPropertyEndpoint(BaseAPIView):
         return Response(serializer.data, status=status.HTTP_200_OK)
 
 
+class BulkCreateIssuesEndpoint(BaseAPIView):
+    @allow_permission([ROLE.ADMIN, ROLE.MEMBER])
+    def post(self, request, slug, project_id):
+        project = Project.objects.get(pk=project_id, workspace__slug=slug)
+
+        serializer = IssueBulkCreateSerializer(data=request.data, context={"project_id": project_id})
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+        issues = bulk_create_issues(
+            project,
+            serializer.validated_data["issues"],
+            actor_id=request.user.id,
+            origin=base_host(request=request, is_app=True),
+        )
+        return Response(
+            [
+                {
+                    "id": issue.id,
+                    "name": issue.name,
+                    "sequence_id": issue.sequence_id,
+                    "state_id": issue.state_id,
+                    "sort_order": issue.sort_order,
+                }
+                for issue in issues
+            ],
+            status=status.HTTP_201_CREATED,
+        )
+
+
 class BulkDeleteIssuesEndpoint(BaseAPIView):
     @allow_permission([ROLE.ADMIN])
     def delete(self, request, slug, project_id):
@@ -766,15 +714,24 @@ class BulkDeleteIssuesEndpoint(BaseAPIView):
         issues = Issue.issue_objects.filter(workspace__slug=slug, project_id=project_id, pk__in=issue_ids)
 
         total_issues = len(issues)
+        # Read before the cycle and module issues are deleted
+        cycle_ids, module_ids = get_issue_containers(issue_ids)
 
-        # First, delete all related cycle issues
-        CycleIssue.objects.filter(issue_id__in=issue_ids).delete()
+        with transaction.atomic():
+            # First, delete all related cycle issues
+            CycleIssue.objects.filter(issue_id__in=issue_ids).delete()
 
-        # Then, delete all related module issues
-        ModuleIssue.objects.filter(issue_id__in=issue_ids).delete()
+            # Then, delete all related module issues
+            ModuleIssue.objects.filter(issue_id__in=issue_ids).delete()
 
-        # Finally, delete the issues themselves
-        issues.delete()
+            # Finally, delete the issues themselves
+            issues.delete()
+
+            # The parents count their deleted sub issues no more
+            refresh_parent_issue_counters(issue_ids)
+            record_issue_changes(issue_ids)
+            # The cycles and modules count them no more either, no activity is sent for the deletes
+            refresh_containers_progress(cycle_ids, module_ids)
 
         return Response(
             {"message": f"{total_issues} issues were deleted"},
@@ -798,6 +755,76 @@ class DeletedIssuesListViewSet(BaseAPIView):
         return Response(deleted_issues, status=status.HTTP_200_OK)
 
 
+# The fields of the issues read by the clients keeping a copy of the issues of a project
+PAGINATED_ISSUE_FIELDS = [
+    "id",
+    "name",
+    "state_id",
+    "state__group",
+    "sort_order",
+    "completed_at",
+    "estimate_point",
+    "priority",
+    "start_date",
+    "target_date",
+    "sequence_id",
+    "project_id",
+    "parent_id",
+    "cycle_id",
+    "created_at",
+    "updated_at",
+    "created_by",
+    "updated_by",
+    "is_draft",
+    "archived_at",
+    "module_ids",
+    "label_ids",
+    "assignee_ids",
+    "link_count",
+    "attachment_count",
+    "sub_issues_count",
+]
+
+
+def annotate_related_ids(queryset):
+    """Annotate the issues with the ids of their labels, assignees and modules"""
+    return queryset.annotate(
+        label_ids=Coalesce(
+            Subquery(
+                IssueLabel.objects.filter(issue_id=OuterRef("pk"))
+                .values("issue_id")
+                .annotate(arr=ArrayAgg("label_id", distinct=True))
+                .values("arr")
+            ),
+            Value([], output_field=ArrayField(UUIDField())),
+        ),
+        assignee_ids=Coalesce(
+            Subquery(
+                IssueAssignee.objects.filter(
+                    issue_id=OuterRef("pk"),
+                    assignee__member_project__is_active=True,
+                )
+                .values("issue_id")
+                .annotate(arr=ArrayAgg("assignee_id", distinct=True))
+                .values("arr")
+            ),
+            Value([], output_field=ArrayField(UUIDField())),
+        ),
+        module_ids=Coalesce(
+            Subquery(
+                ModuleIssue.objects.filter(
+                    issue_id=OuterRef("pk"),
+                    module__archived_at__isnull=True,
+                )
+                .values("issue_id")
+                .annotate(arr=ArrayAgg("module_id", distinct=True))
+                .values("arr")
+            ),
+            Value([], output_field=ArrayField(UUIDField())),
+        ),
+    )
+
+
 class IssuePaginatedViewSet(BaseViewSet):
     def get_queryset(self):
         workspace_slug = self.kwargs.get("slug")
@@ -805,37 +832,7 @@ class IssuePaginatedViewSet(BaseViewSet):
 
         issue_queryset = Issue.issue_objects.filter(workspace__slug=workspace_slug, project_id=project_id)
 
-        return (
-            issue_queryset.select_related("state")
-            .annotate(cycle_id=Subquery(CycleIssue.objects.filter(issue=OuterRef("id")).values("cycle_id")[:1]))
-            .annotate(
-                link_count=Subquery(
-                    IssueLink.objects.filter(issue=OuterRef("id"))
-                    .values("issue")
-                    .annotate(count=Count("id"))
-                    .values("count")
-                )
-            )
-            .annotate(
-                attachment_count=Subquery(
-                    FileAsset.objects.filter(
-                        issue_id=OuterRef("id"),
-                        entity_type=FileAsset.EntityTypeContext.ISSUE_ATTACHMENT,
-                    )
-                    .values("issue_id")
-                    .annotate(count=Count("id"))
-                    .values("count")
-                )
-            )
-            .annotate(
-                sub_issues_count=Subquery(
-                    Issue.issue_objects.filter(parent=OuterRef("id"))
-                    .values("parent")
-                    .annotate(count=Count("id"))
-                    .values("count")
-                )
-            )
-        )
+        return issue_queryset.select_related("state").annotate(**issue_counter_annotations())
 
     def process_paginated_result(self, fields, results, timezone):
         paginated_data = results.values(*fields)
@@ -853,34 +850,7 @@ class IssuePaginatedViewSet(BaseViewSet):
         updated_at = request.GET.get("updated_at__gt", None)
 
         # required fields
-        required_fields = [
-            "id",
-            "name",
-            "state_id",
-            "state__group",
-            "sort_order",
-            "completed_at",
-            "estimate_point",
-            "priority",
-            "start_date",
-            "target_date",
-            "sequence_id",
-            "project_id",
-            "parent_id",
-            "cycle_id",
-            "created_at",
-            "updated_at",
-            "created_by",
-            "updated_by",
-            "is_draft",
-            "archived_at",
-            "module_ids",
-            "label_ids",
-            "assignee_ids",
-            "link_count",
-            "attachment_count",
-            "sub_issues_count",
-        ]
+        required_fields = list(PAGINATED_ISSUE_FIELDS)
 
         if str(is_description_required).lower() == "true":
             required_fields.append("description_html")
@@ -909,41 +879,7 @@ class IssuePaginatedViewSet(BaseViewSet):
             base_queryset = base_queryset.filter(updated_at__gt=updated_at)
             queryset = queryset.filter(updated_at__gt=updated_at)
 
-        queryset = queryset.annotate(
-            label_ids=Coalesce(
-                Subquery(
-                    IssueLabel.objects.filter(issue_id=OuterRef("pk"))
-                    .values("issue_id")
-                    .annotate(arr=ArrayAgg("label_id", distinct=True))
-                    .values("arr")
-                ),
-                Value([], output_field=ArrayField(UUIDField())),
-            ),
-            assignee_ids=Coalesce(
-                Subquery(
-                    IssueAssignee.objects.filter(
-                        issue_id=OuterRef("pk"),
-                        assignee__member_project__is_active=True,
-                    )
-                    .values("issue_id")
-                    .annotate(arr=ArrayAgg("assignee_id", distinct=True))
-                    .values("arr")
-                ),
-                Value([], output_field=ArrayField(UUIDField())),
-            ),
-            module_ids=Coalesce(
-                Subquery(
-                    ModuleIssue.objects.filter(
-                        issue_id=OuterRef("pk"),
-                        module__archived_at__isnull=True,
-                    )
-                    .values("issue_id")
-                    .annotate(arr=ArrayAgg("module_id", distinct=True))
-                    .values("arr")
-                ),
-                Value([], output_field=ArrayField(UUIDField())),
-            ),
-        )
+        queryset = annotate_related_ids(queryset)
 
         paginated_data = paginate(
             base_queryset=base_queryset,
@@ -963,32 +899,7 @@ class IssueDetailEndpoint(BaseAPIView):
 
     def apply_annotations(self, issues):
         return (
-            issues.annotate(
-                cycle_id=Subquery(
-                    CycleIssue.objects.filter(issue=OuterRef("id"), deleted_at__isnull=True).values("cycle_id")[:1]
-                )
-            )
-            .annotate(
-                link_count=IssueLink.objects.filter(issue=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
-            .annotate(
-                attachment_count=FileAsset.objects.filter(
-                    issue_id=OuterRef("id"),
-                    entity_type=FileAsset.EntityTypeContext.ISSUE_ATTACHMENT,
-                )
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
-            .annotate(
-                sub_issues_count=Issue.issue_objects.filter(parent=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
+            issues.annotate(**issue_counter_annotations())
             .prefetch_related(
                 Prefetch(
                     "issue_assignee",
@@ -1120,50 +1031,59 @@ class IssueBulkUpdateDateEndpoint(BaseAPIView):
         issues_dict = {str(issue.id): issue for issue in issues}
         issues_to_update = []
 
+        # Checked before any activity is queued, a rejected request sends none
         for update in updates:
-            issue_id = update["id"]
-            issue = issues_dict.get(issue_id)
-
-            if not issue:
-                continue
-
-            start_date = update.get("start_date")
-            target_date = update.get("target_date")
-            validate_dates = self.validate_dates(issue.start_date, issue.target_date, start_date, target_date)
-            if not validate_dates:
+            issue = issues_dict.get(update["id"])
+            if issue and not self.validate_dates(
+                issue.start_date, issue.target_date, update.get("start_date"), update.get("target_date")
+            ):
                 return Response(
                     {"message": "Start date cannot exceed target date"},
                     status=status.HTTP_400_BAD_REQUEST,
                 )
 
-            if start_date:
-                issue_activity.delay(
-                    type="issue.activity.updated",
-                    requested_data=json.dumps({"start_date": update.get("start_date")}),
-                    current_instance=json.dumps({"start_date": str(issue.start_date)}),
-                    issue_id=str(issue_id),
-                    actor_id=str(request.user.id),
-                    project_id=str(project_id),
-                    epoch=epoch,
-                )
-                issue.start_date = start_date
-                issues_to_update.append(issue)
-
-            if target_date:
-                issue_activity.delay(
-                    type="issue.activity.updated",
-                    requested_data=json.dumps({"target_date": update.get("target_date")}),
-                    current_instance=json.dumps({"target_date": str(issue.target_date)}),
-                    issue_id=str(issue_id),
-                    actor_id=str(request.user.id),
-                    project_id=str(project_id),
-                    epoch=epoch,
-                )
-                issue.target_date = target_date
-                issues_to_update.append(issue)
+        # Send the activities of all the updates in batches
+        with batch_issue_activities():
+            for update in updates:
+                issue_id = update["id"]
+                issue = issues_dict.get(issue_id)
+
+                if not issue:
+                    continue
+
+                start_date = update.get("start_date")
+                target_date = update.get("target_date")
+
+                if start_date:
+                    queue_issue_activity(
+                        type="issue.activity.updated",
+                        requested_data=json.dumps({"start_date": update.get("start_date")}),
+                        current_instance=json.dumps({"start_date": str(issue.start_date)}),
+                        issue_id=str(issue_id),
+                        actor_id=str(request.user.id),
+                        project_id=str(project_id),
+                        epoch=epoch,
+                    )
+                    issue.start_date = start_date
+                    issues_to_update.append(issue)
+
+                if target_date:
+                    queue_issue_activity(
+                        type="issue.activity.updated",
+                        requested_data=json.dumps({"target_date": update.get("target_date")}),
+                        current_instance=json.dumps({"target_date": str(issue.target_date)}),
+                        issue_id=str(issue_id),
+                        actor_id=str(request.user.id),
+                        project_id=str(project_id),
+                        epoch=epoch,
+                    )
+                    issue.target_date = target_date
+                    issues_to_update.append(issue)
 
         # Bulk update issues
-        Issue.objects.bulk_update(issues_to_update, ["start_date", "target_date"])
+        with transaction.atomic():
+            Issue.objects.bulk_update(issues_to_update, ["start_date", "target_date"])
+            record_issue_changes(issue.id for issue in issues_to_update)
 
         return Response({"message": "Issues updated successfully"}, status=status.HTTP_200_OK)
 
@@ -1220,28 +1140,7 @@ class IssueDetailIdentifierEndpoint(BaseAPIView):
             .filter(workspace__slug=slug)
             .select_related("workspace", "project", "state", "parent")
             .prefetch_related("assignees", "labels", "issue_module__module")
-            .annotate(cycle_id=Subquery(CycleIssue.objects.filter(issue=OuterRef("id")).values("cycle_id")[:1]))
-            .annotate(
-                link_count=IssueLink.objects.filter(issue=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
-            .annotate(
-                attachment_count=FileAsset.objects.filter(
-                    issue_id=OuterRef("id"),
-                    entity_type=FileAsset.EntityTypeContext.ISSUE_ATTACHMENT,
-                )
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
-            .annotate(
-                sub_issues_count=Issue.issue_objects.filter(parent=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
+            .annotate(**issue_counter_annotations())
             .filter(sequence_id=issue_identifier)
             .annotate(
                 label_ids=Coalesce(
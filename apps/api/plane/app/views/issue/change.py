@@ -0,0 +1,97 @@
+# Django imports
+from django.db.models import Q
+from django.utils.decorators import method_decorator
+from django.views.decorators.gzip import gzip_page
+
+# Third Party imports
+from rest_framework import status
+from rest_framework.exceptions import ParseError
+from rest_framework.response import Response
+
+# Module imports
+from plane.app.permissions import ROLE, allow_permission
+from plane.db.models import Issue, IssueChange, Project
+from plane.utils.issue_changes import IssueChangeCursorExpired, read_issue_changes
+from plane.utils.issue_counters import issue_counter_annotations
+from plane.utils.member_roles import get_member_roles
+from plane.utils.timezone_converter import user_timezone_converter
+
+from .. import BaseAPIView
+from .base import PAGINATED_ISSUE_FIELDS, annotate_related_ids
+
+
+def issue_changes_response(request, changes, issues):
+    """
+    Page of a change feed: the issues changed after the cursor that the user sees as upserts, and the ids of
+    the others, deleted, archived, drafted, moved to triage or out of the feed, as tombstones. A cursor older
+    than the changes kept gets a 410, the client downloads the issues again and follows a new cursor.
+    """
+    try:
+        issue_ids, cursor, has_more = read_issue_changes(changes, request.GET.get("cursor", None))
+    except ValueError:
+        raise ParseError(detail="Invalid cursor parameter.")
+    except IssueChangeCursorExpired:
+        return Response(
+            {"error": "The changes after the cursor are no longer kept, download the issues again"},
+            status=status.HTTP_410_GONE,
+        )
+
+    fields = list(PAGINATED_ISSUE_FIELDS)
+    if str(request.GET.get("description", "false")).lower() == "true":
+        fields.append("description_html")
+
+    upserts = []
+    if issue_ids:
+        changed_issues = issues.filter(pk__in=issue_ids).annotate(**issue_counter_annotations())
+        upserts = annotate_related_ids(changed_issues).values(*fields)
+        upserts = user_timezone_converter(upserts, ["created_at", "updated_at"], request.user.user_timezone)
+
+    upserted_ids = {str(issue["id"]) for issue in upserts}
+    return Response(
+        {
+            "cursor": cursor,
+            "has_more": has_more,
+            "upserts": upserts,
+            "tombstones": [issue_id for issue_id in issue_ids if issue_id not in upserted_ids],
+        },
+        status=status.HTTP_200_OK,
+    )
+
+
+class ProjectIssueChangeEndpoint(BaseAPIView):
+    """Changes of the issues of a project after a cursor, for the clients keeping a copy of them"""
+
+    @method_decorator(gzip_page)
+    @allow_permission([ROLE.ADMIN, ROLE.MEMBER, ROLE.GUEST])
+    def get(self, request, slug, project_id):
+        changes = IssueChange.objects.filter(project_id=project_id)
+        issues = Issue.issue_objects.filter(workspace__slug=slug, project_id=project_id)
+
+        # The guests see their own issues unless the project shows them all
+        if (
+            get_member_roles(request, slug).project_role(project_id) == ROLE.GUEST.value
+            and not Project.objects.filter(pk=project_id, guest_view_all_features=True).exists()
+        ):
+            issues = issues.filter(created_by=request.user)
+
+        return issue_changes_response(request, changes, issues)
+
+
+class WorkspaceIssueChangeEndpoint(BaseAPIView):
+    """Changes of the issues of the projects of the user in a workspace after a cursor"""
+
+    @method_decorator(gzip_page)
+    @allow_permission([ROLE.ADMIN, ROLE.MEMBER, ROLE.GUEST], level="WORKSPACE")
+    def get(self, request, slug):
+        project_roles = get_member_roles(request, slug).project_roles
+        changes = IssueChange.objects.filter(workspace__slug=slug, project_id__in=list(project_roles))
+        issues = Issue.issue_objects.filter(workspace__slug=slug, project_id__in=list(project_roles))
+
+        # The guests see their own issues in the projects not showing them all
+        guest_project_ids = Project.objects.filter(
+            pk__in=[project_id for project_id, role in project_roles.items() if role == ROLE.GUEST.value],
+            guest_view_all_features=False,
+        ).values_list("id", flat=True)
+        issues = issues.exclude(Q(project_id__in=guest_project_ids) & ~Q(created_by=request.user))
+
+        return issue_changes_response(request, changes, issues)
@@ -2,8 +2,9 @@
 import json
 
 # Django imports
+from django.db import transaction
 from django.utils import timezone
-from django.db.models import OuterRef, Func, F, Q, Value, UUIDField, Subquery
+from django.db.models import F, Q, Value, UUIDField
 from django.utils.decorators import method_decorator
 from django.views.decorators.gzip import gzip_page
 from django.contrib.postgres.aggregates import ArrayAgg
@@ -18,11 +19,12 @@ from rest_framework import status
 from .. import BaseAPIView
 from plane.app.serializers import IssueSerializer
 from plane.app.permissions import ProjectEntityPermission
-from plane.db.models import Issue, IssueLink, FileAsset, CycleIssue
+from plane.db.models import Issue, record_issue_changes, refresh_issue_counters
 from plane.bgtasks.issue_activities_task import issue_activity
 from plane.utils.timezone_converter import user_timezone_converter
 from collections import defaultdict
 from plane.utils.host import base_host
+from plane.utils.issue_counters import issue_counter_annotations
 from plane.utils.order_queryset import order_issue_queryset
 
 
@@ -35,32 +37,7 @@ class SubIssuesEndpoint(BaseAPIView):
             Issue.issue_objects.filter(parent_id=issue_id, workspace__slug=slug)
             .select_related("workspace", "project", "state", "parent")
             .prefetch_related("assignees", "labels", "issue_module__module")
-            .annotate(
-                cycle_id=Subquery(
-                    CycleIssue.objects.filter(issue=OuterRef("id"), deleted_at__isnull=True).values("cycle_id")[:1]
-                )
-            )
-            .annotate(
-                link_count=IssueLink.objects.filter(issue=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
-            .annotate(
-                attachment_count=FileAsset.objects.filter(
-                    issue_id=OuterRef("id"),
-                    entity_type=FileAsset.EntityTypeContext.ISSUE_ATTACHMENT,
-                )
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
-            .annotate(
-                sub_issues_count=Issue.issue_objects.filter(parent=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
+            .annotate(**issue_counter_annotations())
             .annotate(
                 label_ids=Coalesce(
                     ArrayAgg(
@@ -178,10 +155,16 @@ class SubIssuesEndpoint(BaseAPIView):
 
         sub_issues = Issue.issue_objects.filter(id__in=sub_issue_ids)
 
+        # The previous parents of the sub issues count them no more
+        parent_ids = {parent_issue.id}
         for sub_issue in sub_issues:
+            parent_ids.add(sub_issue.parent_id)
             sub_issue.parent = parent_issue
 
-        _ = Issue.objects.bulk_update(sub_issues, ["parent"], batch_size=10)
+        with transaction.atomic():
+            _ = Issue.objects.bulk_update(sub_issues, ["parent"], batch_size=10)
+            refresh_issue_counters(parent_ids)
+            record_issue_changes(sub_issue.id for sub_issue in sub_issues)
 
         updated_sub_issues = Issue.issue_objects.filter(id__in=sub_issue_ids).annotate(state_group=F("state__group"))
 
@@ -106,7 +106,7 @@ class WorkItemDescriptionVersionEndpoint(BaseAPIView):
                 project_id=project_id,
                 issue_id=work_item_id,
                 pk=pk,
-            )
+            ).load_version_content()
 
             serializer = IssueDescriptionVersionDetailSerializer(issue_description_version)
             return Response(serializer.data, status=status.HTTP_200_OK)
@@ -2,7 +2,7 @@
 import copy
 import json
 
-from django.db.models import F, Func, OuterRef, Q, Subquery
+from django.db.models import Q
 
 # Django Imports
 from django.utils import timezone
@@ -18,17 +18,15 @@ from plane.app.serializers import ModuleIssueSerializer
 from plane.bgtasks.issue_activities_task import issue_activity
 from plane.db.models import (
     Issue,
-    FileAsset,
-    IssueLink,
     ModuleIssue,
     Project,
-    CycleIssue,
 )
 from plane.utils.grouper import (
     issue_group_values,
     issue_on_results,
     issue_queryset_grouper,
 )
+from plane.utils.issue_counters import issue_counter_annotations
 from plane.utils.issue_filters import issue_filters
 from plane.utils.order_queryset import order_issue_queryset
 from plane.utils.paginator import GroupedOffsetPaginator, SubGroupedOffsetPaginator
@@ -47,34 +45,8 @@ class ModuleIssueViewSet(BaseViewSet):
     filterset_class = IssueFilterSet
 
     def apply_annotations(self, issues):
-        return (
-            issues.annotate(
-                cycle_id=Subquery(
-                    CycleIssue.objects.filter(issue=OuterRef("id"), deleted_at__isnull=True).values("cycle_id")[:1]
-                )
-            )
-            .annotate(
-                link_count=IssueLink.objects.filter(issue=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
-            .annotate(
-                attachment_count=FileAsset.objects.filter(
-                    issue_id=OuterRef("id"),
-                    entity_type=FileAsset.EntityTypeContext.ISSUE_ATTACHMENT,
-                )
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
-            .annotate(
-                sub_issues_count=Issue.issue_objects.filter(parent=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
-            .prefetch_related("assignees", "labels", "issue_module__module")
+        return issues.annotate(**issue_counter_annotations()).prefetch_related(
+            "assignees", "labels", "issue_module__module"
         )
 
     def get_queryset(self):
@@ -287,26 +259,22 @@ class ModuleIssueViewSet(BaseViewSet):
                 module_id=module_id,
                 issue_id=issue_id,
             )
+            module_name = (
+                module_issue.first().module.name if (module_issue.first() and module_issue.first().module) else None
+            )
+            # Removed before the activity so that the module progress is recounted without the issue
+            module_issue.delete()
             issue_activity.delay(
                 type="module.activity.deleted",
                 requested_data=json.dumps({"module_id": str(module_id)}),
                 actor_id=str(request.user.id),
                 issue_id=str(issue_id),
                 project_id=str(project_id),
-                current_instance=json.dumps(
-                    {
-                        "module_name": (
-                            module_issue.first().module.name
-                            if (module_issue.first() and module_issue.first().module)
-                            else None
-                        )
-                    }
-                ),
+                current_instance=json.dumps({"module_name": module_name}),
                 epoch=int(timezone.now().timestamp()),
                 notification=True,
                 origin=base_host(request=request, is_app=True),
             )
-            module_issue.delete()
 
         return Response({"message": "success"}, status=status.HTTP_201_CREATED)
 
@@ -318,16 +286,17 @@ class ModuleIssueViewSet(BaseViewSet):
             module_id=module_id,
             issue_id=issue_id,
         )
+        module_name = module_issue.first().module.name
+        module_issue.delete()
         issue_activity.delay(
             type="module.activity.deleted",
             requested_data=json.dumps({"module_id": str(module_id)}),
             actor_id=str(request.user.id),
             issue_id=str(issue_id),
             project_id=str(project_id),
-            current_instance=json.dumps({"module_name": module_issue.first().module.name}),
+            current_instance=json.dumps({"module_name": module_name}),
             epoch=int(timezone.now().timestamp()),
             notification=True,
             origin=base_host(request=request, is_app=True),
         )
-        module_issue.delete()
         return Response(status=status.HTTP_204_NO_CONTENT)
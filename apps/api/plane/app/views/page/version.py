@@ -17,6 +17,8 @@ class PageVersionEndpoint(BaseAPIView):
         if pk:
             # Return a single page version
             page_version = PageVersion.objects.get(workspace__slug=slug, page_id=page_id, pk=pk)
+            # Rebuild the description of versions stored as deltas
+            page_version.load_version_content()
             # Serialize the page version
             serializer = PageVersionDetailSerializer(page_version)
             return Response(serializer.data, status=status.HTTP_200_OK)
@@ -1,6 +1,3 @@
-# Python imports
-import re
-
 # Django imports
 from django.db import models
 from django.db.models import (
@@ -36,6 +33,7 @@ from plane.db.models import (
     ProjectPage,
     WorkspaceMember,
 )
+from plane.utils.search_backend import get_search_backend, issue_name_search_vector
 
 
 class GlobalSearchEndpoint(BaseAPIView):
@@ -45,51 +43,34 @@ class GlobalSearchEndpoint(BaseAPIView):
 
     def filter_workspaces(self, query, _slug, _project_id, _workspace_search):
         fields = ["name"]
-        q = Q()
-        if query:
-            for field in fields:
-                q |= Q(**{f"{field}__icontains": query})
         return (
-            Workspace.objects.filter(q, workspace_member__member=self.request.user)
-            .order_by("-created_at")
+            get_search_backend()
+            .search(Workspace.objects.filter(workspace_member__member=self.request.user), query, fields)
+            .order_by("-search_rank", "-created_at")
             .distinct()
             .values("name", "id", "slug")
         )
 
     def filter_projects(self, query, slug, _project_id, _workspace_search):
         fields = ["name", "identifier"]
-        q = Q()
-        if query:
-            for field in fields:
-                q |= Q(**{f"{field}__icontains": query})
+        projects = Project.objects.filter(
+            project_projectmember__member=self.request.user,
+            project_projectmember__is_active=True,
+            archived_at__isnull=True,
+            workspace__slug=slug,
+        )
         return (
-            Project.objects.filter(
-                q,
-                project_projectmember__member=self.request.user,
-                project_projectmember__is_active=True,
-                archived_at__isnull=True,
-                workspace__slug=slug,
-            )
-            .order_by("-created_at")
+            get_search_backend()
+            .search(projects, query, fields)
+            .order_by("-search_rank", "-created_at")
             .distinct()
             .values("name", "id", "identifier", "workspace__slug")
         )
 
     def filter_issues(self, query, slug, project_id, workspace_search):
         fields = ["name", "sequence_id", "project__identifier"]
-        q = Q()
-        if query:
-            for field in fields:
-                if field == "sequence_id":
-                    # Match whole integers only (exclude decimal numbers)
-                    sequences = re.findall(r"\b\d+\b", query)
-                    for sequence_id in sequences:
-                        q |= Q(**{"sequence_id": sequence_id})
-                else:
-                    q |= Q(**{f"{field}__icontains": query})
 
         issues = Issue.issue_objects.filter(
-            q,
             project__project_projectmember__member=self.request.user,
             project__project_projectmember__is_active=True,
             project__archived_at__isnull=True,
@@ -99,24 +80,25 @@ class GlobalSearchEndpoint(BaseAPIView):
         if workspace_search == "false" and project_id:
             issues = issues.filter(project_id=project_id)
 
-        return issues.distinct().values(
-            "name",
-            "id",
-            "sequence_id",
-            "project__identifier",
-            "project_id",
-            "workspace__slug",
-        )[:100]
+        issues = get_search_backend().search(issues, query, fields, document=issue_name_search_vector())
+
+        return (
+            issues.order_by("-search_rank", "-created_at")
+            .distinct()
+            .values(
+                "name",
+                "id",
+                "sequence_id",
+                "project__identifier",
+                "project_id",
+                "workspace__slug",
+            )[:100]
+        )
 
     def filter_cycles(self, query, slug, project_id, workspace_search):
         fields = ["name"]
-        q = Q()
-        if query:
-            for field in fields:
-                q |= Q(**{f"{field}__icontains": query})
 
         cycles = Cycle.objects.filter(
-            q,
             project__project_projectmember__member=self.request.user,
             project__project_projectmember__is_active=True,
             project__archived_at__isnull=True,
@@ -127,20 +109,17 @@ class GlobalSearchEndpoint(BaseAPIView):
             cycles = cycles.filter(project_id=project_id)
 
         return (
-            cycles.order_by("-created_at")
+            get_search_backend()
+            .search(cycles, query, fields)
+            .order_by("-search_rank", "-created_at")
             .distinct()
             .values("name", "id", "project_id", "project__identifier", "workspace__slug")
         )
 
     def filter_modules(self, query, slug, project_id, workspace_search):
         fields = ["name"]
-        q = Q()
-        if query:
-            for field in fields:
-                q |= Q(**{f"{field}__icontains": query})
 
         modules = Module.objects.filter(
-            q,
             project__project_projectmember__member=self.request.user,
             project__project_projectmember__is_active=True,
             project__archived_at__isnull=True,
@@ -151,21 +130,18 @@ class GlobalSearchEndpoint(BaseAPIView):
             modules = modules.filter(project_id=project_id)
 
         return (
-            modules.order_by("-created_at")
+            get_search_backend()
+            .search(modules, query, fields)
+            .order_by("-search_rank", "-created_at")
             .distinct()
             .values("name", "id", "project_id", "project__identifier", "workspace__slug")
         )
 
     def filter_pages(self, query, slug, project_id, workspace_search):
         fields = ["name"]
-        q = Q()
-        if query:
-            for field in fields:
-                q |= Q(**{f"{field}__icontains": query})
 
         pages = (
             Page.objects.filter(
-                q,
                 projects__project_projectmember__member=self.request.user,
                 projects__project_projectmember__is_active=True,
                 projects__archived_at__isnull=True,
@@ -197,20 +173,17 @@ class GlobalSearchEndpoint(BaseAPIView):
             pages = pages.annotate(project_id=Subquery(project_subquery)).filter(project_id=project_id)
 
         return (
-            pages.order_by("-created_at")
+            get_search_backend()
+            .search(pages, query, fields)
+            .order_by("-search_rank", "-created_at")
             .distinct()
             .values("name", "id", "project_ids", "project_identifiers", "workspace__slug")
         )
 
     def filter_views(self, query, slug, project_id, workspace_search):
         fields = ["name"]
-        q = Q()
-        if query:
-            for field in fields:
-                q |= Q(**{f"{field}__icontains": query})
 
         issue_views = IssueView.objects.filter(
-            q,
             project__project_projectmember__member=self.request.user,
             project__project_projectmember__is_active=True,
             project__archived_at__isnull=True,
@@ -221,26 +194,17 @@ class GlobalSearchEndpoint(BaseAPIView):
             issue_views = issue_views.filter(project_id=project_id)
 
         return (
-            issue_views.order_by("-created_at")
+            get_search_backend()
+            .search(issue_views, query, fields)
+            .order_by("-search_rank", "-created_at")
             .distinct()
             .values("name", "id", "project_id", "project__identifier", "workspace__slug")
         )
 
     def filter_intakes(self, query, slug, project_id, workspace_search):
         fields = ["name", "sequence_id", "project__identifier"]
-        q = Q()
-        if query:
-            for field in fields:
-                if field == "sequence_id":
-                    # Match whole integers only (exclude decimal numbers)
-                    sequences = re.findall(r"\b\d+\b", query)
-                    for sequence_id in sequences:
-                        q |= Q(**{"sequence_id": sequence_id})
-                else:
-                    q |= Q(**{f"{field}__icontains": query})
 
         issues = Issue.objects.filter(
-            q,
             project__project_projectmember__member=self.request.user,
             project__project_projectmember__is_active=True,
             project__archived_at__isnull=True,
@@ -251,7 +215,9 @@ class GlobalSearchEndpoint(BaseAPIView):
             issues = issues.filter(project_id=project_id)
 
         return (
-            issues.order_by("-created_at")
+            get_search_backend()
+            .search(issues, query, fields, document=issue_name_search_vector())
+            .order_by("-search_rank", "-created_at")
             .distinct()
             .values(
                 "name",
@@ -360,18 +326,17 @@ class SearchEndpoint(BaseAPIView):
 
                 elif query_type == "project":
                     fields = ["name", "identifier"]
-                    q = Q()
-
-                    if query:
-                        for field in fields:
-                            q |= Q(**{f"{field}__icontains": query})
                     projects = (
-                        Project.objects.filter(
-                            q,
-                            Q(project_projectmember__member=self.request.user) | Q(network=2),
-                            workspace__slug=slug,
+                        get_search_backend()
+                        .search(
+                            Project.objects.filter(
+                                Q(project_projectmember__member=self.request.user) | Q(network=2),
+                                workspace__slug=slug,
+                            ),
+                            query,
+                            fields,
                         )
-                        .order_by("-created_at")
+                        .order_by("-search_rank", "-created_at")
                         .distinct()
                         .values("name", "id", "identifier", "logo_props", "workspace__slug")[:count]
                     )
@@ -379,26 +344,20 @@ class SearchEndpoint(BaseAPIView):
 
                 elif query_type == "issue":
                     fields = ["name", "sequence_id", "project__identifier"]
-                    q = Q()
-
-                    if query:
-                        for field in fields:
-                            if field == "sequence_id":
-                                sequences = re.findall(r"\b\d+\b", query)
-                                for sequence_id in sequences:
-                                    q |= Q(**{"sequence_id": sequence_id})
-                            else:
-                                q |= Q(**{f"{field}__icontains": query})
-
                     issues = (
-                        Issue.issue_objects.filter(
-                            q,
-                            project__project_projectmember__member=self.request.user,
-                            project__project_projectmember__is_active=True,
-                            workspace__slug=slug,
-                            project_id=project_id,
+                        get_search_backend()
+                        .search(
+                            Issue.issue_objects.filter(
+                                project__project_projectmember__member=self.request.user,
+                                project__project_projectmember__is_active=True,
+                                workspace__slug=slug,
+                                project_id=project_id,
+                            ),
+                            query,
+                            fields,
+                            document=issue_name_search_vector(),
                         )
-                        .order_by("-created_at")
+                        .order_by("-search_rank", "-created_at")
                         .distinct()
                         .values(
                             "name",
@@ -415,19 +374,17 @@ class SearchEndpoint(BaseAPIView):
 
                 elif query_type == "cycle":
                     fields = ["name"]
-                    q = Q()
-
-                    if query:
-                        for field in fields:
-                            q |= Q(**{f"{field}__icontains": query})
-
                     cycles = (
-                        Cycle.objects.filter(
-                            q,
-                            project__project_projectmember__member=self.request.user,
-                            project__project_projectmember__is_active=True,
-                            workspace__slug=slug,
-                            project_id=project_id,
+                        get_search_backend()
+                        .search(
+                            Cycle.objects.filter(
+                                project__project_projectmember__member=self.request.user,
+                                project__project_projectmember__is_active=True,
+                                workspace__slug=slug,
+                                project_id=project_id,
+                            ),
+                            query,
+                            fields,
                         )
                         .annotate(
                             status=Case(
@@ -448,7 +405,7 @@ class SearchEndpoint(BaseAPIView):
                                 output_field=CharField(),
                             )
                         )
-                        .order_by("-created_at")
+                        .order_by("-search_rank", "-created_at")
                         .distinct()
                         .values(
                             "name",
@@ -463,21 +420,19 @@ class SearchEndpoint(BaseAPIView):
 
                 elif query_type == "module":
                     fields = ["name"]
-                    q = Q()
-
-                    if query:
-                        for field in fields:
-                            q |= Q(**{f"{field}__icontains": query})
-
                     modules = (
-                        Module.objects.filter(
-                            q,
-                            project__project_projectmember__member=self.request.user,
-                            project__project_projectmember__is_active=True,
-                            workspace__slug=slug,
-                            project_id=project_id,
+                        get_search_backend()
+                        .search(
+                            Module.objects.filter(
+                                project__project_projectmember__member=self.request.user,
+                                project__project_projectmember__is_active=True,
+                                workspace__slug=slug,
+                                project_id=project_id,
+                            ),
+                            query,
+                            fields,
                         )
-                        .order_by("-created_at")
+                        .order_by("-search_rank", "-created_at")
                         .distinct()
                         .values(
                             "name",
@@ -492,22 +447,20 @@ class SearchEndpoint(BaseAPIView):
 
                 elif query_type == "page":
                     fields = ["name"]
-                    q = Q()
-
-                    if query:
-                        for field in fields:
-                            q |= Q(**{f"{field}__icontains": query})
-
                     pages = (
-                        Page.objects.filter(
-                            q,
-                            projects__project_projectmember__member=self.request.user,
-                            projects__project_projectmember__is_active=True,
-                            projects__id=project_id,
-                            workspace__slug=slug,
-                            access=0,
+                        get_search_backend()
+                        .search(
+                            Page.objects.filter(
+                                projects__project_projectmember__member=self.request.user,
+                                projects__project_projectmember__is_active=True,
+                                projects__id=project_id,
+                                workspace__slug=slug,
+                                access=0,
+                            ),
+                            query,
+                            fields,
                         )
-                        .order_by("-created_at")
+                        .order_by("-search_rank", "-created_at")
                         .distinct()
                         .values(
                             "name",
@@ -565,18 +518,17 @@ class SearchEndpoint(BaseAPIView):
 
                 elif query_type == "project":
                     fields = ["name", "identifier"]
-                    q = Q()
-
-                    if query:
-                        for field in fields:
-                            q |= Q(**{f"{field}__icontains": query})
                     projects = (
-                        Project.objects.filter(
-                            q,
-                            Q(project_projectmember__member=self.request.user) | Q(network=2),
-                            workspace__slug=slug,
+                        get_search_backend()
+                        .search(
+                            Project.objects.filter(
+                                Q(project_projectmember__member=self.request.user) | Q(network=2),
+                                workspace__slug=slug,
+                            ),
+                            query,
+                            fields,
                         )
-                        .order_by("-created_at")
+                        .order_by("-search_rank", "-created_at")
                         .distinct()
                         .values("name", "id", "identifier", "logo_props", "workspace__slug")[:count]
                     )
@@ -584,25 +536,19 @@ class SearchEndpoint(BaseAPIView):
 
                 elif query_type == "issue":
                     fields = ["name", "sequence_id", "project__identifier"]
-                    q = Q()
-
-                    if query:
-                        for field in fields:
-                            if field == "sequence_id":
-                                sequences = re.findall(r"\b\d+\b", query)
-                                for sequence_id in sequences:
-                                    q |= Q(**{"sequence_id": sequence_id})
-                            else:
-                                q |= Q(**{f"{field}__icontains": query})
-
                     issues = (
-                        Issue.issue_objects.filter(
-                            q,
-                            project__project_projectmember__member=self.request.user,
-                            project__project_projectmember__is_active=True,
-                            workspace__slug=slug,
+                        get_search_backend()
+                        .search(
+                            Issue.issue_objects.filter(
+                                project__project_projectmember__member=self.request.user,
+                                project__project_projectmember__is_active=True,
+                                workspace__slug=slug,
+                            ),
+                            query,
+                            fields,
+                            document=issue_name_search_vector(),
                         )
-                        .order_by("-created_at")
+                        .order_by("-search_rank", "-created_at")
                         .distinct()
                         .values(
                             "name",
@@ -619,18 +565,16 @@ class SearchEndpoint(BaseAPIView):
 
                 elif query_type == "cycle":
                     fields = ["name"]
-                    q = Q()
-
-                    if query:
-                        for field in fields:
-                            q |= Q(**{f"{field}__icontains": query})
-
                     cycles = (
-                        Cycle.objects.filter(
-                            q,
-                            project__project_projectmember__member=self.request.user,
-                            project__project_projectmember__is_active=True,
-                            workspace__slug=slug,
+                        get_search_backend()
+                        .search(
+                            Cycle.objects.filter(
+                                project__project_projectmember__member=self.request.user,
+                                project__project_projectmember__is_active=True,
+                                workspace__slug=slug,
+                            ),
+                            query,
+                            fields,
                         )
                         .annotate(
                             status=Case(
@@ -651,7 +595,7 @@ class SearchEndpoint(BaseAPIView):
                                 output_field=CharField(),
                             )
                         )
-                        .order_by("-created_at")
+                        .order_by("-search_rank", "-created_at")
                         .distinct()
                         .values(
                             "name",
@@ -666,20 +610,18 @@ class SearchEndpoint(BaseAPIView):
 
                 elif query_type == "module":
                     fields = ["name"]
-                    q = Q()
-
-                    if query:
-                        for field in fields:
-                            q |= Q(**{f"{field}__icontains": query})
-
                     modules = (
-                        Module.objects.filter(
-                            q,
-                            project__project_projectmember__member=self.request.user,
-                            project__project_projectmember__is_active=True,
-                            workspace__slug=slug,
+                        get_search_backend()
+                        .search(
+                            Module.objects.filter(
+                                project__project_projectmember__member=self.request.user,
+                                project__project_projectmember__is_active=True,
+                                workspace__slug=slug,
+                            ),
+                            query,
+                            fields,
                         )
-                        .order_by("-created_at")
+                        .order_by("-search_rank", "-created_at")
                         .distinct()
                         .values(
                             "name",
@@ -694,22 +636,20 @@ class SearchEndpoint(BaseAPIView):
 
                 elif query_type == "page":
                     fields = ["name"]
-                    q = Q()
-
-                    if query:
-                        for field in fields:
-                            q |= Q(**{f"{field}__icontains": query})
-
                     pages = (
-                        Page.objects.filter(
-                            q,
-                            projects__project_projectmember__member=self.request.user,
-                            projects__project_projectmember__is_active=True,
-                            workspace__slug=slug,
-                            access=0,
-                            is_global=True,
+                        get_search_backend()
+                        .search(
+                            Page.objects.filter(
+                                projects__project_projectmember__member=self.request.user,
+                                projects__project_projectmember__is_active=True,
+                                workspace__slug=slug,
+                                access=0,
+                                is_global=True,
+                            ),
+                            query,
+                            fields,
                         )
-                        .order_by("-created_at")
+                        .order_by("-search_rank", "-created_at")
                         .distinct()
                         .values(
                             "name",
@@ -3,11 +3,8 @@ import copy
 # Django imports
 from django.db.models import (
     Exists,
-    F,
-    Func,
     OuterRef,
     Q,
-    Subquery,
     Prefetch,
 )
 from django.utils.decorators import method_decorator
@@ -23,19 +20,17 @@ from plane.app.permissions import allow_permission, ROLE
 from plane.app.serializers import IssueViewSerializer, ViewIssueListSerializer
 from plane.db.models import (
     Issue,
-    FileAsset,
-    IssueLink,
     IssueView,
     Workspace,
     WorkspaceMember,
     ProjectMember,
     Project,
-    CycleIssue,
     UserRecentVisit,
     IssueAssignee,
     IssueLabel,
     ModuleIssue,
 )
+from plane.utils.issue_counters import issue_counter_annotations
 from plane.utils.issue_filters import issue_filters
 from plane.utils.order_queryset import order_issue_queryset
 from plane.bgtasks.recent_visited_task import recent_visited_task
@@ -159,32 +154,7 @@ class WorkspaceViewIssuesViewSet(BaseViewSet):
 
     def apply_annotations(self, issues):
         return (
-            issues.annotate(
-                cycle_id=Subquery(
-                    CycleIssue.objects.filter(issue=OuterRef("id"), deleted_at__isnull=True).values("cycle_id")[:1]
-                )
-            )
-            .annotate(
-                link_count=IssueLink.objects.filter(issue=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
-            .annotate(
-                attachment_count=FileAsset.objects.filter(
-                    issue_id=OuterRef("id"),
-                    entity_type=FileAsset.EntityTypeContext.ISSUE_ATTACHMENT,
-                )
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
-            .annotate(
-                sub_issues_count=Issue.issue_objects.filter(parent=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
+            issues.annotate(**issue_counter_annotations())
             .prefetch_related(
                 Prefetch(
                     "issue_assignee",
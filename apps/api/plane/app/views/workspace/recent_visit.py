@@ -4,6 +4,7 @@ from rest_framework.response import Response
 
 from plane.db.models import UserRecentVisit
 from plane.app.serializers import WorkspaceRecentVisitSerializer
+from plane.utils.recent_visits import get_recent_visits
 
 # Modules imports
 from ..base import BaseViewSet
@@ -19,14 +20,29 @@ class UserRecentVisitViewSet(BaseViewSet):
 
     @allow_permission([ROLE.ADMIN, ROLE.MEMBER, ROLE.GUEST], level="WORKSPACE")
     def list(self, request, slug):
-        user_recent_visits = UserRecentVisit.objects.filter(workspace__slug=slug, user=request.user)
-
         entity_name = request.query_params.get("entity_name")
-
-        if entity_name:
-            user_recent_visits = user_recent_visits.filter(entity_name=entity_name)
-
-        user_recent_visits = user_recent_visits.filter(entity_name__in=["issue", "page", "project"])
-
-        serializer = WorkspaceRecentVisitSerializer(user_recent_visits[:20], many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        entity_names = [entity_name] if entity_name else ["issue", "page", "project"]
+        entity_names = [name for name in entity_names if name in ["issue", "page", "project"]]
+
+        # The latest visits are kept in redis, the database only has those flushed
+        recent_visits = get_recent_visits(slug, request.user.id)
+        if recent_visits is not None:
+            user_recent_visits = [
+                UserRecentVisit(
+                    id=visit["id"],
+                    entity_name=visit["entity_name"],
+                    entity_identifier=visit["entity_identifier"],
+                    visited_at=visit["visited_at"],
+                )
+                for visit in recent_visits
+                if visit["entity_name"] in entity_names
+            ]
+        else:
+            user_recent_visits = UserRecentVisit.objects.filter(
+                workspace__slug=slug, user=request.user, entity_name__in=entity_names
+            ).order_by("-visited_at")[:20]
+
+        serializer = WorkspaceRecentVisitSerializer(user_recent_visits, many=True)
+        # Entities deleted since their visit are left out, whether the visits come from redis or the database
+        data = [visit for visit in serializer.data if visit["entity_data"] is not None]
+        return Response(data, status=status.HTTP_200_OK)
@@ -0,0 +1,89 @@
+# Python imports
+import logging
+
+# Django imports
+from django.db import transaction
+
+# Third party imports
+from celery import shared_task
+
+# Module imports
+from plane.db.models import Issue, IssueAnalyticsFact, Project
+from plane.settings.redis import redis_instance
+from plane.utils.analytics_rollup import (
+    ANALYTICS_DIRTY_ISSUES_KEY,
+    rebuild_project_facts,
+    refresh_analytics_facts,
+)
+from plane.utils.exception_logger import log_exception
+
+logger = logging.getLogger("plane.worker")
+
+# Issues being refreshed, kept until the refresh succeeds so that a failed refresh is retried by the next one
+ANALYTICS_REFRESHING_KEY = "analytics:refreshing_issues"
+# Changed issues whose days are refreshed per transaction
+REFRESH_BATCH_SIZE = 1000
+
+
+def get_fact_buckets(issue_ids):
+    """Days of the projects whose facts count the issues, by project id"""
+    buckets = {}
+    # Deleted issues are looked up too, their days are recomputed without them
+    for project_id, created_date in Issue.all_objects.filter(pk__in=issue_ids).values_list(
+        "project_id", "created_at__date"
+    ):
+        buckets.setdefault(project_id, set()).add(created_date)
+    return buckets
+
+
+@shared_task
+def refresh_analytics_rollups():
+    """Recompute the facts of the days of the issues changed since the last refresh"""
+    try:
+        ri = redis_instance()
+        if not ri.exists(ANALYTICS_REFRESHING_KEY):
+            # No issue changed since the last refresh
+            if not ri.exists(ANALYTICS_DIRTY_ISSUES_KEY):
+                return 0
+            # Issues changed from now on are marked in a new set
+            ri.rename(ANALYTICS_DIRTY_ISSUES_KEY, ANALYTICS_REFRESHING_KEY)
+
+        issue_ids = sorted(issue_id.decode() for issue_id in ri.smembers(ANALYTICS_REFRESHING_KEY))
+        refreshed = 0
+        for start in range(0, len(issue_ids), REFRESH_BATCH_SIZE):
+            batch = issue_ids[start : start + REFRESH_BATCH_SIZE]
+            with transaction.atomic():
+                refreshed += refresh_analytics_facts(get_fact_buckets(batch))
+            ri.srem(ANALYTICS_REFRESHING_KEY, *batch)
+
+        logger.info(f"Refreshed {refreshed} analytics facts of {len(issue_ids)} issues")
+        return refreshed
+    except Exception as e:
+        log_exception(e)
+        return
+
+
+@shared_task
+def reconcile_analytics_rollups(project_ids=None):
+    """
+    Recompute every fact, one project per transaction, catching up on the changes that do not go
+    through the issue activity such as state, label or project deletions.
+    """
+    try:
+        projects = Project.objects.all()
+        if project_ids is not None:
+            projects = projects.filter(pk__in=project_ids)
+        else:
+            # Facts of the deleted projects are not read anymore
+            IssueAnalyticsFact.all_objects.filter(project__deleted_at__isnull=False).delete()
+
+        reconciled = 0
+        for project_id in projects.values_list("id", flat=True).iterator():
+            with transaction.atomic():
+                reconciled += rebuild_project_facts(project_id)
+
+        logger.info(f"Reconciled {reconciled} analytics facts")
+        return reconciled
+    except Exception as e:
+        log_exception(e)
+        return
@@ -0,0 +1,53 @@
+# Python imports
+import logging
+
+# Third party imports
+from celery import shared_task
+
+# Django imports
+from django.db import connection
+from django.utils.dateparse import parse_datetime
+
+# Module imports
+from plane.settings.redis import redis_instance
+from plane.utils.api_token_cache import API_TOKEN_LAST_USED_KEY
+from plane.utils.exception_logger import log_exception
+
+logger = logging.getLogger("plane.worker")
+
+# Uses being written, kept until the update succeeds so that a failed flush is retried by the next one
+API_TOKEN_LAST_USED_FLUSHING_KEY = "api_token:last_used:flushing"
+
+UPDATE_LAST_USED_SQL = """
+UPDATE api_tokens SET last_used = uses.last_used
+FROM (SELECT UNNEST(%s::uuid[]) AS id, UNNEST(%s::timestamptz[]) AS last_used) AS uses
+WHERE api_tokens.id = uses.id AND (api_tokens.last_used IS NULL OR api_tokens.last_used < uses.last_used)
+"""
+
+
+@shared_task
+def flush_api_token_last_used():
+    """Write the last use of every token recorded since the last flush in one UPDATE"""
+    try:
+        ri = redis_instance()
+        if not ri.exists(API_TOKEN_LAST_USED_FLUSHING_KEY):
+            # No token was used since the last flush
+            if not ri.exists(API_TOKEN_LAST_USED_KEY):
+                return 0
+            # Uses recorded from now on go to a new hash
+            ri.rename(API_TOKEN_LAST_USED_KEY, API_TOKEN_LAST_USED_FLUSHING_KEY)
+
+        uses = ri.hgetall(API_TOKEN_LAST_USED_FLUSHING_KEY)
+        token_ids = [token_id.decode() for token_id in uses]
+        last_used = [parse_datetime(used_at.decode()) for used_at in uses.values()]
+
+        with connection.cursor() as cursor:
+            cursor.execute(UPDATE_LAST_USED_SQL, [token_ids, last_used])
+            rows = cursor.rowcount
+
+        ri.delete(API_TOKEN_LAST_USED_FLUSHING_KEY)
+        logger.info(f"Flushed the last use of {len(token_ids)} API tokens, {rows} updated")
+        return rows
+    except Exception as e:
+        log_exception(e)
+        return
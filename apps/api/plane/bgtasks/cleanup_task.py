@@ -5,6 +5,7 @@ from typing import List, Dict, Any, Callable, Optional
 import os
 
 # Django imports
+from django.conf import settings
 from django.utils import timezone
 from django.db.models import F, Window, Subquery
 from django.db.models.functions import RowNumber
@@ -20,11 +21,13 @@ from plane.db.models import (
     EmailNotificationLog,
     PageVersion,
     APIActivityLog,
+    IssueChange,
     IssueDescriptionVersion,
     WebhookLog,
 )
 from plane.settings.mongo import MongoConnection
 from plane.utils.exception_logger import log_exception
+from plane.utils.issue_changes import ended_transactions, set_issue_changes_horizon
 
 
 logger = logging.getLogger("plane.worker")
@@ -210,6 +213,7 @@ def transform_page_version(record: Dict) -> Dict:
         "description_binary": record["description_binary"],
         "description_stripped": record["description_stripped"],
         "description_json": record["description_json"],
+        "description_delta": record["description_delta"],
         "sub_pages_data": record["sub_pages_data"],
         "created_by_id": str(record["created_by_id"]),
         "updated_by_id": str(record["updated_by_id"]),
@@ -234,6 +238,7 @@ def transform_issue_description_version(record: Dict) -> Dict:
         "description_html": record["description_html"],
         "description_stripped": record["description_stripped"],
         "description_json": record["description_json"],
+        "description_delta": record["description_delta"],
         "deleted_at": str(record["deleted_at"]) if record.get("deleted_at") else None,
     }
 
@@ -340,6 +345,7 @@ def get_page_versions_queryset():
             "description_binary",
             "description_stripped",
             "description_json",
+            "description_delta",
             "sub_pages_data",
             "created_by_id",
             "updated_by_id",
@@ -380,6 +386,7 @@ def get_issue_description_versions_queryset():
             "description_html",
             "description_stripped",
             "description_json",
+            "description_delta",
             "deleted_at",
         )
         .iterator(chunk_size=BATCH_SIZE)
@@ -473,3 +480,39 @@ def delete_webhook_logs():
         task_name="Webhook Log",
         collection_name="webhook_logs",
     )
+
+
+@shared_task
+def delete_issue_changes():
+    """
+    Delete the changes of the issues logged before ISSUE_CHANGES_RETENTION_DAYS, up to the last transaction
+    that logged one of them. The horizon is moved past that transaction before the delete, so that the
+    feeds turn down the cursors before it rather than skipping the changes being deleted.
+    """
+    cutoff = timezone.now() - timedelta(days=settings.ISSUE_CHANGES_RETENTION_DAYS)
+    horizon = (
+        IssueChange.objects.filter(created_at__lt=cutoff, transaction_id__lt=ended_transactions())
+        .order_by("-transaction_id")
+        .values_list("transaction_id", flat=True)
+        .first()
+    )
+    if horizon is None:
+        logger.info("No issue changes to delete")
+        return 0
+
+    set_issue_changes_horizon(horizon + 1)
+
+    deleted = 0
+    while True:
+        # The oldest changes first, along the primary key
+        ids = list(
+            IssueChange.objects.filter(transaction_id__lte=horizon)
+            .order_by("id")
+            .values_list("id", flat=True)[:BATCH_SIZE]
+        )
+        if not ids:
+            break
+        deleted += IssueChange.objects.filter(id__in=ids).delete()[0]
+
+    logger.info(f"Deleted {deleted} issue changes before transaction {horizon + 1}")
+    return deleted
@@ -1,19 +1,169 @@
+# Python imports
+import json
+import logging
+import time
+from collections import defaultdict
+from datetime import datetime
+from functools import lru_cache
+
 # Django imports
 from django.utils import timezone
 from django.apps import apps
 from django.conf import settings
-from django.db import models
-from django.db.models.fields.related import OneToOneRel
+from django.db import connection, transaction
+from django.db.models.signals import post_delete, post_save, pre_delete
 
 
 # Third party imports
 from celery import shared_task
 
+# Module imports
+from plane.settings.redis import acquire_lock, redis_instance, release_lock, renew_lock
+from plane.utils.exception_logger import log_exception
+
+logger = logging.getLogger("plane.worker")
+
+# Rows of a model whose related rows are updated by one statement per relation
+CASCADE_CHUNK_SIZE = 1000
+
+# Progress of the purge, to resume it after a worker restart
+HARD_DELETE_CHECKPOINT_KEY = "hard_delete:checkpoint"
+# Held while a purge runs, renewed after each chunk and while the purge waits for the database
+HARD_DELETE_LOCK_KEY = "hard_delete:lock"
+HARD_DELETE_LOCK_EXPIRY = 15 * 60
+
+
+def is_soft_deletable(model):
+    return any(field.name == "deleted_at" for field in model._meta.concrete_fields)
+
+
+@lru_cache(maxsize=None)
+def get_cascade_relations(model):
+    """
+    Reverse relations followed by the soft deletes of the rows of the model, computed once per model.
+    Returns:
+        tuple: (related model, foreign key name, on delete name) of each relation, skipping the relations
+        that do nothing and those cascading to models that are not soft deleted
+    """
+    relations = []
+    for relation in model._meta.get_fields():
+        if not ((relation.one_to_many or relation.one_to_one) and relation.auto_created and not relation.concrete):
+            continue
+
+        # Get the on_delete behavior name
+        on_delete_name = relation.on_delete.__name__ if hasattr(relation.on_delete, "__name__") else ""
+        if on_delete_name == "DO_NOTHING":
+            continue
+        if on_delete_name != "SET_NULL" and not is_soft_deletable(relation.related_model):
+            continue
+        relations.append((relation.related_model, relation.field.name, on_delete_name))
+    return tuple(relations)
+
+
+def set_deleted_at(queryset, deleted_at):
+    """
+    Set the deleted_at of the rows with one update, or with a save per row for the models with post_save
+    receivers, such as the memberships and the api tokens whose caches they invalidate
+    """
+    model = queryset.model
+    if post_save.has_listeners(model):
+        for related_obj in queryset:
+            related_obj.deleted_at = deleted_at
+            related_obj.save()
+        return
+
+    values = {"deleted_at": deleted_at}
+    if any(field.name == "updated_at" for field in model._meta.concrete_fields):
+        values["updated_at"] = timezone.now()
+    queryset.update(**values)
+
+
+def get_counted_issue_ids(queryset):
+    """
+    Issues whose counters count the rows of the queryset: the issues of the links, attachments and cycle
+    issues, and the parents of the issues
+    """
+    from plane.db.models import CycleIssue, FileAsset, Issue, IssueLink
+
+    field_name = {Issue: "parent_id", IssueLink: "issue_id", FileAsset: "issue_id", CycleIssue: "issue_id"}.get(
+        queryset.model
+    )
+    if field_name is None:
+        return []
+    return queryset.filter(**{f"{field_name}__isnull": False}).values_list(field_name, flat=True)
+
+
+def get_changed_issue_ids(queryset):
+    """
+    Issues changed along with the rows of the queryset for the change feeds, besides the counted ones: the
+    issues themselves, and the issues of the labels, assignees and modules
+    """
+    from plane.db.models import Issue, IssueAssignee, IssueLabel, ModuleIssue
+
+    field_name = {Issue: "pk", IssueLabel: "issue_id", IssueAssignee: "issue_id", ModuleIssue: "issue_id"}.get(
+        queryset.model
+    )
+    if field_name is None:
+        return []
+    return queryset.values_list(field_name, flat=True)
+
+
+def refresh_counted_issues(issue_ids):
+    """Recount the issues whose counted rows the cascade soft deleted or restored, chunk by chunk"""
+    from plane.db.models import refresh_issue_counters
+
+    issue_ids = list(issue_ids)
+    for start in range(0, len(issue_ids), CASCADE_CHUNK_SIZE):
+        try:
+            refresh_issue_counters(issue_ids[start : start + CASCADE_CHUNK_SIZE])
+        except Exception as e:
+            log_exception(e)
+
+
+def record_changed_issues(issue_ids):
+    """Log the changes of the issues the cascade changed for the change feeds, chunk by chunk"""
+    from plane.db.models import record_issue_changes
+
+    issue_ids = list(issue_ids)
+    for start in range(0, len(issue_ids), CASCADE_CHUNK_SIZE):
+        try:
+            record_issue_changes(issue_ids[start : start + CASCADE_CHUNK_SIZE])
+        except Exception as e:
+            log_exception(e)
+
+
+def walk_cascade(model, instance_pk, cascade):
+    """
+    Walk the rows reached through the cascade relations from the instance, level by level.
+    cascade(model, field_name, on_delete_name, chunk) updates the rows related to a chunk of pks of the model,
+    and returns the pks of the updated rows to walk next.
+    """
+    pending = {model: {instance_pk}}
+    walked = defaultdict(set)
+    while pending:
+        model, pks = pending.popitem()
+        # Rows reached through several relations are walked once
+        pks = list(pks - walked[model])
+        walked[model].update(pks)
+
+        for start in range(0, len(pks), CASCADE_CHUNK_SIZE):
+            chunk = pks[start : start + CASCADE_CHUNK_SIZE]
+            for related_model, field_name, on_delete_name in get_cascade_relations(model):
+                try:
+                    related_pks = cascade(related_model, field_name, on_delete_name, chunk)
+                except Exception as e:
+                    log_exception(e)
+                    continue
+                if related_pks:
+                    pending.setdefault(related_model, set()).update(related_pks)
+
 
 @shared_task
 def soft_delete_related_objects(app_label, model_name, instance_pk, using=None):
     """
-    Soft delete related objects for a given model instance
+    Soft delete related objects for a given model instance.
+    The related rows are soft deleted with the deleted_at of the instance, one update per relation and chunk
+    of rows, so that restore_related_objects finds the rows deleted along with it.
     """
     # Get the model class using app registry
     model_class = apps.get_model(app_label, model_name)
@@ -24,90 +174,90 @@ def soft_delete_related_objects(app_label, model_name, instance_pk, using=None):
     except model_class.DoesNotExist:
         return
 
-    # Get all related fields that are reverse relationships
-    all_related = [
-        f for f in instance._meta.get_fields() if (f.one_to_many or f.one_to_one) and f.auto_created and not f.concrete
-    ]
+    deleted_at = instance.deleted_at or timezone.now()
+    counted_issue_ids = set()
+    changed_issue_ids = set()
+
+    def cascade(related_model, field_name, on_delete_name, chunk):
+        related = related_model._base_manager.filter(**{f"{field_name}__in": chunk})
+        if is_soft_deletable(related_model):
+            related = related.filter(deleted_at__isnull=True)
+
+        if on_delete_name == "SET_NULL":
+            changed_issue_ids.update(get_changed_issue_ids(related))
+            related.update(**{field_name: None})
+            return None
+
+        # Handle CASCADE and other delete behaviors
+        counted_issue_ids.update(get_counted_issue_ids(related))
+        changed_issue_ids.update(get_changed_issue_ids(related))
+        set_deleted_at(related, deleted_at)
+        # The rows soft deleted now, the ones deleted before are left as they are
+        if get_cascade_relations(related_model):
+            return related_model._base_manager.filter(
+                **{f"{field_name}__in": chunk}, deleted_at=deleted_at
+            ).values_list("pk", flat=True)
+        return None
+
+    walk_cascade(model_class, instance.pk, cascade)
 
-    # Handle each related field
-    for relation in all_related:
-        related_name = relation.get_accessor_name()
+    # Finally, soft delete the instance itself if it hasn't been deleted yet
+    if hasattr(instance, "deleted_at") and not instance.deleted_at:
+        instance.deleted_at = deleted_at
+        instance.save()
 
-        # Skip if the relation doesn't exist
-        if not hasattr(instance, related_name):
-            continue
+    # The counters of the issues left count the rows deleted along no more
+    refresh_counted_issues(counted_issue_ids)
+    record_changed_issues(changed_issue_ids)
 
-        # Get the on_delete behavior name
-        on_delete_name = relation.on_delete.__name__ if hasattr(relation.on_delete, "__name__") else ""
 
-        if on_delete_name == "DO_NOTHING":
-            continue
+@shared_task
+def restore_related_objects(app_label, model_name, instance_pk, using=None):
+    """
+    Restore a soft deleted instance and the related objects soft deleted along with it, those with its
+    deleted_at. The relations set to null by the delete stay null.
+    """
+    model_class = apps.get_model(app_label, model_name)
 
-        elif on_delete_name == "SET_NULL":
-            # Handle SET_NULL relationships
-            if isinstance(relation, OneToOneRel):
-                # For OneToOne relationships
-                related_obj = getattr(instance, related_name, None)
-                if related_obj and isinstance(related_obj, models.Model):
-                    setattr(related_obj, relation.remote_field.name, None)
-                    related_obj.save(update_fields=[relation.remote_field.name])
-            else:
-                # For other relationships
-                related_queryset = getattr(instance, related_name).all()
-                related_queryset.update(**{relation.remote_field.name: None})
+    try:
+        instance = model_class.all_objects.get(pk=instance_pk)
+    except model_class.DoesNotExist:
+        return
 
-        else:
-            # Handle CASCADE and other delete behaviors
-            try:
-                if relation.one_to_one:
-                    # Handle OneToOne relationships
-                    related_obj = getattr(instance, related_name, None)
-                    if related_obj:
-                        if hasattr(related_obj, "deleted_at"):
-                            if not related_obj.deleted_at:
-                                related_obj.deleted_at = timezone.now()
-                                related_obj.save()
-                                # Recursively handle related objects
-                                soft_delete_related_objects(
-                                    related_obj._meta.app_label,
-                                    related_obj._meta.model_name,
-                                    related_obj.pk,
-                                    using,
-                                )
-                else:
-                    # Handle other relationships
-                    related_queryset = getattr(instance, related_name)(manager="objects").all()
-
-                    for related_obj in related_queryset:
-                        if hasattr(related_obj, "deleted_at"):
-                            if not related_obj.deleted_at:
-                                related_obj.deleted_at = timezone.now()
-                                related_obj.save()
-                                # Recursively handle related objects
-                                soft_delete_related_objects(
-                                    related_obj._meta.app_label,
-                                    related_obj._meta.model_name,
-                                    related_obj.pk,
-                                    using,
-                                )
-            except Exception as e:
-                # Log the error or handle as needed
-                print(f"Error handling relation {related_name}: {str(e)}")
-                continue
+    deleted_at = instance.deleted_at
+    if deleted_at is None:
+        return
 
-    # Finally, soft delete the instance itself if it hasn't been deleted yet
-    if hasattr(instance, "deleted_at") and not instance.deleted_at:
-        instance.deleted_at = timezone.now()
-        instance.save()
+    counted_issue_ids = set()
+    changed_issue_ids = set()
 
+    def cascade(related_model, field_name, on_delete_name, chunk):
+        if on_delete_name == "SET_NULL":
+            return None
 
-# @shared_task
-def restore_related_objects(app_label, model_name, instance_pk, using=None):
-    pass
+        related = related_model._base_manager.filter(**{f"{field_name}__in": chunk}, deleted_at=deleted_at)
+        # Read before the update, the restored rows are not told apart from the others afterwards
+        related_pks = list(related.values_list("pk", flat=True)) if get_cascade_relations(related_model) else None
+        counted_issue_ids.update(get_counted_issue_ids(related))
+        changed_issue_ids.update(get_changed_issue_ids(related))
+        set_deleted_at(related, None)
+        return related_pks
 
+    walk_cascade(model_class, instance.pk, cascade)
 
-@shared_task
-def hard_delete():
+    instance.deleted_at = None
+    instance.save()
+
+    # The restored issues and the issues of the restored rows are recounted
+    refresh_counted_issues(counted_issue_ids)
+    record_changed_issues(changed_issue_ids)
+
+
+def get_purge_models():
+    """
+    Soft deletable models in the order of the purge, the containers first so that their rows take the
+    rows below them along, then every other model
+    """
     from plane.db.models import (
         Workspace,
         Project,
@@ -129,61 +279,220 @@ def hard_delete():
         EstimatePoint,
     )
 
-    days = settings.HARD_DELETE_AFTER_DAYS
-    # check delete workspace
-    _ = Workspace.all_objects.filter(deleted_at__lt=timezone.now() - timezone.timedelta(days=days)).delete()
-
-    # check delete project
-    _ = Project.all_objects.filter(deleted_at__lt=timezone.now() - timezone.timedelta(days=days)).delete()
-
-    # check delete cycle
-    _ = Cycle.all_objects.filter(deleted_at__lt=timezone.now() - timezone.timedelta(days=days)).delete()
-
-    # check delete module
-    _ = Module.all_objects.filter(deleted_at__lt=timezone.now() - timezone.timedelta(days=days)).delete()
-
-    # check delete issue
-    _ = Issue.all_objects.filter(deleted_at__lt=timezone.now() - timezone.timedelta(days=days)).delete()
-
-    # check delete page
-    _ = Page.all_objects.filter(deleted_at__lt=timezone.now() - timezone.timedelta(days=days)).delete()
-
-    # check delete view
-    _ = IssueView.all_objects.filter(deleted_at__lt=timezone.now() - timezone.timedelta(days=days)).delete()
-
-    # check delete label
-    _ = Label.all_objects.filter(deleted_at__lt=timezone.now() - timezone.timedelta(days=days)).delete()
-
-    # check delete state
-    _ = State.all_objects.filter(deleted_at__lt=timezone.now() - timezone.timedelta(days=days)).delete()
+    models = [
+        Workspace,
+        Project,
+        Cycle,
+        Module,
+        Issue,
+        Page,
+        IssueView,
+        Label,
+        State,
+        IssueActivity,
+        IssueComment,
+        IssueLink,
+        IssueReaction,
+        UserFavorite,
+        ModuleIssue,
+        CycleIssue,
+        Estimate,
+        EstimatePoint,
+    ]
+    models += [model for model in apps.get_models() if is_soft_deletable(model) and model not in models]
+    return models
 
-    _ = IssueActivity.all_objects.filter(deleted_at__lt=timezone.now() - timezone.timedelta(days=days)).delete()
 
-    _ = IssueComment.all_objects.filter(deleted_at__lt=timezone.now() - timezone.timedelta(days=days)).delete()
+@lru_cache(maxsize=None)
+def get_delete_relations(model):
+    """
+    Reverse relations the database delete of the rows of the model has to handle first, as Django's
+    collector does, the auto created many to many tables included.
+    Returns:
+        tuple: (related model, foreign key name, on delete name) of each relation, skipping the relations
+        that do nothing. The nullable ones, such as the activities of a work item kept once it is deleted, are
+        set to null, the foreign key constraint of the database would fail the delete otherwise.
+    """
+    relations = []
+    for relation in model._meta.get_fields(include_hidden=True):
+        if not ((relation.one_to_many or relation.one_to_one) and relation.auto_created and not relation.concrete):
+            continue
 
-    _ = IssueLink.all_objects.filter(deleted_at__lt=timezone.now() - timezone.timedelta(days=days)).delete()
+        on_delete_name = relation.on_delete.__name__ if hasattr(relation.on_delete, "__name__") else ""
+        if on_delete_name == "DO_NOTHING":
+            if not relation.field.null:
+                continue
+            on_delete_name = "SET_NULL"
+        relations.append((relation.related_model, relation.field.name, on_delete_name))
+    return tuple(relations)
 
-    _ = IssueReaction.all_objects.filter(deleted_at__lt=timezone.now() - timezone.timedelta(days=days)).delete()
 
-    _ = UserFavorite.all_objects.filter(deleted_at__lt=timezone.now() - timezone.timedelta(days=days)).delete()
+def purge_rows(model, pks, deleted):
+    """
+    Delete the rows of the model with the pks from the database, after the rows depending on them, chunk by
+    chunk of dependent rows. Each statement commits on its own so that no lock is held for the whole cascade,
+    an interrupted purge leaves soft deleted rows with fewer dependents to the next one.
+    The rows of the models with delete receivers, such as the memberships, are deleted through Django so that
+    the receivers run. deleted counts the deleted rows per model label.
+    """
+    if post_delete.has_listeners(model) or pre_delete.has_listeners(model):
+        _, counts = model._base_manager.filter(pk__in=pks).delete()
+        for label, count in counts.items():
+            deleted[label.lower()] += count
+        return
 
-    _ = ModuleIssue.all_objects.filter(deleted_at__lt=timezone.now() - timezone.timedelta(days=days)).delete()
+    for related_model, field_name, on_delete_name in get_delete_relations(model):
+        related = related_model._base_manager.filter(**{f"{field_name}__in": pks})
+        if related_model is model:
+            related = related.exclude(pk__in=pks)
 
-    _ = CycleIssue.all_objects.filter(deleted_at__lt=timezone.now() - timezone.timedelta(days=days)).delete()
+        if on_delete_name == "SET_NULL":
+            with transaction.atomic():
+                related.update(**{field_name: None})
+            continue
 
-    _ = Estimate.all_objects.filter(deleted_at__lt=timezone.now() - timezone.timedelta(days=days)).delete()
+        # Handle CASCADE and the others, the protected rows fail the delete of the chunk
+        while True:
+            related_pks = list(related.values_list("pk", flat=True)[: settings.HARD_DELETE_CHUNK_SIZE])
+            if not related_pks:
+                break
+            purge_rows(related_model, related_pks, deleted)
+
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute(
+            f"DELETE FROM {connection.ops.quote_name(model._meta.db_table)} "
+            f"WHERE {connection.ops.quote_name(model._meta.pk.column)} = ANY(%s)",
+            [list(pks)],
+        )
+        deleted[model._meta.label_lower] += cursor.rowcount
+
+
+def get_active_queries():
+    """Number of the other queries running on the database of the app"""
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT count(*) FROM pg_stat_activity "
+            "WHERE state = 'active' AND datname = current_database() AND pid <> pg_backend_pid()"
+        )
+        return cursor.fetchone()[0]
+
+
+def throttle(duration, keepalive=None):
+    """
+    Pause after a chunk for a share of the time it took, so that a loaded database, slower to delete,
+    gets longer pauses, and wait while the database runs more queries than allowed, for at most
+    HARD_DELETE_THROTTLE_MAX_WAIT seconds. keepalive is called before every wait.
+    Returns:
+        bool: False when the purge should stop, the database staying busy or keepalive returning False
+    """
+    time.sleep(duration * settings.HARD_DELETE_THROTTLE_RATIO)
+    if not settings.HARD_DELETE_MAX_ACTIVE_QUERIES:
+        return True
+    waited = 0
+    while get_active_queries() > settings.HARD_DELETE_MAX_ACTIVE_QUERIES:
+        if waited >= settings.HARD_DELETE_THROTTLE_MAX_WAIT:
+            return False
+        if keepalive is not None and not keepalive():
+            return False
+        time.sleep(settings.HARD_DELETE_THROTTLE_WAIT)
+        waited += settings.HARD_DELETE_THROTTLE_WAIT
+    return True
+
+
+def purge_model(model, cutoff, last_pk, ri, keepalive):
+    """
+    Purge the rows of the model soft deleted before the cutoff, in chunks of pks ordered from the last
+    purged pk, saving the checkpoint after each chunk. The purge is interrupted when keepalive returns
+    False or the database stays busy, and resumes from the checkpoint on the next run.
+    """
+    label = model._meta.label_lower
+    metrics = {"model": label, "rows": 0, "cascaded": 0, "chunks": 0, "failed_chunks": 0, "interrupted": False}
+    started_at = time.monotonic()
+    deleted = defaultdict(int)
+
+    rows = model.all_objects.filter(deleted_at__lt=cutoff).order_by("pk").values_list("pk", flat=True)
+    while True:
+        chunk = rows.filter(pk__gt=last_pk) if last_pk is not None else rows
+        pks = list(chunk[: settings.HARD_DELETE_CHUNK_SIZE])
+        if not pks:
+            break
+
+        chunk_started_at = time.monotonic()
+        try:
+            purge_rows(model, pks, deleted)
+        except Exception as e:
+            # The chunk is skipped, its rows are tried again on the next purge
+            metrics["failed_chunks"] += 1
+            log_exception(e)
+        metrics["chunks"] += 1
+        last_pk = pks[-1]
+
+        ri.set(
+            HARD_DELETE_CHECKPOINT_KEY,
+            json.dumps({"cutoff": cutoff.isoformat(), "model": label, "pk": str(last_pk)}),
+        )
+        if not keepalive() or not throttle(time.monotonic() - chunk_started_at, keepalive):
+            metrics["interrupted"] = True
+            break
+
+    metrics["rows"] = deleted.pop(label, 0)
+    metrics["cascaded"] = sum(deleted.values())
+    metrics["duration"] = round(time.monotonic() - started_at, 3)
+    if metrics["chunks"]:
+        logger.info(
+            "Hard delete %s: %s rows and %s cascaded rows in %s chunks (%s failed) in %ss",
+            label,
+            metrics["rows"],
+            metrics["cascaded"],
+            metrics["chunks"],
+            metrics["failed_chunks"],
+            metrics["duration"],
+        )
+    return metrics
 
-    _ = EstimatePoint.all_objects.filter(deleted_at__lt=timezone.now() - timezone.timedelta(days=days)).delete()
 
-    # at last, check for every thing which ever is left and delete it
-    # Get all Django models
-    all_models = apps.get_models()
+@shared_task
+def hard_delete():
+    """
+    Purge the rows soft deleted more than HARD_DELETE_AFTER_DAYS ago, model by model in chunks of pks.
+    The checkpoint saved after each chunk lets a purge interrupted by a worker restart, or by a database
+    staying busy, resume where it stopped, with the same cutoff, on the next run.
+    Returns:
+        list: the metrics of each model
+    """
+    ri = redis_instance()
+    token = acquire_lock(HARD_DELETE_LOCK_KEY, HARD_DELETE_LOCK_EXPIRY)
+    if token is None:
+        logger.info("Hard delete already running")
+        return []
 
-    # Iterate through all models
-    for model in all_models:
-        # Check if the model has a 'deleted_at' field
-        if hasattr(model, "deleted_at"):
-            # Get all instances where 'deleted_at' is greater than 30 days ago
-            _ = model.all_objects.filter(deleted_at__lt=timezone.now() - timezone.timedelta(days=days)).delete()
+    def keepalive():
+        return renew_lock(HARD_DELETE_LOCK_KEY, token, HARD_DELETE_LOCK_EXPIRY)
 
-    return
+    try:
+        models = get_purge_models()
+        checkpoint = ri.get(HARD_DELETE_CHECKPOINT_KEY)
+        last_pk = None
+        if checkpoint:
+            checkpoint = json.loads(checkpoint)
+            cutoff = datetime.fromisoformat(checkpoint["cutoff"])
+            model = apps.get_model(checkpoint["model"])
+            if model in models:
+                models = models[models.index(model) :]
+                last_pk = checkpoint["pk"]
+            logger.info("Hard delete resuming from %s after %s", checkpoint["model"], checkpoint["pk"])
+        else:
+            cutoff = timezone.now() - timezone.timedelta(days=settings.HARD_DELETE_AFTER_DAYS)
+
+        metrics = []
+        for model in models:
+            metrics.append(purge_model(model, cutoff, last_pk, ri, keepalive))
+            last_pk = None
+            if metrics[-1]["interrupted"]:
+                logger.info("Hard delete interrupted in %s, resuming on the next run", metrics[-1]["model"])
+                return metrics
+
+        ri.delete(HARD_DELETE_CHECKPOINT_KEY)
+        return metrics
+    finally:
+        release_lock(HARD_DELETE_LOCK_KEY, token)
@@ -33,6 +33,9 @@ from plane.db.models import (
     PageLabel,
     Intake,
     IntakeIssue,
+    record_issue_changes,
+    refresh_issue_counters,
+    reserve_issue_sequences,
 )
 from plane.db.models.intake import SourceType
 
@@ -273,10 +276,8 @@ def create_issues(workspace, project, user_id, issue_count):
 
     issues = []
 
-    # Get the maximum sequence_id
-    last_id = IssueSequence.objects.filter(project=project).aggregate(largest=Max("sequence"))["largest"]
-
-    last_id = 1 if last_id is None else last_id + 1
+    # Reserve the sequence ids
+    last_id = reserve_issue_sequences(project.id, issue_count)
 
     # Get the maximum sort order
     largest_sort_order = Issue.objects.filter(
@@ -448,6 +449,7 @@ def create_cycle_issues(workspace, project, user_id, issue_count):
 
     # Issue assignees
     CycleIssue.objects.bulk_create(bulk_cycle_issues, batch_size=1000, ignore_conflicts=True)
+    refresh_issue_counters(issues)
 
 
 def create_module_issues(workspace, project, user_id, issue_count):
@@ -478,6 +480,8 @@ def create_module_issues(workspace, project, user_id, issue_count):
             )
     # Issue assignees
     ModuleIssue.objects.bulk_create(bulk_module_issues, batch_size=1000, ignore_conflicts=True)
+    # The issues are complete, for the change feeds of the project
+    record_issue_changes(issues)
 
 
 @shared_task
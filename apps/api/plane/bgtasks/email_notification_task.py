@@ -39,45 +39,61 @@ def release_lock(lock_id):
     redis_client.delete(lock_id)
 
 
+# Pending logs read per round trip, and marked as processed per UPDATE
+EMAIL_NOTIFICATION_CHUNK_SIZE = 2000
+# Issues emailed by one send_email_notification_batch task
+EMAIL_NOTIFICATION_BATCH_SIZE = 50
+
+
 @shared_task
 def stack_email_notification():
-    # get all email notifications
-    email_notifications = EmailNotificationLog.objects.filter(processed_at__isnull=True).order_by("receiver").values()
-
-    # Create the below format for each of the issues
+    """
+    Group the pending notifications by receiver and issue in a single pass over the logs ordered by receiver,
+    and dispatch the emails of every receiver in batches as soon as all of their logs are read
+    """
+    email_notifications = (
+        EmailNotificationLog.objects.filter(processed_at__isnull=True)
+        .order_by("receiver_id", "entity_identifier", "created_at")
+        .values_list("id", "receiver_id", "entity_identifier", "triggered_by_id", "data")
+        .iterator(chunk_size=EMAIL_NOTIFICATION_CHUNK_SIZE)
+    )
+
+    # Create the below format for each of the issues of the receiver
     # {"issue_id" : { "actor_id1": [ { data }, { data } ], "actor_id2": [ { data }, { data } ] }}
+    receiver_id = None
+    payload = {}
+    dispatched_notifications = []
+    for notification_id, notification_receiver_id, issue_id, triggered_by_id, data in email_notifications:
+        if notification_receiver_id != receiver_id:
+            dispatched_notifications.extend(dispatch_email_notifications(receiver_id, payload))
+            receiver_id = notification_receiver_id
+            payload = {}
+
+            if len(dispatched_notifications) >= EMAIL_NOTIFICATION_CHUNK_SIZE:
+                mark_email_notifications_processed(dispatched_notifications)
+                dispatched_notifications = []
+
+        issue = payload.setdefault(str(issue_id), {"notification_data": {}, "email_notification_ids": []})
+        issue["notification_data"].setdefault(str(triggered_by_id), []).append(data)
+        issue["email_notification_ids"].append(str(notification_id))
+
+    dispatched_notifications.extend(dispatch_email_notifications(receiver_id, payload))
+    mark_email_notifications_processed(dispatched_notifications)
 
-    # Convert to unique receivers list
-    receivers = list(set([str(notification.get("receiver_id")) for notification in email_notifications]))
-    processed_notifications = []
-    # Loop through all the issues to create the emails
-    for receiver_id in receivers:
-        # Notification triggered for the receiver
-        receiver_notifications = [
-            notification for notification in email_notifications if str(notification.get("receiver_id")) == receiver_id
-        ]
-        # create payload for all issues
-        payload = {}
-        email_notification_ids = []
-        for receiver_notification in receiver_notifications:
-            payload.setdefault(receiver_notification.get("entity_identifier"), {}).setdefault(
-                str(receiver_notification.get("triggered_by_id")), []
-            ).append(receiver_notification.get("data"))
-            # append processed notifications
-            processed_notifications.append(receiver_notification.get("id"))
-            email_notification_ids.append(receiver_notification.get("id"))
-
-        # Create emails for all the issues
-        for issue_id, notification_data in payload.items():
-            send_email_notification.delay(
-                issue_id=issue_id,
-                notification_data=notification_data,
-                receiver_id=receiver_id,
-                email_notification_ids=email_notification_ids,
-            )
-
-    # Update the email notification log
-    EmailNotificationLog.objects.filter(pk__in=processed_notifications).update(processed_at=timezone.now())
+
+def dispatch_email_notifications(receiver_id, payload):
+    """Queue the emails of every issue of the receiver in batches, return the ids of the dispatched logs"""
+    issues = [{"issue_id": issue_id, **issue} for issue_id, issue in payload.items()]
+    for start in range(0, len(issues), EMAIL_NOTIFICATION_BATCH_SIZE):
+        send_email_notification_batch.delay(
+            receiver_id=str(receiver_id), issues=issues[start : start + EMAIL_NOTIFICATION_BATCH_SIZE]
+        )
+    return [notification_id for issue in issues for notification_id in issue["email_notification_ids"]]
+
+
+def mark_email_notifications_processed(email_notification_ids):
+    if email_notification_ids:
+        EmailNotificationLog.objects.filter(pk__in=email_notification_ids).update(processed_at=timezone.now())
 
 
 def create_payload(notification_data):
@@ -147,6 +163,52 @@ def process_html_content(content):
 
 @shared_task
 def send_email_notification(issue_id, notification_data, receiver_id, email_notification_ids):
+    send_issue_email_notification(
+        issue_id, notification_data, receiver_id, email_notification_ids, get_email_configuration()
+    )
+
+
+@shared_task
+def send_email_notification_batch(receiver_id, issues):
+    """Email the updates of a batch of issues to the receiver over one SMTP connection"""
+    email_configuration = get_email_configuration()
+    try:
+        with get_email_connection(email_configuration) as connection:
+            for issue in issues:
+                send_issue_email_notification(
+                    receiver_id=receiver_id,
+                    email_configuration=email_configuration,
+                    connection=connection,
+                    **issue,
+                )
+    except Exception as e:
+        log_exception(e)
+        return
+
+
+def get_email_connection(email_configuration):
+    (
+        EMAIL_HOST,
+        EMAIL_HOST_USER,
+        EMAIL_HOST_PASSWORD,
+        EMAIL_PORT,
+        EMAIL_USE_TLS,
+        EMAIL_USE_SSL,
+        _,
+    ) = email_configuration
+    return get_connection(
+        host=EMAIL_HOST,
+        port=int(EMAIL_PORT),
+        username=EMAIL_HOST_USER,
+        password=EMAIL_HOST_PASSWORD,
+        use_tls=EMAIL_USE_TLS == "1",
+        use_ssl=EMAIL_USE_SSL == "1",
+    )
+
+
+def send_issue_email_notification(
+    issue_id, notification_data, receiver_id, email_notification_ids, email_configuration, connection=None
+):
     # Convert UUIDs to a sorted, concatenated string
     sorted_ids = sorted(email_notification_ids)
     ids_str = "_".join(str(id) for id in sorted_ids)
@@ -157,7 +219,8 @@ def send_email_notification(issue_id, notification_data, receiver_id, email_noti
         if acquire_lock(lock_id=lock_id):
             # get the redis instance
             ri = redis_instance()
-            base_api = ri.get(str(issue_id)).decode() if ri.get(str(issue_id)) else None
+            base_api = ri.get(str(issue_id))
+            base_api = base_api.decode() if base_api else None
 
             # Skip if base api is not present
             if not base_api:
@@ -165,16 +228,7 @@ def send_email_notification(issue_id, notification_data, receiver_id, email_noti
 
             data = create_payload(notification_data=notification_data)
 
-            # Get email configurations
-            (
-                EMAIL_HOST,
-                EMAIL_HOST_USER,
-                EMAIL_HOST_PASSWORD,
-                EMAIL_PORT,
-                EMAIL_USE_TLS,
-                EMAIL_USE_SSL,
-                EMAIL_FROM,
-            ) = get_email_configuration()
+            EMAIL_FROM = email_configuration[-1]
 
             receiver = User.objects.get(pk=receiver_id)
             issue = Issue.objects.get(pk=issue_id)
@@ -259,14 +313,8 @@ def send_email_notification(issue_id, notification_data, receiver_id, email_noti
             text_content = strip_tags(html_content)
 
             try:
-                connection = get_connection(
-                    host=EMAIL_HOST,
-                    port=int(EMAIL_PORT),
-                    username=EMAIL_HOST_USER,
-                    password=EMAIL_HOST_PASSWORD,
-                    use_tls=EMAIL_USE_TLS == "1",
-                    use_ssl=EMAIL_USE_SSL == "1",
-                )
+                # Batches share the connection of the whole batch
+                connection = connection or get_email_connection(email_configuration)
 
                 msg = EmailMultiAlternatives(
                     subject=subject,
@@ -1,7 +1,7 @@
 # Python imports
-import io
+import tempfile
 import zipfile
-from typing import List
+from typing import IO, List
 import boto3
 from botocore.client import Config
 from uuid import UUID
@@ -12,32 +12,34 @@ from celery import shared_task
 # Django imports
 from django.conf import settings
 from django.utils import timezone
-from django.db.models import Prefetch
+from django.db.models import Prefetch, QuerySet
 
 # Module imports
-from plane.db.models import ExporterHistory, Issue, IssueComment, IssueRelation, IssueSubscriber
+from plane.db.models import ExporterHistory, Issue, IssueComment, IssueLabel, IssueRelation, IssueSubscriber
 from plane.utils.exception_logger import log_exception
 from plane.utils.porters.exporter import DataExporter
 from plane.utils.porters.serializers.issue import IssueExportSerializer
 
 
-def create_zip_file(files: List[tuple[str, str | bytes]]) -> io.BytesIO:
+def create_zip_file(exporter: DataExporter, exports: List[tuple[str, QuerySet]]) -> IO[bytes]:
     """
-    Create a ZIP file from the provided files.
+    Create a ZIP file of the exports of the querysets, streamed chunk by chunk into a
+    temporary file that is kept in memory up to EXPORT_SPOOL_MAX_SIZE.
     """
-    zip_buffer = io.BytesIO()
-    with zipfile.ZipFile(zip_buffer, "w", zipfile.ZIP_DEFLATED) as zipf:
-        for filename, file_content in files:
-            zipf.writestr(filename, file_content)
+    zip_file = tempfile.SpooledTemporaryFile(max_size=settings.EXPORT_SPOOL_MAX_SIZE)
+    with zipfile.ZipFile(zip_file, "w", zipfile.ZIP_DEFLATED) as zipf:
+        for filename, queryset in exports:
+            with zipf.open(f"{filename}.{exporter.formatter.extension}", "w", force_zip64=True) as entry:
+                exporter.write(queryset, entry, chunk_size=settings.EXPORT_CHUNK_SIZE)
 
-    zip_buffer.seek(0)
-    return zip_buffer
+    zip_file.seek(0)
+    return zip_file
 
 
 # TODO: Change the upload_to_s3 function to use the new storage method with entry in file asset table
-def upload_to_s3(zip_file: io.BytesIO, workspace_id: UUID, token_id: str, slug: str) -> None:
+def upload_to_s3(zip_file: IO[bytes], workspace_id: UUID, token_id: str, slug: str) -> None:
     """
-    Upload a ZIP file to S3 and generate a presigned URL.
+    Upload a ZIP file to S3, in parts once it is larger than the multipart threshold, and generate a presigned URL.
     """
     file_name = f"{workspace_id}/export-{slug}-{token_id[:6]}-{str(timezone.now().date())}.zip"
     expires_in = 7 * 24 * 60 * 60
@@ -120,6 +122,58 @@ def upload_to_s3(zip_file: io.BytesIO, workspace_id: UUID, token_id: str, slug:
     exporter_instance.save(update_fields=["status", "url", "key"])
 
 
+def get_issue_export_queryset(workspace_id: UUID, project_ids: List[str], member_id: UUID) -> QuerySet:
+    """
+    Issues of the projects the member is active in, with the relations the export serializer reads.
+    """
+    return (
+        Issue.objects.filter(
+            workspace__id=workspace_id,
+            project_id__in=project_ids,
+            project__project_projectmember__member=member_id,
+            project__project_projectmember__is_active=True,
+            project__archived_at__isnull=True,
+        )
+        .select_related(
+            "project",
+            "workspace",
+            "state",
+            "created_by",
+            "estimate_point",
+        )
+        .prefetch_related(
+            Prefetch(
+                "label_issue",
+                queryset=IssueLabel.objects.select_related("label"),
+            ),
+            "issue_cycle__cycle",
+            "issue_module__module",
+            "assignees",
+            "issue_link",
+            Prefetch(
+                "issue_subscribers",
+                queryset=IssueSubscriber.objects.select_related("subscriber"),
+            ),
+            Prefetch(
+                "issue_comments",
+                queryset=IssueComment.objects.select_related("actor").order_by("created_at"),
+            ),
+            Prefetch(
+                "issue_relation",
+                queryset=IssueRelation.objects.select_related("related_issue", "related_issue__project"),
+            ),
+            Prefetch(
+                "issue_related",
+                queryset=IssueRelation.objects.select_related("issue", "issue__project"),
+            ),
+            Prefetch(
+                "parent",
+                queryset=Issue.objects.select_related("type", "project"),
+            ),
+        )
+    )
+
+
 @shared_task
 def issue_export_task(
     provider: str,
@@ -141,49 +195,7 @@ def issue_export_task(
         exporter_instance.save(update_fields=["status"])
 
         # Build base queryset for issues
-        workspace_issues = (
-            Issue.objects.filter(
-                workspace__id=workspace_id,
-                project_id__in=project_ids,
-                project__project_projectmember__member=exporter_instance.initiated_by_id,
-                project__project_projectmember__is_active=True,
-                project__archived_at__isnull=True,
-            )
-            .select_related(
-                "project",
-                "workspace",
-                "state",
-                "created_by",
-                "estimate_point",
-            )
-            .prefetch_related(
-                "labels",
-                "issue_cycle__cycle",
-                "issue_module__module",
-                "assignees",
-                "issue_link",
-                Prefetch(
-                    "issue_subscribers",
-                    queryset=IssueSubscriber.objects.select_related("subscriber"),
-                ),
-                Prefetch(
-                    "issue_comments",
-                    queryset=IssueComment.objects.select_related("actor").order_by("created_at"),
-                ),
-                Prefetch(
-                    "issue_relation",
-                    queryset=IssueRelation.objects.select_related("related_issue", "related_issue__project"),
-                ),
-                Prefetch(
-                    "issue_related",
-                    queryset=IssueRelation.objects.select_related("issue", "issue__project"),
-                ),
-                Prefetch(
-                    "parent",
-                    queryset=Issue.objects.select_related("type", "project"),
-                ),
-            )
-        )
+        workspace_issues = get_issue_export_queryset(workspace_id, project_ids, exporter_instance.initiated_by_id)
 
         # Create exporter for the specified format
         try:
@@ -196,22 +208,17 @@ def issue_export_task(
             exporter_instance.save(update_fields=["status", "reason"])
             return
 
-        files = []
         if multiple:
             # Export each project separately with its own queryset
-            for project_id in project_ids:
-                project_issues = workspace_issues.filter(project_id=project_id)
-                export_filename = f"{slug}-{project_id}"
-                filename, content = exporter.export(export_filename, project_issues)
-                files.append((filename, content))
+            exports = [
+                (f"{slug}-{project_id}", workspace_issues.filter(project_id=project_id)) for project_id in project_ids
+            ]
         else:
             # Export all issues in a single file
-            export_filename = f"{slug}-{workspace_id}"
-            filename, content = exporter.export(export_filename, workspace_issues)
-            files.append((filename, content))
+            exports = [(f"{slug}-{workspace_id}", workspace_issues)]
 
-        zip_buffer = create_zip_file(files)
-        upload_to_s3(zip_buffer, workspace_id, token_id, slug)
+        with create_zip_file(exporter, exports) as zip_file:
+            upload_to_s3(zip_file, workspace_id, token_id, slug)
 
     except Exception as e:
         exporter_instance = ExporterHistory.objects.get(token=token_id)
@@ -1,5 +1,7 @@
 # Python imports
 import json
+from contextlib import contextmanager
+from contextvars import ContextVar
 
 
 # Third Party imports
@@ -27,9 +29,12 @@ from plane.db.models import (
     State,
     User,
     EstimatePoint,
+    record_issue_changes,
 )
-from plane.settings.redis import redis_instance
+from plane.settings.redis import redis_pipeline
+from plane.utils.analytics_rollup import ANALYTICS_DIRTY_ISSUES_KEY
 from plane.utils.exception_logger import log_exception
+from plane.utils.progress_counters import get_changed_containers, refresh_progress_counters
 from plane.utils.issue_relation_mapper import get_inverse_relation
 from plane.utils.uuid import is_valid_uuid
 
@@ -1495,6 +1500,132 @@ def create_intake_activity(
         )
 
 
+ACTIVITY_MAPPER = {
+    "issue.activity.created": create_issue_activity,
+    "issue.activity.updated": update_issue_activity,
+    "issue.activity.deleted": delete_issue_activity,
+    "comment.activity.created": create_comment_activity,
+    "comment.activity.updated": update_comment_activity,
+    "comment.activity.deleted": delete_comment_activity,
+    "cycle.activity.created": create_cycle_issue_activity,
+    "cycle.activity.deleted": delete_cycle_issue_activity,
+    "module.activity.created": create_module_issue_activity,
+    "module.activity.deleted": delete_module_issue_activity,
+    "link.activity.created": create_link_activity,
+    "link.activity.updated": update_link_activity,
+    "link.activity.deleted": delete_link_activity,
+    "attachment.activity.created": create_attachment_activity,
+    "attachment.activity.deleted": delete_attachment_activity,
+    "issue_relation.activity.created": create_issue_relation_activity,
+    "issue_relation.activity.deleted": delete_issue_relation_activity,
+    "issue_reaction.activity.created": create_issue_reaction_activity,
+    "issue_reaction.activity.deleted": delete_issue_reaction_activity,
+    "comment_reaction.activity.created": create_comment_reaction_activity,
+    "comment_reaction.activity.deleted": delete_comment_reaction_activity,
+    "issue_vote.activity.created": create_issue_vote_activity,
+    "issue_vote.activity.deleted": delete_issue_vote_activity,
+    "issue_draft.activity.created": create_draft_issue_activity,
+    "issue_draft.activity.updated": update_draft_issue_activity,
+    "issue_draft.activity.deleted": delete_draft_issue_activity,
+    "intake.activity.created": create_intake_activity,
+}
+
+# Maximum number of activity events processed by one issue_activity_batch task
+ISSUE_ACTIVITY_BATCH_SIZE = 500
+
+# Events collected by batch_issue_activities, None when no batch is open
+_buffered_activity_events = ContextVar("buffered_activity_events", default=None)
+
+
+def process_issue_activities(events):
+    """
+    Create the activities of a batch of events with one project lookup,
+    one updated_at update, one change log insert and one bulk insert for the whole batch.
+    """
+    events = [event for event in events if is_valid_uuid(str(event["project_id"]))]
+    if not events:
+        return
+
+    workspace_ids = {
+        str(project_id): workspace_id
+        for project_id, workspace_id in Project.objects.filter(
+            pk__in={str(event["project_id"]) for event in events}
+        ).values_list("id", "workspace_id")
+    }
+    events = [event for event in events if str(event["project_id"]) in workspace_ids]
+
+    issue_events = [event for event in events if event.get("issue_id") is not None]
+    if issue_events:
+        # set the request origin in redis
+        with redis_pipeline() as pipeline:
+            for event in issue_events:
+                if event.get("origin"):
+                    pipeline.set(str(event["issue_id"]), event["origin"], ex=600)
+            # mark the issues for the refresh of the analytics facts
+            pipeline.sadd(ANALYTICS_DIRTY_ISSUES_KEY, *{str(event["issue_id"]) for event in issue_events})
+        try:
+            issue_ids = {str(event["issue_id"]) for event in issue_events}
+            Issue.objects.filter(pk__in=issue_ids).update(updated_at=timezone.now())
+            # Logged for the change feeds along with the activities, after the changes made around the issues
+            # such as their modules, labels and relations
+            record_issue_changes(issue_ids)
+        except Exception:
+            pass
+
+    event_activities = []
+    for event in events:
+        issue_activities = []
+        func = ACTIVITY_MAPPER.get(event["type"])
+        if func is not None:
+            try:
+                func(
+                    requested_data=event.get("requested_data"),
+                    current_instance=event.get("current_instance"),
+                    issue_id=event.get("issue_id"),
+                    project_id=event["project_id"],
+                    workspace_id=workspace_ids[str(event["project_id"])],
+                    actor_id=event.get("actor_id"),
+                    issue_activities=issue_activities,
+                    epoch=event.get("epoch"),
+                )
+            except Exception as e:
+                # A malformed event must not drop the rest of the batch
+                log_exception(e)
+                continue
+        event_activities.append((event, issue_activities))
+
+    # Save all the values to database
+    IssueActivity.objects.bulk_create(
+        [activity for _, issue_activities in event_activities for activity in issue_activities]
+    )
+
+    # Recount the progress of the cycles and modules of the changed issues
+    try:
+        cycle_ids, module_ids = get_changed_containers(events)
+        if cycle_ids:
+            refresh_progress_counters(Cycle, cycle_ids)
+        if module_ids:
+            refresh_progress_counters(Module, module_ids)
+    except Exception as e:
+        log_exception(e)
+
+    for event, issue_activities_created in event_activities:
+        if event.get("notification", False):
+            notifications.delay(
+                type=event["type"],
+                issue_id=event.get("issue_id"),
+                actor_id=event.get("actor_id"),
+                project_id=event["project_id"],
+                subscriber=event.get("subscriber", True),
+                issue_activities_created=json.dumps(
+                    IssueActivitySerializer(issue_activities_created, many=True).data,
+                    cls=DjangoJSONEncoder,
+                ),
+                requested_data=event.get("requested_data"),
+                current_instance=event.get("current_instance"),
+            )
+
+
 # Receive message from room group
 @shared_task
 def issue_activity(
@@ -1511,90 +1642,64 @@ def issue_activity(
     intake=None,
 ):
     try:
-        issue_activities = []
-
-        # check if project_id is valid
-        if not is_valid_uuid(str(project_id)):
-            return
-
-        project = Project.objects.get(pk=project_id)
-        workspace_id = project.workspace_id
-
-        if issue_id is not None:
-            if origin:
-                ri = redis_instance()
-                # set the request origin in redis
-                ri.set(str(issue_id), origin, ex=600)
-            issue = Issue.objects.filter(pk=issue_id).first()
-            if issue:
-                try:
-                    issue.updated_at = timezone.now()
-                    issue.save(update_fields=["updated_at"])
-                except Exception:
-                    pass
-
-        ACTIVITY_MAPPER = {
-            "issue.activity.created": create_issue_activity,
-            "issue.activity.updated": update_issue_activity,
-            "issue.activity.deleted": delete_issue_activity,
-            "comment.activity.created": create_comment_activity,
-            "comment.activity.updated": update_comment_activity,
-            "comment.activity.deleted": delete_comment_activity,
-            "cycle.activity.created": create_cycle_issue_activity,
-            "cycle.activity.deleted": delete_cycle_issue_activity,
-            "module.activity.created": create_module_issue_activity,
-            "module.activity.deleted": delete_module_issue_activity,
-            "link.activity.created": create_link_activity,
-            "link.activity.updated": update_link_activity,
-            "link.activity.deleted": delete_link_activity,
-            "attachment.activity.created": create_attachment_activity,
-            "attachment.activity.deleted": delete_attachment_activity,
-            "issue_relation.activity.created": create_issue_relation_activity,
-            "issue_relation.activity.deleted": delete_issue_relation_activity,
-            "issue_reaction.activity.created": create_issue_reaction_activity,
-            "issue_reaction.activity.deleted": delete_issue_reaction_activity,
-            "comment_reaction.activity.created": create_comment_reaction_activity,
-            "comment_reaction.activity.deleted": delete_comment_reaction_activity,
-            "issue_vote.activity.created": create_issue_vote_activity,
-            "issue_vote.activity.deleted": delete_issue_vote_activity,
-            "issue_draft.activity.created": create_draft_issue_activity,
-            "issue_draft.activity.updated": update_draft_issue_activity,
-            "issue_draft.activity.deleted": delete_draft_issue_activity,
-            "intake.activity.created": create_intake_activity,
-        }
-
-        func = ACTIVITY_MAPPER.get(type)
-        if func is not None:
-            func(
-                requested_data=requested_data,
-                current_instance=current_instance,
-                issue_id=issue_id,
-                project_id=project_id,
-                workspace_id=workspace_id,
-                actor_id=actor_id,
-                issue_activities=issue_activities,
-                epoch=epoch,
-            )
+        process_issue_activities(
+            [
+                {
+                    "type": type,
+                    "requested_data": requested_data,
+                    "current_instance": current_instance,
+                    "issue_id": issue_id,
+                    "actor_id": actor_id,
+                    "project_id": project_id,
+                    "epoch": epoch,
+                    "subscriber": subscriber,
+                    "notification": notification,
+                    "origin": origin,
+                }
+            ]
+        )
+        return
+    except Exception as e:
+        log_exception(e)
+        return
 
-        # Save all the values to database
-        issue_activities_created = IssueActivity.objects.bulk_create(issue_activities)
-
-        if notification:
-            notifications.delay(
-                type=type,
-                issue_id=issue_id,
-                actor_id=actor_id,
-                project_id=project_id,
-                subscriber=subscriber,
-                issue_activities_created=json.dumps(
-                    IssueActivitySerializer(issue_activities_created, many=True).data,
-                    cls=DjangoJSONEncoder,
-                ),
-                requested_data=requested_data,
-                current_instance=current_instance,
-            )
 
+@shared_task
+def issue_activity_batch(events):
+    """Process a batch of issue_activity events, each event holds the issue_activity arguments"""
+    try:
+        process_issue_activities(events)
         return
     except Exception as e:
         log_exception(e)
         return
+
+
+def enqueue_issue_activities(events):
+    """Send the events to the workers in batches of ISSUE_ACTIVITY_BATCH_SIZE"""
+    for start in range(0, len(events), ISSUE_ACTIVITY_BATCH_SIZE):
+        issue_activity_batch.delay(events=events[start : start + ISSUE_ACTIVITY_BATCH_SIZE])
+
+
+def queue_issue_activity(**event):
+    """Buffer the event inside batch_issue_activities, send it on its own otherwise"""
+    buffered_events = _buffered_activity_events.get()
+    if buffered_events is None:
+        issue_activity.delay(**event)
+    else:
+        buffered_events.append(event)
+
+
+@contextmanager
+def batch_issue_activities():
+    """
+    Buffer the events queued in the block and send them in batches when it exits, a return from the block
+    included. The events are dropped when the block raises.
+    """
+    buffered_events = []
+    token = _buffered_activity_events.set(buffered_events)
+    try:
+        yield buffered_events
+    finally:
+        _buffered_activity_events.reset(token)
+    enqueue_issue_activities(buffered_events)
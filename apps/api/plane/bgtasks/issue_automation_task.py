@@ -1,82 +1,194 @@
 # Python imports
 import json
+import logging
+import time
 from datetime import timedelta
 
 # Third party imports
 from celery import shared_task
-from django.db.models import Q
 
 # Django imports
+from django.db import connection, transaction
+from django.db.models import DateTimeField, ExpressionWrapper, F, OuterRef, Q, Subquery
+from django.db.models.functions import Coalesce, Now
 from django.utils import timezone
 
 # Module imports
-from plane.bgtasks.issue_activities_task import issue_activity
-from plane.db.models import Issue, Project, State
+from plane.bgtasks.notification_task import issue_activities_notifications
+from plane.db.models import (
+    Cycle,
+    Issue,
+    IssueActivity,
+    Module,
+    Project,
+    State,
+    record_issue_changes,
+    refresh_parent_issue_counters,
+)
+from plane.utils.analytics_rollup import mark_analytics_issues
 from plane.utils.exception_logger import log_exception
+from plane.utils.progress_counters import get_issue_containers, refresh_progress_counters
+
+logger = logging.getLogger("plane.worker")
+
+# Number of issues archived or closed by one UPDATE statement
+AUTOMATION_CHUNK_SIZE = 1000
+
+ARCHIVE_ISSUES_SQL = """
+UPDATE issues SET archived_at = %s, updated_at = %s
+WHERE id = ANY(%s::uuid[]) AND archived_at IS NULL
+RETURNING id, project_id, workspace_id
+"""
+
+CLOSE_ISSUES_SQL = """
+UPDATE issues SET state_id = close_states.state_id, updated_at = %s
+FROM (SELECT UNNEST(%s::uuid[]) AS project_id, UNNEST(%s::uuid[]) AS state_id) AS close_states
+WHERE issues.id = ANY(%s::uuid[]) AND issues.project_id = close_states.project_id AND issues.archived_at IS NULL
+RETURNING issues.id, issues.project_id, issues.workspace_id, issues.state_id
+"""
 
 
 @shared_task
 def archive_and_close_old_issues():
-    archive_old_issues()
-    close_old_issues()
+    return {"archive": archive_old_issues(), "close": close_old_issues()}
+
+
+def automation_eligible_issues(months_field, state_groups):
+    """Issues of every project whose automation period, in months, has passed since their last update"""
+    return (
+        Issue.issue_objects.filter(
+            Q(
+                **{f"project__{months_field}__gt": 0},
+                archived_at__isnull=True,
+                state__group__in=state_groups,
+                updated_at__lte=ExpressionWrapper(
+                    Now() - F(f"project__{months_field}") * timedelta(days=30),
+                    output_field=DateTimeField(),
+                ),
+            ),
+            Q(issue_cycle__isnull=True)
+            | (Q(issue_cycle__cycle__end_date__lt=timezone.now()) & Q(issue_cycle__isnull=False)),
+            Q(issue_module__isnull=True)
+            | (Q(issue_module__module__target_date__lt=timezone.now()) & Q(issue_module__isnull=False)),
+        )
+        .filter(
+            Q(issue_intake__status=1)
+            | Q(issue_intake__status=-1)
+            | Q(issue_intake__status=2)
+            | Q(issue_intake__isnull=True)
+        )
+        .order_by("id")
+        .values_list("id", flat=True)
+        .distinct()
+    )
+
+
+def run_automation(name, issues, update_chunk):
+    """
+    Apply update_chunk to the eligible issues in chunks of AUTOMATION_CHUNK_SIZE.
+    Every chunk is updated and gets its activities in one transaction.
+    Updated issues leave the eligible set, so every chunk reads from the start.
+    """
+    metrics = {"automation": name, "rows": 0, "chunks": 0}
+    start = time.monotonic()
+
+    while True:
+        issue_ids = [str(issue_id) for issue_id in issues[:AUTOMATION_CHUNK_SIZE]]
+        if not issue_ids:
+            break
+
+        with transaction.atomic():
+            rows = update_chunk(issue_ids)
+
+        metrics["rows"] += rows
+        metrics["chunks"] += 1
+        # Stop if a concurrent change keeps the chunk from being updated
+        if not rows:
+            break
+
+    metrics["duration"] = round(time.monotonic() - start, 3)
+    logger.info(
+        f"Issue automation {name} completed: {metrics['rows']} issues in {metrics['chunks']} chunks "
+        f"in {metrics['duration']}s"
+    )
+    return metrics
+
+
+def after_automation_chunk(issue_ids, issue_activities, requested_data, current_instance=None):
+    """
+    Run for the issues of a chunk what the issue activities run after their writes: log the changes for the
+    change feeds and recount the progress of the cycles and modules in the transaction of the chunk, then
+    once it is committed mark the issues for the analytics facts and notify their subscribers with one task.
+    requested_data is built per activity.
+    """
+    record_issue_changes(issue_ids)
+    cycle_ids, module_ids = get_issue_containers(issue_ids)
+    if cycle_ids:
+        refresh_progress_counters(Cycle, cycle_ids)
+    if module_ids:
+        refresh_progress_counters(Module, module_ids)
+
+    def on_commit():
+        mark_analytics_issues(issue_ids)
+        issue_activities_notifications.delay(
+            issue_activity_ids=[str(issue_activity.id) for issue_activity in issue_activities],
+            requested_data={
+                str(issue_activity.id): requested_data(issue_activity) for issue_activity in issue_activities
+            },
+            current_instance=current_instance,
+        )
+
+    transaction.on_commit(on_commit)
 
 
 def archive_old_issues():
     try:
-        # Get all the projects whose archive_in is greater than 0
-        projects = Project.objects.filter(archive_in__gt=0)
-
-        for project in projects:
-            project_id = project.id
-            archive_in = project.archive_in
-
-            # Get all the issues whose updated_at in less that the archive_in month
-            issues = Issue.issue_objects.filter(
-                Q(
-                    project=project_id,
-                    archived_at__isnull=True,
-                    updated_at__lte=(timezone.now() - timedelta(days=archive_in * 30)),
-                    state__group__in=["completed", "cancelled"],
-                ),
-                Q(issue_cycle__isnull=True)
-                | (Q(issue_cycle__cycle__end_date__lt=timezone.now()) & Q(issue_cycle__isnull=False)),
-                Q(issue_module__isnull=True)
-                | (Q(issue_module__module__target_date__lt=timezone.now()) & Q(issue_module__isnull=False)),
-            ).filter(
-                Q(issue_intake__status=1)
-                | Q(issue_intake__status=-1)
-                | Q(issue_intake__status=2)
-                | Q(issue_intake__isnull=True)
+        archive_at = timezone.now().date()
+        epoch = int(timezone.now().timestamp())
+        # The automation acts on behalf of the project creator
+        actors = {}
+
+        def archive_chunk(issue_ids):
+            with connection.cursor() as cursor:
+                cursor.execute(ARCHIVE_ISSUES_SQL, [archive_at, timezone.now(), issue_ids])
+                archived = cursor.fetchall()
+
+            missing = {project_id for _, project_id, _ in archived} - actors.keys()
+            if missing:
+                actors.update(Project.objects.filter(pk__in=missing).values_list("id", "created_by_id"))
+
+            issue_activities = IssueActivity.objects.bulk_create(
+                [
+                    IssueActivity(
+                        issue_id=issue_id,
+                        project_id=project_id,
+                        workspace_id=workspace_id,
+                        comment="Plane has archived the issue",
+                        verb="updated",
+                        actor_id=actors.get(project_id),
+                        field="archived_at",
+                        old_value=None,
+                        new_value="archive",
+                        epoch=epoch,
+                    )
+                    for issue_id, project_id, workspace_id in archived
+                ]
+            )
+            # The parents count their archived sub issues no more
+            refresh_parent_issue_counters([issue_id for issue_id, _, _ in archived])
+            after_automation_chunk(
+                [issue_id for issue_id, _, _ in archived],
+                issue_activities,
+                lambda _: json.dumps({"archived_at": str(archive_at), "automation": True}),
+                current_instance=json.dumps({"archived_at": None}),
             )
+            return len(archived)
 
-            # Check if Issues
-            if issues:
-                # Set the archive time to current time
-                archive_at = timezone.now().date()
-
-                issues_to_update = []
-                for issue in issues:
-                    issue.archived_at = archive_at
-                    issues_to_update.append(issue)
-
-                # Bulk Update the issues and log the activity
-                if issues_to_update:
-                    Issue.objects.bulk_update(issues_to_update, ["archived_at"], batch_size=100)
-                    _ = [
-                        issue_activity.delay(
-                            type="issue.activity.updated",
-                            requested_data=json.dumps({"archived_at": str(archive_at), "automation": True}),
-                            actor_id=str(project.created_by_id),
-                            issue_id=issue.id,
-                            project_id=project_id,
-                            current_instance=json.dumps({"archived_at": None}),
-                            subscriber=False,
-                            epoch=int(timezone.now().timestamp()),
-                            notification=True,
-                        )
-                        for issue in issues_to_update
-                    ]
-        return
+        return run_automation(
+            "archive",
+            automation_eligible_issues("archive_in", ["completed", "cancelled"]),
+            archive_chunk,
+        )
     except Exception as e:
         log_exception(e)
         return
@@ -84,62 +196,72 @@ def archive_old_issues():
 
 def close_old_issues():
     try:
-        # Get all the projects whose close_in is greater than 0
-        projects = Project.objects.filter(close_in__gt=0).select_related("default_state")
-
-        for project in projects:
-            project_id = project.id
-            close_in = project.close_in
-
-            # Get all the issues whose updated_at in less that the close_in month
-            issues = Issue.issue_objects.filter(
-                Q(
-                    project=project_id,
-                    archived_at__isnull=True,
-                    updated_at__lte=(timezone.now() - timedelta(days=close_in * 30)),
-                    state__group__in=["backlog", "unstarted", "started"],
-                ),
-                Q(issue_cycle__isnull=True)
-                | (Q(issue_cycle__cycle__end_date__lt=timezone.now()) & Q(issue_cycle__isnull=False)),
-                Q(issue_module__isnull=True)
-                | (Q(issue_module__module__target_date__lt=timezone.now()) & Q(issue_module__isnull=False)),
-            ).filter(
-                Q(issue_intake__status=1)
-                | Q(issue_intake__status=-1)
-                | Q(issue_intake__status=2)
-                | Q(issue_intake__isnull=True)
+        epoch = int(timezone.now().timestamp())
+
+        # Close to the default state of the project, or its first cancelled state
+        projects = {
+            project_id: (close_state_id, created_by_id)
+            for project_id, close_state_id, created_by_id in Project.objects.filter(close_in__gt=0)
+            .annotate(
+                close_state_id=Coalesce(
+                    F("default_state_id"),
+                    Subquery(
+                        State.objects.filter(project_id=OuterRef("pk"), group="cancelled")
+                        .order_by("sequence")
+                        .values("id")[:1]
+                    ),
+                )
             )
+            .filter(close_state_id__isnull=False)
+            .values_list("id", "close_state_id", "created_by_id")
+        }
+        if not projects:
+            return
 
-            # Check if Issues
-            if issues:
-                if project.default_state is None:
-                    close_state = State.objects.filter(group="cancelled").first()
-                else:
-                    close_state = project.default_state
-
-                issues_to_update = []
-                for issue in issues:
-                    issue.state = close_state
-                    issues_to_update.append(issue)
-
-                # Bulk Update the issues and log the activity
-                if issues_to_update:
-                    Issue.objects.bulk_update(issues_to_update, ["state"], batch_size=100)
-                    [
-                        issue_activity.delay(
-                            type="issue.activity.updated",
-                            requested_data=json.dumps({"closed_to": str(issue.state_id)}),
-                            actor_id=str(project.created_by_id),
-                            issue_id=issue.id,
-                            project_id=project_id,
-                            current_instance=None,
-                            subscriber=False,
-                            epoch=int(timezone.now().timestamp()),
-                            notification=True,
-                        )
-                        for issue in issues_to_update
-                    ]
-        return
+        state_names = dict(
+            State.objects.filter(pk__in=[state_id for state_id, _ in projects.values()]).values_list("id", "name")
+        )
+        project_ids = [str(project_id) for project_id in projects]
+        close_state_ids = [str(state_id) for state_id, _ in projects.values()]
+
+        def close_chunk(issue_ids):
+            with connection.cursor() as cursor:
+                cursor.execute(CLOSE_ISSUES_SQL, [timezone.now(), project_ids, close_state_ids, issue_ids])
+                closed = cursor.fetchall()
+
+            issue_activities = IssueActivity.objects.bulk_create(
+                [
+                    IssueActivity(
+                        issue_id=issue_id,
+                        actor_id=projects[project_id][1],
+                        verb="updated",
+                        old_value=None,
+                        new_value=state_names.get(state_id),
+                        field="state",
+                        project_id=project_id,
+                        workspace_id=workspace_id,
+                        comment="Plane updated the state to ",
+                        old_identifier=None,
+                        new_identifier=state_id,
+                        epoch=epoch,
+                    )
+                    for issue_id, project_id, workspace_id, state_id in closed
+                ]
+            )
+            after_automation_chunk(
+                [issue_id for issue_id, _, _, _ in closed],
+                issue_activities,
+                lambda issue_activity: json.dumps({"closed_to": str(issue_activity.new_identifier)}),
+            )
+            return len(closed)
+
+        return run_automation(
+            "close",
+            automation_eligible_issues("close_in", ["backlog", "unstarted", "started"]).filter(
+                project_id__in=project_ids
+            ),
+            close_chunk,
+        )
     except Exception as e:
         log_exception(e)
         return
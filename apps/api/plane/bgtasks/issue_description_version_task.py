@@ -7,6 +7,8 @@ import json
 from plane.db.models import Issue, IssueDescriptionVersion
 from plane.utils.exception_logger import log_exception
 
+MAX_ISSUE_DESCRIPTION_VERSIONS = 20
+
 
 def should_update_existing_version(
     version: IssueDescriptionVersion, user_id: str, max_time_difference: int = 600
@@ -19,20 +21,12 @@ def should_update_existing_version(
 
 
 def update_existing_version(version: IssueDescriptionVersion, issue) -> None:
-    version.description_json = issue.description
-    version.description_html = issue.description_html
-    version.description_binary = issue.description_binary
-    version.description_stripped = issue.description_stripped
-    version.last_saved_at = timezone.now()
-
-    version.save(
-        update_fields=[
-            "description_json",
-            "description_html",
-            "description_binary",
-            "description_stripped",
-            "last_saved_at",
-        ]
+    version.update_version(
+        description_json=issue.description,
+        description_html=issue.description_html,
+        description_binary=issue.description_binary,
+        description_stripped=issue.description_stripped,
+        last_saved_at=timezone.now(),
     )
 
 
@@ -50,16 +44,19 @@ def issue_description_version_task(updated_issue, issue_id, user_id, is_creating
             return
 
         with transaction.atomic():
+            # The versions are deltas of the previous one, the latest must not change until this one is written
+            IssueDescriptionVersion.lock_versions(issue_id)
+
             # Get latest version
-            latest_version = (
-                IssueDescriptionVersion.objects.filter(issue_id=issue_id).order_by("-last_saved_at").first()
-            )
+            latest_version = IssueDescriptionVersion.objects.filter(issue_id=issue_id).order_by("-created_at").first()
 
             # Determine whether to update existing or create new version
             if should_update_existing_version(version=latest_version, user_id=user_id):
                 update_existing_version(latest_version, issue)
             else:
                 IssueDescriptionVersion.log_issue_description_version(issue, user_id)
+                # Keep the latest versions, the older ones are archived by the cleanup task
+                IssueDescriptionVersion.prune_versions(issue_id, keep=MAX_ISSUE_DESCRIPTION_VERSIONS)
 
             return
 
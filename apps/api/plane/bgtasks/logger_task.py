@@ -1,6 +1,6 @@
 # Python imports
 import logging
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 
 # Third party imports
 from pymongo.collection import Collection
@@ -84,6 +84,51 @@ def log_to_postgres(log_data: Dict[str, Any]) -> bool:
         return False
 
 
+def save_api_activity_logs(records: List[Dict[str, Any]]) -> bool:
+    """
+    Write a batch of API activity logs with a single insert, to MongoDB when it is
+    configured or to PostgreSQL otherwise.
+    Each record has the log_data of process_logs and the created_at and user_id of the request.
+    """
+    if not records:
+        return True
+
+    try:
+        if MongoConnection.is_configured():
+            mongo_collection = get_mongo_collection()
+            if mongo_collection is None:
+                logger.error("MongoDB not configured")
+                return False
+            mongo_collection.insert_many(
+                [
+                    {
+                        **record["log_data"],
+                        "created_at": record["created_at"],
+                        "updated_at": record["created_at"],
+                        "created_by": record["user_id"],
+                        "updated_by": record["user_id"],
+                    }
+                    for record in records
+                ],
+                ordered=False,
+            )
+        else:
+            APIActivityLog.objects.bulk_create(
+                [
+                    APIActivityLog(
+                        **record["log_data"],
+                        created_by_id=record["user_id"],
+                        updated_by_id=record["user_id"],
+                    )
+                    for record in records
+                ]
+            )
+        return True
+    except Exception as e:
+        log_exception(e)
+        return False
+
+
 @shared_task
 def process_logs(log_data: Dict[str, Any], mongo_log: Dict[str, Any]) -> None:
     """
@@ -5,6 +5,7 @@ from uuid import UUID
 
 
 # Module imports
+from plane.app.serializers import IssueActivitySerializer
 from plane.db.models import (
     IssueMention,
     IssueSubscriber,
@@ -20,6 +21,7 @@ from plane.db.models import (
     UserNotificationPreference,
     ProjectMember,
 )
+from django.core.serializers.json import DjangoJSONEncoder
 from django.db.models import Subquery
 
 # Third Party imports
@@ -668,3 +670,28 @@ def notifications(
     except Exception as e:
         print(e)
         return
+
+
+@shared_task
+def issue_activities_notifications(issue_activity_ids, requested_data, current_instance=None):
+    """
+    Notify the subscribers of the issues of many activities in one task, such as the activities of a chunk of
+    issues the automation updated. requested_data holds the requested data of every activity by activity id.
+    """
+    issue_activities = IssueActivity.objects.filter(pk__in=issue_activity_ids).select_related(
+        "actor", "issue", "project", "workspace"
+    )
+    for issue_activity in issue_activities:
+        notifications(
+            type="issue.activity.updated",
+            issue_id=str(issue_activity.issue_id),
+            actor_id=str(issue_activity.actor_id),
+            project_id=str(issue_activity.project_id),
+            subscriber=False,
+            issue_activities_created=json.dumps(
+                IssueActivitySerializer([issue_activity], many=True).data,
+                cls=DjangoJSONEncoder,
+            ),
+            requested_data=requested_data.get(str(issue_activity.id)),
+            current_instance=current_instance,
+        )
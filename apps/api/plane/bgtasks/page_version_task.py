@@ -4,10 +4,15 @@ import json
 # Third party imports
 from celery import shared_task
 
+# Django imports
+from django.db import transaction
+
 # Module imports
 from plane.db.models import Page, PageVersion
 from plane.utils.exception_logger import log_exception
 
+MAX_PAGE_VERSIONS = 20
+
 
 @shared_task
 def page_version(page_id, existing_instance, user_id):
@@ -20,22 +25,21 @@ def page_version(page_id, existing_instance, user_id):
 
         # Create a version if description_html is updated
         if current_instance.get("description_html") != page.description_html:
-            # Create a new page version
-            PageVersion.objects.create(
-                page_id=page_id,
-                workspace_id=page.workspace_id,
-                description_html=page.description_html,
-                description_binary=page.description_binary,
-                owned_by_id=user_id,
-                last_saved_at=page.updated_at,
-                description_json=page.description,
-                description_stripped=page.description_stripped,
-            )
-
-            # If page versions are greater than 20 delete the oldest one
-            if PageVersion.objects.filter(page_id=page_id).count() > 20:
-                # Delete the old page version
-                PageVersion.objects.filter(page_id=page_id).order_by("last_saved_at").first().delete()
+            with transaction.atomic():
+                # Create a new page version, stored as a delta of the previous one between snapshots
+                PageVersion.create_version(
+                    page_id=page_id,
+                    workspace_id=page.workspace_id,
+                    description_html=page.description_html,
+                    description_binary=page.description_binary,
+                    owned_by_id=user_id,
+                    last_saved_at=page.updated_at,
+                    description_json=page.description,
+                    description_stripped=page.description_stripped,
+                )
+
+                # Keep the latest 20 page versions
+                PageVersion.prune_versions(page_id, keep=MAX_PAGE_VERSIONS)
 
         return
     except Page.DoesNotExist:
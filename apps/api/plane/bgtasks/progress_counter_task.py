@@ -0,0 +1,26 @@
+# Python imports
+import logging
+
+# Third party imports
+from celery import shared_task
+
+# Module imports
+from plane.utils.exception_logger import log_exception
+from plane.utils.progress_counters import reconcile_progress_counters
+
+logger = logging.getLogger("plane.worker")
+
+
+@shared_task
+def reconcile_cycle_and_module_progress():
+    """
+    Store a recount of the progress of the cycles and modules that differs from the stored one, catching up
+    on the changes that do not go through the issue activity
+    """
+    try:
+        mismatches = reconcile_progress_counters()
+        logger.info(f"Recounted the progress of {len(mismatches)} cycles and modules")
+        return len(mismatches)
+    except Exception as e:
+        log_exception(e)
+        return
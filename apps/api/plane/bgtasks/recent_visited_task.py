@@ -1,57 +1,191 @@
 # Python imports
+import json
+import logging
+from datetime import datetime, timezone as dt_timezone
+
+# Django imports
+from django.db import transaction
 from django.utils import timezone
-from django.db import DatabaseError
 
 # Third party imports
 from celery import shared_task
 
 # Module imports
-from plane.db.models import UserRecentVisit, Workspace
+from plane.db.models import Cycle, Issue, IssueView, Module, Page, Project, UserRecentVisit, Workspace
+from plane.settings.redis import redis_instance
 from plane.utils.exception_logger import log_exception
+from plane.utils.recent_visits import (
+    RECENT_VISITS_DIRTY_KEY,
+    RECENT_VISITS_LIMIT,
+    forget_recent_visits,
+    get_recent_visit_id,
+    get_recent_visit_member,
+    parse_recent_visits_key,
+    record_recent_visit,
+)
+
+logger = logging.getLogger("plane.worker")
+
+# Keys being written, kept until the flush succeeds so that a failed flush is retried by the next one
+RECENT_VISITS_FLUSHING_KEY = "recent_visits:flushing"
+# Sorted sets written to the database per transaction
+FLUSH_BATCH_SIZE = 500
+
+ENTITY_MODELS = {
+    "cycle": Cycle,
+    "issue": Issue,
+    "module": Module,
+    "page": Page,
+    "project": Project,
+    "view": IssueView,
+}
 
 
 @shared_task
 def recent_visited_task(entity_name, entity_identifier, user_id, project_id, slug):
     try:
-        workspace = Workspace.objects.get(slug=slug)
-        recent_visited = UserRecentVisit.objects.filter(
-            entity_name=entity_name,
-            entity_identifier=entity_identifier,
-            user_id=user_id,
-            project_id=project_id,
-            workspace_id=workspace.id,
-        ).first()
-
-        if recent_visited:
-            # Check if the database is available
-            try:
-                recent_visited.visited_at = timezone.now()
-                recent_visited.save(update_fields=["visited_at"])
-            except DatabaseError:
-                pass
-        else:
-            recent_visited_count = UserRecentVisit.objects.filter(user_id=user_id, workspace_id=workspace.id).count()
-            if recent_visited_count == 20:
-                recent_visited = (
-                    UserRecentVisit.objects.filter(user_id=user_id, workspace_id=workspace.id)
-                    .order_by("created_at")
-                    .first()
-                )
-                recent_visited.delete()
-
-            recent_activity = UserRecentVisit.objects.create(
-                entity_name=entity_name,
-                entity_identifier=entity_identifier,
-                user_id=user_id,
-                visited_at=timezone.now(),
-                project_id=project_id,
-                workspace_id=workspace.id,
+        visited_at = timezone.now()
+        if not record_recent_visit(slug, user_id, entity_name, entity_identifier, project_id, visited_at):
+            # Seed the new or expired sorted set with the visits flushed to the database
+            seed = UserRecentVisit.objects.filter(workspace__slug=slug, user_id=user_id).order_by("-visited_at")
+            record_recent_visit(
+                slug,
+                user_id,
+                entity_name,
+                entity_identifier,
+                project_id,
+                visited_at,
+                seed=list(
+                    seed.values_list("entity_name", "entity_identifier", "project_id", "visited_at")[
+                        :RECENT_VISITS_LIMIT
+                    ]
+                ),
             )
-            recent_activity.created_by_id = user_id
-            recent_activity.updated_by_id = user_id
-            recent_activity.save(update_fields=["created_by_id", "updated_by_id"])
-
         return
     except Exception as e:
         log_exception(e)
         return
+
+
+def get_existing_entities(visits):
+    """Ids of the visited entities that still exist, by entity name"""
+    identifiers = {}
+    for visit in visits:
+        if visit["entity_name"] in ENTITY_MODELS and visit["entity_identifier"]:
+            identifiers.setdefault(visit["entity_name"], set()).add(visit["entity_identifier"])
+    return {
+        entity_name: {
+            str(pk) for pk in ENTITY_MODELS[entity_name].objects.filter(pk__in=ids).values_list("pk", flat=True)
+        }
+        for entity_name, ids in identifiers.items()
+    }
+
+
+def flush_recent_visits_batch(keys):
+    """Replace the stored visits of every sorted set with its members, returns the number of stored visits"""
+    pipeline = redis_instance().pipeline(transaction=False)
+    for key in keys:
+        pipeline.zrange(key, 0, -1, withscores=True)
+    visits = [
+        {
+            **json.loads(member),
+            "key": key,
+            "member": member.decode(),
+            "visited_at": datetime.fromtimestamp(score, tz=dt_timezone.utc),
+        }
+        for key, members in zip(keys, pipeline.execute())
+        for member, score in members
+    ]
+
+    owners = {key: parse_recent_visits_key(key) for key in keys}
+    workspaces = {
+        slug: str(workspace_id)
+        for slug, workspace_id in Workspace.objects.filter(slug__in={slug for slug, _ in owners.values()}).values_list(
+            "slug", "id"
+        )
+    }
+    # The (workspace, user) of every sorted set, sets of renamed or deleted workspaces are skipped
+    owner_keys = {(workspaces[slug], user_id): key for key, (slug, user_id) in owners.items() if slug in workspaces}
+
+    # Visits of deleted entities are dropped from the sorted sets
+    existing_entities = get_existing_entities(visits)
+    visits_by_member, forgotten = {}, {}
+    for visit in visits:
+        entity_ids = existing_entities.get(visit["entity_name"])
+        if entity_ids is not None and visit["entity_identifier"] not in entity_ids:
+            forgotten.setdefault(visit["key"], []).append(visit["member"])
+        else:
+            visits_by_member[(visit["key"], visit["member"])] = visit
+    for key, members in forgotten.items():
+        forget_recent_visits(key, members)
+
+    updated, deleted_ids = [], []
+    rows = UserRecentVisit.objects.filter(
+        workspace_id__in={workspace_id for workspace_id, _ in owner_keys},
+        user_id__in={user_id for _, user_id in owner_keys},
+    )
+    for row in rows:
+        key = owner_keys.get((str(row.workspace_id), str(row.user_id)))
+        if key is None:
+            continue
+        member = get_recent_visit_member(row.entity_name, row.entity_identifier, row.project_id)
+        visit = visits_by_member.pop((key, member), None)
+        if visit is None:
+            deleted_ids.append(row.id)
+        else:
+            row.visited_at = visit["visited_at"]
+            updated.append(row)
+
+    key_owners = {key: owner for owner, key in owner_keys.items()}
+    created = [
+        UserRecentVisit(
+            id=get_recent_visit_id(key, visit["member"]),
+            workspace_id=key_owners[key][0],
+            user_id=key_owners[key][1],
+            entity_name=visit["entity_name"],
+            entity_identifier=visit["entity_identifier"],
+            project_id=visit["project_id"],
+            visited_at=visit["visited_at"],
+            created_by_id=key_owners[key][1],
+            updated_by_id=key_owners[key][1],
+        )
+        for (key, _), visit in visits_by_member.items()
+        if key in key_owners
+    ]
+
+    # Visits falling out of the latest ones are removed, like those of deleted entities
+    UserRecentVisit.all_objects.filter(id__in=deleted_ids).delete()
+    visited_at = [row.visited_at for row in created]
+    UserRecentVisit.objects.bulk_create(created, ignore_conflicts=True)
+    # bulk_create sets visited_at to the current time, the visits are written with the time they happened
+    for row, row_visited_at in zip(created, visited_at):
+        row.visited_at = row_visited_at
+    UserRecentVisit.objects.bulk_update(updated + created, ["visited_at"])
+    return len(updated) + len(created)
+
+
+@shared_task
+def flush_recent_visits():
+    """Write the recent visits of the sorted sets visited since the last flush to the database in bulk"""
+    try:
+        ri = redis_instance()
+        if not ri.exists(RECENT_VISITS_FLUSHING_KEY):
+            # Nothing was visited since the last flush
+            if not ri.exists(RECENT_VISITS_DIRTY_KEY):
+                return 0
+            # Visits recorded from now on mark their sorted set in a new set
+            ri.rename(RECENT_VISITS_DIRTY_KEY, RECENT_VISITS_FLUSHING_KEY)
+
+        keys = sorted(key.decode() for key in ri.smembers(RECENT_VISITS_FLUSHING_KEY))
+        flushed = 0
+        for start in range(0, len(keys), FLUSH_BATCH_SIZE):
+            batch = keys[start : start + FLUSH_BATCH_SIZE]
+            with transaction.atomic():
+                flushed += flush_recent_visits_batch(batch)
+            ri.srem(RECENT_VISITS_FLUSHING_KEY, *batch)
+
+        logger.info(f"Flushed {flushed} recent visits of {len(keys)} users")
+        return flushed
+    except Exception as e:
+        log_exception(e)
+        return
@@ -2,10 +2,12 @@ import hashlib
 import hmac
 import json
 import logging
+import random
+import time
 import uuid
 
 import requests
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 # Third party imports
 from celery import shared_task
@@ -49,6 +51,15 @@ from plane.db.models import (
 from plane.license.utils.instance_value import get_email_configuration
 from plane.utils.exception_logger import log_exception
 from plane.settings.mongo import MongoConnection
+from plane.settings.redis import acquire_lock, redis_instance, redis_pipeline, release_lock, renew_lock
+from plane.utils.webhook_delivery import (
+    WebhookCircuits,
+    WebhookSender,
+    has_due_webhook_deliveries,
+    pop_due_webhook_deliveries,
+    queue_webhook_deliveries,
+    record_webhook_results,
+)
 
 
 SERIALIZER_MAPPER = {
@@ -78,6 +89,25 @@ MODEL_MAPPER = {
 
 logger = logging.getLogger("plane.worker")
 
+# Serialized data and activity of an event, shared by its deliveries to every subscribed webhook
+WEBHOOK_PAYLOAD_KEY = "webhook:payload:{payload_id}"
+# Redis hash with the events, deliveries and payload bytes fanned out, by event type
+WEBHOOK_FANOUT_STATS_KEY = "webhook:fanout:stats"
+# Held by the running deliver_webhooks task
+WEBHOOK_DELIVERY_LOCK_KEY = "webhook:deliveries:lock"
+
+# Failed deliveries are retried after a random delay of up to WEBHOOK_RETRY_BACKOFF seconds,
+# the webhook is deactivated when the last retry fails
+WEBHOOK_MAX_RETRIES = 5
+WEBHOOK_RETRY_BACKOFF = 600
+
+WEBHOOK_ACTIONS = {
+    "POST": "create",
+    "PATCH": "update",
+    "PUT": "update",
+    "DELETE": "delete",
+}
+
 
 def get_issue_prefetches():
     return [
@@ -86,7 +116,7 @@ def get_issue_prefetches():
     ]
 
 
-def save_webhook_log(
+def get_webhook_log_data(
     webhook: Webhook,
     request_method: str,
     request_headers: str,
@@ -96,11 +126,8 @@ def save_webhook_log(
     response_body: str,
     retry_count: int,
     event_type: str,
-) -> None:
-    # webhook_logs
-    mongo_collection = MongoConnection.get_collection("webhook_logs")
-
-    log_data = {
+) -> Dict[str, Any]:
+    return {
         "workspace_id": str(webhook.workspace_id),
         "webhook": str(webhook.id),
         "event_type": str(event_type),
@@ -113,27 +140,105 @@ def save_webhook_log(
         "retry_count": retry_count,
     }
 
+
+def save_webhook_logs(logs: List[Dict[str, Any]]) -> None:
+    """Save the logs of the webhook requests to mongo, or to the database when mongo is not available"""
+    if not logs:
+        return
+
+    # webhook_logs
+    mongo_collection = MongoConnection.get_collection("webhook_logs")
+
     mongo_save_success = False
     if mongo_collection is not None:
         try:
-            # insert the log data into the mongo collection
-            mongo_collection.insert_one(log_data)
-            logger.info("Webhook log saved successfully to mongo")
+            # insert the log data into the mongo collection, insert_many adds an _id to the documents
+            mongo_collection.insert_many([dict(log) for log in logs])
+            logger.info(f"{len(logs)} webhook logs saved successfully to mongo")
             mongo_save_success = True
         except Exception as e:
             log_exception(e, warning=True)
-            logger.error(f"Failed to save webhook log: {e}")
+            logger.error(f"Failed to save webhook logs: {e}")
             mongo_save_success = False
 
     # if the mongo save is not successful, save the log data into the database
     if not mongo_save_success:
         try:
             # insert the log data into the database
-            WebhookLog.objects.create(**log_data)
-            logger.info("Webhook log saved successfully to database")
+            WebhookLog.objects.bulk_create([WebhookLog(**log) for log in logs])
+            logger.info(f"{len(logs)} webhook logs saved successfully to database")
         except Exception as e:
             log_exception(e, warning=True)
-            logger.error(f"Failed to save webhook log: {e}")
+            logger.error(f"Failed to save webhook logs: {e}")
+
+
+def save_webhook_log(
+    webhook: Webhook,
+    request_method: str,
+    request_headers: str,
+    request_body: str,
+    response_status: str,
+    response_headers: str,
+    response_body: str,
+    retry_count: int,
+    event_type: str,
+) -> None:
+    save_webhook_logs(
+        [
+            get_webhook_log_data(
+                webhook=webhook,
+                request_method=request_method,
+                request_headers=request_headers,
+                request_body=request_body,
+                response_status=response_status,
+                response_headers=response_headers,
+                response_body=response_body,
+                retry_count=retry_count,
+                event_type=event_type,
+            )
+        ]
+    )
+
+
+def build_webhook_request(
+    webhook: Webhook,
+    event: str,
+    action: str,
+    event_data: Optional[Dict[str, Any]],
+    activity: Optional[Dict[str, Any]],
+) -> Tuple[Dict[str, str], Dict[str, Any]]:
+    """
+    Build the headers and the payload of a webhook request, signed with the secret key of the webhook.
+
+    Returns:
+        Tuple[Dict[str, str], Dict[str, Any]]: Headers and JSON payload of the request
+    """
+    headers = {
+        "Content-Type": "application/json",
+        "User-Agent": "Autopilot",
+        "X-Plane-Delivery": str(uuid.uuid4()),
+        "X-Plane-Event": event,
+    }
+
+    payload = {
+        "event": event,
+        "action": WEBHOOK_ACTIONS.get(action, action),
+        "webhook_id": str(webhook.id),
+        "workspace_id": str(webhook.workspace_id),
+        "data": event_data,
+        "activity": activity,
+    }
+
+    # Use HMAC for generating signature
+    if webhook.secret_key:
+        hmac_signature = hmac.new(
+            webhook.secret_key.encode("utf-8"),
+            json.dumps(payload).encode("utf-8"),
+            hashlib.sha256,
+        )
+        headers["X-Plane-Signature"] = hmac_signature.hexdigest()
+
+    return headers, payload
 
 
 def get_model_data(event: str, event_id: Union[str, List[str]], many: bool = False) -> Dict[str, Any]:
@@ -170,7 +275,7 @@ def get_model_data(event: str, event_id: Union[str, List[str]], many: bool = Fal
         issue_prefetches = get_issue_prefetches()
         if event == "issue":
             if many:
-                queryset = queryset.prefetch_related(*issue_prefetches)
+                queryset = queryset.select_related("state").prefetch_related(*issue_prefetches)
             else:
                 issue_id = queryset.id
                 queryset = model.objects.filter(pk=issue_id).prefetch_related(*issue_prefetches).first()
@@ -182,6 +287,47 @@ def get_model_data(event: str, event_id: Union[str, List[str]], many: bool = Fal
         raise ObjectDoesNotExist(f"No {event} found with id: {event_id}")
 
 
+def store_webhook_payload(event: str, event_data: Optional[Dict[str, Any]], activity: Dict[str, Any], deliveries: int):
+    """
+    Store the payload of an event once for all of its deliveries.
+
+    Args:
+        event (str): Event type
+        event_data (Optional[Dict[str, Any]]): Serialized event object
+        activity (Dict[str, Any]): Activity data
+        deliveries (int): Number of webhooks the event is sent to
+
+    Returns:
+        Tuple[str, int]: Redis key of the payload and its size in bytes
+    """
+    payload = json.dumps({"event_data": event_data, "activity": activity}, cls=DjangoJSONEncoder)
+    payload_key = WEBHOOK_PAYLOAD_KEY.format(payload_id=uuid.uuid4().hex)
+
+    with redis_pipeline() as pipeline:
+        # Kept for the retries of the deliveries, which do not delete it
+        pipeline.set(payload_key, payload, ex=settings.WEBHOOK_PAYLOAD_TTL)
+        pipeline.hincrby(WEBHOOK_FANOUT_STATS_KEY, f"{event}:events")
+        pipeline.hincrby(WEBHOOK_FANOUT_STATS_KEY, f"{event}:deliveries", deliveries)
+        pipeline.hincrby(WEBHOOK_FANOUT_STATS_KEY, f"{event}:payload_bytes", len(payload))
+
+    return payload_key, len(payload)
+
+
+def load_webhook_payload(payload_key: str) -> Optional[Dict[str, Any]]:
+    """Return the event data and activity stored under the key, None once it expired"""
+    payload = redis_instance().get(payload_key)
+    return json.loads(payload) if payload is not None else None
+
+
+def get_webhook_fanout_stats() -> Dict[str, Dict[str, int]]:
+    """Events, deliveries and payload bytes fanned out, by event type"""
+    stats = {}
+    for field, value in redis_instance().hgetall(WEBHOOK_FANOUT_STATS_KEY).items():
+        event, counter = field.decode().rsplit(":", 1)
+        stats.setdefault(event, {})[counter] = int(value)
+    return stats
+
+
 @shared_task
 def send_webhook_deactivation_email(webhook_id: str, receiver_id: str, current_site: str, reason: str) -> None:
     """
@@ -249,8 +395,8 @@ def send_webhook_deactivation_email(webhook_id: str, receiver_id: str, current_s
 @shared_task(
     bind=True,
     autoretry_for=(requests.RequestException,),
-    retry_backoff=600,
-    max_retries=5,
+    retry_backoff=WEBHOOK_RETRY_BACKOFF,
+    max_retries=WEBHOOK_MAX_RETRIES,
     retry_jitter=True,
 )
 def webhook_send_task(
@@ -262,6 +408,7 @@ def webhook_send_task(
     action: str,
     current_site: str,
     activity: Optional[Dict[str, Any]],
+    payload_key: Optional[str] = None,
 ) -> None:
     """
     Send webhook notifications to configured endpoints.
@@ -274,47 +421,25 @@ def webhook_send_task(
         action (str): HTTP method/action
         current_site (str): Current site URL
         activity (Optional[Dict[str, Any]]): Activity data
+        payload_key (Optional[str]): Redis key of the event data and activity shared by all the
+            deliveries of the event, used instead of event_data and activity when given
     """
     try:
         webhook = Webhook.objects.get(id=webhook_id, workspace__slug=slug)
 
-        headers = {
-            "Content-Type": "application/json",
-            "User-Agent": "Autopilot",
-            "X-Plane-Delivery": str(uuid.uuid4()),
-            "X-Plane-Event": event,
-        }
+        if payload_key is not None:
+            stored_payload = load_webhook_payload(payload_key)
+            if stored_payload is None:
+                logger.error(f"Payload of webhook {webhook_id} expired before its delivery")
+                return
+            event_data, activity = stored_payload["event_data"], stored_payload["activity"]
+        else:
+            event_data = json.loads(json.dumps(event_data, cls=DjangoJSONEncoder)) if event_data is not None else None
 
-        # # Your secret key
-        event_data = json.loads(json.dumps(event_data, cls=DjangoJSONEncoder)) if event_data is not None else None
-
-        activity = json.loads(json.dumps(activity, cls=DjangoJSONEncoder)) if activity is not None else None
-
-        action = {
-            "POST": "create",
-            "PATCH": "update",
-            "PUT": "update",
-            "DELETE": "delete",
-        }.get(action, action)
-
-        payload = {
-            "event": event,
-            "action": action,
-            "webhook_id": str(webhook.id),
-            "workspace_id": str(webhook.workspace_id),
-            "data": event_data,
-            "activity": activity,
-        }
+            activity = json.loads(json.dumps(activity, cls=DjangoJSONEncoder)) if activity is not None else None
 
-        # Use HMAC for generating signature
-        if webhook.secret_key:
-            hmac_signature = hmac.new(
-                webhook.secret_key.encode("utf-8"),
-                json.dumps(payload).encode("utf-8"),
-                hashlib.sha256,
-            )
-            signature = hmac_signature.hexdigest()
-            headers["X-Plane-Signature"] = signature
+        headers, payload = build_webhook_request(webhook, event, action, event_data, activity)
+        action = payload["action"]
     except Exception as e:
         log_exception(e)
         logger.error(f"Failed to send webhook: {e}")
@@ -370,6 +495,187 @@ def webhook_send_task(
         return
 
 
+def deliver_webhook_batch(
+    deliveries: List[Dict[str, Any]],
+    sender: WebhookSender,
+    deadline: Optional[float] = None,
+    keepalive: Optional[Callable[[], bool]] = None,
+) -> int:
+    """
+    Send a batch of queued deliveries concurrently and write their logs in bulk.
+
+    Deliveries of paused webhooks, including those paused by the failures of the batch, are queued again
+    for the end of the pause. Deliveries not sent by the deadline are queued again as they were. Failed
+    deliveries are retried until WEBHOOK_MAX_RETRIES after which their webhook is deactivated.
+
+    Args:
+        deadline (Optional[float]): time.monotonic() after which no more request of the batch is sent
+        keepalive (Optional[Callable[[], bool]]): called while the requests run, see WebhookSender.send
+
+    Returns:
+        int: Number of requests sent
+    """
+    webhooks = {
+        str(webhook.id): webhook
+        for webhook in Webhook.objects.filter(
+            pk__in={delivery["webhook_id"] for delivery in deliveries}, is_active=True
+        )
+    }
+    circuits = WebhookCircuits(webhooks)
+    payload_keys = list({delivery["payload_key"] for delivery in deliveries})
+    payloads = {
+        key: json.loads(payload) for key, payload in zip(payload_keys, redis_instance().mget(payload_keys)) if payload
+    }
+
+    requests_to_send = []
+    for delivery in deliveries:
+        webhook = webhooks.get(delivery["webhook_id"])
+        # Deleted or deactivated since the event
+        if webhook is None:
+            continue
+        # Paused after repeated failures, sent once the pause ends
+        if circuits.is_open(delivery["webhook_id"]):
+            queue_webhook_deliveries([delivery], due=circuits.open_until[delivery["webhook_id"]])
+            continue
+        stored_payload = payloads.get(delivery["payload_key"])
+        if stored_payload is None:
+            logger.error(f"Payload of webhook {webhook.id} expired before its delivery")
+            continue
+
+        headers, payload = build_webhook_request(
+            webhook, delivery["event"], delivery["action"], stored_payload["event_data"], stored_payload["activity"]
+        )
+        requests_to_send.append((delivery, webhook, headers, payload))
+
+    responses = sender.send(
+        [
+            (delivery["webhook_id"], webhook.url, headers, json.dumps(payload).encode("utf-8"))
+            for delivery, webhook, headers, payload in requests_to_send
+        ],
+        circuits=circuits,
+        deadline=deadline,
+        keepalive=keepalive,
+    )
+
+    sent, logs, succeeded_ids, failures = 0, [], [], []
+    for (delivery, webhook, headers, payload), response in zip(requests_to_send, responses):
+        # Not sent, queued again for the end of the pause of its webhook or for the next run
+        if response is None:
+            queue_webhook_deliveries([delivery], due=circuits.open_until.get(delivery["webhook_id"]))
+            continue
+
+        sent += 1
+        failed = isinstance(response, Exception)
+        logs.append(
+            get_webhook_log_data(
+                webhook=webhook,
+                request_method=payload["action"],
+                request_headers=headers,
+                request_body=payload,
+                response_status=500 if failed else response.status_code,
+                response_headers="" if failed else response.headers,
+                response_body=str(response) if failed else response.text,
+                retry_count=delivery["retry_count"],
+                event_type=delivery["event"],
+            )
+        )
+        if failed:
+            logger.error(f"Webhook {webhook.id} failed with error: {response}")
+            failures.append((delivery, webhook, response))
+        else:
+            succeeded_ids.append(delivery["webhook_id"])
+
+    save_webhook_logs(logs)
+    record_webhook_results(succeeded_ids, [delivery["webhook_id"] for delivery, _, _ in failures])
+
+    deactivated = {}
+    for delivery, webhook, error in failures:
+        if delivery["retry_count"] >= WEBHOOK_MAX_RETRIES:
+            deactivated[webhook.id] = (webhook, delivery, error)
+        else:
+            queue_webhook_deliveries(
+                [{**delivery, "retry_count": delivery["retry_count"] + 1}],
+                due=time.time() + random.uniform(0, WEBHOOK_RETRY_BACKOFF),
+            )
+
+    if deactivated:
+        Webhook.objects.filter(pk__in=deactivated).update(is_active=False)
+        for webhook, delivery, error in deactivated.values():
+            # send email for the deactivation of the webhook
+            send_webhook_deactivation_email.delay(
+                webhook_id=webhook.id,
+                receiver_id=webhook.created_by_id,
+                reason=str(error),
+                current_site=delivery["current_site"],
+            )
+
+    return sent
+
+
+@shared_task
+def deliver_webhooks() -> int:
+    """
+    Send the due webhook deliveries in batches of WEBHOOK_DELIVERY_BATCH_SIZE until none is left or the run
+    reaches WEBHOOK_DELIVERY_RUN_SECONDS, the deliveries of a batch not sent by then are left for the next run.
+    One run at a time sends the deliveries, others return immediately. The run renews its lock while it sends,
+    and stops sending once it lost it.
+
+    Returns:
+        int: Number of requests sent
+    """
+    # Expires soon after a worker dies in the middle of a run
+    lock_expiry = 2 * settings.WEBHOOK_DELIVERY_TIMEOUT
+    token = acquire_lock(WEBHOOK_DELIVERY_LOCK_KEY, lock_expiry)
+    if token is None:
+        return 0
+
+    def keepalive():
+        return renew_lock(WEBHOOK_DELIVERY_LOCK_KEY, token, lock_expiry)
+
+    sent = 0
+    try:
+        deadline = time.monotonic() + settings.WEBHOOK_DELIVERY_RUN_SECONDS
+        with WebhookSender() as sender:
+            while time.monotonic() < deadline and keepalive():
+                deliveries = pop_due_webhook_deliveries(settings.WEBHOOK_DELIVERY_BATCH_SIZE)
+                if not deliveries:
+                    break
+                sent += deliver_webhook_batch(deliveries, sender, deadline=deadline, keepalive=keepalive)
+    except Exception as e:
+        log_exception(e)
+    finally:
+        release_lock(WEBHOOK_DELIVERY_LOCK_KEY, token)
+
+    # Deliveries queued while the lock was held, or left when the run ran out of time
+    if has_due_webhook_deliveries():
+        deliver_webhooks.delay()
+
+    logger.info(f"Sent {sent} webhook requests")
+    return sent
+
+
+def get_event_webhook_ids(event: str, slug: str) -> List[str]:
+    """Return the ids of the active webhooks of the workspace subscribed to the event type"""
+    webhooks = Webhook.objects.filter(workspace__slug=slug, is_active=True)
+
+    if event == "project":
+        webhooks = webhooks.filter(project=True)
+
+    if event == "issue":
+        webhooks = webhooks.filter(issue=True)
+
+    if event == "module" or event == "module_issue":
+        webhooks = webhooks.filter(module=True)
+
+    if event == "cycle" or event == "cycle_issue":
+        webhooks = webhooks.filter(cycle=True)
+
+    if event == "issue_comment":
+        webhooks = webhooks.filter(issue_comment=True)
+
+    return [str(webhook_id) for webhook_id in webhooks.values_list("id", flat=True)]
+
+
 @shared_task
 def webhook_activity(
     event: str,
@@ -388,7 +694,8 @@ def webhook_activity(
     Process and send webhook notifications for various activities in the system.
 
     This task filters relevant webhooks based on the event type and sends notifications
-    to all active webhooks for the workspace.
+    to all active webhooks for the workspace. The payload is serialized once and stored
+    in redis, the deliveries reference it by its key and are sent by deliver_webhooks.
 
     Args:
         event (str): Type of event (project, issue, module, cycle, issue_comment)
@@ -411,40 +718,39 @@ def webhook_activity(
         race conditions where objects might have been deleted.
     """
     try:
-        webhooks = Webhook.objects.filter(workspace__slug=slug, is_active=True)
-
-        if event == "project":
-            webhooks = webhooks.filter(project=True)
-
-        if event == "issue":
-            webhooks = webhooks.filter(issue=True)
-
-        if event == "module" or event == "module_issue":
-            webhooks = webhooks.filter(module=True)
-
-        if event == "cycle" or event == "cycle_issue":
-            webhooks = webhooks.filter(cycle=True)
+        webhook_ids = get_event_webhook_ids(event, slug)
+        if not webhook_ids:
+            return
 
-        if event == "issue_comment":
-            webhooks = webhooks.filter(issue_comment=True)
+        payload_key, payload_size = store_webhook_payload(
+            event=event,
+            event_data=({"id": event_id} if verb == "deleted" else get_model_data(event=event, event_id=event_id)),
+            activity={
+                "field": field,
+                "new_value": new_value,
+                "old_value": old_value,
+                "actor": get_model_data(event="user", event_id=actor_id),
+                "old_identifier": old_identifier,
+                "new_identifier": new_identifier,
+            },
+            deliveries=len(webhook_ids),
+        )
 
-        for webhook in webhooks:
-            webhook_send_task.delay(
-                webhook_id=webhook.id,
-                slug=slug,
-                event=event,
-                event_data=({"id": event_id} if verb == "deleted" else get_model_data(event=event, event_id=event_id)),
-                action=verb,
-                current_site=current_site,
-                activity={
-                    "field": field,
-                    "new_value": new_value,
-                    "old_value": old_value,
-                    "actor": get_model_data(event="user", event_id=actor_id),
-                    "old_identifier": old_identifier,
-                    "new_identifier": new_identifier,
-                },
-            )
+        queue_webhook_deliveries(
+            [
+                {
+                    "webhook_id": webhook_id,
+                    "event": event,
+                    "action": verb,
+                    "current_site": current_site,
+                    "payload_key": payload_key,
+                    "retry_count": 0,
+                }
+                for webhook_id in webhook_ids
+            ]
+        )
+        deliver_webhooks.delay()
+        logger.info(f"Fanned out {event} {verb} of {payload_size} bytes to {len(webhook_ids)} webhooks")
         return
     except Exception as e:
         # Return if a does not exist error occurs
@@ -500,3 +806,55 @@ def model_activity(model_name, model_id, requested_data, current_instance, actor
                 )
 
     return
+
+
+@shared_task
+def bulk_model_activity(model_name, model_ids, actor_id, slug, origin=None):
+    """
+    Send the created events of the objects created together, as model_activity does for one object. The
+    webhooks, the actor and the objects are read once for the batch, and the deliveries queued at once.
+    """
+    try:
+        webhook_ids = get_event_webhook_ids(model_name, slug)
+        if not webhook_ids or not model_ids:
+            return
+
+        actor = get_model_data(event="user", event_id=actor_id)
+        event_data = {str(data["id"]): data for data in get_model_data(event=model_name, event_id=model_ids, many=True)}
+
+        deliveries = []
+        for model_id in model_ids:
+            # Deleted before the task ran
+            if str(model_id) not in event_data:
+                continue
+            payload_key, _ = store_webhook_payload(
+                event=model_name,
+                event_data=event_data[str(model_id)],
+                activity={
+                    "field": None,
+                    "new_value": None,
+                    "old_value": None,
+                    "actor": actor,
+                    "old_identifier": None,
+                    "new_identifier": None,
+                },
+                deliveries=len(webhook_ids),
+            )
+            deliveries.extend(
+                {
+                    "webhook_id": webhook_id,
+                    "event": model_name,
+                    "action": "created",
+                    "current_site": origin,
+                    "payload_key": payload_key,
+                    "retry_count": 0,
+                }
+                for webhook_id in webhook_ids
+            )
+
+        if deliveries:
+            queue_webhook_deliveries(deliveries)
+            deliver_webhooks.delay()
+        logger.info(f"Fanned out {len(event_data)} {model_name} created events to {len(webhook_ids)} webhooks")
+    except Exception as e:
+        log_exception(e)
@@ -5,17 +5,16 @@ import logging
 # Third party imports
 from celery import Celery
 from pythonjsonlogger.jsonlogger import JsonFormatter
-from celery.signals import after_setup_logger, after_setup_task_logger
+from celery.signals import after_setup_logger, after_setup_task_logger, worker_init, worker_process_init
 from celery.schedules import crontab
+from django.conf import settings
 
 # Module imports
-from plane.settings.redis import redis_instance
+from plane.settings.redis import reset_redis_instance
 
 # Set the default Django settings module for the 'celery' program.
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "plane.settings.production")
 
-ri = redis_instance()
-
 app = Celery("plane")
 
 # Using a string here means the worker will not have to
@@ -28,6 +27,22 @@ app.conf.beat_schedule = {
         "task": "plane.bgtasks.email_notification_task.stack_email_notification",
         "schedule": crontab(minute="*/5"),  # Every 5 minutes
     },
+    "check-every-minute-to-flush-api-token-last-used": {
+        "task": "plane.bgtasks.api_token_task.flush_api_token_last_used",
+        "schedule": crontab(minute="*"),  # Every minute
+    },
+    "check-every-minute-to-flush-recent-visits": {
+        "task": "plane.bgtasks.recent_visited_task.flush_recent_visits",
+        "schedule": crontab(minute="*"),  # Every minute
+    },
+    "check-every-minute-to-deliver-webhooks": {
+        "task": "plane.bgtasks.webhook_task.deliver_webhooks",
+        "schedule": crontab(minute="*"),  # Every minute
+    },
+    "check-every-minute-to-refresh-analytics-rollups": {
+        "task": "plane.bgtasks.analytics_rollup_task.refresh_analytics_rollups",
+        "schedule": crontab(minute="*"),  # Every minute
+    },
     "run-every-6-hours-for-instance-trace": {
         "task": "plane.license.bgtasks.tracer.instance_traces",
         "schedule": crontab(hour="*/6", minute=0),  # Every 6 hours
@@ -73,6 +88,18 @@ app.conf.beat_schedule = {
         "task": "plane.bgtasks.exporter_expired_task.delete_old_s3_link",
         "schedule": crontab(hour=3, minute=45),  # UTC 03:45
     },
+    "check-every-day-to-reconcile-analytics-rollups": {
+        "task": "plane.bgtasks.analytics_rollup_task.reconcile_analytics_rollups",
+        "schedule": crontab(hour=4, minute=0),  # UTC 04:00
+    },
+    "check-every-day-to-delete-issue-changes": {
+        "task": "plane.bgtasks.cleanup_task.delete_issue_changes",
+        "schedule": crontab(hour=4, minute=15),  # UTC 04:15
+    },
+    "check-every-day-to-reconcile-progress-counters": {
+        "task": "plane.bgtasks.progress_counter_task.reconcile_cycle_and_module_progress",
+        "schedule": crontab(hour=4, minute=30),  # UTC 04:30
+    },
 }
 
 
@@ -93,6 +120,20 @@ def setup_task_loggers(logger, *args, **kwargs):
     logger.addHandler(handler)
 
 
+# Do not reuse the redis connections of the parent in prefork worker processes
+@worker_process_init.connect
+def reset_redis_connections(*args, **kwargs):
+    reset_redis_instance()
+
+
+# Reuse the database connections of a worker across its tasks, they are closed once older than
+# CELERY_DATABASE_CONN_MAX_AGE or unusable by the django fixup of celery before and after every task
+@worker_init.connect
+def persist_database_connections(*args, **kwargs):
+    for database in settings.DATABASES.values():
+        database["CONN_MAX_AGE"] = settings.CELERY_DATABASE_CONN_MAX_AGE
+
+
 # Load task modules from all registered Django app configs.
 app.autodiscover_tasks()
 
@@ -0,0 +1,13 @@
+# Django imports
+from django.core.management import BaseCommand
+
+# Module imports
+from plane.utils.cache import get_cache_stats
+
+
+class Command(BaseCommand):
+    help = "Show the hit, miss and eviction counters of the cached API responses"
+
+    def handle(self, *args, **options):
+        for name, value in get_cache_stats().items():
+            self.stdout.write(f"{name}: {value}")
@@ -0,0 +1,68 @@
+# Django imports
+from django.core.management.base import BaseCommand
+
+# Module imports
+from plane.db.models import (
+    ISSUE_COUNTER_FIELDS,
+    Issue,
+    IssueCounter,
+    compute_issue_counters,
+    refresh_issue_counters,
+)
+
+BATCH_SIZE = 1000
+
+# The counters of an issue without any, as the lists read them
+EMPTY_COUNTERS = {"link_count": 0, "attachment_count": 0, "sub_issues_count": 0, "cycle_id": None}
+
+
+class Command(BaseCommand):
+    help = "Compares the stored counters of the issues with a recount of their links, attachments and sub issues"
+
+    def add_arguments(self, parser):
+        parser.add_argument("project_ids", nargs="*", type=str, help="project ids")
+        parser.add_argument(
+            "--fix",
+            action="store_true",
+            help="Store the recounted counters of the issues that differ",
+        )
+
+    def handle(self, *args, **options):
+        project_ids = options.get("project_ids")
+        fix = options["fix"]
+
+        issues = Issue.objects.order_by("pk").values_list("id", flat=True)
+        if project_ids:
+            issues = issues.filter(project_id__in=project_ids)
+
+        mismatches = 0
+        last_pk = None
+        while True:
+            batch = list((issues.filter(pk__gt=last_pk) if last_pk else issues)[:BATCH_SIZE])
+            if not batch:
+                break
+            last_pk = batch[-1]
+
+            stored = {
+                str(counters.pop("issue_id")): counters
+                for counters in IssueCounter.objects.filter(issue_id__in=batch).values(
+                    "issue_id", *ISSUE_COUNTER_FIELDS
+                )
+            }
+            changed = [
+                issue_id
+                for issue_id, counters in compute_issue_counters(batch).items()
+                if counters != stored.get(issue_id, EMPTY_COUNTERS)
+            ]
+            for issue_id in changed:
+                self.stdout.write(self.style.WARNING(f"The counters of the issue {issue_id} differ"))
+            if fix and changed:
+                refresh_issue_counters(changed)
+            mismatches += len(changed)
+
+        if not mismatches:
+            self.stdout.write(self.style.SUCCESS("The issue counters match the issues"))
+        elif fix:
+            self.stdout.write(self.style.SUCCESS(f"Recounted the counters of {mismatches} issues"))
+        else:
+            self.stdout.write(self.style.ERROR(f"The counters of {mismatches} issues differ"))
@@ -0,0 +1,32 @@
+# Django imports
+from django.core.management.base import BaseCommand
+
+# Module imports
+from plane.utils.progress_counters import reconcile_progress_counters
+
+
+class Command(BaseCommand):
+    help = "Compares the stored progress counters of the cycles and modules with a recount of their issues"
+
+    def add_arguments(self, parser):
+        parser.add_argument("project_ids", nargs="*", type=str, help="project ids")
+        parser.add_argument(
+            "--fix",
+            action="store_true",
+            help="Store the recounted counters of the cycles and modules that differ",
+        )
+
+    def handle(self, *args, **options):
+        project_ids = options.get("project_ids")
+        fix = options["fix"]
+
+        mismatches = reconcile_progress_counters(project_ids, fix=fix)
+        for container_name, container_id in mismatches:
+            self.stdout.write(self.style.WARNING(f"The progress of the {container_name} {container_id} differs"))
+
+        if not mismatches:
+            self.stdout.write(self.style.SUCCESS("The progress counters match the issues"))
+        elif fix:
+            self.stdout.write(self.style.SUCCESS(f"Recounted the progress of {len(mismatches)} cycles and modules"))
+        else:
+            self.stdout.write(self.style.ERROR(f"The progress of {len(mismatches)} cycles and modules differs"))
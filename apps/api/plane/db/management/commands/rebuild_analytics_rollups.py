@@ -0,0 +1,19 @@
+# Django imports
+from django.core.management.base import BaseCommand
+
+# Module imports
+from plane.bgtasks.analytics_rollup_task import reconcile_analytics_rollups
+
+
+class Command(BaseCommand):
+    help = "Recomputes the analytics facts of every project, or of the given projects"
+
+    def add_arguments(self, parser):
+        parser.add_argument("project_ids", nargs="*", type=str, help="project ids")
+
+    def handle(self, *args, **options):
+        project_ids = options.get("project_ids") or None
+
+        reconcile_analytics_rollups.delay(project_ids=project_ids)
+
+        self.stdout.write(self.style.SUCCESS("Successfully created analytics rollup task"))
@@ -0,0 +1,22 @@
+# Django imports
+from django.core.management import BaseCommand
+
+# Module imports
+from plane.utils.core import get_routing_stats
+
+# Reads that went to the primary, because the view is not opted in, its client just wrote or the replica lagged
+PRIMARY_READ_DECISIONS = ("primary_view", "primary_sticky", "primary_lag")
+
+
+class Command(BaseCommand):
+    help = "Show the read replica routing decisions of every view, views with the most primary reads first"
+
+    def handle(self, *args, **options):
+        stats = get_routing_stats()
+        primary_reads = {
+            view_name: sum(decisions.get(decision, 0) for decision in PRIMARY_READ_DECISIONS)
+            for view_name, decisions in stats.items()
+        }
+        for view_name in sorted(stats, key=lambda name: -primary_reads[name]):
+            decisions = ", ".join(f"{decision}={count}" for decision, count in sorted(stats[view_name].items()))
+            self.stdout.write(f"{view_name}: {decisions}")
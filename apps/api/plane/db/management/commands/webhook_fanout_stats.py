@@ -0,0 +1,19 @@
+# Django imports
+from django.core.management import BaseCommand
+
+# Module imports
+from plane.bgtasks.webhook_task import get_webhook_fanout_stats
+
+
+class Command(BaseCommand):
+    help = "Show the events, deliveries and payload bytes fanned out to the webhooks, by event type"
+
+    def handle(self, *args, **options):
+        for event, counters in sorted(get_webhook_fanout_stats().items()):
+            events = counters.get("events", 0)
+            deliveries = counters.get("deliveries", 0)
+            average_fanout = round(deliveries / events, 2) if events else 0
+            self.stdout.write(
+                f"{event}: {events} events, {deliveries} deliveries ({average_fanout} per event), "
+                f"{counters.get('payload_bytes', 0)} payload bytes"
+            )
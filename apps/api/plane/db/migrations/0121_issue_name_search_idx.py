@@ -0,0 +1,44 @@
+# Generated by Django 4.2.27 on 2026-10-17 06:49
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.contrib.postgres.operations import AddIndexConcurrently, TrigramExtension
+from django.db import migrations
+
+# Trigram indexes serving the icontains searches, which compile to UPPER(field::text) LIKE UPPER(%s)
+TRIGRAM_INDEXES = [
+    ("issue_name_trgm_idx", "issues", "name"),
+    ("project_name_trgm_idx", "projects", "name"),
+    ("project_identifier_trgm_idx", "projects", "identifier"),
+    ("cycle_name_trgm_idx", "cycles", "name"),
+    ("module_name_trgm_idx", "modules", "name"),
+    ("page_name_trgm_idx", "pages", "name"),
+    ("issue_view_name_trgm_idx", "issue_views", "name"),
+]
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ("db", "0120_page_work_item_document_type"),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        AddIndexConcurrently(
+            model_name="issue",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.search.SearchVector("name", config="simple"),
+                name="issue_name_search_idx",
+            ),
+        ),
+        *[
+            migrations.RunSQL(
+                sql=f'CREATE INDEX CONCURRENTLY IF NOT EXISTS "{name}" ON "{table}" '
+                f'USING gin (UPPER("{column}"::text) gin_trgm_ops)',
+                reverse_sql=f'DROP INDEX CONCURRENTLY IF EXISTS "{name}"',
+            )
+            for name, table, column in TRIGRAM_INDEXES
+        ],
+    ]
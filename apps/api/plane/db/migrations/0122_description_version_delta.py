@@ -0,0 +1,22 @@
+# Generated by Django 4.2.27 on 2026-10-17 07:25
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("db", "0121_issue_name_search_idx"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="issuedescriptionversion",
+            name="description_delta",
+            field=models.BinaryField(null=True),
+        ),
+        migrations.AddField(
+            model_name="pageversion",
+            name="description_delta",
+            field=models.BinaryField(null=True),
+        ),
+    ]
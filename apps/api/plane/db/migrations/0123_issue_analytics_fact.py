@@ -0,0 +1,108 @@
+# Generated by Django 4.2.27 on 2026-10-17 07:53
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+import uuid
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("db", "0122_description_version_delta"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="IssueAnalyticsFact",
+            fields=[
+                ("created_at", models.DateTimeField(auto_now_add=True, verbose_name="Created At")),
+                ("updated_at", models.DateTimeField(auto_now=True, verbose_name="Last Modified At")),
+                ("deleted_at", models.DateTimeField(blank=True, null=True, verbose_name="Deleted At")),
+                (
+                    "id",
+                    models.UUIDField(
+                        db_index=True,
+                        default=uuid.uuid4,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                        unique=True,
+                    ),
+                ),
+                ("date", models.DateField()),
+                ("state_group", models.CharField(max_length=20)),
+                ("priority", models.CharField(max_length=30)),
+                (
+                    "dimension",
+                    models.CharField(
+                        blank=True,
+                        choices=[
+                            ("", "None"),
+                            ("assignee", "Assignee"),
+                            ("label", "Label"),
+                            ("cycle", "Cycle"),
+                            ("module", "Module"),
+                        ],
+                        default="",
+                        max_length=20,
+                    ),
+                ),
+                ("dimension_id", models.UUIDField(null=True)),
+                ("issue_count", models.PositiveIntegerField(default=0)),
+                ("estimate", models.FloatField(null=True)),
+                (
+                    "created_by",
+                    models.ForeignKey(
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="%(class)s_created_by",
+                        to=settings.AUTH_USER_MODEL,
+                        verbose_name="Created By",
+                    ),
+                ),
+                (
+                    "project",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE, related_name="project_%(class)s", to="db.project"
+                    ),
+                ),
+                (
+                    "state",
+                    models.ForeignKey(
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="analytics_facts",
+                        to="db.state",
+                    ),
+                ),
+                (
+                    "updated_by",
+                    models.ForeignKey(
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="%(class)s_updated_by",
+                        to=settings.AUTH_USER_MODEL,
+                        verbose_name="Last Modified By",
+                    ),
+                ),
+                (
+                    "workspace",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="workspace_%(class)s",
+                        to="db.workspace",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Issue Analytics Fact",
+                "verbose_name_plural": "Issue Analytics Facts",
+                "db_table": "issue_analytics_facts",
+                "ordering": ("-date",),
+                "indexes": [
+                    models.Index(fields=["project", "date"], name="analytics_fact_project_date"),
+                    models.Index(fields=["workspace", "dimension", "date"], name="analytics_fact_dimension_date"),
+                ],
+            },
+        ),
+    ]
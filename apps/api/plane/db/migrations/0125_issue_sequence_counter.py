@@ -0,0 +1,45 @@
+# Generated by Django 4.2.27 on 2026-10-17 09:11
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("db", "0124_cycle_module_progress"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="IssueSequenceCounter",
+            fields=[
+                (
+                    "project",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="issue_sequence_counter",
+                        serialize=False,
+                        to="db.project",
+                    ),
+                ),
+                ("last_sequence", models.PositiveBigIntegerField(default=0)),
+            ],
+            options={
+                "verbose_name": "Issue Sequence Counter",
+                "verbose_name_plural": "Issue Sequence Counters",
+                "db_table": "issue_sequence_counters",
+            },
+        ),
+        migrations.RunSQL(
+            """
+            INSERT INTO issue_sequence_counters (project_id, last_sequence)
+            SELECT projects.id, GREATEST(
+                (SELECT COALESCE(MAX(sequence), 0) FROM issue_sequences WHERE project_id = projects.id),
+                (SELECT COALESCE(MAX(sequence_id), 0) FROM issues WHERE project_id = projects.id)
+            )
+            FROM projects
+            """,
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+    ]
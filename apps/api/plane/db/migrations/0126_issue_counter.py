@@ -0,0 +1,81 @@
+# Generated by Django 4.2.27 on 2026-10-17 09:23
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("db", "0125_issue_sequence_counter"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="IssueCounter",
+            fields=[
+                (
+                    "issue",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="counters",
+                        serialize=False,
+                        to="db.issue",
+                    ),
+                ),
+                ("link_count", models.PositiveIntegerField(default=0)),
+                ("attachment_count", models.PositiveIntegerField(default=0)),
+                ("sub_issues_count", models.PositiveIntegerField(default=0)),
+                (
+                    "cycle",
+                    models.ForeignKey(
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="+",
+                        to="db.cycle",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Issue Counter",
+                "verbose_name_plural": "Issue Counters",
+                "db_table": "issue_counters",
+            },
+        ),
+        migrations.RunSQL(
+            """
+            INSERT INTO issue_counters (issue_id, link_count, attachment_count, sub_issues_count, cycle_id)
+            SELECT
+                issues.id,
+                (
+                    SELECT COUNT(*) FROM issue_links
+                    WHERE issue_links.issue_id = issues.id AND issue_links.deleted_at IS NULL
+                ),
+                (
+                    SELECT COUNT(*) FROM file_assets
+                    WHERE file_assets.issue_id = issues.id
+                        AND file_assets.entity_type = 'ISSUE_ATTACHMENT'
+                        AND file_assets.deleted_at IS NULL
+                ),
+                (
+                    SELECT COUNT(*) FROM issues AS sub_issues
+                    JOIN projects ON projects.id = sub_issues.project_id
+                    LEFT JOIN states ON states.id = sub_issues.state_id
+                    WHERE sub_issues.parent_id = issues.id
+                        AND sub_issues.deleted_at IS NULL
+                        AND sub_issues.archived_at IS NULL
+                        AND sub_issues.is_draft = false
+                        AND projects.archived_at IS NULL
+                        AND states."group" IS DISTINCT FROM 'triage'
+                ),
+                (
+                    SELECT cycle_id FROM cycle_issues
+                    WHERE cycle_issues.issue_id = issues.id AND cycle_issues.deleted_at IS NULL
+                    LIMIT 1
+                )
+            FROM issues
+            WHERE issues.deleted_at IS NULL
+            """,
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+    ]
@@ -0,0 +1,43 @@
+# Generated by Django 4.2.27 on 2026-10-17 09:45
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("db", "0126_issue_counter"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="IssueChange",
+            fields=[
+                ("id", models.BigAutoField(primary_key=True, serialize=False)),
+                ("transaction_id", models.BigIntegerField()),
+                ("issue_id", models.UUIDField()),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                (
+                    "project",
+                    models.ForeignKey(
+                        db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name="+", to="db.project"
+                    ),
+                ),
+                (
+                    "workspace",
+                    models.ForeignKey(
+                        db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name="+", to="db.workspace"
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Issue Change",
+                "verbose_name_plural": "Issue Changes",
+                "db_table": "issue_changes",
+                "indexes": [
+                    models.Index(fields=["project", "transaction_id", "id"], name="issue_change_project_idx"),
+                    models.Index(fields=["workspace", "transaction_id", "id"], name="issue_change_workspace_idx"),
+                ],
+            },
+        ),
+    ]
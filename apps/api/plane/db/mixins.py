@@ -2,11 +2,15 @@
 from typing import Any
 
 # Django imports
-from django.db import models
+from django.conf import settings
+from django.db import connection, models, transaction
 from django.utils import timezone
 
 # Module imports
 from plane.bgtasks.deletion_task import soft_delete_related_objects
+from plane.utils.member_roles import MEMBER_ROLE_FIELDS, bump_member_roles_version
+from plane.utils.uuid import convert_uuid_to_integer
+from plane.utils.version_store import JSON, apply_version_delta, encode_version_delta, get_field_kind
 
 
 class TimeAuditModel(models.Model):
@@ -54,6 +58,46 @@ class SoftDeletionManager(models.Manager):
         return SoftDeletionQuerySet(self.model, using=self._db).filter(deleted_at__isnull=True)
 
 
+class MemberRoleQuerySet(SoftDeletionQuerySet):
+    """
+    Invalidate the cached member roles of the workspaces on bulk changes of the memberships that change the roles,
+    bulk_update goes through update
+    """
+
+    def _workspace_ids(self):
+        # Read before the change, which can take the memberships out of the queryset
+        if not settings.MEMBER_ROLES_CACHE_TTL:
+            return []
+        return list(self.order_by().values_list("workspace_id", flat=True).distinct())
+
+    def update(self, **kwargs):
+        if MEMBER_ROLE_FIELDS.isdisjoint(kwargs):
+            return super().update(**kwargs)
+        workspace_ids = self._workspace_ids()
+        rows = super().update(**kwargs)
+        bump_member_roles_version(workspace_ids)
+        return rows
+
+    def bulk_create(self, *args, **kwargs):
+        objs = super().bulk_create(*args, **kwargs)
+        bump_member_roles_version(obj.workspace_id for obj in objs)
+        return objs
+
+    def delete(self, soft=True):
+        if soft:
+            # Soft deletes go through update
+            return super().delete(soft=soft)
+        workspace_ids = self._workspace_ids()
+        result = super().delete(soft=soft)
+        bump_member_roles_version(workspace_ids)
+        return result
+
+
+class MemberRoleManager(SoftDeletionManager):
+    def get_queryset(self):
+        return MemberRoleQuerySet(self.model, using=self._db).filter(deleted_at__isnull=True)
+
+
 class SoftDeleteModel(models.Model):
     """To soft delete records"""
 
@@ -215,3 +259,207 @@ class ChangeTrackerMixin:
         """
         self._original_values = {}
         self._track_fields()
+
+
+class DeltaVersionMixin(models.Model):
+    """
+    Store the description versions of an object as periodic snapshots with compressed deltas in between.
+
+    Every VERSION_SNAPSHOT_INTERVAL-th version of an object keeps its description in the
+    versioned fields, the versions in between only store description_delta: the changes from
+    the previous version, encoded by plane.utils.version_store. A version without delta is a
+    snapshot, so the versions stored before deltas existed remain valid as they are.
+
+    Usage:
+        Models define the foreign key to the versioned object and the versioned fields:
+
+        class PageVersion(DeltaVersionMixin, BaseModel):
+            VERSION_PARENT_FIELD = "page"
+            VERSIONED_FIELDS = ["description_html", "description_json"]
+
+    Notes:
+        - Versions are created with create_version, updated with update_version and pruned
+          with prune_versions, which serialize the writes of the versions of an object.
+        - The versioned fields of a delta are empty until load_version_content rebuilds them.
+    """
+
+    VERSION_PARENT_FIELD: str
+    VERSIONED_FIELDS: list[str]
+
+    description_delta = models.BinaryField(null=True)
+
+    class Meta:
+        abstract = True
+
+    def save(self, *args: Any, previous_content: dict | None = None, **kwargs: Any) -> None:
+        """
+        Save the version, as a delta of previous_content when it is given.
+        """
+        if previous_content is None:
+            return super().save(*args, **kwargs)
+
+        content = self.get_stored_content()
+        self.description_delta = encode_version_delta(self.get_field_kinds(), previous_content, content)
+        for field in self.VERSIONED_FIELDS:
+            setattr(self, field, self._empty_value(field))
+        if kwargs.get("update_fields") is not None:
+            kwargs["update_fields"] = {*kwargs["update_fields"], *self.VERSIONED_FIELDS, "description_delta"}
+        super().save(*args, **kwargs)
+
+        for field, value in content.items():
+            setattr(self, field, value)
+
+    @classmethod
+    def _empty_value(cls, field_name: str) -> Any:
+        field = cls._meta.get_field(field_name)
+        if field.null:
+            return None
+        return {} if get_field_kind(cls, field_name) == JSON else ""
+
+    @classmethod
+    def get_field_kinds(cls) -> dict[str, str]:
+        return {field: get_field_kind(cls, field) for field in cls.VERSIONED_FIELDS}
+
+    @classmethod
+    def versions_of(cls, parent_id: Any) -> models.QuerySet:
+        """
+        The versions of an object, latest first, with the fields needed to rebuild them.
+        Soft deleted versions are included as they may be the base of the deltas that follow them.
+        """
+        return (
+            cls.all_objects.filter(**{f"{cls.VERSION_PARENT_FIELD}_id": parent_id})
+            .order_by("-created_at", "-id")
+            .only("id", "created_at", "description_delta", *cls.VERSIONED_FIELDS)
+        )
+
+    @classmethod
+    def lock_versions(cls, parent_id: Any) -> None:
+        """
+        Serialize the writes of the versions of an object until the end of the transaction.
+        """
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT pg_advisory_xact_lock(%s)", [convert_uuid_to_integer(parent_id)])
+
+    @classmethod
+    def _rebuild_content(cls, versions: list) -> dict:
+        # The versions are latest first and the last one is a snapshot
+        kinds = cls.get_field_kinds()
+        content = versions[-1].get_stored_content()
+        for version in reversed(versions[:-1]):
+            content = apply_version_delta(kinds, content, version.description_delta)
+        return content
+
+    def get_stored_content(self) -> dict:
+        return {field: getattr(self, field) for field in self.VERSIONED_FIELDS}
+
+    def get_version_content(self) -> dict:
+        """
+        Rebuild the description of the version from the nearest snapshot before it.
+
+        Returns:
+            dict: The values of the versioned fields, by field name.
+        """
+        if self.description_delta is None:
+            return self.get_stored_content()
+
+        parent_id = getattr(self, f"{self.VERSION_PARENT_FIELD}_id")
+        older = self.versions_of(parent_id).filter(created_at__lt=self.created_at)
+        chunk_size = settings.VERSION_SNAPSHOT_INTERVAL
+        versions = [self]
+        while versions[-1].description_delta is not None:
+            chunk = list(older[len(versions) - 1 : len(versions) - 1 + chunk_size])
+            if not chunk:
+                raise ValueError(f"The snapshot of the {self._meta.verbose_name} {self.id} is missing")
+            for version in chunk:
+                versions.append(version)
+                if version.description_delta is None:
+                    break
+        return self._rebuild_content(versions)
+
+    def load_version_content(self):
+        """
+        Fill the versioned fields of a delta with its description.
+        """
+        if self.description_delta is not None:
+            for field, value in self.get_version_content().items():
+                setattr(self, field, value)
+        return self
+
+    @classmethod
+    def _get_latest_content(cls, parent_id: Any) -> dict | None:
+        # The description of the latest version when the next one is a delta,
+        # None when the next one completes the interval and is a snapshot
+        recent = list(cls.versions_of(parent_id)[: settings.VERSION_SNAPSHOT_INTERVAL - 1])
+        for index, version in enumerate(recent):
+            if version.description_delta is None:
+                return cls._rebuild_content(recent[: index + 1])
+        return None
+
+    @classmethod
+    def create_version(cls, **values: Any):
+        """
+        Create the next version of an object.
+
+        Args:
+            **values: The field values of the version, including the foreign key to the object.
+
+        Returns:
+            The created version, with its versioned fields filled.
+        """
+        parent_id = values[f"{cls.VERSION_PARENT_FIELD}_id"]
+        with transaction.atomic():
+            cls.lock_versions(parent_id)
+            version = cls(**values)
+            version.save(previous_content=cls._get_latest_content(parent_id))
+        return version
+
+    def update_version(self, **values: Any) -> None:
+        """
+        Update the latest version of an object in place.
+
+        Args:
+            **values: The field values to update.
+        """
+        parent_id = getattr(self, f"{self.VERSION_PARENT_FIELD}_id")
+        with transaction.atomic():
+            self.lock_versions(parent_id)
+            previous_content = None
+            if self.description_delta is not None:
+                previous = self.versions_of(parent_id).filter(created_at__lt=self.created_at).first()
+                previous_content = previous.get_version_content()
+            for field, value in values.items():
+                setattr(self, field, value)
+            self.save(update_fields=list(values), previous_content=previous_content)
+
+    @classmethod
+    def prune_versions(cls, parent_id: Any, keep: int) -> int:
+        """
+        Soft delete all but the latest versions of an object in a single update.
+        The versions are counted like the cleanup task does, soft deleted ones included,
+        and the oldest kept version is turned into a snapshot first when it is a delta.
+
+        Args:
+            parent_id: The id of the versioned object.
+            keep: The number of versions to keep.
+
+        Returns:
+            int: The number of deleted versions.
+        """
+        versions = cls.all_objects.filter(**{f"{cls.VERSION_PARENT_FIELD}_id": parent_id}).order_by(
+            "-created_at", "-id"
+        )
+        with transaction.atomic():
+            cls.lock_versions(parent_id)
+            boundary = list(versions.only("id", "created_at", "description_delta")[keep - 1 : keep + 1])
+            if len(boundary) < 2:
+                return 0
+
+            oldest_kept = boundary[0]
+            if oldest_kept.description_delta is not None:
+                oldest_kept = versions.get(pk=oldest_kept.pk).load_version_content()
+                oldest_kept.description_delta = None
+                oldest_kept.save(update_fields=[*cls.VERSIONED_FIELDS, "description_delta"])
+
+            return versions.filter(created_at__lt=oldest_kept.created_at, deleted_at__isnull=True).update(
+                deleted_at=timezone.now()
+            )
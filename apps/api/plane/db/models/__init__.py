@@ -1,8 +1,8 @@
-from .analytic import AnalyticView
+from .analytic import AnalyticView, IssueAnalyticsDimension, IssueAnalyticsFact
 from .api import APIActivityLog, APIToken
 from .asset import FileAsset
 from .base import BaseModel
-from .cycle import Cycle, CycleIssue, CycleUserProperties
+from .cycle import Cycle, CycleIssue, CycleProgress, CycleUserProperties
 from .deploy_board import DeployBoard
 from .draft import (
     DraftIssue,
@@ -30,19 +30,28 @@ from .issue import (
     IssueActivity,
     IssueAssignee,
     IssueBlocker,
+    IssueChange,
     IssueComment,
+    IssueCounter,
     IssueLabel,
     IssueLink,
     IssueMention,
     IssueReaction,
     IssueRelation,
     IssueSequence,
+    IssueSequenceCounter,
     IssueSubscriber,
     IssueVote,
     IssueVersion,
     IssueDescriptionVersion,
+    ISSUE_COUNTER_FIELDS,
+    compute_issue_counters,
+    record_issue_changes,
+    refresh_issue_counters,
+    refresh_parent_issue_counters,
+    reserve_issue_sequences,
 )
-from .module import Module, ModuleIssue, ModuleLink, ModuleMember, ModuleUserProperties
+from .module import Module, ModuleIssue, ModuleLink, ModuleMember, ModuleProgress, ModuleUserProperties
 from .notification import EmailNotificationLog, Notification, UserNotificationPreference
 from .page import Page, PageLabel, PageLog, ProjectPage, PageVersion
 from .project import (
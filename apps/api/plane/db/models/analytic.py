@@ -2,6 +2,7 @@
 from django.db import models
 
 from .base import BaseModel
+from .project import ProjectBaseModel
 
 
 class AnalyticView(BaseModel):
@@ -20,3 +21,41 @@ class AnalyticView(BaseModel):
     def __str__(self):
         """Return name of the analytic view"""
         return f"{self.name} <{self.workspace.name}>"
+
+
+class IssueAnalyticsDimension(models.TextChoices):
+    NONE = "", "None"
+    ASSIGNEE = "assignee", "Assignee"
+    LABEL = "label", "Label"
+    CYCLE = "cycle", "Cycle"
+    MODULE = "module", "Module"
+
+
+class IssueAnalyticsFact(ProjectBaseModel):
+    """
+    Number of issues of a project created on a date, by state and priority. Rows with a dimension split
+    the issues further by their assignees, labels, cycles or modules, with a null dimension_id for the
+    issues without any.
+    """
+
+    date = models.DateField()
+    state = models.ForeignKey("db.State", on_delete=models.SET_NULL, null=True, related_name="analytics_facts")
+    state_group = models.CharField(max_length=20)
+    priority = models.CharField(max_length=30)
+    dimension = models.CharField(max_length=20, choices=IssueAnalyticsDimension.choices, blank=True, default="")
+    dimension_id = models.UUIDField(null=True)
+    issue_count = models.PositiveIntegerField(default=0)
+    estimate = models.FloatField(null=True)
+
+    class Meta:
+        verbose_name = "Issue Analytics Fact"
+        verbose_name_plural = "Issue Analytics Facts"
+        db_table = "issue_analytics_facts"
+        ordering = ("-date",)
+        indexes = [
+            models.Index(fields=["project", "date"], name="analytics_fact_project_date"),
+            models.Index(fields=["workspace", "dimension", "date"], name="analytics_fact_dimension_date"),
+        ]
+
+    def __str__(self):
+        return f"{self.project_id} <{self.date}>"
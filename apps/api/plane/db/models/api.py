@@ -4,8 +4,11 @@ from uuid import uuid4
 # Django imports
 from django.db import models
 from django.conf import settings
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 
 from .base import BaseModel
+from plane.utils.api_token_cache import invalidate_api_token
 
 
 def generate_label_token():
@@ -44,6 +47,12 @@ class APIToken(BaseModel):
         return str(self.user.id)
 
 
+@receiver([post_save, post_delete], sender=APIToken)
+def invalidate_api_token_cache(sender, instance, **kwargs):
+    # Revoked, expired or deactivated tokens must not be served from the validation cache
+    invalidate_api_token(instance.token)
+
+
 class APIActivityLog(BaseModel):
     token_identifier = models.CharField(max_length=255)
 
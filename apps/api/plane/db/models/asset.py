@@ -4,10 +4,11 @@ from uuid import uuid4
 # Django import
 from django.conf import settings
 from django.core.exceptions import ValidationError
-from django.db import models
+from django.db import models, transaction
 
 # Module import
 from .base import BaseModel
+from .issue import refresh_issue_counters
 
 
 def get_upload_path(instance, filename):
@@ -72,6 +73,14 @@ class FileAsset(BaseModel):
     def __str__(self):
         return str(self.asset)
 
+    def save(self, *args, **kwargs):
+        if self.entity_type != self.EntityTypeContext.ISSUE_ATTACHMENT or self.issue_id is None:
+            return super(FileAsset, self).save(*args, **kwargs)
+
+        with transaction.atomic():
+            super(FileAsset, self).save(*args, **kwargs)
+            refresh_issue_counters([self.issue_id])
+
     @property
     def asset_url(self):
         if (
@@ -3,9 +3,10 @@ import pytz
 
 # Django imports
 from django.conf import settings
-from django.db import models
+from django.db import models, transaction
 
 # Module imports
+from .issue import refresh_issue_counters
 from .project import ProjectBaseModel
 
 
@@ -97,6 +98,25 @@ class Cycle(ProjectBaseModel):
         return f"{self.name} <{self.project.name}>"
 
 
+class CycleProgress(ProjectBaseModel):
+    """
+    Issue counts and estimate points of the cycle by state group, and its issues completed per day,
+    refreshed when its issues change
+    """
+
+    cycle = models.OneToOneField(Cycle, on_delete=models.CASCADE, related_name="progress")
+    counters = models.JSONField(default=dict)
+
+    class Meta:
+        verbose_name = "Cycle Progress"
+        verbose_name_plural = "Cycle Progress"
+        db_table = "cycle_progress"
+        ordering = ("-created_at",)
+
+    def __str__(self):
+        return f"{self.cycle_id} <{self.project_id}>"
+
+
 class CycleIssue(ProjectBaseModel):
     """
     Cycle Issues
@@ -119,6 +139,11 @@ class CycleIssue(ProjectBaseModel):
         db_table = "cycle_issues"
         ordering = ("-created_at",)
 
+    def save(self, *args, **kwargs):
+        with transaction.atomic():
+            super(CycleIssue, self).save(*args, **kwargs)
+            refresh_issue_counters([self.issue_id])
+
     def __str__(self):
         return f"{self.cycle}"
 
@@ -4,11 +4,13 @@ from uuid import uuid4
 # Django imports
 from django.conf import settings
 from django.contrib.postgres.fields import ArrayField
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVector
 from django.core.exceptions import ValidationError
 from django.core.validators import MaxValueValidator, MinValueValidator
 from django.db import models, transaction, connection
 from django.utils import timezone
-from django.db.models import Q
+from django.db.models import F, Func, OuterRef, Q, Subquery
 from django import apps
 
 # Module imports
@@ -16,9 +18,8 @@ from plane.utils.html_processor import strip_tags
 from plane.db.mixins import SoftDeletionManager
 from plane.utils.exception_logger import log_exception
 from .project import ProjectBaseModel
-from plane.utils.uuid import convert_uuid_to_integer
 from .description import Description
-from plane.db.mixins import ChangeTrackerMixin
+from plane.db.mixins import ChangeTrackerMixin, DeltaVersionMixin
 from .state import StateGroup
 
 
@@ -97,7 +98,7 @@ class IssueManager(SoftDeletionManager):
         )
 
 
-class Issue(ProjectBaseModel):
+class Issue(ChangeTrackerMixin, ProjectBaseModel):
     PRIORITY_CHOICES = (
         ("urgent", "Urgent"),
         ("high", "High"),
@@ -167,11 +168,18 @@ class Issue(ProjectBaseModel):
 
     issue_objects = IssueManager()
 
+    # The fields deciding whether the issue counts as a sub issue of its parent, and in which project it changes
+    TRACKED_FIELDS = ["parent_id", "state_id", "archived_at", "is_draft", "deleted_at", "project_id"]
+
     class Meta:
         verbose_name = "Issue"
         verbose_name_plural = "Issues"
         db_table = "issues"
         ordering = ("-created_at",)
+        indexes = [
+            # Full text prefix search of the issue names, always current as it indexes the name itself
+            GinIndex(SearchVector("name", config="simple"), name="issue_name_search_idx"),
+        ]
 
     def save(self, *args, **kwargs):
         if self.state is None:
@@ -199,28 +207,29 @@ class Issue(ProjectBaseModel):
             except ImportError:
                 pass
 
+        # Parents whose sub issue count the save changes, the previous one included
+        parent_ids = set()
+        if self._state.adding:
+            parent_ids = {self.parent_id}
+        elif self.changed_fields:
+            parent_ids = {self.parent_id, self.old_values.get("parent_id")}
+        parent_ids.discard(None)
+        # Moved out of its project, the issue is gone from the change feed of the previous one
+        previous_project_id = None
+        if not self._state.adding and "project_id" in self.changed_fields:
+            previous_project_id = self.old_values.get("project_id")
+
         if self._state.adding:
+            # Strip the html tags using html parser
+            self.description_stripped = (
+                None
+                if (self.description_html == "" or self.description_html is None)
+                else strip_tags(self.description_html)
+            )
             with transaction.atomic():
-                # Create a lock for this specific project using a transaction-level advisory lock
-                # This ensures only one transaction per project can execute this code at a time
-                # The lock is automatically released when the transaction ends
-                lock_key = convert_uuid_to_integer(self.project.id)
-
-                with connection.cursor() as cursor:
-                    # Get an exclusive transaction-level lock using the project ID as the lock key
-                    cursor.execute("SELECT pg_advisory_xact_lock(%s)", [lock_key])
-
-                # Get the last sequence for the project
-                last_sequence = IssueSequence.objects.filter(project=self.project).aggregate(
-                    largest=models.Max("sequence")
-                )["largest"]
-                self.sequence_id = last_sequence + 1 if last_sequence else 1
-                # Strip the html tags using html parser
-                self.description_stripped = (
-                    None
-                    if (self.description_html == "" or self.description_html is None)
-                    else strip_tags(self.description_html)
-                )
+                # Reserved right before the inserts, the counter row of the project stays locked until the commit
+                self.sequence_id = reserve_issue_sequences(self.project_id)
+                # Read under the lock, so that the issues created at the same time do not get the same one
                 largest_sort_order = Issue.objects.filter(project=self.project, state=self.state).aggregate(
                     largest=models.Max("sort_order")
                 )["largest"]
@@ -230,6 +239,8 @@ class Issue(ProjectBaseModel):
                 super(Issue, self).save(*args, **kwargs)
 
                 IssueSequence.objects.create(issue=self, sequence=self.sequence_id, project=self.project)
+                refresh_issue_counters(parent_ids)
+                record_issue_changes([self.id])
         else:
             # Strip the html tags using html parser
             self.description_stripped = (
@@ -237,7 +248,12 @@ class Issue(ProjectBaseModel):
                 if (self.description_html == "" or self.description_html is None)
                 else strip_tags(self.description_html)
             )
-            super(Issue, self).save(*args, **kwargs)
+            with transaction.atomic():
+                super(Issue, self).save(*args, **kwargs)
+                refresh_issue_counters(parent_ids)
+                record_issue_changes([self.id])
+                if previous_project_id:
+                    record_issue_changes([self.id], project_id=previous_project_id)
 
     def __str__(self):
         """Return name of the issue"""
@@ -369,6 +385,11 @@ class IssueLink(ProjectBaseModel):
         db_table = "issue_links"
         ordering = ("-created_at",)
 
+    def save(self, *args, **kwargs):
+        with transaction.atomic():
+            super(IssueLink, self).save(*args, **kwargs)
+            refresh_issue_counters([self.issue_id])
+
     def __str__(self):
         return f"{self.issue.name} {self.url}"
 
@@ -542,6 +563,198 @@ class IssueLabel(ProjectBaseModel):
         return f"{self.issue.name} {self.label.name}"
 
 
+class IssueSequenceCounter(models.Model):
+    """Last sequence id handed out in a project, see reserve_issue_sequences"""
+
+    project = models.OneToOneField(
+        "db.Project", on_delete=models.CASCADE, primary_key=True, related_name="issue_sequence_counter"
+    )
+    last_sequence = models.PositiveBigIntegerField(default=0)
+
+    class Meta:
+        verbose_name = "Issue Sequence Counter"
+        verbose_name_plural = "Issue Sequence Counters"
+        db_table = "issue_sequence_counters"
+
+
+def reserve_issue_sequences(project_id, count=1):
+    """
+    Reserve count consecutive sequence ids in the project with one update of its counter. The counter of a
+    project without one starts from the largest sequence id given in it.
+    The counter row stays locked until the transaction ends, so the reservation should come right before the
+    inserts of the issues.
+    Returns:
+        int: the first reserved sequence id
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "UPDATE issue_sequence_counters SET last_sequence = last_sequence + %s "
+            "WHERE project_id = %s RETURNING last_sequence",
+            [count, project_id],
+        )
+        row = cursor.fetchone()
+        if row is None:
+            cursor.execute(
+                """
+                INSERT INTO issue_sequence_counters (project_id, last_sequence)
+                SELECT %(project_id)s, GREATEST(
+                    (SELECT COALESCE(MAX(sequence), 0) FROM issue_sequences WHERE project_id = %(project_id)s),
+                    (SELECT COALESCE(MAX(sequence_id), 0) FROM issues WHERE project_id = %(project_id)s)
+                ) + %(count)s
+                ON CONFLICT (project_id) DO UPDATE
+                SET last_sequence = issue_sequence_counters.last_sequence + %(count)s
+                RETURNING last_sequence
+                """,
+                {"project_id": project_id, "count": count},
+            )
+            row = cursor.fetchone()
+    return row[0] - count + 1
+
+
+class IssueCounter(models.Model):
+    """
+    Link, attachment and sub issue counts of an issue and its cycle, read by the issue lists in place of a
+    subquery per row. Refreshed by refresh_issue_counters in the transactions changing them.
+    """
+
+    issue = models.OneToOneField("db.Issue", on_delete=models.CASCADE, primary_key=True, related_name="counters")
+    link_count = models.PositiveIntegerField(default=0)
+    attachment_count = models.PositiveIntegerField(default=0)
+    sub_issues_count = models.PositiveIntegerField(default=0)
+    cycle = models.ForeignKey("db.Cycle", on_delete=models.SET_NULL, null=True, related_name="+")
+
+    class Meta:
+        verbose_name = "Issue Counter"
+        verbose_name_plural = "Issue Counters"
+        db_table = "issue_counters"
+
+
+ISSUE_COUNTER_FIELDS = ["link_count", "attachment_count", "sub_issues_count", "cycle_id"]
+
+
+def get_issue_counter_expressions():
+    """The subqueries counting the links, attachments and sub issues of an issue, and reading its cycle"""
+    from plane.db.models import CycleIssue, FileAsset
+
+    return {
+        "link_count": IssueLink.objects.filter(issue=OuterRef("id"))
+        .order_by()
+        .annotate(count=Func(F("id"), function="Count"))
+        .values("count"),
+        "attachment_count": FileAsset.objects.filter(
+            issue_id=OuterRef("id"),
+            entity_type=FileAsset.EntityTypeContext.ISSUE_ATTACHMENT,
+        )
+        .order_by()
+        .annotate(count=Func(F("id"), function="Count"))
+        .values("count"),
+        "sub_issues_count": Issue.issue_objects.filter(parent=OuterRef("id"))
+        .order_by()
+        .annotate(count=Func(F("id"), function="Count"))
+        .values("count"),
+        "cycle_id": Subquery(CycleIssue.objects.filter(issue=OuterRef("id")).values("cycle_id")[:1]),
+    }
+
+
+def compute_issue_counters(issue_ids):
+    """
+    Count the links, attachments and sub issues of the issues and read their cycle from scratch, the deleted
+    issues left out.
+    Returns:
+        dict: The counters by issue id
+    """
+    issues = Issue.objects.filter(pk__in=issue_ids).annotate(**get_issue_counter_expressions())
+    return {str(row.pop("id")): row for row in issues.order_by().values("id", *ISSUE_COUNTER_FIELDS)}
+
+
+def refresh_issue_counters(issue_ids):
+    """
+    Recount and store the counters of the issues, in the transaction of the change, so that the lists read
+    them as they are committed along with it
+    """
+    issue_ids = sorted({str(issue_id) for issue_id in issue_ids if issue_id})
+    if not issue_ids:
+        return
+
+    with transaction.atomic():
+        # Counted once the previous refresh of the issues is stored, so that the latest stored counters are
+        # the latest counted. The counter rows, created first if missing, stay locked until the commit.
+        with connection.cursor() as cursor:
+            cursor.execute(
+                """
+                INSERT INTO issue_counters (issue_id, link_count, attachment_count, sub_issues_count)
+                SELECT id, 0, 0, 0 FROM issues WHERE id = ANY(%s::uuid[]) AND deleted_at IS NULL ORDER BY id
+                ON CONFLICT (issue_id) DO UPDATE SET link_count = issue_counters.link_count
+                """,
+                [issue_ids],
+            )
+
+        IssueCounter.objects.bulk_create(
+            [
+                IssueCounter(issue_id=issue_id, **counters)
+                for issue_id, counters in compute_issue_counters(issue_ids).items()
+            ],
+            update_conflicts=True,
+            unique_fields=["issue"],
+            update_fields=ISSUE_COUNTER_FIELDS,
+        )
+
+        # The lists show the counters, the issues recounted changed for the change feeds
+        record_issue_changes(issue_ids)
+
+
+def refresh_parent_issue_counters(issue_ids):
+    """Recount the sub issues of the parents of the issues, after an update of the issues in bulk"""
+    refresh_issue_counters(
+        Issue.all_objects.filter(pk__in=issue_ids, parent__isnull=False).values_list("parent_id", flat=True)
+    )
+
+
+class IssueChange(models.Model):
+    """
+    Append only log of the changes of the issues, a row per issue and change, read by the change feeds.
+    The rows are ordered by the id of the transaction writing them, so that a feed only returns the rows of
+    the transactions ended before it reads, and never passes a row committed later.
+    """
+
+    id = models.BigAutoField(primary_key=True)
+    transaction_id = models.BigIntegerField()
+    # Not a foreign key, the changes of the issues purged since stay in the log
+    issue_id = models.UUIDField()
+    project = models.ForeignKey("db.Project", on_delete=models.CASCADE, related_name="+", db_index=False)
+    workspace = models.ForeignKey("db.Workspace", on_delete=models.CASCADE, related_name="+", db_index=False)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        verbose_name = "Issue Change"
+        verbose_name_plural = "Issue Changes"
+        db_table = "issue_changes"
+        indexes = [
+            models.Index(fields=["project", "transaction_id", "id"], name="issue_change_project_idx"),
+            models.Index(fields=["workspace", "transaction_id", "id"], name="issue_change_workspace_idx"),
+        ]
+
+
+def record_issue_changes(issue_ids, project_id=None):
+    """
+    Log a change of the issues for the change feeds, in the transaction of the change so that the feeds read
+    it once the change is committed. Logged in the current project of each issue, or in the given one.
+    """
+    issue_ids = sorted({str(issue_id) for issue_id in issue_ids if issue_id})
+    if not issue_ids:
+        return
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            """
+            INSERT INTO issue_changes (transaction_id, issue_id, project_id, workspace_id, created_at)
+            SELECT pg_current_xact_id()::text::bigint, id, COALESCE(%s::uuid, project_id), workspace_id, now()
+            FROM issues WHERE id = ANY(%s::uuid[])
+            """,
+            [project_id, issue_ids],
+        )
+
+
 class IssueSequence(ProjectBaseModel):
     issue = models.ForeignKey(
         Issue,
@@ -767,7 +980,10 @@ class IssueVersion(ProjectBaseModel):
             return False
 
 
-class IssueDescriptionVersion(ProjectBaseModel):
+class IssueDescriptionVersion(DeltaVersionMixin, ProjectBaseModel):
+    VERSION_PARENT_FIELD = "issue"
+    VERSIONED_FIELDS = ["description_binary", "description_html", "description_stripped", "description_json"]
+
     issue = models.ForeignKey("db.Issue", on_delete=models.CASCADE, related_name="description_versions")
     description_binary = models.BinaryField(null=True)
     description_html = models.TextField(blank=True, default="<p></p>")
@@ -791,7 +1007,7 @@ class IssueDescriptionVersion(ProjectBaseModel):
             """
             Log the issue description version
             """
-            cls.objects.create(
+            cls.create_version(
                 workspace_id=issue.workspace_id,
                 project_id=issue.project_id,
                 created_by_id=issue.created_by_id,
@@ -145,6 +145,25 @@ class ModuleMember(ProjectBaseModel):
         return f"{self.module.name} {self.member}"
 
 
+class ModuleProgress(ProjectBaseModel):
+    """
+    Issue counts and estimate points of the module by state group, and its issues completed per day,
+    refreshed when its issues change
+    """
+
+    module = models.OneToOneField(Module, on_delete=models.CASCADE, related_name="progress")
+    counters = models.JSONField(default=dict)
+
+    class Meta:
+        verbose_name = "Module Progress"
+        verbose_name_plural = "Module Progress"
+        db_table = "module_progress"
+        ordering = ("-created_at",)
+
+    def __str__(self):
+        return f"{self.module_id} <{self.project_id}>"
+
+
 class ModuleIssue(ProjectBaseModel):
     module = models.ForeignKey("db.Module", on_delete=models.CASCADE, related_name="issue_module")
     issue = models.ForeignKey("db.Issue", on_delete=models.CASCADE, related_name="issue_module")
@@ -7,6 +7,7 @@ from django.utils import timezone
 from django.db import models
 
 # Module imports
+from plane.db.mixins import DeltaVersionMixin
 from plane.utils.html_processor import strip_tags, html_to_markdown, process_description_html
 
 from .base import BaseModel
@@ -173,7 +174,16 @@ class ProjectPage(BaseModel):
         return f"{self.project.name} {self.page.name}"
 
 
-class PageVersion(BaseModel):
+class PageVersion(DeltaVersionMixin, BaseModel):
+    VERSION_PARENT_FIELD = "page"
+    VERSIONED_FIELDS = [
+        "description_binary",
+        "description_html",
+        "description_stripped",
+        "description_json",
+        "description_md",
+    ]
+
     workspace = models.ForeignKey("db.Workspace", on_delete=models.CASCADE, related_name="page_versions")
     page = models.ForeignKey("db.Page", on_delete=models.CASCADE, related_name="page_versions")
     last_saved_at = models.DateTimeField(default=timezone.now)
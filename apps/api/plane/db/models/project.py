@@ -8,9 +8,12 @@ from django.conf import settings
 from django.core.validators import MaxValueValidator, MinValueValidator
 from django.db import models
 from django.db.models import Q
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 
 # Module imports
-from plane.db.mixins import AuditModel
+from plane.db.mixins import AuditModel, ChangeTrackerMixin, MemberRoleManager
+from plane.utils.member_roles import MEMBER_ROLE_FIELDS, invalidate_member_roles
 
 from .base import BaseModel
 
@@ -201,7 +204,9 @@ class ProjectMemberInvite(ProjectBaseModel):
         return f"{self.project.name} {self.email} {self.accepted}"
 
 
-class ProjectMember(ProjectBaseModel):
+class ProjectMember(ChangeTrackerMixin, ProjectBaseModel):
+    TRACKED_FIELDS = list(MEMBER_ROLE_FIELDS)
+
     member = models.ForeignKey(
         settings.AUTH_USER_MODEL,
         on_delete=models.CASCADE,
@@ -217,6 +222,8 @@ class ProjectMember(ProjectBaseModel):
     sort_order = models.FloatField(default=65535)
     is_active = models.BooleanField(default=True)
 
+    objects = MemberRoleManager()
+
     def save(self, *args, **kwargs):
         if self._state.adding and self.member:
             # Get the minimum sort_order for this member in the workspace
@@ -254,6 +261,12 @@ class ProjectMember(ProjectBaseModel):
         return f"{self.member.email} <{self.project.name}>"
 
 
+@receiver([post_save, post_delete], sender=ProjectMember)
+def invalidate_project_member_roles(sender, instance, created=True, **kwargs):
+    # Deleted memberships are sent without created, and change the roles as the created ones do
+    invalidate_member_roles(instance, created=created)
+
+
 # TODO: Remove workspace relation later
 class ProjectIdentifier(AuditModel):
     workspace = models.ForeignKey("db.Workspace", models.CASCADE, related_name="project_identifiers", null=True)
@@ -6,9 +6,13 @@ from typing import Optional, Any
 from django.conf import settings
 from django.core.exceptions import ValidationError
 from django.db import models
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 
 # Module imports
 from .base import BaseModel
+from plane.db.mixins import ChangeTrackerMixin, MemberRoleManager
+from plane.utils.member_roles import MEMBER_ROLE_FIELDS, invalidate_member_roles
 from plane.utils.constants import RESTRICTED_WORKSPACE_SLUGS
 from plane.utils.color import get_random_color
 
@@ -201,7 +205,9 @@ class WorkspaceBaseModel(BaseModel):
         super(WorkspaceBaseModel, self).save(*args, **kwargs)
 
 
-class WorkspaceMember(BaseModel):
+class WorkspaceMember(ChangeTrackerMixin, BaseModel):
+    TRACKED_FIELDS = list(MEMBER_ROLE_FIELDS)
+
     workspace = models.ForeignKey("db.Workspace", on_delete=models.CASCADE, related_name="workspace_member")
     member = models.ForeignKey(
         settings.AUTH_USER_MODEL,
@@ -218,6 +224,8 @@ class WorkspaceMember(BaseModel):
     tips = models.JSONField(default=dict)
     explored_features = models.JSONField(default=dict)
 
+    objects = MemberRoleManager()
+
     class Meta:
         unique_together = ["workspace", "member", "deleted_at"]
         constraints = [
@@ -237,6 +245,12 @@ class WorkspaceMember(BaseModel):
         return f"{self.member.email} <{self.workspace.name}>"
 
 
+@receiver([post_save, post_delete], sender=WorkspaceMember)
+def invalidate_workspace_member_roles(sender, instance, created=True, **kwargs):
+    # Deleted memberships are sent without created, and change the roles as the created ones do
+    invalidate_member_roles(instance, created=created)
+
+
 class WorkspaceMemberInvite(BaseModel):
     workspace = models.ForeignKey("db.Workspace", on_delete=models.CASCADE, related_name="workspace_member_invite")
     email = models.CharField(max_length=255)
@@ -12,6 +12,10 @@ from django.http import HttpRequest, HttpResponse
 from plane.utils.core import (
     set_use_read_replica,
     clear_read_replica_context,
+    is_pinned_to_primary,
+    pin_to_primary,
+    record_routing_decision,
+    replica_is_lagging,
 )
 
 logger = logging.getLogger("plane.api")
@@ -24,8 +28,12 @@ class ReadReplicaRoutingMiddleware:
     • Non-GET requests (POST, PUT, DELETE, PATCH) ➜ Primary database
     • GET requests:
         - View has use_read_replica=False ➜ Primary database
-        - View has use_read_replica=True ➜ Read replica
+        - View has use_read_replica=True ➜ Read replica, unless
+            - the client wrote within READ_REPLICA_STICKY_SECONDS ➜ Primary database
+            - the replica lags more than READ_REPLICA_MAX_LAG seconds ➜ Primary database
         - View has no use_read_replica attribute ➜ Primary database (safe default)
+    Write requests pin their client to the primary so that it reads its own writes.
+    Every routing decision is counted per view.
     The middleware supports both Django CBVs and DRF APIViews/ViewSets.
     Context is properly isolated per request to prevent data leakage.
     """
@@ -57,6 +65,8 @@ class ReadReplicaRoutingMiddleware:
         try:
             # Process the request through the middleware chain
             response = self.get_response(request)
+            if request.method not in self.READ_ONLY_METHODS:
+                pin_to_primary(request)
             return response
         finally:
             # Always clean up context, even if an exception occurs
@@ -82,15 +92,51 @@ class ReadReplicaRoutingMiddleware:
         """
         # Only process read operations (write operations already handled in __call__)
         if request.method in self.READ_ONLY_METHODS:
-            use_replica = self._should_use_read_replica(view_func)
+            decision = self._get_routing_decision(request, view_func)
+            use_replica = decision == "replica"
             set_use_read_replica(use_replica)
 
             db_type = "read replica" if use_replica else "primary database"
-            logger.debug(f"Routing {request.method} {request.path} to {db_type}")
+            logger.debug(f"Routing {request.method} {request.path} to {db_type} ({decision})")
+        else:
+            decision = "primary_write"
+
+        if view_func is not None:
+            record_routing_decision(self._get_view_name(view_func), decision)
 
         # Return None to continue normal request processing
         return None
 
+    def _get_routing_decision(self, request: HttpRequest, view_func: Callable) -> str:
+        """
+        Decide where a read request goes and why.
+        Args:
+            request: The HTTP request object
+            view_func: The view function to be called
+        Returns:
+            str: "replica", or "primary_view", "primary_sticky" or "primary_lag"
+                 for a view not opted in, a client that just wrote, or a lagging replica
+        """
+        if not self._should_use_read_replica(view_func):
+            return "primary_view"
+        if is_pinned_to_primary(request):
+            return "primary_sticky"
+        if replica_is_lagging():
+            return "primary_lag"
+        return "replica"
+
+    def _get_view_name(self, view_func: Callable) -> str:
+        """
+        Name a view for the routing decision counts.
+        Args:
+            view_func: The view function to be called
+        Returns:
+            str: Dotted path of the view class, or of the function for function-based views
+        """
+        view = getattr(view_func, "cls", None) or getattr(view_func, "view_class", None) or view_func
+        name = getattr(view, "__qualname__", None) or type(view).__qualname__
+        return f"{getattr(view, '__module__', '')}.{name}"
+
     def _should_use_read_replica(self, view_func: Callable) -> bool:
         """
         Determine if the view should use read replica based on its configuration.
@@ -1,8 +1,10 @@
 # Python imports
 import logging
+import random
 import time
 
 # Django imports
+from django.conf import settings
 from django.http import HttpRequest
 from django.utils import timezone
 
@@ -12,7 +14,7 @@ from rest_framework.request import Request
 # Module imports
 from plane.utils.ip_address import get_client_ip
 from plane.utils.exception_logger import log_exception
-from plane.bgtasks.logger_task import process_logs
+from plane.utils.api_log_buffer import get_api_log_buffer
 
 api_logger = logging.getLogger("plane.api.request")
 
@@ -74,13 +76,17 @@ class RequestLoggerMiddleware:
 class APITokenLogMiddleware:
     """
     Middleware to log External API requests to MongoDB or PostgreSQL.
+    The logs are buffered in the process and written in bulk, see APIActivityLogBuffer.
     """
 
+    api_key_header = "X-Api-Key"
+
     def __init__(self, get_response):
         self.get_response = get_response
 
     def __call__(self, request):
-        request_body = request.body
+        # Only the requests of API tokens are logged, the body must be read before the view consumes the stream
+        request_body = request.body if request.headers.get(self.api_key_header) else None
         response = self.get_response(request)
         self.process_request(request, response, request_body)
         return response
@@ -102,14 +108,28 @@ class APITokenLogMiddleware:
         if content.startswith(b"\x89PNG") or content.startswith(b"\xff\xd8\xff") or content.startswith(b"%PDF"):
             return "[Binary Content]"
 
+        # Large bodies are only decoded up to the limit, and only for a sample of the requests
+        size = len(content)
+        truncated = size > settings.API_LOG_BODY_MAX_BYTES
+        if truncated:
+            if random.random() >= settings.API_LOG_LARGE_BODY_SAMPLE_RATE:
+                return f"[Body of {size} bytes not sampled]"
+            content = content[: settings.API_LOG_BODY_MAX_BYTES]
+
         try:
-            return content.decode("utf-8")
-        except UnicodeDecodeError:
-            return "[Could not decode content]"
+            body = content.decode("utf-8")
+        except UnicodeDecodeError as e:
+            # The truncated body may end in the middle of a character
+            if not truncated or e.start < len(content) - 3:
+                return "[Could not decode content]"
+            body = content[: e.start].decode("utf-8")
+
+        if truncated:
+            body += f"... [truncated, {size} bytes]"
+        return body
 
     def process_request(self, request, response, request_body):
-        api_key_header = "X-Api-Key"
-        api_key = request.headers.get(api_key_header)
+        api_key = request.headers.get(self.api_key_header)
 
         # If the API key is not present, return
         if not api_key:
@@ -133,16 +153,7 @@ class APITokenLogMiddleware:
                 if getattr(request, "user") and getattr(request.user, "is_authenticated", False)
                 else None
             )
-            # Additional fields for MongoDB
-            mongo_log = {
-                **log_data,
-                "created_at": timezone.now(),
-                "updated_at": timezone.now(),
-                "created_by": user_id,
-                "updated_by": user_id,
-            }
-
-            process_logs.delay(log_data=log_data, mongo_log=mongo_log)
+            get_api_log_buffer().add({"log_data": log_data, "created_at": timezone.now(), "user_id": user_id})
 
         except Exception as e:
             log_exception(e)
@@ -172,10 +172,76 @@ if os.environ.get("ENABLE_READ_REPLICA", "0") == "1":
     # Add middleware at the end for read replica routing
     MIDDLEWARE.append("plane.middleware.db_routing.ReadReplicaRoutingMiddleware")
 
+# Seconds a database connection is reused by the next requests, 0 closes it at the end of every request.
+# Keep it at 0 when served over ASGI, where every request runs in its own thread and connection.
+DATABASE_CONN_MAX_AGE = int(os.environ.get("DATABASE_CONN_MAX_AGE", 0))
+# Seconds a database connection of a celery worker process is reused by the next tasks
+CELERY_DATABASE_CONN_MAX_AGE = int(os.environ.get("CELERY_DATABASE_CONN_MAX_AGE", 300))
+# Check that a reused connection is alive before its first query in a request or task
+DATABASE_CONN_HEALTH_CHECKS = os.environ.get("DATABASE_CONN_HEALTH_CHECKS", "1") == "1"
+# "transaction" when the databases are reached through pgbouncer in transaction pooling mode
+DATABASE_POOL_MODE = os.environ.get("DATABASE_POOL_MODE", "session")
+
+for database in DATABASES.values():
+    database["CONN_MAX_AGE"] = DATABASE_CONN_MAX_AGE
+    database["CONN_HEALTH_CHECKS"] = DATABASE_CONN_HEALTH_CHECKS
+    if DATABASE_POOL_MODE == "transaction":
+        # The server connection changes between transactions, so the named cursors of iterator() cannot be
+        # used outside of a transaction. Prepared statements are already disabled by django for psycopg.
+        database["DISABLE_SERVER_SIDE_CURSORS"] = True
+
+# Seconds the reads of a client go to the primary after it wrote, 0 disables it
+READ_REPLICA_STICKY_SECONDS = int(os.environ.get("READ_REPLICA_STICKY_SECONDS", 0))
+# Seconds of replication lag above which reads go to the primary, 0 disables the lag check
+READ_REPLICA_MAX_LAG = float(os.environ.get("READ_REPLICA_MAX_LAG", 0))
+# Seconds between two measures of the replication lag by a process
+READ_REPLICA_LAG_CHECK_INTERVAL = float(os.environ.get("READ_REPLICA_LAG_CHECK_INTERVAL", 5))
+
 
 # Redis Config
 REDIS_URL = os.environ.get("REDIS_URL")
 REDIS_SSL = REDIS_URL and "rediss" in REDIS_URL
+# Connection pool shared by the redis_instance client of each process
+REDIS_MAX_CONNECTIONS = int(os.environ.get("REDIS_MAX_CONNECTIONS", 50))
+# Seconds to wait for a free pooled connection
+REDIS_POOL_TIMEOUT = int(os.environ.get("REDIS_POOL_TIMEOUT", 20))
+# Seconds a connection can stay idle before it is checked on checkout
+REDIS_HEALTH_CHECK_INTERVAL = int(os.environ.get("REDIS_HEALTH_CHECK_INTERVAL", 30))
+# Seconds the workspace and project roles of a member are cached for the permission checks, 0 disables it
+MEMBER_ROLES_CACHE_TTL = int(os.environ.get("MEMBER_ROLES_CACHE_TTL", 0))
+# Seconds the validation of an API token is cached, revoked and updated tokens are dropped from the cache
+API_TOKEN_CACHE_TTL = int(os.environ.get("API_TOKEN_CACHE_TTL", 60))
+# Seconds the payload of a webhook event is kept for its deliveries and their retries
+WEBHOOK_PAYLOAD_TTL = int(os.environ.get("WEBHOOK_PAYLOAD_TTL", 6 * 60 * 60))
+# Webhook deliveries sent concurrently per batch, and seconds a delivery run sends batches for
+WEBHOOK_DELIVERY_BATCH_SIZE = int(os.environ.get("WEBHOOK_DELIVERY_BATCH_SIZE", 200))
+WEBHOOK_DELIVERY_RUN_SECONDS = int(os.environ.get("WEBHOOK_DELIVERY_RUN_SECONDS", 60))
+# Seconds to wait for the response of a webhook endpoint
+WEBHOOK_DELIVERY_TIMEOUT = int(os.environ.get("WEBHOOK_DELIVERY_TIMEOUT", 30))
+# Requests sent at the same time to a webhook host
+WEBHOOK_HOST_CONCURRENCY = int(os.environ.get("WEBHOOK_HOST_CONCURRENCY", 4))
+# Consecutive failures after which the deliveries of a webhook are paused, and seconds they are paused for
+WEBHOOK_CIRCUIT_FAILURES = int(os.environ.get("WEBHOOK_CIRCUIT_FAILURES", 3))
+WEBHOOK_CIRCUIT_COOLDOWN = int(os.environ.get("WEBHOOK_CIRCUIT_COOLDOWN", 300))
+# Every Nth page and work item description version is stored in full, the others as deltas of the previous one
+VERSION_SNAPSHOT_INTERVAL = max(int(os.environ.get("VERSION_SNAPSHOT_INTERVAL", 10)), 1)
+# External API activity logs buffered per process before they are written in bulk
+API_LOG_BUFFER_SIZE = int(os.environ.get("API_LOG_BUFFER_SIZE", 10000))
+# Logs written per insert, and seconds between writes of a partial batch
+API_LOG_FLUSH_SIZE = int(os.environ.get("API_LOG_FLUSH_SIZE", 500))
+API_LOG_FLUSH_INTERVAL = float(os.environ.get("API_LOG_FLUSH_INTERVAL", 5))
+# Request and response bodies are logged up to this size, larger ones are truncated for a sample of the requests
+API_LOG_BODY_MAX_BYTES = int(os.environ.get("API_LOG_BODY_MAX_BYTES", 4096))
+API_LOG_LARGE_BODY_SAMPLE_RATE = float(os.environ.get("API_LOG_LARGE_BODY_SAMPLE_RATE", 1.0))
+# Analytics are read from the issue facts refreshed in the background, unless filtered ad hoc
+ANALYTICS_ROLLUPS_ENABLED = os.environ.get("ANALYTICS_ROLLUPS_ENABLED", "1") == "1"
+# Work items fetched and serialized at a time by the exports, and bytes of an export archive kept in memory
+# before it is spooled to disk
+EXPORT_CHUNK_SIZE = int(os.environ.get("EXPORT_CHUNK_SIZE", 1000))
+EXPORT_SPOOL_MAX_SIZE = int(os.environ.get("EXPORT_SPOOL_MAX_SIZE", 16 * 1024 * 1024))
+# Work items accepted by a bulk create request, and rows inserted per statement
+ISSUE_BULK_CREATE_MAX_ISSUES = int(os.environ.get("ISSUE_BULK_CREATE_MAX_ISSUES", 1000))
+ISSUE_BULK_CREATE_BATCH_SIZE = int(os.environ.get("ISSUE_BULK_CREATE_BATCH_SIZE", 500))
 
 if REDIS_SSL:
     CACHES = {
@@ -184,7 +250,11 @@ if REDIS_SSL:
             "LOCATION": REDIS_URL,
             "OPTIONS": {
                 "CLIENT_CLASS": "django_redis.client.DefaultClient",
-                "CONNECTION_POOL_KWARGS": {"ssl_cert_reqs": False},
+                "CONNECTION_POOL_KWARGS": {
+                    "ssl_cert_reqs": False,
+                    "max_connections": REDIS_MAX_CONNECTIONS,
+                    "health_check_interval": REDIS_HEALTH_CHECK_INTERVAL,
+                },
             },
         }
     }
@@ -193,7 +263,13 @@ else:
         "default": {
             "BACKEND": "django_redis.cache.RedisCache",
             "LOCATION": REDIS_URL,
-            "OPTIONS": {"CLIENT_CLASS": "django_redis.client.DefaultClient"},
+            "OPTIONS": {
+                "CLIENT_CLASS": "django_redis.client.DefaultClient",
+                "CONNECTION_POOL_KWARGS": {
+                    "max_connections": REDIS_MAX_CONNECTIONS,
+                    "health_check_interval": REDIS_HEALTH_CHECK_INTERVAL,
+                },
+            },
         }
     }
 
@@ -229,6 +305,9 @@ TIME_ZONE = "UTC"
 # Default Auto Field
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
+# Search backend of the issue and global search endpoints
+SEARCH_BACKEND = os.environ.get("SEARCH_BACKEND", "plane.utils.search_backend.PostgresSearchBackend")
+
 # Email settings
 EMAIL_BACKEND = "django.core.mail.backends.smtp.EmailBackend"
 
@@ -278,6 +357,10 @@ CELERY_IMPORTS = (
     "plane.bgtasks.file_asset_task",
     "plane.bgtasks.email_notification_task",
     "plane.bgtasks.cleanup_task",
+    "plane.bgtasks.api_token_task",
+    "plane.bgtasks.webhook_task",
+    "plane.bgtasks.recent_visited_task",
+    "plane.bgtasks.analytics_rollup_task",
     "plane.license.bgtasks.tracer",
     # management tasks
     "plane.bgtasks.dummy_data_task",
@@ -358,6 +441,18 @@ LIVE_URL = urljoin(LIVE_BASE_URL, LIVE_BASE_PATH) if LIVE_BASE_URL else None
 WEB_URL = os.environ.get("WEB_URL")
 
 HARD_DELETE_AFTER_DAYS = int(os.environ.get("HARD_DELETE_AFTER_DAYS", 60))
+# Rows purged per transaction by the hard delete
+HARD_DELETE_CHUNK_SIZE = int(os.environ.get("HARD_DELETE_CHUNK_SIZE", 500))
+# Pause after each chunk, as a share of the time the chunk took
+HARD_DELETE_THROTTLE_RATIO = float(os.environ.get("HARD_DELETE_THROTTLE_RATIO", 0.5))
+# Active queries of the database above which the purge waits, 0 to never wait
+HARD_DELETE_MAX_ACTIVE_QUERIES = int(os.environ.get("HARD_DELETE_MAX_ACTIVE_QUERIES", 20))
+HARD_DELETE_THROTTLE_WAIT = float(os.environ.get("HARD_DELETE_THROTTLE_WAIT", 5))
+# Longest wait for the active queries to go down, after which the purge stops and resumes on the next run
+HARD_DELETE_THROTTLE_MAX_WAIT = float(os.environ.get("HARD_DELETE_THROTTLE_MAX_WAIT", 300))
+
+# Days the changes of the issues are kept for the change feeds, the clients not reading them for longer resync
+ISSUE_CHANGES_RETENTION_DAYS = int(os.environ.get("ISSUE_CHANGES_RETENTION_DAYS", 30))
 
 # Instance Changelog URL
 INSTANCE_CHANGELOG_URL = os.environ.get("INSTANCE_CHANGELOG_URL", "")
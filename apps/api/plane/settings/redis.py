@@ -1,20 +1,96 @@
+import os
+import threading
+import uuid
+from contextlib import contextmanager
+
 import redis
 from django.conf import settings
-from urllib.parse import urlparse
 
+# Process wide client, re-created in forked processes such as celery prefork workers
+_redis_client = None
+_redis_client_pid = None
+_redis_client_lock = threading.Lock()
 
-def redis_instance():
-    # connect to redis
+# Extend or release a lock only while the token that acquired it holds it
+_RENEW_LOCK_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("expire", KEYS[1], ARGV[2])
+end
+return 0
+"""
+_RELEASE_LOCK_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
+
+def _create_redis_client():
+    pool_kwargs = {
+        "max_connections": settings.REDIS_MAX_CONNECTIONS,
+        "timeout": settings.REDIS_POOL_TIMEOUT,
+        "health_check_interval": settings.REDIS_HEALTH_CHECK_INTERVAL,
+        "db": 0,
+    }
     if settings.REDIS_SSL:
-        url = urlparse(settings.REDIS_URL)
-        ri = redis.Redis(
-            host=url.hostname,
-            port=url.port,
-            password=url.password,
-            ssl=True,
-            ssl_cert_reqs=None,
-        )
-    else:
-        ri = redis.Redis.from_url(settings.REDIS_URL, db=0)
-
-    return ri
+        pool_kwargs["ssl_cert_reqs"] = None
+
+    # Wait for a free connection instead of failing when the pool is exhausted
+    pool = redis.BlockingConnectionPool.from_url(settings.REDIS_URL, **pool_kwargs)
+    return redis.Redis(connection_pool=pool)
+
+
+def redis_instance():
+    """Return the pooled redis client of the current process"""
+    global _redis_client, _redis_client_pid
+
+    pid = os.getpid()
+    if _redis_client is None or _redis_client_pid != pid:
+        with _redis_client_lock:
+            if _redis_client is None or _redis_client_pid != pid:
+                _redis_client = _create_redis_client()
+                _redis_client_pid = pid
+
+    return _redis_client
+
+
+def reset_redis_instance():
+    """Drop the pooled client, the next call to redis_instance creates a new one"""
+    global _redis_client, _redis_client_pid
+
+    with _redis_client_lock:
+        client = _redis_client
+        _redis_client = None
+        _redis_client_pid = None
+
+    # Sockets inherited from a parent process are closed without being shared
+    if client is not None:
+        client.connection_pool.reset()
+
+
+@contextmanager
+def redis_pipeline(transaction=False):
+    """Buffer the commands of the block and send them to redis in one round trip"""
+    pipeline = redis_instance().pipeline(transaction=transaction)
+    try:
+        yield pipeline
+        pipeline.execute()
+    finally:
+        pipeline.reset()
+
+
+def acquire_lock(key, expiry):
+    """Take the lock for expiry seconds. Returns the token holding it, or None when it is held already"""
+    token = uuid.uuid4().hex
+    return token if redis_instance().set(key, token, nx=True, ex=expiry) else None
+
+
+def renew_lock(key, token, expiry):
+    """Hold the lock for expiry more seconds. Returns False when the token lost it, e.g. once it expired"""
+    return bool(redis_instance().eval(_RENEW_LOCK_SCRIPT, 1, key, token, int(expiry)))
+
+
+def release_lock(key, token):
+    """Release the lock unless it expired and another holder took it since"""
+    redis_instance().eval(_RELEASE_LOCK_SCRIPT, 1, key, token)
@@ -10,3 +10,7 @@ EMAIL_BACKEND = "django.core.mail.backends.locmem.EmailBackend"
 INSTALLED_APPS.append(  # noqa
     "plane.tests"
 )
+
+# Tests flush the API activity log buffer themselves
+API_LOG_FLUSH_SIZE = 100000
+API_LOG_FLUSH_INTERVAL = 24 * 60 * 60
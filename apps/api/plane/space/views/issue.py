@@ -17,10 +17,7 @@ from django.db.models import (
     When,
     JSONField,
     Value,
-    OuterRef,
-    Func,
     CharField,
-    Subquery,
 )
 from django.db.models.functions import Concat
 
@@ -52,17 +49,15 @@ from plane.app.serializers import (
 from plane.db.models import (
     Issue,
     IssueComment,
-    IssueLink,
     IssueReaction,
     ProjectMember,
     CommentReaction,
     DeployBoard,
     IssueVote,
     ProjectPublicMember,
-    FileAsset,
-    CycleIssue,
 )
 from plane.bgtasks.issue_activities_task import issue_activity
+from plane.utils.issue_counters import issue_counter_annotations
 from plane.utils.issue_filters import issue_filters
 
 
@@ -91,32 +86,7 @@ class ProjectIssuesPublicEndpoint(BaseAPIView):
                 )
             )
             .prefetch_related(Prefetch("votes", queryset=IssueVote.objects.select_related("actor")))
-            .annotate(
-                cycle_id=Subquery(
-                    CycleIssue.objects.filter(issue=OuterRef("id"), deleted_at__isnull=True).values("cycle_id")[:1]
-                )
-            )
-            .annotate(
-                link_count=IssueLink.objects.filter(issue=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
-            .annotate(
-                attachment_count=FileAsset.objects.filter(
-                    issue_id=OuterRef("id"),
-                    entity_type=FileAsset.EntityTypeContext.ISSUE_ATTACHMENT,
-                )
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
-            .annotate(
-                sub_issues_count=Issue.issue_objects.filter(parent=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
+            .annotate(**issue_counter_annotations())
         ).distinct()
 
         issue_queryset = issue_queryset.filter(**filters)
@@ -601,11 +571,7 @@ class IssueRetrievePublicEndpoint(BaseAPIView):
             )
             .select_related("workspace", "project", "state", "parent")
             .prefetch_related("assignees", "labels", "issue_module__module")
-            .annotate(
-                cycle_id=Subquery(
-                    CycleIssue.objects.filter(issue=OuterRef("id"), deleted_at__isnull=True).values("cycle_id")[:1]
-                )
-            )
+            .annotate(**issue_counter_annotations("cycle_id"))
             .annotate(
                 label_ids=Coalesce(
                     ArrayAgg(
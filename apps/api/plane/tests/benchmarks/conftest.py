@@ -0,0 +1,101 @@
+import random
+import time
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from plane.db.models import Issue, IssueLabel, IssueSequence, Label, Project, State
+
+
+class Measurement:
+    """Query count and wall time of a block"""
+
+    def __init__(self):
+        self.queries = 0
+        self.statements = []
+        self.duration = 0.0
+
+    def __str__(self):
+        return f"{self.queries} queries in {self.duration * 1000:.1f}ms"
+
+
+@pytest.fixture
+def measure():
+    """Measure the queries and the time spent in a block"""
+
+    class Measure:
+        def __call__(self):
+            return self
+
+        def __enter__(self):
+            self.measurement = Measurement()
+            self.context = CaptureQueriesContext(connection)
+            self.context.__enter__()
+            self.start = time.perf_counter()
+            return self.measurement
+
+        def __exit__(self, *exc_info):
+            self.measurement.duration = time.perf_counter() - self.start
+            self.context.__exit__(*exc_info)
+            self.measurement.statements = [query["sql"] for query in self.context.captured_queries]
+            self.measurement.queries = len(self.measurement.statements)
+
+    return Measure()
+
+
+@pytest.fixture
+def seed_project(workspace, create_user):
+    """Return a function that seeds a project with issues spread over states, priorities and labels"""
+
+    def seed(issue_count, label_count=20, issue_name=None):
+        project = Project.objects.create(
+            name=f"Benchmark {issue_count}",
+            identifier=f"B{issue_count}"[:12],
+            workspace=workspace,
+            created_by=create_user,
+        )
+        states = [
+            State.objects.create(name=group.title(), group=group, project=project, workspace=workspace)
+            for group in ["backlog", "unstarted", "started", "completed", "cancelled"]
+        ]
+        labels = [
+            Label.objects.create(name=f"Label {index}", project=project, workspace=workspace)
+            for index in range(label_count)
+        ]
+
+        randomizer = random.Random(issue_count)
+        issues = Issue.objects.bulk_create(
+            [
+                Issue(
+                    name=issue_name(index) if issue_name else f"Issue {index}",
+                    project=project,
+                    workspace=workspace,
+                    state=randomizer.choice(states),
+                    priority=randomizer.choice(["urgent", "high", "medium", "low", "none"]),
+                    sequence_id=index + 1,
+                    sort_order=index * 10000,
+                    created_by=create_user,
+                )
+                for index in range(issue_count)
+            ],
+            batch_size=1000,
+        )
+        IssueSequence.objects.bulk_create(
+            [
+                IssueSequence(issue=issue, sequence=issue.sequence_id, project=project, workspace=workspace)
+                for issue in issues
+            ],
+            batch_size=1000,
+        )
+        IssueLabel.objects.bulk_create(
+            [
+                IssueLabel(issue=issue, label=label, project=project, workspace=workspace)
+                for issue in issues
+                for label in randomizer.sample(labels, randomizer.randint(0, 2))
+            ],
+            batch_size=1000,
+        )
+        return project
+
+    return seed
@@ -0,0 +1,60 @@
+import json
+import statistics
+
+import pytest
+from django.db import connection
+from django.urls import reverse
+
+from plane.bgtasks.analytics_rollup_task import reconcile_analytics_rollups
+from plane.db.models import IssueAnalyticsFact, ProjectMember
+
+ISSUE_COUNT = 20000
+RUNS = 5
+AXES = [("state_id", "priority"), ("labels__id", "state__group"), ("created_at", None)]
+
+
+def sort_segments(analytics):
+    for rows in analytics["distribution"].values():
+        rows.sort(key=lambda row: str(row.get("segment")))
+    return analytics
+
+
+@pytest.mark.slow
+class TestAnalyticsRollupsBenchmark:
+    """Analytics served from the issue facts against the live aggregates over the issues"""
+
+    @pytest.mark.django_db
+    def test_analytics(self, seed_project, workspace, create_user, session_client, measure):
+        project = seed_project(ISSUE_COUNT)
+        ProjectMember.objects.create(project=project, workspace=workspace, member=create_user, role=20)
+        # Spread the issues over a year of daily facts
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "UPDATE issues SET created_at = now() - random() * interval '365 days' WHERE project_id = %s",
+                [project.id],
+            )
+
+        with measure() as reconcile:
+            reconcile_analytics_rollups()
+        facts = IssueAnalyticsFact.objects.filter(project=project).count()
+        print(f"\nReconciled {ISSUE_COUNT} issues into {facts} facts: {reconcile}")
+        assert facts > 0
+
+        url = reverse("plane-analytics", kwargs={"slug": workspace.slug})
+        for x_axis, segment in AXES:
+            params = {"x_axis": x_axis, "y_axis": "issue_count", **({"segment": segment} if segment else {})}
+            timings = {}
+            for mode, extra in [("live", {"live": "true"}), ("rollup", {})]:
+                durations = []
+                for _ in range(RUNS):
+                    with measure() as request:
+                        response = session_client.get(url, {**params, **extra})
+                    durations.append(request.duration)
+                timings[mode] = (statistics.median(durations), request.queries, json.loads(response.content))
+
+            print(
+                f"{x_axis}/{segment}: live {timings['live'][0] * 1000:.1f}ms in {timings['live'][1]} queries, "
+                f"rollup {timings['rollup'][0] * 1000:.1f}ms in {timings['rollup'][1]} queries"
+            )
+            assert sort_segments(timings["rollup"][2]) == sort_segments(timings["live"][2])
+            assert timings["rollup"][0] < timings["live"][0]
@@ -0,0 +1,55 @@
+import time
+import uuid
+
+import pytest
+from celery.fixups.django import DjangoWorkerFixup
+from django.db import connection
+
+from plane.bgtasks.issue_description_version_task import issue_description_version_task
+from plane.celery import app, persist_database_connections
+
+TASK_COUNT = 500
+
+
+def run_tasks(workspace, user, conn_max_age=None):
+    """Run tasks like a worker process, closing the obsolete connections before and after every task"""
+    connection.close()
+    if conn_max_age is None:
+        persist_database_connections()
+    else:
+        connection.settings_dict["CONN_MAX_AGE"] = conn_max_age
+
+    fixup = DjangoWorkerFixup(app)
+    connections = set()
+    start = time.perf_counter()
+    for _ in range(TASK_COUNT):
+        fixup.close_database()
+        # A single lookup of a missing work item
+        issue_description_version_task(updated_issue=None, issue_id=str(uuid.uuid4()), user_id=str(user.id))
+        connections.add(connection.connection.info.backend_pid)
+        fixup.close_database()
+    return TASK_COUNT / (time.perf_counter() - start), len(connections)
+
+
+@pytest.mark.slow
+class TestDatabaseConnectionsBenchmark:
+    """Throughput of tiny tasks with and without persistent connections"""
+
+    @pytest.mark.django_db(transaction=True)
+    def test_persistent_connections(self, workspace, create_user):
+        conn_max_age = connection.settings_dict["CONN_MAX_AGE"]
+        try:
+            closed_rate, closed_connections = run_tasks(workspace, create_user, conn_max_age=0)
+            persistent_rate, persistent_connections = run_tasks(workspace, create_user)
+        finally:
+            connection.close()
+            connection.settings_dict["CONN_MAX_AGE"] = conn_max_age
+
+        print(
+            f"\n{TASK_COUNT} tasks: {closed_rate:.0f} tasks/s with a connection per task, "
+            f"{persistent_rate:.0f} tasks/s with a persistent connection"
+        )
+
+        # The rates are printed, the connections opened do not depend on the load of the machine
+        assert closed_connections == TASK_COUNT
+        assert persistent_connections == 1
@@ -0,0 +1,88 @@
+from unittest.mock import patch
+
+import pytest
+from django.utils import timezone
+
+from plane.bgtasks.deletion_task import (
+    HARD_DELETE_CHECKPOINT_KEY,
+    HARD_DELETE_LOCK_KEY,
+    hard_delete,
+    restore_related_objects,
+    soft_delete_related_objects,
+)
+from plane.db.models import Issue, IssueActivity, IssueAssignee, IssueComment, IssueLink, Project, ProjectMember
+from plane.settings.redis import redis_instance
+
+ISSUE_COUNT = 20000
+
+
+def seed_issue_relations(seed_project, workspace, create_user):
+    """A project with activities, a comment, a link and an assignee per work item"""
+    project = seed_project(ISSUE_COUNT)
+    ProjectMember.objects.create(project=project, workspace=workspace, member=create_user, role=20)
+    issues = list(Issue.objects.filter(project=project).values_list("id", flat=True))
+    scope = {"project": project, "workspace": workspace}
+    IssueActivity.objects.bulk_create(
+        [
+            IssueActivity(issue_id=issue_id, actor=create_user, verb=verb, **scope)
+            for issue_id in issues
+            for verb in ["created", "updated"]
+        ],
+        batch_size=5000,
+    )
+    IssueComment.objects.bulk_create(
+        [IssueComment(issue_id=issue_id, actor=create_user, comment_html="<p>c</p>", **scope) for issue_id in issues],
+        batch_size=5000,
+    )
+    IssueLink.objects.bulk_create(
+        [IssueLink(issue_id=issue_id, url="https://plane.so", **scope) for issue_id in issues], batch_size=5000
+    )
+    IssueAssignee.objects.bulk_create(
+        [IssueAssignee(issue_id=issue_id, assignee=create_user, **scope) for issue_id in issues], batch_size=5000
+    )
+    return project
+
+
+@pytest.mark.slow
+class TestDeletionCascadeBenchmark:
+    """Soft delete, restore and purge of a project with many work items and their relations"""
+
+    @pytest.mark.django_db
+    def test_project_cascade(self, seed_project, workspace, create_user, measure):
+        project = seed_issue_relations(seed_project, workspace, create_user)
+
+        with patch("plane.db.mixins.soft_delete_related_objects.delay"):
+            project.delete()
+        with measure() as delete:
+            soft_delete_related_objects("db", "project", project.id)
+        print(f"\nSoft deleted a project of {ISSUE_COUNT} work items: {delete}")
+        assert not IssueComment.objects.filter(project=project).exists()
+        assert not IssueActivity.objects.filter(project=project).exists()
+
+        with measure() as restore:
+            restore_related_objects("db", "project", project.id)
+        print(f"Restored it: {restore}")
+        assert IssueLink.objects.filter(project=project).count() == ISSUE_COUNT
+
+        # A statement per relation and chunk of rows, where a save per row used to run
+        assert delete.queries < ISSUE_COUNT / 10
+
+    @pytest.mark.django_db
+    def test_project_purge(self, seed_project, workspace, create_user, measure, settings):
+        settings.HARD_DELETE_THROTTLE_RATIO = 0
+        redis_instance().delete(HARD_DELETE_CHECKPOINT_KEY, HARD_DELETE_LOCK_KEY)
+        project = seed_issue_relations(seed_project, workspace, create_user)
+        with patch("plane.db.mixins.soft_delete_related_objects.delay"):
+            project.delete()
+        soft_delete_related_objects("db", "project", project.id)
+        Project.all_objects.filter(pk=project.id).update(deleted_at=timezone.now() - timezone.timedelta(days=61))
+
+        with measure() as purge:
+            metrics = {metric["model"]: metric for metric in hard_delete()}
+        print(f"\nPurged a project of {ISSUE_COUNT} work items: {purge}, {metrics['db.project']}")
+        assert not Issue.all_objects.filter(project=project).exists()
+        assert not IssueActivity.all_objects.filter(project=project).exists()
+        assert metrics["db.project"]["cascaded"] > ISSUE_COUNT * 6
+
+        # A few statements per relation and chunk of rows, where the collector held every row in memory
+        assert purge.queries * 20 < metrics["db.project"]["cascaded"]
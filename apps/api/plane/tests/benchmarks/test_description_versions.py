@@ -0,0 +1,79 @@
+import json
+import random
+import time
+
+import pytest
+from django.db import connection
+
+from plane.bgtasks.page_version_task import MAX_PAGE_VERSIONS, page_version
+from plane.db.models import Page, PageVersion
+
+PAGE_COUNT = 10
+PARAGRAPH_COUNT = 400
+
+
+def write_versions(workspace, user):
+    """Edit one paragraph of every page per version, like an author revising a long document"""
+    words = [f"word{index}" for index in range(5000)]
+    pages = []
+    for page_index in range(PAGE_COUNT):
+        paragraphs = [" ".join(random.choices(words, k=40)) for _ in range(PARAGRAPH_COUNT)]
+        page = Page.objects.create(name=f"Benchmark {page_index}", workspace=workspace, owned_by=user)
+        for _ in range(MAX_PAGE_VERSIONS):
+            paragraphs[random.randrange(PARAGRAPH_COUNT)] = " ".join(random.choices(words, k=40))
+            html = "".join(f"<p>{paragraph}</p>" for paragraph in paragraphs)
+            previous_html = page.description_html
+            Page.objects.filter(pk=page.id).update(
+                description_html=html,
+                description={"type": "doc", "content": paragraphs},
+                description_stripped=" ".join(paragraphs),
+            )
+            page.refresh_from_db()
+            page_version(page.id, json.dumps({"description_html": previous_html}), user.id)
+        pages.append(page)
+    return pages
+
+
+def stored_size(pages):
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT sum(pg_column_size(page_versions.*)) FROM page_versions WHERE page_id = ANY(%s)",
+            [[page.id for page in pages]],
+        )
+        return cursor.fetchone()[0]
+
+
+def read_latencies(pages):
+    latencies = []
+    for version in PageVersion.objects.filter(page__in=pages):
+        start = time.perf_counter()
+        version.load_version_content()
+        latencies.append(time.perf_counter() - start)
+    latencies.sort()
+    return latencies[len(latencies) // 2], latencies[-1]
+
+
+@pytest.mark.slow
+class TestDescriptionVersionsBenchmark:
+    """Storage and read latency of page versions stored in full and as deltas between snapshots"""
+
+    @pytest.mark.django_db
+    def test_delta_versions(self, workspace, create_user, settings):
+        settings.VERSION_SNAPSHOT_INTERVAL = 1
+        full_pages = write_versions(workspace, create_user)
+        full_size = stored_size(full_pages)
+        full_median, full_max = read_latencies(full_pages)
+
+        settings.VERSION_SNAPSHOT_INTERVAL = 10
+        delta_pages = write_versions(workspace, create_user)
+        delta_size = stored_size(delta_pages)
+        delta_median, delta_max = read_latencies(delta_pages)
+
+        print(
+            f"\n{PAGE_COUNT * MAX_PAGE_VERSIONS} versions: {full_size / 1024:.0f}KB stored in full, "
+            f"{delta_size / 1024:.0f}KB with snapshots every 10 versions\n"
+            f"read latency: median {full_median * 1000:.2f}ms max {full_max * 1000:.2f}ms in full, "
+            f"median {delta_median * 1000:.2f}ms max {delta_max * 1000:.2f}ms from deltas"
+        )
+
+        assert delta_size * 3 < full_size
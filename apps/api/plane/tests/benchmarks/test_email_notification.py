@@ -0,0 +1,66 @@
+import random
+from unittest.mock import patch
+
+import pytest
+
+from plane.bgtasks.email_notification_task import EMAIL_NOTIFICATION_BATCH_SIZE, stack_email_notification
+from plane.db.models import EmailNotificationLog, Issue, User
+
+LOG_COUNT = 100_000
+RECEIVER_COUNT = 1000
+
+
+@pytest.fixture
+def pending_logs(seed_project, create_user):
+    """Pending notifications of random issues for many receivers"""
+    project = seed_project(2000)
+    issue_ids = list(Issue.objects.filter(project=project).values_list("id", flat=True))
+    receivers = User.objects.bulk_create(
+        [User(email=f"receiver{index}@plane.so", username=f"receiver{index}") for index in range(RECEIVER_COUNT)]
+    )
+
+    randomizer = random.Random(LOG_COUNT)
+    EmailNotificationLog.objects.bulk_create(
+        [
+            EmailNotificationLog(
+                receiver=randomizer.choice(receivers),
+                triggered_by=create_user,
+                entity_identifier=randomizer.choice(issue_ids),
+                entity_name="issue",
+                entity="issue",
+                data={
+                    "issue_activity": {
+                        "field": "priority",
+                        "old_value": "low",
+                        "new_value": "high",
+                        "activity_time": "2025-01-01T10:00:00Z",
+                    }
+                },
+            )
+            for _ in range(LOG_COUNT)
+        ],
+        batch_size=5000,
+    )
+
+
+@pytest.mark.slow
+class TestEmailNotificationBenchmark:
+    """Throughput of the grouping of the pending email notifications"""
+
+    @pytest.mark.django_db
+    def test_stack_email_notification(self, pending_logs, measure):
+        with patch("plane.bgtasks.email_notification_task.send_email_notification_batch.delay") as batch_delay:
+            with measure() as stacked:
+                stack_email_notification()
+
+        issues = sum(len(call.kwargs["issues"]) for call in batch_delay.call_args_list)
+        print(
+            f"\n{LOG_COUNT} logs of {RECEIVER_COUNT} receivers: {stacked} ({LOG_COUNT / stacked.duration:.0f} logs/s), "
+            f"{batch_delay.call_count} batches for {issues} issue emails"
+        )
+
+        assert not EmailNotificationLog.objects.filter(processed_at__isnull=True).exists()
+        # One task per batch of issues of a receiver instead of one per issue
+        assert batch_delay.call_count <= issues // EMAIL_NOTIFICATION_BATCH_SIZE + RECEIVER_COUNT
+        # The logs are read in chunks and marked as processed in chunks
+        assert stacked.queries <= 2 * LOG_COUNT // 2000 + 2
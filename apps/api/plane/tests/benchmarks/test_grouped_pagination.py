@@ -0,0 +1,135 @@
+import pytest
+from django.db import connection
+from django.db.models import Q
+from django.test import RequestFactory
+
+from plane.app.views.issue.base import IssueViewSet
+from plane.db.models import Issue
+from plane.utils.grouper import issue_group_values, issue_on_results, issue_queryset_grouper
+from plane.utils.order_queryset import order_issue_queryset
+from plane.utils.paginator import BasePaginator, GroupedOffsetPaginator, SubGroupedOffsetPaginator
+
+from .baseline_paginator import BaselineGroupedOffsetPaginator, BaselineSubGroupedOffsetPaginator
+
+ISSUE_COUNT = 5000
+RUNS = 3
+
+COUNT_FILTER = Q(
+    Q(issue_intake__status=1) | Q(issue_intake__status=-1) | Q(issue_intake__status=2) | Q(issue_intake__isnull=True),
+    archived_at__isnull=True,
+    is_draft=False,
+)
+
+
+def group_values(project, field):
+    """Values of the board columns, fetched by the view before paginating"""
+    return issue_group_values(
+        field=field,
+        slug=project.workspace.slug,
+        project_id=project.id,
+        queryset=Issue.issue_objects.filter(project=project),
+    )
+
+
+def paginate_board(
+    project,
+    group_by,
+    group_by_fields,
+    sub_group_by=None,
+    sub_group_by_fields=None,
+    cursor="50:0:0",
+    baseline=False,
+):
+    """Paginate the project issues the way the board layout of the issue list does, or as it did before"""
+    queryset = Issue.issue_objects.filter(project=project)
+    filtered_queryset = queryset
+    queryset = IssueViewSet().apply_annotations(queryset)
+    queryset, order_by = order_issue_queryset(queryset, "-created_at")
+    queryset = issue_queryset_grouper(queryset=queryset, group_by=group_by, sub_group_by=sub_group_by)
+
+    kwargs = {"paginator_cls": BaselineGroupedOffsetPaginator if baseline else GroupedOffsetPaginator}
+    if sub_group_by:
+        kwargs = {
+            "paginator_cls": BaselineSubGroupedOffsetPaginator if baseline else SubGroupedOffsetPaginator,
+            "sub_group_by_field_name": sub_group_by,
+            "sub_group_by_fields": sub_group_by_fields,
+        }
+
+    request = RequestFactory().get("/", {"per_page": 50, "cursor": cursor})
+    return BasePaginator().paginate(
+        request=request,
+        order_by=order_by,
+        queryset=queryset,
+        total_count_queryset=filtered_queryset,
+        on_results=lambda issues: issue_on_results(group_by=group_by, issues=issues, sub_group_by=sub_group_by),
+        group_by_fields=group_by_fields,
+        group_by_field_name=group_by,
+        count_filter=COUNT_FILTER,
+        **kwargs,
+    )
+
+
+def board_contents(data):
+    """The total and the page issues of every group of a board page, and of every sub group of it"""
+
+    def contents(group):
+        if isinstance(group["results"], dict):
+            results = {key: contents(sub_group) for key, sub_group in group["results"].items()}
+        else:
+            results = sorted(str(issue["id"]) for issue in group["results"])
+        return group["total_results"], results
+
+    return {key: contents(group) for key, group in data["results"].items()}
+
+
+@pytest.mark.slow
+class TestGroupedPaginationBenchmark:
+    """Query count and latency of the grouped board pagination"""
+
+    @pytest.mark.django_db
+    @pytest.mark.parametrize(
+        "group_by,sub_group_by",
+        [
+            ("state_id", None),
+            ("labels__id", None),
+            ("priority", "state_id"),
+            ("state_id", "labels__id"),
+        ],
+    )
+    def test_grouped_pagination(self, seed_project, measure, group_by, sub_group_by):
+        project = seed_project(ISSUE_COUNT)
+        with connection.cursor() as cursor:
+            cursor.execute("ANALYZE issues, issue_labels, issue_assignees")
+        group_by_fields = group_values(project, group_by)
+        sub_group_by_fields = group_values(project, sub_group_by) if sub_group_by else None
+
+        def paginate(cursor="50:0:0", baseline=False):
+            return paginate_board(
+                project, group_by, group_by_fields, sub_group_by, sub_group_by_fields, cursor, baseline
+            )
+
+        def fastest(**kwargs):
+            """The fastest of a few runs, the first ones warming up the connection and the query plans"""
+            runs = []
+            for _ in range(RUNS):
+                with measure() as measurement:
+                    measurement.response = paginate(**kwargs)
+                runs.append(measurement)
+            return min(runs, key=lambda run: run.duration)
+
+        baseline_page = fastest(baseline=True)
+        first_page = fastest()
+        second_page = fastest(cursor="50:1:0")
+
+        print(
+            f"\n{group_by} / {sub_group_by}: first page {first_page}, second page {second_page}, "
+            f"first page before {baseline_page}"
+        )
+
+        assert first_page.response.data["total_count"] >= ISSUE_COUNT
+        assert board_contents(first_page.response.data) == board_contents(baseline_page.response.data)
+        # One query for the page rows and the totals of every group, one to load the page issues
+        assert first_page.queries <= 2
+        assert second_page.queries <= 2
+        assert first_page.queries < baseline_page.queries
+        assert first_page.duration < baseline_page.duration
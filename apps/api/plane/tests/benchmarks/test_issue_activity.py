@@ -0,0 +1,52 @@
+import json
+
+import pytest
+from django.utils import timezone
+
+from plane.bgtasks.issue_activities_task import issue_activity, issue_activity_batch
+from plane.db.models import Issue, IssueActivity
+
+EVENT_COUNT = 500
+
+
+def activity_events(project, actor):
+    """Events of a bulk date update of the project issues"""
+    epoch = int(timezone.now().timestamp())
+    return [
+        {
+            "type": "issue.activity.updated",
+            "requested_data": json.dumps({"target_date": "2030-01-01"}),
+            "current_instance": json.dumps({"target_date": None}),
+            "issue_id": str(issue_id),
+            "actor_id": str(actor.id),
+            "project_id": str(project.id),
+            "epoch": epoch,
+            "origin": "http://localhost:3000",
+        }
+        for issue_id in Issue.objects.filter(project=project).values_list("id", flat=True)[:EVENT_COUNT]
+    ]
+
+
+@pytest.mark.slow
+class TestIssueActivityBenchmark:
+    """Throughput of the single and the batched issue activity tasks"""
+
+    @pytest.mark.django_db
+    def test_batched_activities(self, seed_project, measure, create_user):
+        project = seed_project(EVENT_COUNT)
+        events = activity_events(project, create_user)
+
+        with measure() as single:
+            for event in events:
+                issue_activity(**event)
+        with measure() as batched:
+            issue_activity_batch(events)
+
+        print(
+            f"\n{len(events)} events: one task per event {single} "
+            f"({len(events) / single.duration:.0f}/s), one batch {batched} ({len(events) / batched.duration:.0f}/s)"
+        )
+
+        assert IssueActivity.objects.filter(project=project, field="target_date").count() == 2 * len(events)
+        assert batched.queries <= 3
+        assert batched.duration < single.duration
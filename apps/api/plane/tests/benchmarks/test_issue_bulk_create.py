@@ -0,0 +1,53 @@
+import pytest
+from django.db import connection
+
+from plane.db.models import Issue, ProjectMember
+from plane.utils.issue_bulk_create import bulk_create_issues
+
+# The one by one creates stay under the 9000 queries the query log keeps
+SINGLE_COUNT = 900
+ISSUE_COUNT = 1500
+BATCH_SIZE = 500
+
+
+@pytest.mark.slow
+class TestIssueBulkCreateBenchmark:
+    """Throughput of the work items created one by one against the bulk create"""
+
+    @pytest.mark.django_db
+    def test_create_throughput(self, seed_project, workspace, create_user, session_client, measure):
+        project = seed_project(1000)
+        ProjectMember.objects.create(project=project, workspace=workspace, member=create_user, role=20)
+
+        with measure() as single:
+            for index in range(SINGLE_COUNT):
+                Issue.objects.create(name=f"Single {index}", project=project, created_by=create_user)
+        print(f"\nCreated {SINGLE_COUNT} work items one by one: {single}, {SINGLE_COUNT / single.duration:.0f}/s")
+
+        connection.queries_log.clear()
+        with measure() as bulk:
+            for start in range(0, ISSUE_COUNT, BATCH_SIZE):
+                bulk_create_issues(
+                    project,
+                    [{"name": f"Bulk {index}"} for index in range(start, start + BATCH_SIZE)],
+                    actor_id=create_user.id,
+                )
+        print(f"Created {ISSUE_COUNT} work items in bulk: {bulk}, {ISSUE_COUNT / bulk.duration:.0f}/s")
+
+        url = f"/api/workspaces/{workspace.slug}/projects/{project.id}/bulk-create-issues/"
+        with measure() as endpoint:
+            for start in range(0, ISSUE_COUNT, BATCH_SIZE):
+                response = session_client.post(
+                    url,
+                    {"issues": [{"name": f"Request {index}"} for index in range(start, start + BATCH_SIZE)]},
+                    format="json",
+                )
+                assert response.status_code == 201
+        rate = ISSUE_COUNT / endpoint.duration
+        print(f"Created {ISSUE_COUNT} work items through the endpoint: {endpoint}, {rate:.0f}/s")
+
+        sequences = list(Issue.objects.filter(project=project).values_list("sequence_id", flat=True))
+        assert len(sequences) == len(set(sequences)) == 1000 + SINGLE_COUNT + ISSUE_COUNT * 2
+        # A statement per table and batch, where every work item ran its own statements
+        assert bulk.queries < 50
+        assert ISSUE_COUNT / bulk.duration > 3 * SINGLE_COUNT / single.duration
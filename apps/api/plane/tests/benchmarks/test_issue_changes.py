@@ -0,0 +1,65 @@
+from unittest.mock import patch
+
+import pytest
+from django.db import connection
+
+from plane.db.models import Issue, ProjectMember, record_issue_changes
+
+ISSUE_COUNT = 20000
+CHANGED_COUNT = 100
+DELETED_COUNT = 20
+
+
+@pytest.mark.slow
+class TestIssueChangesBenchmark:
+    """A client catching up with the changes of a project, through the change feed against a full download"""
+
+    # The feed reads the changes of the ended transactions, the benchmark commits them
+    @pytest.mark.django_db(transaction=True)
+    def test_sync(self, seed_project, workspace, create_user, session_client, measure):
+        project = seed_project(ISSUE_COUNT)
+        ProjectMember.objects.create(project=project, workspace=workspace, member=create_user, role=20)
+        issues = list(Issue.objects.filter(project=project).order_by("sequence_id"))
+        # The history of the project, a change per work item
+        for start in range(0, ISSUE_COUNT, 1000):
+            record_issue_changes(issue.id for issue in issues[start : start + 1000])
+        with connection.cursor() as cursor:
+            cursor.execute("ANALYZE issues, issue_changes")
+
+        feed_url = f"/api/workspaces/{workspace.slug}/projects/{project.id}/issues/changes/"
+        cursor = session_client.get(feed_url).data["cursor"]
+
+        for issue in issues[:CHANGED_COUNT]:
+            issue.name = f"{issue.name} renamed"
+            issue.save()
+        with patch("plane.db.mixins.soft_delete_related_objects.delay"):
+            for issue in issues[-DELETED_COUNT:]:
+                issue.delete()
+
+        upserts, tombstones = [], []
+        with measure() as feed:
+            has_more = True
+            while has_more:
+                response = session_client.get(feed_url, {"cursor": cursor})
+                assert response.status_code == 200
+                upserts.extend(response.data["upserts"])
+                tombstones.extend(response.data["tombstones"])
+                cursor, has_more = response.data["cursor"], response.data["has_more"]
+        print(f"\nSynced {len(upserts)} changed and {len(tombstones)} deleted work items from the feed: {feed}")
+
+        list_url = f"/api/workspaces/{workspace.slug}/projects/{project.id}/v2/issues/"
+        downloaded = []
+        with measure() as download:
+            page_cursor = "1000:0:0"
+            while page_cursor:
+                response = session_client.get(list_url, {"cursor": page_cursor})
+                assert response.status_code == 200
+                downloaded.extend(response.data["results"])
+                page_cursor = response.data["next_cursor"]
+        print(f"Downloaded the {len(downloaded)} work items of the project again: {download}")
+
+        assert {issue["id"] for issue in upserts} == {issue.id for issue in issues[:CHANGED_COUNT]}
+        assert set(tombstones) == {str(issue.id) for issue in issues[-DELETED_COUNT:]}
+        assert len(downloaded) == ISSUE_COUNT - DELETED_COUNT
+        # The changes since the cursor, where the download read every work item
+        assert feed.duration * 10 < download.duration
@@ -0,0 +1,52 @@
+import pytest
+from django.db import connection
+
+from plane.db.models import ISSUE_COUNTER_FIELDS, Issue, IssueLink, refresh_issue_counters
+from plane.db.models.issue import get_issue_counter_expressions
+from plane.utils.issue_counters import issue_counter_annotations
+
+ISSUE_COUNT = 20000
+PAGE_SIZE = 1000
+
+
+@pytest.mark.slow
+class TestIssueCountersBenchmark:
+    """Pages of work items reading the stored counters against the subqueries per row"""
+
+    @pytest.mark.django_db
+    def test_list_pages(self, seed_project, workspace, create_user, measure):
+        project = seed_project(ISSUE_COUNT)
+        issue_ids = list(Issue.objects.filter(project=project).order_by("sequence_id").values_list("id", flat=True))
+        # A link per work item, and a parent for every tenth of them
+        IssueLink.objects.bulk_create(
+            [
+                IssueLink(issue_id=issue_id, url="https://plane.so", project=project, workspace=workspace)
+                for issue_id in issue_ids
+            ],
+            batch_size=5000,
+        )
+        children = Issue.objects.filter(pk__in=issue_ids[1::10])
+        children.update(parent_id=issue_ids[0])
+        with connection.cursor() as cursor:
+            cursor.execute("ANALYZE issues, issue_links")
+        for start in range(0, ISSUE_COUNT, PAGE_SIZE):
+            refresh_issue_counters(issue_ids[start : start + PAGE_SIZE])
+
+        issues = Issue.issue_objects.filter(project=project).order_by("-created_at")
+        results = {}
+        for mode, annotations in [
+            ("subqueries", get_issue_counter_expressions()),
+            ("counters", issue_counter_annotations()),
+        ]:
+            with measure() as listing:
+                pages = [
+                    list(issues.annotate(**annotations).values("id", *ISSUE_COUNTER_FIELDS)[start : start + PAGE_SIZE])
+                    for start in range(0, ISSUE_COUNT, PAGE_SIZE)
+                ]
+            results[mode] = (listing, {row["id"]: row for page in pages for row in page})
+            print(f"\nListed {ISSUE_COUNT} work items in pages of {PAGE_SIZE} with the {mode}: {listing}")
+
+        assert results["counters"][1] == results["subqueries"][1]
+        assert results["counters"][1][issue_ids[0]]["sub_issues_count"] == len(issue_ids[1::10])
+        # A join to the counters, where every row ran a subquery per counter
+        assert results["counters"][0].duration * 2 < results["subqueries"][0].duration
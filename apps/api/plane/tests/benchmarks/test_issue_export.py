@@ -0,0 +1,63 @@
+import io
+import resource
+import tracemalloc
+import zipfile
+
+import pytest
+
+from plane.bgtasks.export_task import create_zip_file, get_issue_export_queryset
+from plane.db.models import ProjectMember
+from plane.utils.porters import DataExporter, IssueExportSerializer
+
+ISSUE_COUNT = 5000
+
+
+def peak_rss():
+    """Peak resident set size of the process in MB"""
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def buffered_export(exporter, exports):
+    """The export held in memory: every row serialized and encoded, then zipped in a buffer"""
+    files = [exporter.export(filename, queryset) for filename, queryset in exports]
+    zip_buffer = io.BytesIO()
+    with zipfile.ZipFile(zip_buffer, "w", zipfile.ZIP_DEFLATED) as zipf:
+        for filename, content in files:
+            zipf.writestr(filename, content)
+    zip_buffer.seek(0)
+    return zip_buffer
+
+
+@pytest.mark.slow
+class TestIssueExportBenchmark:
+    """Memory of the streamed export against the export held in memory"""
+
+    @pytest.mark.django_db
+    @pytest.mark.parametrize("provider", ["csv", "json", "xlsx"])
+    def test_export_memory(self, seed_project, workspace, create_user, measure, provider):
+        project = seed_project(ISSUE_COUNT)
+        ProjectMember.objects.create(project=project, workspace=workspace, member=create_user, role=20)
+        exporter = DataExporter(IssueExportSerializer, format_type=provider)
+        exports = [
+            (f"{workspace.slug}-{project.id}", get_issue_export_queryset(workspace.id, [project.id], create_user.id))
+        ]
+
+        # Streamed first, so that the growth of the peak RSS is the one of the buffered export
+        results = {}
+        for mode, run in [("streamed", create_zip_file), ("buffered", buffered_export)]:
+            rss_before = peak_rss()
+            tracemalloc.start()
+            with measure() as export:
+                with run(exporter, exports) as zip_file:
+                    size = len(zip_file.read())
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            results[mode] = peak / 1024 / 1024
+            print(
+                f"\n{provider} {mode}: {export}, archive of {size / 1024 / 1024:.1f}MB, "
+                f"peak allocations {results[mode]:.1f}MB, "
+                f"peak RSS {peak_rss():.0f}MB (+{peak_rss() - rss_before:.0f}MB)"
+            )
+
+        # The streamed peak is bounded by the chunk size, the buffered one grows with the number of work items
+        assert results["streamed"] * 2 < results["buffered"]
@@ -0,0 +1,64 @@
+from datetime import timedelta
+
+import pytest
+from django.db import connection
+from django.utils import timezone
+
+from plane.db.models import Cycle, CycleIssue, Issue, ProjectMember
+from plane.utils.analytics_plot import burndown_plot
+from plane.utils.progress_counters import refresh_progress_counters
+
+ISSUE_COUNT = 20000
+
+
+@pytest.mark.slow
+class TestProgressCountersBenchmark:
+    """Cycle progress and burndown read from the stored counters of a large cycle"""
+
+    @pytest.mark.django_db
+    def test_progress(self, seed_project, workspace, create_user, session_client, measure):
+        project = seed_project(ISSUE_COUNT)
+        ProjectMember.objects.create(project=project, workspace=workspace, member=create_user, role=20)
+        now = timezone.now()
+        cycle = Cycle.objects.create(
+            name="Cycle",
+            project=project,
+            workspace=workspace,
+            owned_by=create_user,
+            start_date=now - timedelta(days=60),
+            end_date=now + timedelta(days=30),
+        )
+        CycleIssue.objects.bulk_create(
+            [
+                CycleIssue(issue_id=issue_id, cycle=cycle, project=project, workspace=workspace)
+                for issue_id in Issue.objects.filter(project=project).values_list("id", flat=True)
+            ],
+            batch_size=1000,
+        )
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "UPDATE issues SET completed_at = now() - random() * interval '60 days' "
+                "FROM states WHERE issues.state_id = states.id AND states.group = 'completed' "
+                "AND issues.project_id = %s",
+                [project.id],
+            )
+
+        with measure() as refresh:
+            refresh_progress_counters(Cycle, [cycle.id])
+        print(f"\nCounted the progress of {ISSUE_COUNT} issues: {refresh}")
+
+        url = f"/api/workspaces/{workspace.slug}/projects/{project.id}/cycles/{cycle.id}/progress/"
+        # Warm up the url resolution and the middlewares
+        session_client.get(url)
+        with measure() as progress:
+            response = session_client.get(url)
+        assert response.data["total_issues"] == ISSUE_COUNT
+        print(f"Progress: {progress}")
+
+        cycle.total_issues = ISSUE_COUNT
+        with measure() as burndown:
+            chart = burndown_plot(cycle, workspace.slug, project.id, "issues", cycle_id=cycle.id)
+        print(f"Burndown: {burndown}")
+        assert len(chart) == 91
+        # The burndown reads the counters alone
+        assert burndown.queries == 1
@@ -0,0 +1,48 @@
+import random
+
+import pytest
+
+from plane.bgtasks.recent_visited_task import RECENT_VISITS_FLUSHING_KEY, flush_recent_visits, recent_visited_task
+from plane.db.models import Issue, User
+from plane.settings.redis import redis_instance
+from plane.utils.recent_visits import RECENT_VISITS_DIRTY_KEY, get_recent_visits_key
+
+VISIT_COUNT = 5000
+USER_COUNT = 50
+
+
+@pytest.mark.slow
+class TestRecentVisitsBenchmark:
+    """Database queries of recent visits recorded in redis and flushed once"""
+
+    @pytest.mark.django_db
+    def test_visits(self, seed_project, workspace, measure):
+        project = seed_project(200)
+        issue_ids = [str(pk) for pk in Issue.objects.filter(project=project).values_list("id", flat=True)]
+        users = [
+            User.objects.create(email=f"visitor{index}@plane.so", username=f"visitor{index}")
+            for index in range(USER_COUNT)
+        ]
+        keys = [get_recent_visits_key(workspace.slug, user.id) for user in users]
+        redis_instance().delete(*keys, RECENT_VISITS_DIRTY_KEY, RECENT_VISITS_FLUSHING_KEY)
+
+        try:
+            with measure() as visits:
+                for _ in range(VISIT_COUNT):
+                    recent_visited_task(
+                        entity_name="issue",
+                        entity_identifier=random.choice(issue_ids),
+                        user_id=str(random.choice(users).id),
+                        project_id=str(project.id),
+                        slug=workspace.slug,
+                    )
+            with measure() as flush:
+                flush_recent_visits()
+        finally:
+            redis_instance().delete(*keys)
+
+        print(f"\n{VISIT_COUNT} visits of {USER_COUNT} users: {visits}, flush: {flush}")
+
+        # Only the first visit of every user reads its stored visits
+        assert visits.queries == USER_COUNT
+        assert flush.queries < 10
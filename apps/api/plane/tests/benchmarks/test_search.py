@@ -0,0 +1,95 @@
+import importlib
+import os
+import random
+
+import pytest
+from django.db import connection
+
+from plane.db.models import Issue
+from plane.utils.search_backend import IContainsSearchBackend, PostgresSearchBackend, issue_name_search_vector
+
+# Raise it with BENCHMARK_SEARCH_ISSUES to measure a large project, half a million issues seed in a few minutes
+ISSUE_COUNT = int(os.environ.get("BENCHMARK_SEARCH_ISSUES", 20000))
+
+WORDS = [
+    "login", "logout", "crash", "report", "export", "import", "dashboard", "cycle", "module", "label",
+    "state", "priority", "estimate", "webhook", "token", "notification", "email", "search", "filter", "sort",
+]  # fmt: skip
+
+QUERIES = ["login", "rep crash", "webhook token", "zzz"]
+
+
+def issue_name(index):
+    randomizer = random.Random(index)
+    return " ".join(randomizer.sample(WORDS, 4)) + f" {index}"
+
+
+def trigram_available():
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm'")
+        return cursor.fetchone() is not None
+
+
+@pytest.fixture
+def search_indexes():
+    """Create the trigram indexes of the search migration, the test database is created without migrations"""
+    if not trigram_available():
+        return False
+
+    migration = importlib.import_module("plane.db.migrations.0121_issue_name_search_idx")
+    with connection.cursor() as cursor:
+        cursor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        for name, table, column in migration.TRIGRAM_INDEXES:
+            cursor.execute(
+                f'CREATE INDEX IF NOT EXISTS "{name}" ON "{table}" USING gin (UPPER("{column}"::text) gin_trgm_ops)'
+            )
+    return True
+
+
+def search(backend, project, query):
+    """Search the project issues the way the issue search endpoint does"""
+    queryset = backend.search(
+        Issue.issue_objects.filter(project=project),
+        query,
+        ["name", "sequence_id", "project__identifier"],
+        document=issue_name_search_vector(),
+    )
+    return list(queryset.order_by("-search_rank", "-created_at").values("id", "name", "sequence_id")[:100])
+
+
+@pytest.mark.slow
+class TestSearchBenchmark:
+    """Latency of the substring and the indexed search over a large project"""
+
+    @pytest.mark.django_db
+    def test_search(self, seed_project, search_indexes, measure):
+        project = seed_project(ISSUE_COUNT, issue_name=issue_name)
+        with connection.cursor() as cursor:
+            cursor.execute("ANALYZE issues")
+
+        for query in QUERIES:
+            timings = {}
+            for backend in [IContainsSearchBackend(), PostgresSearchBackend()]:
+                # Warm up the connection and the query plan
+                search(backend, project, query)
+                with measure() as measurement:
+                    results = search(backend, project, query)
+                timings[type(backend).__name__] = (measurement, len(results))
+
+            print(f"\n{query!r}: " + ", ".join(f"{name} {m} ({count} results)" for name, (m, count) in timings.items()))
+
+        # Every word is matched as a prefix by the full text index
+        assert search(PostgresSearchBackend(), project, "rep crash")
+        assert not search(IContainsSearchBackend(), project, "rep crash")
+
+        if search_indexes:
+            # Both the full text and the substring match are served by the indexes
+            plan = (
+                PostgresSearchBackend()
+                .search(
+                    Issue.objects.filter(project=project), "rep crash", ["name"], document=issue_name_search_vector()
+                )
+                .explain()
+            )
+            assert "issue_name_search_idx" in plan
+            assert "issue_name_trgm_idx" in plan
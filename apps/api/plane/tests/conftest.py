@@ -1,9 +1,16 @@
+import os
+import uuid
+
 import pytest
+from django.db.models.expressions import RawSQL
 from rest_framework.test import APIClient
 from pytest_django.fixtures import django_db_setup
 
 from plane.db.models import User, Workspace, WorkspaceMember
 from plane.db.models.api import APIToken
+from plane.settings.redis import redis_instance
+from plane.utils.api_log_buffer import get_api_log_buffer
+from plane.utils.issue_changes import ISSUE_CHANGES_HORIZON_KEY
 
 
 @pytest.fixture(scope="session")
@@ -12,6 +19,13 @@ def django_db_setup(django_db_setup):  # noqa: F811
     pass
 
 
+@pytest.fixture(scope="session", autouse=True)
+def discard_api_activity_logs():
+    """Drop the API activity logs of the test requests instead of writing them at exit"""
+    yield
+    get_api_log_buffer().clear()
+
+
 @pytest.fixture
 def api_client():
     """Return an unauthenticated API client"""
@@ -134,3 +148,29 @@ def workspace(create_user):
     WorkspaceMember.objects.create(workspace=created_workspace, member=create_user, role=20)
 
     return created_workspace
+
+
+@pytest.fixture
+def isolated_change_feed(monkeypatch):
+    """
+    Scope the issue change feeds to the test, for the parallel runs whose workers share the redis and the
+    transaction ids of the database server. The horizon gets a key of its own, and in a parallel run the
+    feeds wait for the running transactions of the test database only, the other workers keeping theirs
+    open in their own databases. Returns the key of the horizon.
+    """
+    key = f"{ISSUE_CHANGES_HORIZON_KEY}:{uuid.uuid4().hex}"
+    monkeypatch.setattr("plane.utils.issue_changes.ISSUE_CHANGES_HORIZON_KEY", key)
+    if os.environ.get("PYTEST_XDIST_WORKER"):
+
+        def ended_transactions():
+            return RawSQL(
+                "SELECT COALESCE(MIN(backend_xid::text::bigint), "
+                "pg_snapshot_xmax(pg_current_snapshot())::text::bigint) "
+                "FROM pg_stat_activity WHERE datname = current_database()",
+                [],
+            )
+
+        for module in ["plane.utils.issue_changes", "plane.bgtasks.cleanup_task"]:
+            monkeypatch.setattr(f"{module}.ended_transactions", ended_transactions)
+    yield key
+    redis_instance().delete(key)
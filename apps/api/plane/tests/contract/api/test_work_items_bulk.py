@@ -0,0 +1,47 @@
+import pytest
+from rest_framework import status
+
+from plane.db.models import Issue, IssueAssignee, IssueLabel, Label, Project, ProjectMember, State
+
+
+@pytest.fixture
+def project(db, workspace, create_user):
+    project = Project.objects.create(name="Bulk", identifier="BLK", workspace=workspace, created_by=create_user)
+    ProjectMember.objects.create(project=project, workspace=workspace, member=create_user, role=20, is_active=True)
+    State.objects.create(name="Backlog", group="backlog", project=project, workspace=workspace, default=True)
+    return project
+
+
+@pytest.mark.contract
+class TestIssueBulkCreateAPIEndpoint:
+    """Test the bulk create of work items in the external API"""
+
+    def get_url(self, workspace_slug, project_id):
+        return f"/api/v1/workspaces/{workspace_slug}/projects/{project_id}/work-items/bulk-create/"
+
+    @pytest.mark.django_db
+    def test_bulk_create(self, api_key_client, workspace, project, create_user):
+        label = Label.objects.create(name="Bug", project=project, workspace=workspace)
+        issues = [
+            {"name": "First", "labels": [str(label.id)], "assignees": [str(create_user.id)]},
+            {"name": "Second", "external_source": "github", "external_id": "2"},
+        ]
+
+        response = api_key_client.post(self.get_url(workspace.slug, project.id), {"issues": issues}, format="json")
+
+        assert response.status_code == status.HTTP_201_CREATED
+        assert [issue["sequence_id"] for issue in response.data] == [1, 2]
+        first = Issue.objects.get(pk=response.data[0]["id"])
+        assert IssueLabel.objects.filter(issue=first, label=label).exists()
+        assert IssueAssignee.objects.filter(issue=first, assignee=create_user).exists()
+
+    @pytest.mark.django_db
+    def test_bulk_create_existing_external_id(self, api_key_client, workspace, project):
+        existing = Issue.objects.create(name="Synced", project=project, external_source="github", external_id="1")
+        issues = [{"name": "New"}, {"name": "Synced again", "external_source": "github", "external_id": "1"}]
+
+        response = api_key_client.post(self.get_url(workspace.slug, project.id), {"issues": issues}, format="json")
+
+        assert response.status_code == status.HTTP_409_CONFLICT
+        assert response.data["ids"] == [str(existing.id)]
+        assert Issue.objects.filter(project=project).count() == 1
@@ -0,0 +1,54 @@
+import pytest
+from rest_framework import status
+
+from plane.db.models import Issue, IssueActivity, Project, ProjectMember, State
+
+
+@pytest.fixture
+def project(db, workspace, create_user):
+    project = Project.objects.create(name="Bulk", identifier="BLK", workspace=workspace, created_by=create_user)
+    ProjectMember.objects.create(project=project, workspace=workspace, member=create_user, role=20, is_active=True)
+    State.objects.create(name="Backlog", group="backlog", project=project, workspace=workspace, default=True)
+    return project
+
+
+@pytest.mark.contract
+class TestBulkCreateIssuesEndpoint:
+    """Test the bulk create of work items in the app"""
+
+    def get_url(self, workspace_slug, project_id):
+        return f"/api/workspaces/{workspace_slug}/projects/{project_id}/bulk-create-issues/"
+
+    @pytest.mark.django_db
+    def test_bulk_create(self, session_client, workspace, project):
+        Issue.objects.create(name="Existing", project=project)
+        issues = [{"name": f"Imported {index}", "priority": "high"} for index in range(5)]
+
+        response = session_client.post(self.get_url(workspace.slug, project.id), {"issues": issues}, format="json")
+
+        assert response.status_code == status.HTTP_201_CREATED
+        assert [issue["sequence_id"] for issue in response.data] == [2, 3, 4, 5, 6]
+        assert Issue.objects.filter(project=project, priority="high").count() == 5
+        assert IssueActivity.objects.filter(project=project, verb="created").count() == 5
+
+    @pytest.mark.django_db
+    def test_bulk_create_invalid_state(self, session_client, workspace, project):
+        other = Project.objects.create(name="Other", identifier="OTH", workspace=workspace)
+        state = State.objects.create(name="Todo", group="unstarted", project=other, workspace=workspace)
+        issues = [{"name": "Valid"}, {"name": "Invalid", "state_id": str(state.id)}]
+
+        response = session_client.post(self.get_url(workspace.slug, project.id), {"issues": issues}, format="json")
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "1" in {str(index) for index in response.data["issues"]}
+        assert not Issue.objects.filter(project=project).exists()
+
+    @pytest.mark.django_db
+    def test_bulk_create_limit(self, session_client, workspace, project):
+        url = self.get_url(workspace.slug, project.id)
+
+        response = session_client.post(url, {"issues": []}, format="json")
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+        response = session_client.post(url, {"issues": [{"name": "Issue"}] * 1001}, format="json")
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
@@ -0,0 +1,63 @@
+from unittest.mock import patch
+
+import pytest
+from rest_framework import status
+
+from plane.db.models import Issue, Project, ProjectMember, State
+
+
+@pytest.fixture
+def project(db, workspace, create_user):
+    project = Project.objects.create(name="Bulk", identifier="BLK", workspace=workspace, created_by=create_user)
+    ProjectMember.objects.create(project=project, workspace=workspace, member=create_user, role=20, is_active=True)
+    for name, group in [("Backlog", "backlog"), ("Done", "completed")]:
+        State.objects.create(name=name, group=group, project=project, workspace=workspace, default=group == "backlog")
+    return project
+
+
+@pytest.mark.contract
+class TestIssueBulkUpdateEndpoints:
+    """Test that the bulk updates rejected by their checks send no activity"""
+
+    def get_url(self, workspace_slug, project_id, path):
+        return f"/api/workspaces/{workspace_slug}/projects/{project_id}/{path}/"
+
+    @pytest.mark.django_db
+    def test_rejected_archive_sends_no_activity(self, session_client, workspace, project):
+        done = State.objects.get(project=project, group="completed")
+        # Listed newest first, the open issue is checked after the completed one
+        issues = [
+            Issue.objects.create(name="Open", project=project),
+            Issue.objects.create(name="Done", project=project, state=done),
+        ]
+
+        with patch("plane.bgtasks.issue_activities_task.issue_activity_batch.delay") as batch_delay:
+            response = session_client.post(
+                self.get_url(workspace.slug, project.id, "bulk-archive-issues"),
+                {"issue_ids": [str(issue.id) for issue in issues]},
+                format="json",
+            )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        batch_delay.assert_not_called()
+        assert not Issue.objects.filter(project=project, archived_at__isnull=False).exists()
+
+    @pytest.mark.django_db
+    def test_rejected_dates_send_no_activity(self, session_client, workspace, project):
+        issues = [Issue.objects.create(name=f"Issue {index}", project=project) for index in range(2)]
+
+        with patch("plane.bgtasks.issue_activities_task.issue_activity_batch.delay") as batch_delay:
+            response = session_client.post(
+                self.get_url(workspace.slug, project.id, "issue-dates"),
+                {
+                    "updates": [
+                        {"id": str(issues[0].id), "start_date": "2026-01-01"},
+                        {"id": str(issues[1].id), "start_date": "2026-02-01", "target_date": "2026-01-01"},
+                    ]
+                },
+                format="json",
+            )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        batch_delay.assert_not_called()
+        assert not Issue.objects.filter(project=project, start_date__isnull=False).exists()
@@ -0,0 +1,103 @@
+from unittest.mock import patch
+
+import pytest
+from django.utils import timezone
+from rest_framework import status
+
+from plane.db.models import Issue, Project, ProjectMember, State, User
+from plane.settings.redis import redis_instance
+
+
+@pytest.fixture
+def project(db, workspace, create_user):
+    project = Project.objects.create(name="Changes", identifier="CHG", workspace=workspace, created_by=create_user)
+    ProjectMember.objects.create(project=project, workspace=workspace, member=create_user, role=20, is_active=True)
+    State.objects.create(name="Backlog", group="backlog", project=project, workspace=workspace, default=True)
+    return project
+
+
+@pytest.fixture(autouse=True)
+def horizon_key(isolated_change_feed):
+    return isolated_change_feed
+
+
+@pytest.mark.contract
+class TestIssueChangeEndpoints:
+    """Test the change feeds of the issues of a project and of a workspace"""
+
+    def get_url(self, workspace_slug, project_id=None):
+        if project_id is None:
+            return f"/api/workspaces/{workspace_slug}/issues/changes/"
+        return f"/api/workspaces/{workspace_slug}/projects/{project_id}/issues/changes/"
+
+    def get_changes(self, session_client, url, cursor=None):
+        response = session_client.get(url, {"cursor": cursor} if cursor else {})
+        assert response.status_code == status.HTTP_200_OK
+        return response.data
+
+    # The feeds read the changes of the ended transactions, the tests commit them
+    @pytest.mark.django_db(transaction=True)
+    def test_feed_returns_upserts_and_tombstones_after_the_cursor(self, session_client, workspace, project):
+        url = self.get_url(workspace.slug, project.id)
+        issues = {name: Issue.objects.create(name=name, project=project) for name in ["Kept", "Archived", "Deleted"]}
+
+        # Without a cursor the feed starts after the latest change
+        head = self.get_changes(session_client, url)
+        assert head["upserts"] == [] and head["tombstones"] == []
+
+        issues["Kept"].name = "Renamed"
+        issues["Kept"].save()
+        issues["Archived"].archived_at = timezone.now().date()
+        issues["Archived"].save()
+        with patch("plane.db.mixins.soft_delete_related_objects.delay"):
+            issues["Deleted"].delete()
+
+        changes = self.get_changes(session_client, url, head["cursor"])
+        assert [issue["name"] for issue in changes["upserts"]] == ["Renamed"]
+        assert changes["upserts"][0]["link_count"] == 0 and changes["upserts"][0]["label_ids"] == []
+        assert set(changes["tombstones"]) == {str(issues["Archived"].id), str(issues["Deleted"].id)}
+        assert not changes["has_more"]
+
+        # Nothing changed since
+        changes = self.get_changes(session_client, url, changes["cursor"])
+        assert changes["upserts"] == [] and changes["tombstones"] == []
+
+    @pytest.mark.django_db(transaction=True)
+    def test_guest_sees_their_own_issues(self, session_client, workspace, project, create_user):
+        ProjectMember.objects.filter(project=project, member=create_user).update(role=5)
+        other_user = User.objects.create(email="other@plane.so", username="other")
+        own = Issue.objects.create(name="Own", project=project)
+        other = Issue.objects.create(name="Other", project=project)
+        # Saved without a request user, the creators are set afterwards
+        Issue.objects.filter(pk=own.pk).update(created_by=create_user)
+        Issue.objects.filter(pk=other.pk).update(created_by=other_user)
+
+        for url in [self.get_url(workspace.slug, project.id), self.get_url(workspace.slug)]:
+            changes = self.get_changes(session_client, url, "0:0")
+            assert [issue["id"] for issue in changes["upserts"]] == [own.id]
+            assert changes["tombstones"] == [str(other.id)]
+
+    @pytest.mark.django_db(transaction=True)
+    def test_workspace_feed_reads_the_projects_of_the_user(self, session_client, workspace, project, create_user):
+        other_project = Project.objects.create(
+            name="Other", identifier="OTH", workspace=workspace, created_by=create_user
+        )
+        Issue.objects.create(name="Member", project=project)
+        Issue.objects.create(name="Not a member", project=other_project)
+
+        changes = self.get_changes(session_client, self.get_url(workspace.slug), "0:0")
+        assert [issue["name"] for issue in changes["upserts"]] == ["Member"]
+        assert changes["tombstones"] == []
+
+    @pytest.mark.django_db
+    def test_invalid_cursor(self, session_client, workspace, project):
+        response = session_client.get(self.get_url(workspace.slug, project.id), {"cursor": "latest"})
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    @pytest.mark.django_db
+    def test_expired_cursor(self, session_client, workspace, project, horizon_key):
+        redis_instance().set(horizon_key, 100)
+        response = session_client.get(self.get_url(workspace.slug, project.id), {"cursor": "99:5"})
+        assert response.status_code == status.HTTP_410_GONE
+        # A new cursor starts from the horizon
+        assert self.get_changes(session_client, self.get_url(workspace.slug, project.id))["cursor"] == "100:0"
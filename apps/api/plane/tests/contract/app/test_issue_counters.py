@@ -0,0 +1,60 @@
+from unittest.mock import patch
+
+import pytest
+from rest_framework import status
+
+from plane.db.models import Issue, Project, ProjectMember, State
+
+
+@pytest.fixture
+def project(db, workspace, create_user):
+    project = Project.objects.create(name="Counters", identifier="CNT", workspace=workspace, created_by=create_user)
+    ProjectMember.objects.create(project=project, workspace=workspace, member=create_user, role=20, is_active=True)
+    State.objects.create(name="Backlog", group="backlog", project=project, workspace=workspace, default=True)
+    return project
+
+
+@pytest.mark.contract
+class TestIssueCountersEndpoints:
+    """Test the counters of the work items listed after the changes of their links and sub work items"""
+
+    def get_url(self, workspace_slug, project_id, path=""):
+        return f"/api/workspaces/{workspace_slug}/projects/{project_id}/issues/{path}"
+
+    def list_issues(self, session_client, workspace, project):
+        response = session_client.get(self.get_url(workspace.slug, project.id))
+        assert response.status_code == status.HTTP_200_OK
+        return {issue["name"]: issue for issue in response.data["results"]}
+
+    @pytest.mark.django_db
+    def test_list_counts_the_links_and_sub_issues(self, session_client, workspace, project):
+        parent = Issue.objects.create(name="Parent", project=project)
+        children = [Issue.objects.create(name=f"Child {index}", project=project) for index in range(2)]
+
+        with patch("plane.app.views.issue.sub_issue.issue_activity.delay"):
+            response = session_client.post(
+                self.get_url(workspace.slug, project.id, f"{parent.id}/sub-issues/"),
+                {"sub_issue_ids": [str(child.id) for child in children]},
+                format="json",
+            )
+        assert response.status_code == status.HTTP_200_OK
+
+        with patch("plane.app.views.issue.link.issue_activity.delay"):
+            response = session_client.post(
+                self.get_url(workspace.slug, project.id, f"{parent.id}/issue-links/"),
+                {"url": "https://plane.so"},
+                format="json",
+            )
+        assert response.status_code == status.HTTP_201_CREATED
+
+        issues = self.list_issues(session_client, workspace, project)
+        assert issues["Parent"]["sub_issues_count"] == 2
+        assert issues["Parent"]["link_count"] == 1
+        assert issues["Child 0"]["sub_issues_count"] == 0
+
+        with patch("plane.app.views.issue.link.issue_activity.delay"):
+            response = session_client.delete(
+                self.get_url(workspace.slug, project.id, f"{parent.id}/issue-links/{response.data['id']}/")
+            )
+        assert response.status_code == status.HTTP_204_NO_CONTENT
+        assert self.list_issues(session_client, workspace, project)["Parent"]["link_count"] == 0
@@ -0,0 +1,208 @@
+import json
+import uuid
+
+import pytest
+from django.urls import reverse
+
+from plane.bgtasks.analytics_rollup_task import (
+    ANALYTICS_REFRESHING_KEY,
+    reconcile_analytics_rollups,
+    refresh_analytics_rollups,
+)
+from plane.bgtasks.issue_activities_task import issue_activity
+from plane.db.models import (
+    Cycle,
+    CycleIssue,
+    Estimate,
+    EstimatePoint,
+    Issue,
+    IssueAnalyticsFact,
+    IssueAssignee,
+    IssueLabel,
+    Label,
+    Module,
+    ModuleIssue,
+    Project,
+    ProjectMember,
+    State,
+)
+from plane.settings.redis import redis_instance
+from plane.utils.analytics_rollup import ANALYTICS_DIRTY_ISSUES_KEY
+
+AXES = [
+    ("state_id", None),
+    ("state__group", "priority"),
+    ("priority", "labels__id"),
+    ("labels__id", "state__group"),
+    ("assignees__id", "priority"),
+    ("issue_cycle__cycle_id", "state_id"),
+    ("issue_module__module_id", None),
+    ("created_at", "state__group"),
+]
+
+
+@pytest.fixture
+def project(workspace, create_user):
+    project = Project.objects.create(name="Analytics", identifier="ANA", workspace=workspace, created_by=create_user)
+    ProjectMember.objects.create(project=project, workspace=workspace, member=create_user, role=20)
+    states = [
+        State.objects.create(name=name, group=group, project=project, workspace=workspace, default=index == 0)
+        for index, (name, group) in enumerate(
+            [("Todo", "unstarted"), ("Doing", "started"), ("Done", "completed"), ("Dropped", "cancelled")]
+        )
+    ]
+    labels = [Label.objects.create(name=f"Label {index}", project=project, workspace=workspace) for index in range(3)]
+    cycle = Cycle.objects.create(name="Cycle", project=project, workspace=workspace, owned_by=create_user)
+    module = Module.objects.create(name="Module", project=project, workspace=workspace)
+    estimate = Estimate.objects.create(name="Points", type="points", project=project, workspace=workspace)
+    points = [
+        EstimatePoint.objects.create(estimate=estimate, key=index, value=value, project=project, workspace=workspace)
+        for index, value in enumerate(["1", "2", "3"])
+    ]
+
+    priorities = ["urgent", "high", "medium", "low", "none"]
+    for index in range(30):
+        issue = Issue.objects.create(
+            name=f"Issue {index}",
+            project=project,
+            workspace=workspace,
+            state=states[index % 4],
+            priority=priorities[index % 5],
+            estimate_point=points[index % 3] if index % 4 else None,
+        )
+        for label in labels[: index % 3]:
+            IssueLabel.objects.create(issue=issue, label=label, project=project, workspace=workspace)
+        if index % 2:
+            IssueAssignee.objects.create(issue=issue, assignee=create_user, project=project, workspace=workspace)
+        if index % 3 == 0:
+            CycleIssue.objects.create(issue=issue, cycle=cycle, project=project, workspace=workspace)
+        if index % 5 == 0:
+            ModuleIssue.objects.create(issue=issue, module=module, project=project, workspace=workspace)
+    return project
+
+
+@pytest.fixture(autouse=True)
+def dirty_issues_keys(monkeypatch):
+    """Sets of the issues marked by this test, the parallel workers share the redis of the run"""
+    suffix = uuid.uuid4().hex
+    dirty_key = f"{ANALYTICS_DIRTY_ISSUES_KEY}:{suffix}"
+    refreshing_key = f"{ANALYTICS_REFRESHING_KEY}:{suffix}"
+    for module in [
+        "plane.utils.analytics_rollup",
+        "plane.bgtasks.analytics_rollup_task",
+        "plane.bgtasks.issue_activities_task",
+    ]:
+        monkeypatch.setattr(f"{module}.ANALYTICS_DIRTY_ISSUES_KEY", dirty_key)
+    monkeypatch.setattr("plane.bgtasks.analytics_rollup_task.ANALYTICS_REFRESHING_KEY", refreshing_key)
+    yield dirty_key, refreshing_key
+    redis_instance().delete(dirty_key, refreshing_key)
+
+
+def get_analytics(client, slug, **params):
+    response = client.get(reverse("plane-analytics", kwargs={"slug": slug}), params)
+    assert response.status_code == 200
+    return json.loads(response.content)
+
+
+def sort_segments(analytics):
+    """The segments of a dimension come in no particular order"""
+    for rows in analytics["distribution"].values():
+        rows.sort(key=lambda row: str(row.get("segment")))
+    return analytics
+
+
+@pytest.mark.unit
+class TestAnalyticsRollups:
+    """Test the analytics served from the issue facts"""
+
+    @pytest.mark.django_db
+    @pytest.mark.parametrize("y_axis", ["issue_count", "estimate"])
+    def test_rollups_match_live_analytics(self, session_client, workspace, project, y_axis):
+        """Every axis kept in the facts returns the payload of the live queries"""
+        reconcile_analytics_rollups()
+        assert IssueAnalyticsFact.objects.filter(project=project).exists()
+
+        for x_axis, segment in AXES:
+            params = {"x_axis": x_axis, "y_axis": y_axis, **({"segment": segment} if segment else {})}
+            live = get_analytics(session_client, workspace.slug, live="true", **params)
+            rollup = get_analytics(session_client, workspace.slug, **params)
+            assert sort_segments(rollup) == sort_segments(live), (x_axis, segment)
+
+    @pytest.mark.django_db
+    def test_rollups_skip_the_issues(self, session_client, workspace, project):
+        """The analytics are read from the facts without touching the issues"""
+        reconcile_analytics_rollups()
+        Issue.objects.filter(project=project).update(priority="urgent")
+
+        analytics = get_analytics(session_client, workspace.slug, x_axis="priority", y_axis="issue_count")
+        assert analytics["total"] == 30
+        assert list(analytics["distribution"]) == ["low", "medium", "high", "urgent", "none"]
+
+        # Ad-hoc filters fall back to the live queries
+        filtered = get_analytics(
+            session_client, workspace.slug, x_axis="priority", y_axis="issue_count", priority="urgent"
+        )
+        assert filtered["total"] == 30
+        assert list(filtered["distribution"]) == ["urgent"]
+
+    @pytest.mark.django_db
+    def test_rollups_sum_numeric_estimates(self, session_client, workspace, project):
+        """Estimates that are not numbers are left out of the sums instead of failing the request"""
+        EstimatePoint.objects.filter(project=project, value="3").update(value="large")
+        reconcile_analytics_rollups()
+
+        analytics = get_analytics(session_client, workspace.slug, x_axis="state__group", y_axis="estimate")
+        estimates = {group: rows[0]["estimate"] for group, rows in analytics["distribution"].items()}
+        # The unstarted issues have no estimate, the others the points 1, 2 and large in turn
+        assert estimates == {"cancelled": 7.0, "completed": 6.0, "started": 8.0, "unstarted": None}
+
+    @pytest.mark.django_db
+    def test_refresh_recomputes_the_changed_days(self, workspace, project, create_user, dirty_issues_keys):
+        """Issue activities mark the issues, whose days are recomputed by the next refresh"""
+        reconcile_analytics_rollups()
+        issue = Issue.objects.filter(project=project, priority="urgent").first()
+        issue.priority = "low"
+        issue.save()
+        Issue.objects.filter(project=project, priority="high").first().delete()
+        for changed in Issue.all_objects.filter(project=project, name__in=[issue.name, "Issue 1"]):
+            issue_activity(
+                type="issue.activity.updated",
+                requested_data=json.dumps({"priority": changed.priority}),
+                current_instance=json.dumps({"priority": changed.priority}),
+                issue_id=str(changed.id),
+                actor_id=str(create_user.id),
+                project_id=str(project.id),
+                epoch=0,
+            )
+        assert redis_instance().scard(dirty_issues_keys[0]) == 2
+
+        assert refresh_analytics_rollups() > 0
+        facts = IssueAnalyticsFact.objects.filter(project=project, dimension="")
+        counts = {
+            priority: sum(fact.issue_count for fact in facts if fact.priority == priority)
+            for priority in ["urgent", "high", "low"]
+        }
+        assert counts == {"urgent": 5, "high": 5, "low": 7}
+        assert not redis_instance().exists(*dirty_issues_keys)
+        assert refresh_analytics_rollups() == 0
+
+    @pytest.mark.django_db
+    def test_advance_analytics_match_live_counts(self, session_client, workspace, project):
+        """The advance analytics stats and charts read from the facts return the live counts"""
+        reconcile_analytics_rollups()
+        cycle = Cycle.objects.get(project=project)
+        requests = [
+            (reverse("advance-analytics", kwargs={"slug": workspace.slug}), {"tab": "work-items"}),
+            (reverse("advance-analytics", kwargs={"slug": workspace.slug}), {"tab": "overview"}),
+            (reverse("advance-analytics-stats", kwargs={"slug": workspace.slug}), {}),
+            (reverse("advance-analytics-chart", kwargs={"slug": workspace.slug}), {"type": "work-items"}),
+            (
+                reverse("project-advance-analytics", kwargs={"slug": workspace.slug, "project_id": project.id}),
+                {"cycle_id": str(cycle.id)},
+            ),
+        ]
+        for url, params in requests:
+            live = session_client.get(url, {**params, "live": "true"})
+            rollup = session_client.get(url, params)
+            assert rollup.status_code == live.status_code == 200
+            assert json.loads(rollup.content) == json.loads(live.content), (url, params)
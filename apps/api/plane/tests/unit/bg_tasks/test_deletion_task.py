@@ -0,0 +1,278 @@
+import json
+from unittest.mock import Mock, patch
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from plane.bgtasks.deletion_task import (
+    HARD_DELETE_CHECKPOINT_KEY,
+    HARD_DELETE_LOCK_KEY,
+    hard_delete,
+    restore_related_objects,
+    soft_delete_related_objects,
+    throttle,
+)
+from plane.db.models import (
+    Cycle,
+    CycleIssue,
+    Issue,
+    IssueActivity,
+    IssueAssignee,
+    IssueComment,
+    IssueLink,
+    Project,
+    ProjectMember,
+    State,
+)
+from plane.settings.redis import redis_instance
+
+
+def seed_project(workspace, user, identifier, issue_count):
+    project = Project.objects.create(name=identifier, identifier=identifier, workspace=workspace, created_by=user)
+    ProjectMember.objects.create(project=project, workspace=workspace, member=user, role=20)
+    state = State.objects.create(name="Todo", group="unstarted", project=project, workspace=workspace, default=True)
+    cycle = Cycle.objects.create(name="Cycle", project=project, workspace=workspace, owned_by=user)
+    for index in range(issue_count):
+        issue = Issue.objects.create(name=f"Issue {index}", project=project, workspace=workspace, state=state)
+        IssueComment.objects.create(
+            issue=issue, project=project, workspace=workspace, actor=user, comment_html="<p>c</p>"
+        )
+        IssueLink.objects.create(issue=issue, project=project, workspace=workspace, url="https://plane.so")
+        IssueAssignee.objects.create(issue=issue, assignee=user, project=project, workspace=workspace)
+        IssueActivity.objects.create(issue=issue, project=project, workspace=workspace, actor=user, verb="created")
+        CycleIssue.objects.create(issue=issue, cycle=cycle, project=project, workspace=workspace)
+    return project
+
+
+def delete_project(project):
+    with patch("plane.db.mixins.soft_delete_related_objects.delay"):
+        project.delete()
+    project.refresh_from_db()
+    return project
+
+
+@pytest.fixture
+def purge_settings(settings):
+    settings.HARD_DELETE_AFTER_DAYS = 30
+    settings.HARD_DELETE_CHUNK_SIZE = 2
+    settings.HARD_DELETE_THROTTLE_RATIO = 0
+    settings.HARD_DELETE_MAX_ACTIVE_QUERIES = 0
+    ri = redis_instance()
+    ri.delete(HARD_DELETE_CHECKPOINT_KEY, HARD_DELETE_LOCK_KEY)
+    # The foreign keys are checked by each statement, as they are when each statement commits
+    with connection.cursor() as cursor:
+        cursor.execute("SET CONSTRAINTS ALL IMMEDIATE")
+    yield settings
+    ri.delete(HARD_DELETE_CHECKPOINT_KEY, HARD_DELETE_LOCK_KEY)
+
+
+def expire(model, **filters):
+    """Move the deleted_at of the soft deleted rows past the retention"""
+    model.all_objects.filter(deleted_at__isnull=False, **filters).update(
+        deleted_at=timezone.now() - timezone.timedelta(days=31)
+    )
+
+
+@pytest.mark.unit
+class TestSoftDeleteCascade:
+    """Test the set based soft delete and restore of the related objects"""
+
+    @pytest.mark.django_db
+    def test_cascade_soft_deletes_the_related_rows(self, workspace, create_user):
+        """Every row reached through a cascade relation gets the deleted_at of the project"""
+        project = seed_project(workspace, create_user, "DEL", 5)
+        earlier = timezone.now() - timezone.timedelta(days=1)
+        comment = IssueComment.objects.filter(project=project).first()
+        IssueComment.all_objects.filter(pk=comment.pk).update(deleted_at=earlier)
+        project = delete_project(project)
+
+        soft_delete_related_objects("db", "project", project.id)
+
+        for model in [Issue, IssueLink, IssueAssignee, IssueActivity, CycleIssue, Cycle, State, ProjectMember]:
+            rows = model.all_objects.filter(project=project)
+            assert rows.count() > 0
+            assert set(rows.values_list("deleted_at", flat=True)) == {project.deleted_at}, model
+        comments = IssueComment.all_objects.filter(project=project)
+        assert comments.filter(deleted_at=project.deleted_at).count() == 4
+        # Rows deleted before keep their own deleted_at
+        assert IssueComment.all_objects.get(pk=comment.pk).deleted_at == earlier
+
+    @pytest.mark.django_db
+    def test_cascade_queries_do_not_grow_with_the_rows(self, workspace, create_user):
+        """The cascade runs a number of statements per relation, not per row"""
+        queries = []
+        for identifier, issue_count in [("FEW", 2), ("MANY", 12)]:
+            project = delete_project(seed_project(workspace, create_user, identifier, issue_count))
+            with CaptureQueriesContext(connection) as context:
+                soft_delete_related_objects("db", "project", project.id)
+            queries.append(len(context.captured_queries))
+            assert not Issue.objects.filter(project=project).exists()
+        assert queries[0] == queries[1]
+
+    @pytest.mark.django_db
+    def test_restore_brings_back_the_rows_deleted_along(self, workspace, create_user):
+        """The restore undoes the cascade, leaving the rows deleted before deleted"""
+        project = seed_project(workspace, create_user, "RES", 4)
+        issue = Issue.objects.filter(project=project).first()
+        with patch("plane.db.mixins.soft_delete_related_objects.delay"):
+            issue.delete()
+        soft_delete_related_objects("db", "issue", issue.id)
+        assert not IssueLink.objects.filter(issue=issue).exists()
+
+        project = delete_project(project)
+        soft_delete_related_objects("db", "project", project.id)
+        assert not Issue.objects.filter(project=project).exists()
+
+        restore_related_objects("db", "project", project.id)
+        assert Project.objects.filter(pk=project.id).exists()
+        assert Issue.objects.filter(project=project).count() == 3
+        assert IssueComment.objects.filter(project=project).count() == 3
+        assert ProjectMember.objects.filter(project=project, member=create_user).exists()
+        # The issue deleted on its own stays deleted with its relations
+        assert not Issue.objects.filter(pk=issue.id).exists()
+        assert not IssueLink.objects.filter(issue=issue).exists()
+
+        restore_related_objects("db", "issue", issue.id)
+        assert IssueLink.objects.filter(issue=issue).exists()
+        assert CycleIssue.objects.filter(issue=issue).exists()
+
+
+@pytest.mark.unit
+class TestHardDelete:
+    """Test the chunked purge of the rows soft deleted past the retention"""
+
+    @pytest.mark.django_db
+    def test_purges_the_rows_with_their_dependents(self, workspace, create_user, purge_settings):
+        project = delete_project(seed_project(workspace, create_user, "OLD", 5))
+        soft_delete_related_objects("db", "project", project.id)
+        for model in [Project, Issue, IssueComment, IssueLink, IssueAssignee, IssueActivity, CycleIssue, Cycle]:
+            expire(model)
+        kept = seed_project(workspace, create_user, "NEW", 2)
+        recent = Issue.objects.filter(project=kept).first()
+        with patch("plane.db.mixins.soft_delete_related_objects.delay"):
+            recent.delete()
+
+        metrics = {metric["model"]: metric for metric in hard_delete()}
+
+        assert not Project.all_objects.filter(pk=project.id).exists()
+        for model in [Issue, IssueComment, IssueLink, IssueAssignee, IssueActivity, CycleIssue, State]:
+            assert not model.all_objects.filter(project=project).exists(), model
+        assert metrics["db.project"]["rows"] == 1
+        assert metrics["db.project"]["cascaded"] > 25
+        assert metrics["db.project"]["failed_chunks"] == 0
+        assert "duration" in metrics["db.issue"]
+        # The rows deleted within the retention are kept
+        assert Issue.all_objects.filter(project=kept).count() == 2
+        assert IssueActivity.objects.filter(project=kept).count() == 2
+        assert not redis_instance().exists(HARD_DELETE_CHECKPOINT_KEY)
+
+    @pytest.mark.django_db
+    def test_keeps_the_activities_of_a_purged_work_item(self, workspace, create_user, purge_settings):
+        project = seed_project(workspace, create_user, "ACT", 3)
+        issue = Issue.objects.filter(project=project).first()
+        with patch("plane.db.mixins.soft_delete_related_objects.delay"):
+            issue.delete()
+        soft_delete_related_objects("db", "issue", issue.id)
+        expire(Issue)
+
+        hard_delete()
+
+        assert not Issue.all_objects.filter(pk=issue.id).exists()
+        assert not IssueLink.all_objects.filter(issue_id=issue.id).exists()
+        assert IssueActivity.all_objects.filter(project=project, issue__isnull=True).count() == 1
+
+    @pytest.mark.django_db
+    def test_resumes_from_the_checkpoint(self, workspace, create_user, purge_settings):
+        project = delete_project(seed_project(workspace, create_user, "CHK", 0))
+        live = seed_project(workspace, create_user, "LIV", 4)
+        issues = list(Issue.objects.filter(project=live).order_by("pk"))
+        with patch("plane.db.mixins.soft_delete_related_objects.delay"):
+            for issue in issues:
+                issue.delete()
+        expire(Issue)
+        expire(Project)
+        cutoff = timezone.now() - timezone.timedelta(days=30)
+        checkpoint = {"cutoff": cutoff.isoformat(), "model": "db.issue", "pk": str(issues[1].pk)}
+        redis_instance().set(HARD_DELETE_CHECKPOINT_KEY, json.dumps(checkpoint))
+
+        metrics = hard_delete()
+
+        # The purge goes on after the last purged pk, the models before are left to the next purge
+        assert metrics[0]["model"] == "db.issue"
+        assert list(Issue.all_objects.filter(project=live).order_by("pk")) == issues[:2]
+        assert Project.all_objects.filter(pk=project.id).exists()
+        assert not redis_instance().exists(HARD_DELETE_CHECKPOINT_KEY)
+
+        hard_delete()
+        assert not Issue.all_objects.filter(project=live).exists()
+        assert not Project.all_objects.filter(pk=project.id).exists()
+
+    @pytest.mark.django_db
+    def test_does_not_run_twice(self, workspace, create_user, purge_settings):
+        project = delete_project(seed_project(workspace, create_user, "LCK", 1))
+        expire(Project)
+        redis_instance().set(HARD_DELETE_LOCK_KEY, "other")
+
+        assert hard_delete() == []
+        assert Project.all_objects.filter(pk=project.id).exists()
+        # The lock of the other run is left alone
+        assert redis_instance().get(HARD_DELETE_LOCK_KEY) == b"other"
+
+    @pytest.mark.django_db
+    def test_stops_while_the_database_stays_busy(self, workspace, create_user, purge_settings):
+        live = seed_project(workspace, create_user, "BSY", 4)
+        issues = list(Issue.objects.filter(project=live).order_by("pk"))
+        with patch("plane.db.mixins.soft_delete_related_objects.delay"):
+            for issue in issues:
+                issue.delete()
+        expire(Issue)
+        purge_settings.HARD_DELETE_MAX_ACTIVE_QUERIES = 10
+        purge_settings.HARD_DELETE_THROTTLE_WAIT = 5
+        purge_settings.HARD_DELETE_THROTTLE_MAX_WAIT = 10
+
+        with (
+            patch("plane.bgtasks.deletion_task.get_active_queries", return_value=30),
+            patch("plane.bgtasks.deletion_task.time.sleep"),
+        ):
+            metrics = hard_delete()
+
+        # The purge stops after the first chunk and resumes from it on the next run
+        assert metrics[-1]["model"] == "db.issue" and metrics[-1]["interrupted"]
+        assert list(Issue.all_objects.filter(project=live).order_by("pk")) == issues[2:]
+        checkpoint = json.loads(redis_instance().get(HARD_DELETE_CHECKPOINT_KEY))
+        assert checkpoint["model"] == "db.issue" and checkpoint["pk"] == str(issues[1].pk)
+        assert not redis_instance().exists(HARD_DELETE_LOCK_KEY)
+
+        hard_delete()
+        assert not Issue.all_objects.filter(project=live).exists()
+
+    def test_throttle_waits_for_the_database(self, settings):
+        settings.HARD_DELETE_THROTTLE_RATIO = 0.5
+        settings.HARD_DELETE_MAX_ACTIVE_QUERIES = 10
+        settings.HARD_DELETE_THROTTLE_WAIT = 5
+        settings.HARD_DELETE_THROTTLE_MAX_WAIT = 60
+        keepalive = Mock(return_value=True)
+        with (
+            patch("plane.bgtasks.deletion_task.get_active_queries", side_effect=[30, 12, 3]),
+            patch("plane.bgtasks.deletion_task.time.sleep") as sleep,
+        ):
+            assert throttle(2, keepalive)
+        assert [call.args[0] for call in sleep.call_args_list] == [1, 5, 5]
+        # The lock is renewed before each wait
+        assert keepalive.call_count == 2
+
+    def test_throttle_gives_up(self, settings):
+        settings.HARD_DELETE_THROTTLE_RATIO = 0
+        settings.HARD_DELETE_MAX_ACTIVE_QUERIES = 10
+        settings.HARD_DELETE_THROTTLE_WAIT = 5
+        settings.HARD_DELETE_THROTTLE_MAX_WAIT = 15
+        with (
+            patch("plane.bgtasks.deletion_task.get_active_queries", return_value=30),
+            patch("plane.bgtasks.deletion_task.time.sleep") as sleep,
+        ):
+            assert not throttle(1)
+            # Nor waits on once the lock is lost
+            assert not throttle(1, Mock(return_value=False))
+        assert [call.args[0] for call in sleep.call_args_list] == [0, 5, 5, 5, 0]
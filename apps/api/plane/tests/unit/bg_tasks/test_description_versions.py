@@ -0,0 +1,105 @@
+import json
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from plane.bgtasks.issue_description_version_task import issue_description_version_task
+from plane.bgtasks.page_version_task import MAX_PAGE_VERSIONS, page_version
+from plane.db.models import Issue, IssueDescriptionVersion, Page, PageVersion, Project, State, User
+
+
+def description(index):
+    return f"<p>{'shared paragraph ' * 200}edit {index}</p>"
+
+
+def edit_page(page, user, index):
+    previous_html = page.description_html
+    Page.objects.filter(pk=page.id).update(
+        description_html=description(index),
+        description={"type": "doc", "edit": index},
+        description_binary=f"binary {index}".encode(),
+    )
+    page.refresh_from_db()
+    page_version(page.id, json.dumps({"description_html": previous_html}), user.id)
+
+
+@pytest.fixture
+def page(workspace, create_user):
+    return Page.objects.create(name="Versioned", workspace=workspace, owned_by=create_user)
+
+
+@pytest.fixture
+def issue(workspace, create_user):
+    project = Project.objects.create(name="Versions", identifier="VER", workspace=workspace, created_by=create_user)
+    State.objects.create(name="Todo", group="unstarted", project=project, workspace=workspace, default=True)
+    return Issue.objects.create(name="Versioned issue", project=project, workspace=workspace)
+
+
+@pytest.mark.unit
+class TestDescriptionVersions:
+    """Test the storage of description versions as snapshots with deltas in between"""
+
+    @pytest.mark.django_db
+    def test_page_versions_are_rebuilt_from_deltas(self, page, create_user, settings):
+        """Every version between snapshots is a delta, and reads rebuild the description it was saved with"""
+        settings.VERSION_SNAPSHOT_INTERVAL = 4
+        for index in range(10):
+            edit_page(page, create_user, index)
+
+        versions = list(PageVersion.objects.filter(page=page).order_by("created_at"))
+        assert [version.description_delta is None for version in versions] == [True, False, False, False] * 2 + [
+            True,
+            False,
+        ]
+        assert versions[5].description_html == ""
+
+        for index, version in enumerate(versions):
+            with CaptureQueriesContext(connection) as queries:
+                version.load_version_content()
+            assert len(queries) <= 1
+            assert version.description_html == description(index)
+            assert version.description_json == {"type": "doc", "edit": index}
+            assert bytes(version.description_binary) == f"binary {index}".encode()
+            assert version.description_stripped.endswith(f"edit {index}")
+            assert version.description_md.endswith(f"edit {index}")
+
+    @pytest.mark.django_db
+    def test_page_versions_are_pruned_in_one_update(self, page, create_user, settings):
+        """Older versions are soft deleted and the oldest kept version becomes a snapshot"""
+        settings.VERSION_SNAPSHOT_INTERVAL = 7
+        for index in range(MAX_PAGE_VERSIONS + 5):
+            edit_page(page, create_user, index)
+
+        versions = list(PageVersion.objects.filter(page=page).order_by("created_at"))
+        assert len(versions) == MAX_PAGE_VERSIONS
+        assert versions[0].description_delta is None
+        assert PageVersion.all_objects.filter(page=page, deleted_at__isnull=False).count() == 5
+        for index, version in enumerate(versions, start=5):
+            assert version.load_version_content().description_html == description(index)
+
+    @pytest.mark.django_db
+    def test_snapshot_interval_of_one_stores_full_versions(self, page, create_user, settings):
+        settings.VERSION_SNAPSHOT_INTERVAL = 1
+        for index in range(3):
+            edit_page(page, create_user, index)
+
+        assert not PageVersion.objects.filter(page=page, description_delta__isnull=False).exists()
+
+    @pytest.mark.django_db
+    def test_latest_issue_version_is_updated_in_place(self, issue, create_user):
+        """Updating a delta in place re-encodes it against the previous version"""
+        other_user = User.objects.create(email="other@plane.so", username="other")
+
+        for user, html in [(create_user, "<p>first</p>"), (other_user, "<p>second</p>"), (other_user, "<p>third</p>")]:
+            previous_html = issue.description_html
+            Issue.objects.filter(pk=issue.id).update(description_html=html, description_stripped=html[3:-4])
+            issue.refresh_from_db()
+            issue_description_version_task(json.dumps({"description_html": previous_html}), issue.id, user.id)
+
+        first, latest = IssueDescriptionVersion.objects.filter(issue=issue).order_by("created_at")
+        assert first.description_delta is None
+        assert latest.description_delta is not None
+        assert latest.load_version_content().description_html == "<p>third</p>"
+        assert latest.description_stripped == "third"
+        assert first.description_html == "<p>first</p>"
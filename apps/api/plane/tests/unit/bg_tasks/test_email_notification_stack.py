@@ -0,0 +1,116 @@
+from unittest.mock import patch
+
+import pytest
+from django.core import mail
+
+from plane.bgtasks.email_notification_task import send_email_notification_batch, stack_email_notification
+from plane.db.models import EmailNotificationLog, Issue, Project, State, User
+from plane.settings.redis import redis_instance
+
+
+def activity(field, old_value, new_value):
+    return {
+        "issue_activity": {
+            "field": field,
+            "old_value": old_value,
+            "new_value": new_value,
+            "activity_time": "2025-01-01T10:00:00Z",
+        }
+    }
+
+
+@pytest.fixture
+def issues(workspace, create_user):
+    project = Project.objects.create(name="Email", identifier="MAIL", workspace=workspace, created_by=create_user)
+    State.objects.create(name="Todo", group="unstarted", project=project, workspace=workspace, default=True)
+    return [Issue.objects.create(name=f"Issue {index}", project=project, workspace=workspace) for index in range(2)]
+
+
+@pytest.fixture
+def receivers():
+    return [User.objects.create(email=f"receiver{index}@plane.so", username=f"receiver{index}") for index in range(2)]
+
+
+@pytest.fixture
+def logs(issues, receivers, create_user):
+    """Two updates of every issue for every receiver"""
+    return [
+        EmailNotificationLog.objects.create(
+            receiver=receiver,
+            triggered_by=create_user,
+            entity_identifier=issue.id,
+            entity_name="issue",
+            data=activity("priority", "low", value),
+            entity="issue",
+        )
+        for receiver in receivers
+        for issue in issues
+        for value in ["medium", "high"]
+    ]
+
+
+@pytest.mark.unit
+class TestStackEmailNotification:
+    """Test the grouping and the dispatch of the pending email notifications"""
+
+    @pytest.mark.django_db
+    def test_notifications_are_grouped_by_receiver(self, logs, receivers, issues, create_user):
+        """Every receiver gets one batch with the updates of every issue"""
+        with patch("plane.bgtasks.email_notification_task.send_email_notification_batch.delay") as batch_delay:
+            stack_email_notification()
+
+        assert batch_delay.call_count == 2
+        batches = {call.kwargs["receiver_id"]: call.kwargs["issues"] for call in batch_delay.call_args_list}
+        assert set(batches) == {str(receiver.id) for receiver in receivers}
+
+        for receiver in receivers:
+            batch = batches[str(receiver.id)]
+            assert {issue["issue_id"] for issue in batch} == {str(issue.id) for issue in issues}
+            for issue in batch:
+                # Only the logs of the issue are sent with it
+                assert sorted(issue["email_notification_ids"]) == sorted(
+                    str(log.id)
+                    for log in logs
+                    if log.receiver_id == receiver.id and str(log.entity_identifier) == issue["issue_id"]
+                )
+                assert len(issue["notification_data"][str(create_user.id)]) == 2
+
+        assert not EmailNotificationLog.objects.filter(processed_at__isnull=True).exists()
+
+    @pytest.mark.django_db
+    def test_batches_and_chunks(self, logs, django_assert_num_queries):
+        """Receivers with many issues get several batches, logs are read and marked in chunks"""
+        with (
+            patch("plane.bgtasks.email_notification_task.send_email_notification_batch.delay") as batch_delay,
+            patch("plane.bgtasks.email_notification_task.EMAIL_NOTIFICATION_BATCH_SIZE", 1),
+            patch("plane.bgtasks.email_notification_task.EMAIL_NOTIFICATION_CHUNK_SIZE", 2),
+        ):
+            stack_email_notification()
+
+        assert batch_delay.call_count == 4
+        assert not EmailNotificationLog.objects.filter(processed_at__isnull=True).exists()
+
+        # Processed logs are not dispatched again
+        with patch("plane.bgtasks.email_notification_task.send_email_notification_batch.delay") as batch_delay:
+            with django_assert_num_queries(1):
+                stack_email_notification()
+        assert batch_delay.call_count == 0
+
+    @pytest.mark.django_db
+    def test_send_batch(self, logs, receivers, issues, create_user):
+        """The emails of a batch are sent and their logs marked as sent"""
+        for issue in issues:
+            redis_instance().set(str(issue.id), "http://localhost", ex=60)
+
+        with patch("plane.bgtasks.email_notification_task.send_email_notification_batch.delay") as batch_delay:
+            stack_email_notification()
+        batch = next(
+            call.kwargs for call in batch_delay.call_args_list if call.kwargs["receiver_id"] == str(receivers[0].id)
+        )
+
+        send_email_notification_batch(**batch)
+
+        assert len(mail.outbox) == 2
+        assert {message.to[0] for message in mail.outbox} == {receivers[0].email}
+        assert EmailNotificationLog.objects.filter(sent_at__isnull=False).count() == 4
+        assert not EmailNotificationLog.objects.filter(receiver=receivers[1], sent_at__isnull=False).exists()
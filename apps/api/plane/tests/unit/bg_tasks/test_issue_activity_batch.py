@@ -0,0 +1,103 @@
+import json
+from unittest.mock import patch
+
+import pytest
+from django.utils import timezone
+
+from plane.bgtasks.issue_activities_task import (
+    batch_issue_activities,
+    issue_activity,
+    issue_activity_batch,
+    queue_issue_activity,
+)
+from plane.db.models import Issue, IssueActivity, Project
+
+
+def priority_event(issue, actor, **kwargs):
+    return {
+        "type": "issue.activity.updated",
+        "requested_data": json.dumps({"priority": "high"}),
+        "current_instance": json.dumps({"priority": "none"}),
+        "issue_id": str(issue.id),
+        "actor_id": str(actor.id),
+        "project_id": str(issue.project_id),
+        "epoch": int(timezone.now().timestamp()),
+        **kwargs,
+    }
+
+
+@pytest.mark.unit
+class TestIssueActivityBatch:
+    """Test the batched issue activity pipeline"""
+
+    @pytest.fixture
+    def issues(self, workspace):
+        issues = []
+        for identifier in ["BAT", "BATT"]:
+            project = Project.objects.create(name=identifier, identifier=identifier, workspace=workspace)
+            issues.extend(
+                Issue.objects.create(name=f"{identifier} {index}", project=project, workspace=workspace)
+                for index in range(3)
+            )
+        return issues
+
+    @pytest.mark.django_db
+    def test_batch_creates_activities(self, issues, create_user, django_assert_max_num_queries):
+        """A batch creates the activities of every event with a constant number of writes"""
+        events = [priority_event(issue, create_user, origin="http://localhost") for issue in issues]
+        before = timezone.now()
+
+        # Project lookup, updated_at update, the change log insert, the activity insert and the cycle and
+        # module lookups of the progress counters, the issues being in none
+        with django_assert_max_num_queries(6):
+            issue_activity_batch(events)
+
+        activities = IssueActivity.objects.filter(field="priority")
+        assert activities.count() == len(issues)
+        assert {activity.workspace_id for activity in activities} == {issues[0].workspace_id}
+        assert Issue.objects.filter(updated_at__lt=before, pk__in=[issue.id for issue in issues]).count() == 0
+
+    @pytest.mark.django_db
+    def test_invalid_events_are_skipped(self, issues, create_user):
+        """Events of unknown projects do not drop the rest of the batch"""
+        events = [
+            priority_event(issues[0], create_user),
+            priority_event(issues[1], create_user, project_id="not-a-uuid"),
+            priority_event(issues[2], create_user, project_id="7a2b9c4e-0000-4000-8000-000000000000"),
+        ]
+        issue_activity_batch(events)
+        assert list(IssueActivity.objects.values_list("issue_id", flat=True)) == [issues[0].id]
+
+    @pytest.mark.django_db
+    def test_single_task_matches_batch(self, issues, create_user):
+        """The single event task still creates its activity"""
+        issue_activity(**priority_event(issues[0], create_user))
+        assert IssueActivity.objects.filter(issue=issues[0], field="priority").count() == 1
+
+    def test_buffered_events_are_sent_in_batches(self):
+        """Events queued inside a batch are sent together when it exits"""
+        with (
+            patch("plane.bgtasks.issue_activities_task.issue_activity_batch.delay") as batch_delay,
+            patch("plane.bgtasks.issue_activities_task.issue_activity.delay") as single_delay,
+            patch("plane.bgtasks.issue_activities_task.ISSUE_ACTIVITY_BATCH_SIZE", 2),
+        ):
+            with batch_issue_activities():
+                for index in range(3):
+                    queue_issue_activity(type="issue.activity.updated", project_id=str(index))
+                assert batch_delay.call_count == 0
+
+            assert batch_delay.call_count == 2
+            assert [len(call.kwargs["events"]) for call in batch_delay.call_args_list] == [2, 1]
+
+            # Outside of a batch the event is sent on its own
+            queue_issue_activity(type="issue.activity.updated", project_id="4")
+            assert single_delay.call_count == 1
+
+    def test_buffer_is_dropped_on_error(self):
+        """Nothing is sent when the block fails"""
+        with patch("plane.bgtasks.issue_activities_task.issue_activity_batch.delay") as batch_delay:
+            with pytest.raises(ValueError):
+                with batch_issue_activities():
+                    queue_issue_activity(type="issue.activity.updated", project_id="1")
+                    raise ValueError
+            assert batch_delay.call_count == 0
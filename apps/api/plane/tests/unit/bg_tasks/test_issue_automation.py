@@ -0,0 +1,162 @@
+from datetime import timedelta
+from unittest.mock import patch
+
+import pytest
+from django.utils import timezone
+
+from plane.bgtasks.issue_automation_task import archive_old_issues, close_old_issues
+from plane.bgtasks.notification_task import issue_activities_notifications
+from plane.db.models import Cycle, CycleIssue, CycleProgress, Issue, IssueActivity, IssueChange, Project, State
+from plane.settings.redis import redis_instance
+from plane.utils.analytics_rollup import ANALYTICS_DIRTY_ISSUES_KEY
+
+
+@pytest.mark.unit
+class TestIssueAutomation:
+    """Test the set based archive and close automation"""
+
+    @pytest.fixture
+    def project(self, workspace, create_user):
+        project = Project.objects.create(
+            name="Automation",
+            identifier="AUTO",
+            workspace=workspace,
+            archive_in=1,
+            close_in=1,
+        )
+        # The automation acts on behalf of the project creator
+        Project.objects.filter(pk=project.pk).update(created_by=create_user)
+        for name, group in [("Todo", "unstarted"), ("Done", "completed"), ("Cancelled", "cancelled")]:
+            State.objects.create(name=name, group=group, project=project, workspace=workspace)
+        return project
+
+    def create_issues(self, project, state_name, count, days_ago):
+        state = State.objects.get(project=project, name=state_name)
+        issues = [
+            Issue.objects.create(
+                name=f"{state_name} {index}", project=project, workspace=project.workspace, state=state
+            )
+            for index in range(count)
+        ]
+        Issue.objects.filter(pk__in=[issue.id for issue in issues]).update(
+            updated_at=timezone.now() - timedelta(days=days_ago)
+        )
+        return issues
+
+    @pytest.mark.django_db
+    @patch("plane.bgtasks.issue_automation_task.issue_activities_notifications.delay")
+    @patch("plane.bgtasks.issue_automation_task.AUTOMATION_CHUNK_SIZE", 2)
+    def test_archive_old_issues(self, notifications, project, create_user, django_capture_on_commit_callbacks):
+        """Stale completed issues are archived in chunks with their activities"""
+        stale = self.create_issues(project, "Done", 5, days_ago=40)
+        recent = self.create_issues(project, "Done", 1, days_ago=5)
+        # Issues of a running cycle are kept
+        cycle = Cycle.objects.create(
+            name="Running",
+            project=project,
+            workspace=project.workspace,
+            owned_by=create_user,
+            end_date=timezone.now() + timedelta(days=3),
+        )
+        CycleIssue.objects.create(cycle=cycle, issue=stale[0], project=project, workspace=project.workspace)
+
+        logged = IssueChange.objects.order_by("-id").values_list("id", flat=True).first()
+        # Notifications are sent once the chunks are committed
+        with django_capture_on_commit_callbacks(execute=True):
+            metrics = archive_old_issues()
+
+        assert metrics["rows"] == 4
+        assert metrics["chunks"] == 2
+        archived = set(Issue.objects.filter(archived_at__isnull=False).values_list("id", flat=True))
+        assert archived == {issue.id for issue in stale[1:]}
+        activities = IssueActivity.objects.filter(field="archived_at", new_value="archive")
+        assert set(activities.values_list("issue_id", flat=True)) == archived
+        assert {activity.actor_id for activity in activities} == {create_user.id}
+        # One notification task per chunk
+        assert notifications.call_count == 2
+        notified = [
+            activity_id for call in notifications.call_args_list for activity_id in call.kwargs["issue_activity_ids"]
+        ]
+        assert sorted(notified) == sorted(str(activity.id) for activity in activities)
+        assert recent[0].id not in archived
+        # Logged for the change feeds and marked for the analytics facts
+        assert set(IssueChange.objects.filter(id__gt=logged).values_list("issue_id", flat=True)) == archived
+        dirty = {issue_id.decode() for issue_id in redis_instance().smembers(ANALYTICS_DIRTY_ISSUES_KEY)}
+        assert {str(issue_id) for issue_id in archived} <= dirty
+
+    @pytest.mark.django_db
+    @patch("plane.bgtasks.issue_automation_task.issue_activities_notifications.delay")
+    def test_close_old_issues(self, notifications, project, create_user, django_capture_on_commit_callbacks):
+        """Stale open issues move to the cancelled state of their project"""
+        stale = self.create_issues(project, "Todo", 3, days_ago=40)
+        self.create_issues(project, "Todo", 2, days_ago=5)
+        # Issues of an ended cycle are closed, and the cycle recounted
+        cycle = Cycle.objects.create(
+            name="Ended",
+            project=project,
+            workspace=project.workspace,
+            owned_by=create_user,
+            end_date=timezone.now() - timedelta(days=3),
+        )
+        CycleIssue.objects.create(cycle=cycle, issue=stale[0], project=project, workspace=project.workspace)
+
+        logged = IssueChange.objects.order_by("-id").values_list("id", flat=True).first()
+        with django_capture_on_commit_callbacks(execute=True):
+            metrics = close_old_issues()
+
+        cancelled = State.objects.get(project=project, group="cancelled")
+        assert metrics["rows"] == 3
+        assert set(Issue.objects.filter(state=cancelled).values_list("id", flat=True)) == {issue.id for issue in stale}
+        activities = IssueActivity.objects.filter(field="state", new_identifier=cancelled.id)
+        assert activities.count() == 3
+        assert {activity.new_value for activity in activities} == {"Cancelled"}
+        assert notifications.call_count == 1
+        assert CycleProgress.objects.get(cycle=cycle).counters["issues"]["cancelled"] == 1
+        closed = set(IssueChange.objects.filter(id__gt=logged).values_list("issue_id", flat=True))
+        assert closed == {issue.id for issue in stale}
+
+        # Closed issues were just updated and are not closed again
+        assert close_old_issues()["rows"] == 0
+
+    @pytest.mark.django_db
+    @patch("plane.bgtasks.issue_automation_task.issue_activities_notifications.delay")
+    def test_close_chunk_logs_its_changes_in_its_transaction(self, notifications, project):
+        """A chunk failing after its changes were logged rolls them back with the closed issues and activities"""
+        stale = self.create_issues(project, "Todo", 2, days_ago=40)
+        logged = IssueChange.objects.order_by("-id").values_list("id", flat=True).first()
+
+        with patch("plane.bgtasks.issue_automation_task.get_issue_containers", side_effect=RuntimeError):
+            close_old_issues()
+
+        assert not IssueChange.objects.filter(id__gt=logged).exists()
+        assert not IssueActivity.objects.filter(field="state", issue__in=stale).exists()
+        assert set(
+            Issue.objects.filter(pk__in=[issue.id for issue in stale]).values_list("state__name", flat=True)
+        ) == {"Todo"}
+        notifications.assert_not_called()
+
+    @pytest.mark.django_db
+    @patch("plane.bgtasks.notification_task.notifications")
+    def test_issue_activities_notifications(self, notifications, project):
+        """The activities of a chunk are notified one by one with their own requested data"""
+        issue = self.create_issues(project, "Todo", 1, days_ago=0)[0]
+        activities = [
+            IssueActivity.objects.create(
+                issue=issue, project=project, workspace=project.workspace, field="state", verb="updated"
+            )
+            for _ in range(2)
+        ]
+
+        issue_activities_notifications(
+            issue_activity_ids=[str(activity.id) for activity in activities],
+            requested_data={
+                str(activity.id): f'{{"closed_to": "{index}"}}' for index, activity in enumerate(activities)
+            },
+        )
+
+        assert notifications.call_count == 2
+        assert {call.kwargs["requested_data"] for call in notifications.call_args_list} == {
+            '{"closed_to": "0"}',
+            '{"closed_to": "1"}',
+        }
+        assert all(call.kwargs["issue_id"] == str(issue.id) for call in notifications.call_args_list)
@@ -0,0 +1,351 @@
+import json
+from datetime import timedelta
+from unittest.mock import patch
+
+import pytest
+from django.core.management import call_command
+from django.db.models import Count, Q
+from django.utils import timezone
+
+from plane.bgtasks.issue_activities_task import issue_activity
+from plane.bgtasks.progress_counter_task import reconcile_cycle_and_module_progress
+from plane.db.models import (
+    Cycle,
+    CycleIssue,
+    CycleProgress,
+    Estimate,
+    EstimatePoint,
+    Issue,
+    Module,
+    ModuleIssue,
+    ModuleProgress,
+    Project,
+    ProjectMember,
+    State,
+)
+from plane.utils.analytics_plot import burndown_plot
+from plane.utils.progress_counters import compute_progress_counters, get_changed_containers, get_progress_counters
+
+
+@pytest.fixture
+def project(workspace, create_user):
+    project = Project.objects.create(name="Progress", identifier="PRO", workspace=workspace, created_by=create_user)
+    ProjectMember.objects.create(project=project, workspace=workspace, member=create_user, role=20)
+    states = [
+        State.objects.create(name=name, group=group, project=project, workspace=workspace, default=index == 0)
+        for index, (name, group) in enumerate(
+            [("Backlog", "backlog"), ("Todo", "unstarted"), ("Doing", "started"), ("Done", "completed")]
+        )
+    ]
+    now = timezone.now()
+    cycle = Cycle.objects.create(
+        name="Cycle",
+        project=project,
+        workspace=workspace,
+        owned_by=create_user,
+        start_date=now - timedelta(days=5),
+        end_date=now + timedelta(days=2),
+    )
+    Cycle.objects.create(name="Next", project=project, workspace=workspace, owned_by=create_user)
+    module = Module.objects.create(
+        name="Module",
+        project=project,
+        workspace=workspace,
+        start_date=(now - timedelta(days=5)).date(),
+        target_date=(now + timedelta(days=2)).date(),
+    )
+    estimate = Estimate.objects.create(name="Points", type="points", project=project, workspace=workspace)
+    points = [
+        EstimatePoint.objects.create(estimate=estimate, key=index, value=value, project=project, workspace=workspace)
+        for index, value in enumerate(["1", "2", "3"])
+    ]
+
+    for index in range(20):
+        issue = Issue.objects.create(
+            name=f"Issue {index}",
+            project=project,
+            workspace=workspace,
+            state=states[index % 4],
+            estimate_point=points[index % 3] if index % 5 else None,
+        )
+        if index % 2 == 0:
+            CycleIssue.objects.create(issue=issue, cycle=cycle, project=project, workspace=workspace)
+        if index % 3 == 0:
+            ModuleIssue.objects.create(issue=issue, module=module, project=project, workspace=workspace)
+    # Spread the completions over the days of the cycle
+    for offset, issue in enumerate(Issue.objects.filter(project=project, state__group="completed").order_by("name")):
+        Issue.objects.filter(pk=issue.pk).update(completed_at=now - timedelta(days=offset % 4))
+    return project
+
+
+def count_issues(**filters):
+    """Count the issues of a cycle or module by state group"""
+    issues = Issue.issue_objects.filter(**filters)
+    counts = dict(issues.values_list("state__group").annotate(count=Count("id")))
+    return {group: counts.get(group, 0) for group in ["backlog", "unstarted", "started", "completed", "cancelled"]}
+
+
+@pytest.mark.unit
+class TestProgressCounters:
+    """Test the progress counters of the cycles and modules"""
+
+    @pytest.mark.django_db
+    def test_progress_reads_the_counters(self, session_client, workspace, project):
+        """The cycle progress returns the counts of the issues from the stored counters"""
+        cycle = Cycle.objects.get(project=project, name="Cycle")
+        url = f"/api/workspaces/{workspace.slug}/projects/{project.id}/cycles/{cycle.id}/progress/"
+
+        response = session_client.get(url)
+        assert response.status_code == 200
+        counts = count_issues(issue_cycle__cycle=cycle, issue_cycle__deleted_at__isnull=True)
+        assert {group: response.data[f"{group}_issues"] for group in counts} == counts
+        assert response.data["total_issues"] == 10
+        points = Issue.issue_objects.filter(issue_cycle__cycle=cycle, estimate_point__isnull=False)
+        assert response.data["total_estimate_points"] == sum(float(issue.estimate_point.value) for issue in points)
+        assert CycleProgress.objects.filter(cycle=cycle).exists()
+
+        # Served from the counters until the issue activities recount them
+        Issue.objects.filter(issue_cycle__cycle=cycle).update(state=State.objects.get(project=project, name="Done"))
+        assert session_client.get(url).data["completed_issues"] == counts["completed"]
+
+    @pytest.mark.django_db
+    def test_issue_activities_recount_the_progress(self, session_client, workspace, project, create_user):
+        """State, cycle and module changes recount the progress of the cycles and modules of the issues"""
+        cycle = Cycle.objects.get(project=project, name="Cycle")
+        next_cycle = Cycle.objects.get(project=project, name="Next")
+        module = Module.objects.get(project=project)
+        get_progress_counters(cycle)
+        get_progress_counters(next_cycle)
+        get_progress_counters(module)
+
+        # Issue 0 is in the cycle and the module
+        issue = Issue.objects.get(project=project, name="Issue 0")
+        issue.state = State.objects.get(project=project, name="Doing")
+        issue.save()
+        issue_activity(
+            type="issue.activity.updated",
+            requested_data=json.dumps({"state_id": str(issue.state_id)}),
+            current_instance=json.dumps({"state_id": None}),
+            issue_id=str(issue.id),
+            actor_id=str(create_user.id),
+            project_id=str(project.id),
+            epoch=0,
+        )
+        assert CycleProgress.objects.get(cycle=cycle).counters["issues"]["backlog"] == 4
+        assert ModuleProgress.objects.get(module=module).counters["issues"]["started"] == 3
+
+        # Moved to the next cycle, both cycles are recounted
+        CycleIssue.objects.filter(issue=issue).update(cycle=next_cycle)
+        issue_activity(
+            type="cycle.activity.created",
+            requested_data=json.dumps({"cycle_id": str(next_cycle.id), "issues": [str(issue.id)]}),
+            current_instance=json.dumps(
+                {
+                    "updated_cycle_issues": [
+                        {"issue_id": str(issue.id), "old_cycle_id": str(cycle.id), "new_cycle_id": str(next_cycle.id)}
+                    ],
+                    "created_cycle_issues": "[]",
+                }
+            ),
+            issue_id=None,
+            actor_id=str(create_user.id),
+            project_id=str(project.id),
+            epoch=0,
+        )
+        assert CycleProgress.objects.get(cycle=cycle).counters["total_issues"] == 9
+        assert CycleProgress.objects.get(cycle=next_cycle).counters["issues"]["started"] == 1
+
+        # Removed from the module through the endpoint
+        with (
+            patch("plane.app.views.module.issue.issue_activity.delay", side_effect=issue_activity),
+            patch("plane.bgtasks.issue_activities_task.notifications.delay"),
+        ):
+            response = session_client.delete(
+                f"/api/workspaces/{workspace.slug}/projects/{project.id}/modules/{module.id}/issues/{issue.id}/"
+            )
+        assert response.status_code == 204
+        counters = ModuleProgress.objects.get(module=module).counters
+        assert counters["issues"] == count_issues(issue_module__module=module, issue_module__deleted_at__isnull=True)
+        assert counters["total_issues"] == 6
+
+    @pytest.mark.django_db
+    def test_changed_containers(self, project, django_assert_num_queries):
+        """Only the events that change the counters recount, the containers the issues are in or were moved out of"""
+        cycle = Cycle.objects.get(project=project, name="Cycle")
+        next_cycle = Cycle.objects.get(project=project, name="Next")
+        module = Module.objects.get(project=project)
+        # Issue 0 is in the cycle and the module, and was in the next cycle before
+        issue = Issue.objects.get(project=project, name="Issue 0")
+        CycleIssue.objects.create(issue=issue, cycle=next_cycle, project=project, workspace=project.workspace).delete()
+
+        def event(type, requested_data, current_instance=None, issue_id=issue.id):
+            return {
+                "type": type,
+                "issue_id": str(issue_id) if issue_id else None,
+                "requested_data": json.dumps(requested_data),
+                "current_instance": json.dumps(current_instance) if current_instance else None,
+            }
+
+        with django_assert_num_queries(0):
+            assert get_changed_containers([event("issue.activity.updated", {"name": "Renamed"})]) == (set(), set())
+        assert get_changed_containers([event("issue.activity.updated", {"estimate_point": None})]) == (
+            {str(cycle.id)},
+            {str(module.id)},
+        )
+
+        # Moved to the next cycle by the bulk endpoint, and added to the module
+        moved = event(
+            "cycle.activity.created",
+            {"cycles_list": [str(issue.id)]},
+            {
+                "updated_cycle_issues": [
+                    {"issue_id": str(issue.id), "old_cycle_id": str(cycle.id), "new_cycle_id": str(next_cycle.id)}
+                ],
+                "created_cycle_issues": "[]",
+            },
+            issue_id=None,
+        )
+        added = event("module.activity.created", {"module_id": str(module.id)})
+        with django_assert_num_queries(0):
+            assert get_changed_containers([moved, added]) == ({str(cycle.id), str(next_cycle.id)}, {str(module.id)})
+
+        # Deleted along with its memberships, the cycle it left before is not recounted
+        with patch("plane.db.mixins.soft_delete_related_objects.delay"):
+            issue.delete()
+        CycleIssue.objects.filter(issue=issue).update(deleted_at=timezone.now())
+        assert get_changed_containers([event("issue.activity.deleted", {})]) == ({str(cycle.id)}, {str(module.id)})
+
+    @pytest.mark.django_db
+    def test_burndown_reads_the_completions(self, project):
+        """The burndown walks the issues completed by day of the counters"""
+        today = timezone.now().date()
+        for model, filters in [
+            (Cycle, {"issue_cycle__deleted_at__isnull": True}),
+            (Module, {"issue_module__deleted_at__isnull": True}),
+        ]:
+            relation = "issue_cycle__cycle" if model is Cycle else "issue_module__module"
+            container = model.objects.filter(project=project, name__in=["Cycle", "Module"]).first()
+            issues = Issue.issue_objects.filter(**{relation: container}, **filters)
+            container.total_issues = issues.count()
+            kwargs = {"cycle_id": container.id} if model is Cycle else {"module_id": container.id}
+
+            for plot_type in ["issues", "points"]:
+                chart = burndown_plot(container, project.workspace.slug, project.id, plot_type, **kwargs)
+                assert len(chart) == 8
+
+                def weight(issue):
+                    if plot_type == "issues":
+                        return 1
+                    return float(issue.estimate_point.value) if issue.estimate_point else 0
+
+                total = sum(weight(issue) for issue in issues)
+                for day, pending in chart.items():
+                    if day > str(today):
+                        assert pending is None
+                        continue
+                    completed = sum(
+                        weight(issue)
+                        for issue in issues
+                        if issue.completed_at is not None and str(issue.completed_at.date()) <= day
+                    )
+                    assert pending == total - completed, (model, plot_type, day)
+
+    @pytest.mark.django_db
+    def test_check_progress_counters(self, project, capsys):
+        """The checker reports the counters that differ from a recount and stores the recount with --fix"""
+        cycle = Cycle.objects.get(project=project, name="Cycle")
+        module = Module.objects.get(project=project)
+        get_progress_counters(cycle)
+        get_progress_counters(module)
+
+        call_command("check_progress_counters")
+        assert "match" in capsys.readouterr().out
+
+        Issue.objects.filter(issue_cycle__cycle=cycle).filter(~Q(state__group="completed")).delete()
+        call_command("check_progress_counters", str(project.id))
+        output = capsys.readouterr().out
+        assert str(cycle.id) in output and str(module.id) in output
+
+        call_command("check_progress_counters", "--fix")
+        assert (
+            CycleProgress.objects.get(cycle=cycle).counters
+            == compute_progress_counters(Cycle, [cycle.id])[str(cycle.id)]
+        )
+        call_command("check_progress_counters")
+        assert "match" in capsys.readouterr().out
+
+    @pytest.mark.django_db
+    def test_bulk_delete_recounts_the_progress(self, session_client, workspace, project):
+        """The bulk delete sends no activity for the issues, the progress is recounted by the endpoint"""
+        cycle = Cycle.objects.get(project=project, name="Cycle")
+        module = Module.objects.get(project=project)
+        get_progress_counters(cycle)
+        get_progress_counters(module)
+
+        # Issues 0 and 6 are in the cycle and the module, issue 2 in the cycle only
+        issue_ids = [
+            str(issue_id)
+            for issue_id in Issue.objects.filter(
+                project=project, name__in=["Issue 0", "Issue 2", "Issue 6"]
+            ).values_list("id", flat=True)
+        ]
+        with patch("plane.db.mixins.soft_delete_related_objects.delay"):
+            response = session_client.delete(
+                f"/api/workspaces/{workspace.slug}/projects/{project.id}/bulk-delete-issues/",
+                {"issue_ids": issue_ids},
+                format="json",
+            )
+        assert response.status_code == 200
+        assert CycleProgress.objects.get(cycle=cycle).counters["total_issues"] == 7
+        assert ModuleProgress.objects.get(module=module).counters["total_issues"] == 5
+        for model, container in [(Cycle, cycle), (Module, module)]:
+            stored = CycleProgress if model is Cycle else ModuleProgress
+            counters = stored.objects.get(**{model.__name__.lower(): container}).counters
+            assert counters == compute_progress_counters(model, [container.id])[str(container.id)]
+
+    @pytest.mark.django_db
+    def test_estimate_point_delete_recounts_the_progress(self, session_client, workspace, project):
+        """Deleting an estimate point without a replacement clears it from the issues and recounts the points"""
+        cycle = Cycle.objects.get(project=project, name="Cycle")
+        module = Module.objects.get(project=project)
+        get_progress_counters(cycle)
+        get_progress_counters(module)
+        point = EstimatePoint.objects.get(project=project, value="3")
+        total_points = sum(CycleProgress.objects.get(cycle=cycle).counters["estimate_points"].values())
+
+        with (
+            patch("plane.app.views.estimate.base.issue_activity.delay"),
+            patch("plane.db.mixins.soft_delete_related_objects.delay"),
+        ):
+            response = session_client.delete(
+                f"/api/workspaces/{workspace.slug}/projects/{project.id}"
+                f"/estimates/{point.estimate_id}/estimate-points/{point.id}/"
+            )
+        assert response.status_code == 200
+        assert not Issue.objects.filter(estimate_point_id=point.id).exists()
+        counters = CycleProgress.objects.get(cycle=cycle).counters
+        assert sum(counters["estimate_points"].values()) < total_points
+        assert counters == compute_progress_counters(Cycle, [cycle.id])[str(cycle.id)]
+        assert (
+            ModuleProgress.objects.get(module=module).counters
+            == compute_progress_counters(Module, [module.id])[str(module.id)]
+        )
+
+    @pytest.mark.django_db
+    def test_reconcile_task_recounts_the_progress(self, project):
+        """The periodic task stores a recount of the counters that were changed without an activity"""
+        cycle = Cycle.objects.get(project=project, name="Cycle")
+        module = Module.objects.get(project=project)
+        get_progress_counters(cycle)
+        get_progress_counters(module)
+        assert reconcile_cycle_and_module_progress() == 0
+
+        Issue.objects.filter(issue_cycle__cycle=cycle, state__group="backlog").update(
+            state=State.objects.get(project=project, name="Done")
+        )
+        assert reconcile_cycle_and_module_progress() == 2
+        assert (
+            CycleProgress.objects.get(cycle=cycle).counters
+            == compute_progress_counters(Cycle, [cycle.id])[str(cycle.id)]
+        )
+        assert reconcile_cycle_and_module_progress() == 0
@@ -0,0 +1,112 @@
+from unittest.mock import patch
+
+import pytest
+from django.urls import reverse
+
+from plane.bgtasks.recent_visited_task import RECENT_VISITS_FLUSHING_KEY, flush_recent_visits, recent_visited_task
+from plane.db.models import Issue, Project, State, UserRecentVisit
+from plane.settings.redis import redis_instance
+from plane.utils.recent_visits import RECENT_VISITS_DIRTY_KEY, get_recent_visits, get_recent_visits_key
+
+
+@pytest.fixture
+def issues(workspace, create_user):
+    project = Project.objects.create(name="Visits", identifier="VIS", workspace=workspace, created_by=create_user)
+    State.objects.create(name="Todo", group="unstarted", project=project, workspace=workspace, default=True)
+    return [Issue.objects.create(name=f"Visited {index}", project=project, workspace=workspace) for index in range(25)]
+
+
+@pytest.fixture(autouse=True)
+def clean_recent_visits(workspace, create_user):
+    keys = [get_recent_visits_key(workspace.slug, create_user.id), RECENT_VISITS_DIRTY_KEY, RECENT_VISITS_FLUSHING_KEY]
+    redis_instance().delete(*keys)
+    yield
+    redis_instance().delete(*keys)
+
+
+def visit(issue, user, slug):
+    recent_visited_task(
+        entity_name="issue",
+        entity_identifier=str(issue.id),
+        user_id=str(user.id),
+        project_id=str(issue.project_id),
+        slug=slug,
+    )
+
+
+@pytest.mark.unit
+class TestRecentVisits:
+    """Test the recent visits kept in redis and flushed to the database"""
+
+    @pytest.mark.django_db
+    def test_visits_do_not_write_to_the_database(self, issues, workspace, create_user, django_assert_num_queries):
+        """Only the first visit reads the stored visits, none writes, and the latest 20 are kept"""
+        with django_assert_num_queries(1):
+            visit(issues[0], create_user, workspace.slug)
+        with django_assert_num_queries(0):
+            for issue in issues[1:]:
+                visit(issue, create_user, workspace.slug)
+        visit(issues[3], create_user, workspace.slug)
+
+        visits = get_recent_visits(workspace.slug, create_user.id)
+        assert len(visits) == 20
+        assert visits[0]["entity_identifier"] == str(issues[3].id)
+        assert [visit["entity_identifier"] for visit in visits[1:]] == [str(issue.id) for issue in issues[24:5:-1]]
+        assert not UserRecentVisit.objects.exists()
+
+    @pytest.mark.django_db
+    def test_flush_writes_the_latest_visits(self, issues, workspace, create_user, django_assert_max_num_queries):
+        """The flush stores the sorted sets in bulk, drops the visits that fell out and those of deleted entities"""
+        for issue in issues[:5]:
+            visit(issue, create_user, workspace.slug)
+        flush_recent_visits()
+        assert UserRecentVisit.objects.filter(user=create_user).count() == 5
+
+        issues[4].delete()
+        for issue in issues[5:]:
+            visit(issue, create_user, workspace.slug)
+        with django_assert_max_num_queries(8):
+            assert flush_recent_visits() == 20
+
+        visits = get_recent_visits(workspace.slug, create_user.id)
+        rows = {row.id: row for row in UserRecentVisit.objects.filter(user=create_user)}
+        assert len(rows) == 20
+        assert str(issues[4].id) not in {visit["entity_identifier"] for visit in visits}
+        for visit_data in visits:
+            row = rows[visit_data["id"]]
+            assert str(row.entity_identifier) == visit_data["entity_identifier"]
+            assert row.visited_at == visit_data["visited_at"]
+            assert row.created_by_id == create_user.id
+        assert not redis_instance().exists(RECENT_VISITS_DIRTY_KEY, RECENT_VISITS_FLUSHING_KEY)
+
+    @pytest.mark.django_db
+    def test_expired_visits_are_seeded_from_the_database(self, issues, workspace, create_user, session_client):
+        """The list is served from redis and an expired sorted set resumes from the flushed visits"""
+        for issue in issues[:3]:
+            visit(issue, create_user, workspace.slug)
+        flush_recent_visits()
+        redis_instance().delete(get_recent_visits_key(workspace.slug, create_user.id))
+        visit(issues[3], create_user, workspace.slug)
+
+        response = session_client.get(reverse("workspace-recent-visits", kwargs={"slug": workspace.slug}))
+
+        assert response.status_code == 200
+        assert [visit["entity_identifier"] for visit in response.data] == [str(issue.id) for issue in issues[3::-1]]
+
+    @pytest.mark.django_db
+    def test_visits_of_deleted_entities_are_left_out(self, issues, workspace, create_user, session_client):
+        """Visits of entities deleted since are left out of the list served from the database as from redis"""
+        for issue in issues[:3]:
+            visit(issue, create_user, workspace.slug)
+        flush_recent_visits()
+        with patch("plane.db.mixins.soft_delete_related_objects.delay"):
+            issues[1].delete()
+        url = reverse("workspace-recent-visits", kwargs={"slug": workspace.slug})
+
+        response = session_client.get(url)
+        assert [visit["entity_identifier"] for visit in response.data] == [str(issues[2].id), str(issues[0].id)]
+
+        # Served from the database once the sorted set expired
+        redis_instance().delete(get_recent_visits_key(workspace.slug, create_user.id))
+        response = session_client.get(url)
+        assert [visit["entity_identifier"] for visit in response.data] == [str(issues[2].id), str(issues[0].id)]
@@ -0,0 +1,249 @@
+import hashlib
+import hmac
+import json
+import socket
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+import pytest
+
+from plane.bgtasks.webhook_task import (
+    WEBHOOK_DELIVERY_LOCK_KEY,
+    WEBHOOK_MAX_RETRIES,
+    deliver_webhooks,
+    store_webhook_payload,
+)
+from plane.db.models import Webhook, WebhookLog
+from plane.settings.redis import redis_instance
+from plane.utils.webhook_delivery import (
+    WEBHOOK_CIRCUIT_KEY,
+    WEBHOOK_DELIVERY_QUEUE_KEY,
+    WEBHOOK_FAILURES_KEY,
+    queue_webhook_deliveries,
+)
+
+
+class StubReceiver(BaseHTTPRequestHandler):
+    """Webhook endpoint recording the requests it receives, /slow responds after 100ms and /moved redirects to /"""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        server = self.server
+        if self.path == "/moved":
+            self.rfile.read(int(self.headers["Content-Length"]))
+            self.send_response(308)
+            self.send_header("Location", "/")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        with server.lock:
+            server.in_flight += 1
+            server.max_in_flight = max(server.max_in_flight, server.in_flight)
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        if self.path == "/slow":
+            time.sleep(0.1)
+        with server.lock:
+            server.in_flight -= 1
+            server.received.append({"headers": dict(self.headers), "body": body, "port": self.client_address[1]})
+
+        self.send_response(200)
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"ok")
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def receiver():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubReceiver)
+    server.lock = threading.Lock()
+    server.in_flight = server.max_in_flight = 0
+    server.received = []
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def closed_port():
+    """A local port nothing listens on"""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@pytest.fixture(autouse=True)
+def clean_delivery_state():
+    keys = [WEBHOOK_DELIVERY_QUEUE_KEY, WEBHOOK_DELIVERY_LOCK_KEY, WEBHOOK_FAILURES_KEY, WEBHOOK_CIRCUIT_KEY]
+    redis_instance().delete(*keys)
+    yield
+    redis_instance().delete(*keys)
+
+
+def queue_events(webhook, count):
+    payload_key, _ = store_webhook_payload(
+        event="issue",
+        event_data={"id": "issue-id"},
+        activity={"field": "priority", "new_value": "high"},
+        deliveries=count,
+    )
+    queue_webhook_deliveries(
+        [
+            {
+                "webhook_id": str(webhook.id),
+                "event": "issue",
+                "action": "updated",
+                "current_site": "https://plane.so",
+                "payload_key": payload_key,
+                "retry_count": 0,
+            }
+        ]
+        * count
+    )
+
+
+def queued_deliveries():
+    return [
+        (json.loads(member), due)
+        for member, due in redis_instance().zrange(WEBHOOK_DELIVERY_QUEUE_KEY, 0, -1, withscores=True)
+    ]
+
+
+def run_deliveries():
+    with patch("plane.bgtasks.webhook_task.deliver_webhooks.delay") as deliver_delay:
+        sent = deliver_webhooks()
+    return sent, deliver_delay
+
+
+@pytest.mark.unit
+class TestWebhookDelivery:
+    """Test the delivery engine against a local webhook endpoint"""
+
+    @pytest.mark.django_db
+    def test_deliveries_share_connections_per_host(self, receiver, workspace, settings):
+        """A batch is sent concurrently within the host limit, over reused connections, and logged in bulk"""
+        settings.WEBHOOK_HOST_CONCURRENCY = 2
+        webhook = Webhook.objects.create(workspace=workspace, url=f"http://127.0.0.1:{receiver.server_port}/slow")
+        queue_events(webhook, 10)
+
+        sent, deliver_delay = run_deliveries()
+
+        assert sent == 10
+        assert len(receiver.received) == 10
+        assert receiver.max_in_flight == 2
+        assert len({request["port"] for request in receiver.received}) == 2
+        assert WebhookLog.objects.filter(webhook=webhook.id, response_status="200").count() == 10
+        assert not queued_deliveries()
+        deliver_delay.assert_not_called()
+
+        request = receiver.received[0]
+        payload = json.loads(request["body"])
+        assert payload["action"] == "updated"
+        assert payload["data"] == {"id": "issue-id"}
+        signature = hmac.new(webhook.secret_key.encode("utf-8"), request["body"], hashlib.sha256).hexdigest()
+        assert request["headers"]["X-Plane-Signature"] == signature
+
+    @pytest.mark.django_db
+    def test_failing_webhook_is_retried_then_paused(self, receiver, closed_port, workspace, settings):
+        """Failed deliveries are retried later, repeated failures pause the webhook without affecting others"""
+        settings.WEBHOOK_CIRCUIT_FAILURES = 2
+        failing = Webhook.objects.create(workspace=workspace, url=f"http://127.0.0.1:{closed_port}/")
+        healthy = Webhook.objects.create(workspace=workspace, url=f"http://127.0.0.1:{receiver.server_port}/")
+        queue_events(failing, 2)
+        queue_events(healthy, 1)
+
+        assert run_deliveries()[0] == 3
+
+        assert len(receiver.received) == 1
+        retries = queued_deliveries()
+        assert [delivery["retry_count"] for delivery, _ in retries] == [1, 1]
+        assert all(due > time.time() - 1 for _, due in retries)
+        assert WebhookLog.objects.filter(webhook=failing.id, response_status="500").count() == 2
+
+        # The retries are due, but the webhook is paused until the end of its cooldown
+        redis_instance().delete(WEBHOOK_DELIVERY_QUEUE_KEY)
+        queue_webhook_deliveries([delivery for delivery, _ in retries])
+        assert run_deliveries()[0] == 0
+        assert all(due >= time.time() + settings.WEBHOOK_CIRCUIT_COOLDOWN - 5 for _, due in queued_deliveries())
+
+    @pytest.mark.django_db
+    def test_webhook_is_deactivated_after_last_retry(self, closed_port, workspace, create_user):
+        """The webhook is deactivated and its owner emailed when the last retry fails"""
+        webhook = Webhook.objects.create(workspace=workspace, url=f"http://127.0.0.1:{closed_port}/")
+        Webhook.objects.filter(pk=webhook.id).update(created_by=create_user)
+        queue_events(webhook, 1)
+        delivery, _ = queued_deliveries()[0]
+        redis_instance().delete(WEBHOOK_DELIVERY_QUEUE_KEY)
+        queue_webhook_deliveries([{**delivery, "retry_count": WEBHOOK_MAX_RETRIES}])
+
+        with patch("plane.bgtasks.webhook_task.send_webhook_deactivation_email.delay") as email_delay:
+            run_deliveries()
+
+        webhook.refresh_from_db()
+        assert not webhook.is_active
+        assert email_delay.call_args.kwargs["receiver_id"] == create_user.id
+        assert not queued_deliveries()
+
+    @pytest.mark.django_db
+    def test_batch_stops_at_the_end_of_the_run(self, receiver, workspace, settings):
+        """Deliveries still waiting for their host when the run ends are left for the next run"""
+        settings.WEBHOOK_HOST_CONCURRENCY = 1
+        settings.WEBHOOK_DELIVERY_RUN_SECONDS = 0.25
+        webhook = Webhook.objects.create(workspace=workspace, url=f"http://127.0.0.1:{receiver.server_port}/slow")
+        queue_events(webhook, 10)
+
+        sent, deliver_delay = run_deliveries()
+
+        assert 0 < sent < 10
+        assert len(receiver.received) == sent
+        assert WebhookLog.objects.filter(webhook=webhook.id).count() == sent
+        left = queued_deliveries()
+        assert len(left) == 10 - sent
+        assert all(delivery["retry_count"] == 0 and due <= time.time() for delivery, due in left)
+        deliver_delay.assert_called_once()
+
+    @pytest.mark.django_db
+    def test_circuit_opens_in_the_middle_of_a_batch(self, closed_port, workspace, settings):
+        """The deliveries of a webhook that failed enough times in the batch wait for the end of the pause"""
+        settings.WEBHOOK_HOST_CONCURRENCY = 1
+        settings.WEBHOOK_CIRCUIT_FAILURES = 2
+        webhook = Webhook.objects.create(workspace=workspace, url=f"http://127.0.0.1:{closed_port}/")
+        queue_events(webhook, 5)
+
+        assert run_deliveries()[0] == 2
+
+        assert WebhookLog.objects.filter(webhook=webhook.id, response_status="500").count() == 2
+        paused = [due for delivery, due in queued_deliveries() if delivery["retry_count"] == 0]
+        assert len(paused) == 3
+        assert all(due >= time.time() + settings.WEBHOOK_CIRCUIT_COOLDOWN - 5 for due in paused)
+
+    @pytest.mark.django_db
+    def test_lock_of_another_run_is_kept(self, receiver, workspace):
+        """A run sends nothing while another holds the lock, and releases only its own lock"""
+        webhook = Webhook.objects.create(workspace=workspace, url=f"http://127.0.0.1:{receiver.server_port}/")
+        queue_events(webhook, 1)
+        redis_instance().set(WEBHOOK_DELIVERY_LOCK_KEY, "other-run", ex=60)
+
+        assert run_deliveries()[0] == 0
+        assert redis_instance().get(WEBHOOK_DELIVERY_LOCK_KEY) == b"other-run"
+
+        redis_instance().delete(WEBHOOK_DELIVERY_LOCK_KEY)
+        assert run_deliveries()[0] == 1
+        assert redis_instance().get(WEBHOOK_DELIVERY_LOCK_KEY) is None
+
+    @pytest.mark.django_db
+    def test_redirects_are_followed(self, receiver, workspace):
+        """Webhooks whose endpoint moved are delivered to its new location"""
+        webhook = Webhook.objects.create(workspace=workspace, url=f"http://127.0.0.1:{receiver.server_port}/moved")
+        queue_events(webhook, 1)
+
+        assert run_deliveries()[0] == 1
+        assert len(receiver.received) == 1
+        assert WebhookLog.objects.filter(webhook=webhook.id, response_status="200").count() == 1
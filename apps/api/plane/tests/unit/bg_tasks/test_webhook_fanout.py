@@ -0,0 +1,155 @@
+from unittest.mock import patch
+
+import json
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from plane.bgtasks.webhook_task import (
+    WEBHOOK_FANOUT_STATS_KEY,
+    bulk_model_activity,
+    webhook_activity,
+    webhook_send_task,
+)
+from plane.db.models import Issue, Project, State, Webhook
+from plane.settings.redis import redis_instance
+from plane.utils.webhook_delivery import WEBHOOK_DELIVERY_QUEUE_KEY
+
+
+@pytest.fixture
+def issue(workspace, create_user):
+    project = Project.objects.create(name="Hooks", identifier="HOOK", workspace=workspace, created_by=create_user)
+    State.objects.create(name="Todo", group="unstarted", project=project, workspace=workspace, default=True)
+    return Issue.objects.create(name="Webhook issue", project=project, workspace=workspace)
+
+
+@pytest.fixture
+def webhooks(workspace):
+    return [
+        Webhook.objects.create(workspace=workspace, url=f"https://hooks{index}.plane.so/events", issue=True)
+        for index in range(3)
+    ]
+
+
+@pytest.fixture(autouse=True)
+def clean_fanout_state():
+    redis_instance().delete(WEBHOOK_FANOUT_STATS_KEY, WEBHOOK_DELIVERY_QUEUE_KEY)
+    yield
+    redis_instance().delete(WEBHOOK_FANOUT_STATS_KEY, WEBHOOK_DELIVERY_QUEUE_KEY)
+
+
+def queued_deliveries():
+    return [json.loads(member) for member in redis_instance().zrange(WEBHOOK_DELIVERY_QUEUE_KEY, 0, -1)]
+
+
+def issue_updated(issue, actor, slug):
+    webhook_activity(
+        event="issue",
+        verb="updated",
+        field="priority",
+        old_value="low",
+        new_value="high",
+        actor_id=str(actor.id),
+        slug=slug,
+        current_site="https://plane.so",
+        event_id=str(issue.id),
+        old_identifier=None,
+        new_identifier=None,
+    )
+
+
+@pytest.mark.unit
+class TestWebhookFanout:
+    """Test that the payload of an event is built once and shared by all of its deliveries"""
+
+    @pytest.mark.django_db
+    def test_payload_is_serialized_once(self, issue, webhooks, workspace, create_user):
+        """The queries do not grow with the webhooks and every delivery gets the same payload key"""
+        Webhook.objects.filter(pk__in=[webhook.id for webhook in webhooks[1:]]).update(is_active=False)
+        with patch("plane.bgtasks.webhook_task.deliver_webhooks.delay"):
+            with CaptureQueriesContext(connection) as single_webhook:
+                issue_updated(issue, create_user, workspace.slug)
+        redis_instance().delete(WEBHOOK_DELIVERY_QUEUE_KEY)
+
+        Webhook.objects.update(is_active=True)
+        with patch("plane.bgtasks.webhook_task.deliver_webhooks.delay") as deliver_delay:
+            with CaptureQueriesContext(connection) as three_webhooks:
+                issue_updated(issue, create_user, workspace.slug)
+
+        assert len(three_webhooks) == len(single_webhook)
+
+        deliver_delay.assert_called_once()
+        deliveries = queued_deliveries()
+        assert {delivery["webhook_id"] for delivery in deliveries} == {str(webhook.id) for webhook in webhooks}
+        assert len({delivery["payload_key"] for delivery in deliveries}) == 1
+
+        stats = redis_instance().hgetall(WEBHOOK_FANOUT_STATS_KEY)
+        assert int(stats[b"issue:events"]) == 2
+        assert int(stats[b"issue:deliveries"]) == 4
+
+    @pytest.mark.django_db
+    def test_no_payload_without_webhooks(self, issue, workspace, create_user, django_assert_num_queries):
+        """Events without subscribed webhooks are not serialized"""
+        with patch("plane.bgtasks.webhook_task.deliver_webhooks.delay") as deliver_delay:
+            with django_assert_num_queries(1):
+                issue_updated(issue, create_user, workspace.slug)
+
+        deliver_delay.assert_not_called()
+        assert not queued_deliveries()
+        assert not redis_instance().exists(WEBHOOK_FANOUT_STATS_KEY)
+
+    @pytest.mark.django_db
+    def test_delivery_reads_the_stored_payload(self, issue, webhooks, workspace, create_user):
+        """Deliveries queued as tasks post the stored payload, and are skipped once it expired"""
+        with patch("plane.bgtasks.webhook_task.deliver_webhooks.delay"):
+            issue_updated(issue, create_user, workspace.slug)
+        queued = queued_deliveries()[0]
+        delivery = {
+            "webhook_id": queued["webhook_id"],
+            "slug": workspace.slug,
+            "event": queued["event"],
+            "event_data": None,
+            "action": queued["action"],
+            "current_site": queued["current_site"],
+            "activity": None,
+            "payload_key": queued["payload_key"],
+        }
+
+        with patch("plane.bgtasks.webhook_task.requests.post") as post:
+            post.return_value.status_code = 200
+            webhook_send_task(**delivery)
+
+        payload = post.call_args.kwargs["json"]
+        assert payload["data"]["id"] == str(issue.id)
+        assert payload["activity"]["actor"]["id"] == str(create_user.id)
+        assert payload["activity"]["new_value"] == "high"
+
+        redis_instance().delete(delivery["payload_key"])
+        with patch("plane.bgtasks.webhook_task.requests.post") as post:
+            webhook_send_task(**delivery)
+        post.assert_not_called()
+
+    @pytest.mark.django_db
+    def test_created_issues_are_sent_once_per_batch(self, issue, webhooks, workspace, create_user):
+        """The webhooks, the actor and the issues of a batch are read once, each issue gets its payload"""
+        queries = []
+        for count in [1, 5]:
+            issues = [Issue.objects.create(name=f"Bulk {index}", project=issue.project) for index in range(count)]
+            redis_instance().delete(WEBHOOK_DELIVERY_QUEUE_KEY)
+            with patch("plane.bgtasks.webhook_task.deliver_webhooks.delay") as deliver_delay:
+                with CaptureQueriesContext(connection) as context:
+                    bulk_model_activity(
+                        "issue", [str(issue.id) for issue in issues], str(create_user.id), workspace.slug
+                    )
+            queries.append(len(context))
+            deliver_delay.assert_called_once()
+
+        assert queries[0] == queries[1]
+        deliveries = queued_deliveries()
+        assert len(deliveries) == 5 * len(webhooks)
+        assert {delivery["action"] for delivery in deliveries} == {"created"}
+        payload_keys = {delivery["payload_key"] for delivery in deliveries}
+        assert {json.loads(redis_instance().get(payload_key))["event_data"]["id"] for payload_key in payload_keys} == {
+            str(issue.id) for issue in issues
+        }
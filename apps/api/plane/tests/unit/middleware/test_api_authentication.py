@@ -0,0 +1,96 @@
+from datetime import timedelta
+from unittest.mock import patch
+
+import pytest
+from django.test import RequestFactory
+from django.utils import timezone
+from rest_framework.exceptions import AuthenticationFailed
+
+from plane.api.middleware.api_authentication import APIKeyAuthentication
+from plane.bgtasks.api_token_task import flush_api_token_last_used
+from plane.settings.redis import redis_instance
+from plane.utils.api_token_cache import API_TOKEN_LAST_USED_KEY, api_token_cache_key
+
+
+def authenticate(token):
+    request = RequestFactory().get("/", HTTP_X_API_KEY=token)
+    return APIKeyAuthentication().authenticate(request)
+
+
+@pytest.fixture(autouse=True)
+def clean_redis(api_token):
+    """Start and end every test without cached tokens and recorded uses"""
+    ri = redis_instance()
+    keys = [api_token_cache_key(api_token.token), API_TOKEN_LAST_USED_KEY, "api_token:last_used:flushing"]
+    ri.delete(*keys)
+    yield
+    ri.delete(*keys)
+
+
+@pytest.mark.unit
+class TestAPIKeyAuthentication:
+    """Test the cached API token validation and the write-behind last use"""
+
+    @pytest.mark.django_db
+    def test_validation_is_cached(self, api_token, create_user, django_assert_num_queries):
+        """Cached tokens only load their user and do not write to the database"""
+        assert authenticate(api_token.token) == (create_user, api_token.token)
+
+        with django_assert_num_queries(1):
+            assert authenticate(api_token.token) == (create_user, api_token.token)
+
+    @pytest.mark.django_db
+    def test_invalid_token(self, api_token):
+        """Unknown tokens fail, cached or not"""
+        with pytest.raises(AuthenticationFailed):
+            authenticate("unknown-token")
+        with pytest.raises(AuthenticationFailed):
+            authenticate("unknown-token")
+        redis_instance().delete(api_token_cache_key("unknown-token"))
+
+    @pytest.mark.django_db
+    def test_revoked_token_is_invalidated(self, api_token):
+        """Deactivated and deleted tokens are dropped from the cache"""
+        authenticate(api_token.token)
+
+        api_token.is_active = False
+        api_token.save()
+        with pytest.raises(AuthenticationFailed):
+            authenticate(api_token.token)
+
+        api_token.is_active = True
+        api_token.save()
+        authenticate(api_token.token)
+
+        api_token.delete()
+        with pytest.raises(AuthenticationFailed):
+            authenticate(api_token.token)
+
+    @pytest.mark.django_db
+    def test_cached_token_expires(self, api_token):
+        """Tokens expire while they are cached"""
+        api_token.expired_at = timezone.now() + timedelta(minutes=1)
+        api_token.save()
+        authenticate(api_token.token)
+
+        with patch("plane.utils.api_token_cache.timezone.now", return_value=api_token.expired_at):
+            with pytest.raises(AuthenticationFailed):
+                authenticate(api_token.token)
+
+    @pytest.mark.django_db
+    def test_last_used_is_flushed(self, api_token, django_assert_num_queries):
+        """Uses are coalesced in redis and written in one update"""
+        for _ in range(3):
+            authenticate(api_token.token)
+        api_token.refresh_from_db()
+        assert api_token.last_used is None
+        assert redis_instance().hlen(API_TOKEN_LAST_USED_KEY) == 1
+
+        with django_assert_num_queries(1):
+            assert flush_api_token_last_used() == 1
+
+        api_token.refresh_from_db()
+        assert api_token.last_used is not None
+        assert not redis_instance().exists(API_TOKEN_LAST_USED_KEY)
+        # Nothing to write until the token is used again
+        assert flush_api_token_last_used() == 0
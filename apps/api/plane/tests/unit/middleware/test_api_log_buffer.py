@@ -0,0 +1,114 @@
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+from django.http import HttpResponse
+from django.test import RequestFactory
+from django.utils import timezone
+
+from plane.db.models import APIActivityLog
+from plane.middleware.logger import APITokenLogMiddleware
+from plane.utils.api_log_buffer import APIActivityLogBuffer
+
+
+def log_record(index):
+    return {
+        "log_data": {
+            "token_identifier": "plane_api_token",
+            "path": f"/api/v1/items/{index}/",
+            "method": "GET",
+            "response_code": 200,
+        },
+        "created_at": timezone.now(),
+        "user_id": None,
+    }
+
+
+@pytest.mark.unit
+class TestAPIActivityLogBuffer:
+    """Test the bulk writes and the backpressure of the API activity log buffer"""
+
+    @pytest.mark.django_db
+    def test_flush_writes_in_bulk(self, django_assert_num_queries):
+        buffer = APIActivityLogBuffer(capacity=100, flush_size=4, flush_interval=3600)
+        # Without flusher thread, which writes from its own connection
+        with patch.object(buffer, "_start"):
+            for index in range(10):
+                buffer.add(log_record(index))
+
+        with django_assert_num_queries(3):
+            assert buffer.flush() == 10
+
+        assert APIActivityLog.objects.count() == 10
+        assert len(buffer) == 0
+
+    def test_full_batch_is_written_by_the_flusher(self):
+        written = threading.Event()
+        batches = []
+
+        def save(batch):
+            batches.append(batch)
+            written.set()
+            return True
+
+        buffer = APIActivityLogBuffer(capacity=100, flush_size=3, flush_interval=3600)
+        with patch("plane.utils.api_log_buffer.save_api_activity_logs", side_effect=save):
+            for index in range(3):
+                buffer.add(log_record(index))
+            assert written.wait(5)
+
+        assert [len(batch) for batch in batches] == [3]
+
+    def test_slow_sink_drops_the_oldest_logs(self):
+        """Requests do not wait for a slow sink, the buffer keeps the latest logs up to its capacity"""
+        release = threading.Event()
+        batches = []
+
+        def slow_save(batch):
+            release.wait(5)
+            batches.append(batch)
+            return True
+
+        buffer = APIActivityLogBuffer(capacity=5, flush_size=2, flush_interval=3600)
+        with patch("plane.utils.api_log_buffer.save_api_activity_logs", side_effect=slow_save):
+            start = time.perf_counter()
+            for index in range(20):
+                buffer.add(log_record(index))
+            assert time.perf_counter() - start < 1
+            assert len(buffer) == 5
+
+            release.set()
+            buffer.flush()
+
+        paths = [record["log_data"]["path"] for batch in batches for record in batch]
+        assert paths[-5:] == [f"/api/v1/items/{index}/" for index in range(15, 20)]
+        assert buffer.dropped == 0
+
+
+@pytest.mark.unit
+class TestAPITokenLogBodies:
+    """Test the logging policy of the request and response bodies"""
+
+    @pytest.fixture
+    def middleware(self):
+        return APITokenLogMiddleware(lambda request: HttpResponse())
+
+    def test_large_bodies_are_truncated(self, middleware, settings):
+        settings.API_LOG_BODY_MAX_BYTES = 10
+        assert middleware._safe_decode_body(b"short") == "short"
+        assert middleware._safe_decode_body(b"x" * 9 + "é".encode()) == "xxxxxxxxx... [truncated, 11 bytes]"
+        assert middleware._safe_decode_body(b"\xff" * 20) == "[Could not decode content]"
+
+    def test_large_bodies_are_sampled(self, middleware, settings):
+        settings.API_LOG_BODY_MAX_BYTES = 10
+        settings.API_LOG_LARGE_BODY_SAMPLE_RATE = 0
+        assert middleware._safe_decode_body(b"x" * 20) == "[Body of 20 bytes not sampled]"
+        assert middleware._safe_decode_body(b"x" * 10) == "x" * 10
+
+    def test_requests_without_api_key_are_not_read(self, middleware):
+        request = RequestFactory().post("/api/v1/items/", data=b"{}", content_type="application/json")
+        with patch("plane.middleware.logger.get_api_log_buffer") as get_buffer:
+            middleware(request)
+        assert not hasattr(request, "_body")
+        get_buffer.assert_not_called()
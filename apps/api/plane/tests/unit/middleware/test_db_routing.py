@@ -417,3 +417,110 @@ class TestEdgeCases:
 
         assert result1 is None  # Both should return None safely
         assert result2 is None
+
+
+@pytest.fixture
+def replica_view():
+    """A DRF view opted in to the read replica"""
+
+    class ReplicaAPIView(APIView):
+        use_read_replica = True
+
+    return ReplicaAPIView.as_view()
+
+
+@pytest.fixture
+def clean_routing_state():
+    """Start and end without pinned clients, counted decisions and measured lag"""
+    from plane.settings.redis import redis_instance
+    from plane.utils.core import replica_routing
+
+    def clean():
+        ri = redis_instance()
+        ri.delete(replica_routing.REPLICA_ROUTING_STATS_KEY, *ri.keys("db_routing:primary:*"))
+        replica_routing._replica_lag.update(lag=None, checked_at=None)
+
+    clean()
+    yield
+    clean()
+
+
+@pytest.mark.unit
+@pytest.mark.usefixtures("clean_routing_state")
+class TestLagAwareRouting:
+    """Test the read-your-writes stickiness, the lag fallback and the decision counts."""
+
+    def route(self, middleware, request, view_func):
+        with patch("plane.middleware.db_routing.set_use_read_replica") as mock_set:
+            middleware.process_view(request, view_func, (), {})
+        return mock_set.call_args.args[0]
+
+    def test_client_is_pinned_to_primary_after_write(self, middleware, request_factory, replica_view, settings):
+        """Reads of a client that just wrote go to the primary, other clients still read the replica."""
+        settings.READ_REPLICA_STICKY_SECONDS = 10
+        request_factory.cookies[settings.SESSION_COOKIE_NAME] = "writer"
+
+        assert self.route(middleware, request_factory.get("/api/test/"), replica_view) is True
+        middleware(request_factory.patch("/api/test/"))
+        assert self.route(middleware, request_factory.get("/api/test/"), replica_view) is False
+
+        request_factory.cookies[settings.SESSION_COOKIE_NAME] = "reader"
+        assert self.route(middleware, request_factory.get("/api/test/"), replica_view) is True
+        # API clients are identified by their key
+        api_read = request_factory.get("/api/test/", HTTP_X_API_KEY="key")
+        assert self.route(middleware, api_read, replica_view) is True
+        middleware(request_factory.post("/api/test/", HTTP_X_API_KEY="key"))
+        assert self.route(middleware, api_read, replica_view) is False
+
+    def test_stickiness_disabled(self, middleware, request_factory, replica_view, settings):
+        """Writes do not pin their client when READ_REPLICA_STICKY_SECONDS is 0."""
+        settings.READ_REPLICA_STICKY_SECONDS = 0
+        request_factory.cookies[settings.SESSION_COOKIE_NAME] = "writer"
+
+        middleware(request_factory.patch("/api/test/"))
+
+        assert self.route(middleware, request_factory.get("/api/test/"), replica_view) is True
+
+    def test_lagging_replica_falls_back_to_primary(self, middleware, get_request, replica_view, settings):
+        """Reads go to the primary while the lag exceeds READ_REPLICA_MAX_LAG, measured once per interval."""
+        settings.READ_REPLICA_MAX_LAG = 5
+        settings.READ_REPLICA_LAG_CHECK_INTERVAL = 60
+
+        with patch("plane.utils.core.replica_routing.measure_replica_lag", return_value=30.0) as measure:
+            assert self.route(middleware, get_request, replica_view) is False
+            assert self.route(middleware, get_request, replica_view) is False
+        assert measure.call_count == 1
+
+        settings.READ_REPLICA_LAG_CHECK_INTERVAL = 0
+        with patch("plane.utils.core.replica_routing.measure_replica_lag", return_value=0.5):
+            assert self.route(middleware, get_request, replica_view) is True
+
+    @pytest.mark.django_db
+    def test_lag_is_measured_on_the_replica(self, settings):
+        """The lag query runs on a server that is not replicating and reports no lag."""
+        from django.db import connections
+
+        from plane.utils.core import get_replica_lag
+
+        with patch.dict(connections.settings, {"replica": connections.settings["default"]}):
+            settings.READ_REPLICA_LAG_CHECK_INTERVAL = 0
+            assert get_replica_lag() == 0
+            connections["replica"].close()
+            del connections["replica"]
+
+    def test_decisions_are_counted_per_view(self, middleware, request_factory, replica_view, settings):
+        """Each request counts its decision under the view that served it."""
+        from plane.utils.core import get_routing_stats
+
+        settings.READ_REPLICA_MAX_LAG = 5
+        view_name = f"{__name__}.replica_view.<locals>.ReplicaAPIView"
+
+        settings.READ_REPLICA_LAG_CHECK_INTERVAL = 0
+
+        with patch("plane.utils.core.replica_routing.measure_replica_lag", return_value=0.5):
+            self.route(middleware, request_factory.get("/api/test/"), replica_view)
+        middleware.process_view(request_factory.post("/api/test/"), replica_view, (), {})
+        with patch("plane.utils.core.replica_routing.measure_replica_lag", return_value=30.0):
+            self.route(middleware, request_factory.get("/api/test/"), replica_view)
+
+        assert get_routing_stats()[view_name] == {"replica": 1, "primary_write": 1, "primary_lag": 1}
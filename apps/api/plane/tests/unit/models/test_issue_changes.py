@@ -0,0 +1,151 @@
+import threading
+from unittest.mock import patch
+
+import pytest
+from django.db import connection, transaction
+from django.utils import timezone
+
+from plane.bgtasks.cleanup_task import delete_issue_changes
+from plane.bgtasks.deletion_task import soft_delete_related_objects
+from plane.db.models import (
+    Issue,
+    IssueChange,
+    IssueLabel,
+    IssueLink,
+    Label,
+    Project,
+    ProjectMember,
+    State,
+    record_issue_changes,
+)
+from plane.utils.issue_changes import (
+    IssueChangeCursorExpired,
+    get_issue_changes_horizon,
+    read_issue_changes,
+)
+
+
+@pytest.fixture
+def project(workspace, create_user):
+    project = Project.objects.create(name="Changes", identifier="CHG", workspace=workspace, created_by=create_user)
+    ProjectMember.objects.create(project=project, workspace=workspace, member=create_user, role=20)
+    State.objects.create(name="Todo", group="unstarted", project=project, workspace=workspace, default=True)
+    return project
+
+
+@pytest.fixture(autouse=True)
+def horizon_key(isolated_change_feed):
+    return isolated_change_feed
+
+
+def read_all(changes, cursor, limit=1000):
+    issue_ids, cursor, _ = read_issue_changes(changes, cursor, limit=limit)
+    return issue_ids, cursor
+
+
+@pytest.mark.unit
+class TestIssueChanges:
+    """Test the changes of the issues logged with them and read after a cursor"""
+
+    # The changes are read once their transaction has ended, the tests commit them
+    @pytest.mark.django_db(transaction=True)
+    def test_changes_are_logged_with_the_issues_and_their_rows(self, project):
+        changes = IssueChange.objects.filter(project=project)
+        _, cursor = read_all(changes, None)
+        assert cursor == "0:0"
+
+        issue = Issue.objects.create(name="First", project=project)
+        other = Issue.objects.create(name="Second", project=project)
+        issue_ids, cursor = read_all(changes, cursor)
+        assert issue_ids == [str(issue.id), str(other.id)]
+
+        # The issue of a link changes with its link count, and the parent with its sub issue count
+        IssueLink.objects.create(issue=issue, project=project, url="https://plane.so")
+        Issue.objects.filter(pk=other.pk).update(parent=issue)
+        record_issue_changes([other.id])
+        issue_ids, cursor = read_all(changes, cursor)
+        assert issue_ids == [str(issue.id), str(other.id)]
+
+        # The issues of the labels deleted along with their label
+        label = Label.objects.create(name="Bug", project=project, workspace=project.workspace)
+        IssueLabel.objects.create(issue=other, label=label, project=project)
+        assert read_all(changes, cursor)[0] == []
+        with patch("plane.db.mixins.soft_delete_related_objects.delay"):
+            label.delete()
+        soft_delete_related_objects("db", "label", label.id)
+        issue_ids, cursor = read_all(changes, cursor)
+        assert issue_ids == [str(other.id)]
+
+        with patch("plane.db.mixins.soft_delete_related_objects.delay"):
+            other.delete()
+        issue_ids, cursor = read_all(changes, cursor)
+        assert str(other.id) in issue_ids
+        assert read_all(changes, cursor) == ([], cursor)
+
+    @pytest.mark.django_db(transaction=True)
+    def test_read_pages_through_the_changes(self, project):
+        changes = IssueChange.objects.filter(project=project)
+        issues = [Issue.objects.create(name=f"Issue {index}", project=project) for index in range(5)]
+        # An issue changed again is read where it last changed
+        issues[0].name = "Renamed"
+        issues[0].save()
+
+        issue_ids, cursor, has_more = read_issue_changes(changes, "0:0", limit=4)
+        assert issue_ids == [str(issue.id) for issue in issues[:4]] and has_more
+        issue_ids, cursor, has_more = read_issue_changes(changes, cursor, limit=4)
+        assert issue_ids == [str(issues[4].id), str(issues[0].id)] and not has_more
+
+        with pytest.raises(ValueError):
+            read_issue_changes(changes, "latest")
+
+    @pytest.mark.django_db(transaction=True)
+    def test_read_waits_for_the_running_transactions(self, project):
+        changes = IssueChange.objects.filter(project=project)
+        issues = [Issue.objects.create(name=name, project=project) for name in ["Slow", "Fast"]]
+        _, cursor = read_all(changes, None)
+
+        logged = threading.Event()
+        release = threading.Event()
+
+        def slow_change():
+            try:
+                with transaction.atomic():
+                    record_issue_changes([issues[0].id])
+                    logged.set()
+                    release.wait(5)
+            finally:
+                connection.close()
+
+        thread = threading.Thread(target=slow_change)
+        thread.start()
+        try:
+            assert logged.wait(5)
+            # Committed after the slow change was logged, and read after it
+            record_issue_changes([issues[1].id])
+            assert read_all(changes, cursor) == ([], cursor)
+        finally:
+            release.set()
+            thread.join()
+
+        issue_ids, _ = read_all(changes, cursor)
+        assert issue_ids == [str(issue.id) for issue in issues]
+
+    @pytest.mark.django_db(transaction=True)
+    def test_purge_turns_down_the_cursors_before_the_horizon(self, project, settings):
+        settings.ISSUE_CHANGES_RETENTION_DAYS = 30
+        changes = IssueChange.objects.filter(project=project)
+        old = Issue.objects.create(name="Old", project=project)
+        _, stale_cursor = read_all(changes, None)
+        recent = Issue.objects.create(name="Recent", project=project)
+        changes.filter(issue_id=old.id).update(created_at=timezone.now() - timezone.timedelta(days=31))
+
+        assert delete_issue_changes() == 1
+
+        assert list(changes.values_list("issue_id", flat=True)) == [recent.id]
+        # The client that read up to the purged changes downloads the issues again
+        for cursor in [stale_cursor, "0:0"]:
+            with pytest.raises(IssueChangeCursorExpired):
+                read_issue_changes(changes, cursor)
+        # The cursors from the horizon on read what is kept
+        assert read_all(changes, f"{get_issue_changes_horizon()}:0")[0] == [str(recent.id)]
+        assert delete_issue_changes() == 0
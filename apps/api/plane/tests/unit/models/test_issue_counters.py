@@ -0,0 +1,157 @@
+import importlib
+from unittest.mock import patch
+
+import pytest
+from django.core.management import call_command
+from django.db import connection
+from django.utils import timezone
+
+from plane.bgtasks.deletion_task import restore_related_objects, soft_delete_related_objects
+from plane.db.models import (
+    Cycle,
+    CycleIssue,
+    FileAsset,
+    Issue,
+    IssueCounter,
+    IssueLink,
+    Project,
+    ProjectMember,
+    State,
+    compute_issue_counters,
+)
+from plane.utils.issue_counters import issue_counter_annotations
+
+
+@pytest.fixture
+def project(workspace, create_user):
+    project = Project.objects.create(name="Counters", identifier="CNT", workspace=workspace, created_by=create_user)
+    ProjectMember.objects.create(project=project, workspace=workspace, member=create_user, role=20)
+    State.objects.create(name="Todo", group="unstarted", project=project, workspace=workspace, default=True)
+    return project
+
+
+def get_counters(issue):
+    return IssueCounter.objects.filter(issue=issue).values("link_count", "attachment_count", "sub_issues_count").get()
+
+
+def add_attachment(issue):
+    return FileAsset.objects.create(
+        asset="attachment.pdf",
+        issue=issue,
+        project=issue.project,
+        workspace=issue.workspace,
+        entity_type=FileAsset.EntityTypeContext.ISSUE_ATTACHMENT,
+    )
+
+
+@pytest.mark.unit
+class TestIssueCounters:
+    """Test the counters of the issues refreshed along with the rows they count"""
+
+    @pytest.mark.django_db
+    def test_counters_follow_the_links_attachments_and_sub_issues(self, project):
+        issue = Issue.objects.create(name="Parent", project=project)
+        link = IssueLink.objects.create(issue=issue, project=project, url="https://plane.so")
+        IssueLink.objects.create(issue=issue, project=project, url="https://docs.plane.so")
+        add_attachment(issue)
+        # The other assets of the issue are not attachments
+        FileAsset.objects.create(
+            asset="image.png",
+            issue=issue,
+            project=project,
+            workspace=project.workspace,
+            entity_type=FileAsset.EntityTypeContext.ISSUE_DESCRIPTION,
+        )
+        children = [Issue.objects.create(name=f"Child {index}", project=project, parent=issue) for index in range(3)]
+
+        assert get_counters(issue) == {"link_count": 2, "attachment_count": 1, "sub_issues_count": 3}
+
+        with patch("plane.db.mixins.soft_delete_related_objects.delay"):
+            link.delete()
+            children[0].delete()
+        children[1].archived_at = timezone.now().date()
+        children[1].save()
+        assert get_counters(issue) == {"link_count": 1, "attachment_count": 1, "sub_issues_count": 1}
+
+        other = Issue.objects.create(name="Other parent", project=project)
+        children[2].parent = other
+        children[2].save()
+        assert get_counters(issue)["sub_issues_count"] == 0
+        assert get_counters(other)["sub_issues_count"] == 1
+
+    @pytest.mark.django_db
+    def test_counters_follow_the_cycle(self, project, create_user):
+        issue = Issue.objects.create(name="Planned", project=project)
+        cycles = [
+            Cycle.objects.create(name=name, project=project, workspace=project.workspace, owned_by=create_user)
+            for name in ["First", "Second"]
+        ]
+        cycle_issue = CycleIssue.objects.create(issue=issue, cycle=cycles[0], project=project)
+        assert IssueCounter.objects.get(issue=issue).cycle_id == cycles[0].id
+
+        cycle_issue.cycle = cycles[1]
+        cycle_issue.save()
+        assert IssueCounter.objects.get(issue=issue).cycle_id == cycles[1].id
+
+        # The cycle issues of a deleted cycle are deleted along, and restored with it
+        with patch("plane.db.mixins.soft_delete_related_objects.delay"):
+            cycles[1].delete()
+        soft_delete_related_objects("db", "cycle", cycles[1].id)
+        assert IssueCounter.objects.get(issue=issue).cycle_id is None
+
+        restore_related_objects("db", "cycle", cycles[1].id)
+        assert IssueCounter.objects.get(issue=issue).cycle_id == cycles[1].id
+
+    @pytest.mark.django_db
+    def test_lists_read_the_counters_as_columns(self, project):
+        issue = Issue.objects.create(name="Parent", project=project)
+        IssueLink.objects.create(issue=issue, project=project, url="https://plane.so")
+        Issue.objects.create(name="Child", project=project, parent=issue)
+
+        issues = Issue.issue_objects.filter(project=project).annotate(**issue_counter_annotations())
+        rows = {row["name"]: row for row in issues.values("name", "link_count", "attachment_count", "sub_issues_count")}
+
+        assert rows["Parent"] == {"name": "Parent", "link_count": 1, "attachment_count": 0, "sub_issues_count": 1}
+        # The issues without counters have nothing to count
+        assert rows["Child"] == {"name": "Child", "link_count": 0, "attachment_count": 0, "sub_issues_count": 0}
+        sql = str(issues.query)
+        assert "issue_links" not in sql and "file_assets" not in sql and sql.count("SELECT") == 1
+
+    @pytest.mark.django_db
+    def test_check_command_recounts_the_counters_that_differ(self, project, capsys):
+        issue = Issue.objects.create(name="Parent", project=project)
+        IssueLink.objects.create(issue=issue, project=project, url="https://plane.so")
+        Issue.objects.create(name="Child", project=project, parent=issue)
+
+        call_command("check_issue_counters")
+        assert "match" in capsys.readouterr().out
+
+        IssueCounter.objects.filter(issue=issue).update(link_count=5)
+        call_command("check_issue_counters", str(project.id))
+        assert str(issue.id) in capsys.readouterr().out
+
+        call_command("check_issue_counters", "--fix")
+        assert get_counters(issue) == {"link_count": 1, "attachment_count": 0, "sub_issues_count": 1}
+        call_command("check_issue_counters")
+        assert "match" in capsys.readouterr().out
+
+    @pytest.mark.django_db
+    def test_migration_backfills_the_counters(self, project, create_user):
+        issue = Issue.objects.create(name="Parent", project=project)
+        IssueLink.objects.create(issue=issue, project=project, url="https://plane.so")
+        add_attachment(issue)
+        Issue.objects.create(name="Child", project=project, parent=issue)
+        triage = State.objects.create(name="Triage", group="triage", project=project, workspace=project.workspace)
+        Issue.objects.create(name="Triaged child", project=project, parent=issue, state=triage)
+        cycle = Cycle.objects.create(name="Cycle", project=project, workspace=project.workspace, owned_by=create_user)
+        CycleIssue.objects.create(issue=issue, cycle=cycle, project=project)
+        expected = compute_issue_counters([issue.id])[str(issue.id)]
+        IssueCounter.objects.all().delete()
+
+        migration = importlib.import_module("plane.db.migrations.0126_issue_counter")
+        with connection.cursor() as cursor:
+            cursor.execute(migration.Migration.operations[-1].sql)
+
+        counter = IssueCounter.objects.get(issue=issue)
+        assert expected == {"link_count": 1, "attachment_count": 1, "sub_issues_count": 1, "cycle_id": cycle.id}
+        assert {field: getattr(counter, field) for field in expected} == expected
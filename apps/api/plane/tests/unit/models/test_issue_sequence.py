@@ -0,0 +1,162 @@
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+
+from plane.db.models import (
+    Issue,
+    IssueActivity,
+    IssueAssignee,
+    IssueLabel,
+    IssueSequence,
+    IssueSequenceCounter,
+    Label,
+    Project,
+    ProjectMember,
+    State,
+    reserve_issue_sequences,
+)
+from plane.utils.issue_bulk_create import bulk_create_issues, validate_bulk_issues
+
+
+@pytest.fixture
+def project(workspace, create_user):
+    project = Project.objects.create(name="Sequence", identifier="SEQ", workspace=workspace, created_by=create_user)
+    ProjectMember.objects.create(project=project, workspace=workspace, member=create_user, role=20)
+    return project
+
+
+@pytest.fixture
+def states(project):
+    return {
+        group: State.objects.create(
+            name=group.title(), group=group, project=project, workspace=project.workspace, default=group == "backlog"
+        )
+        for group in ["backlog", "completed"]
+    }
+
+
+@pytest.mark.unit
+class TestIssueSequenceCounter:
+    """Test the sequence ids reserved from the counter of the project"""
+
+    @pytest.mark.django_db
+    def test_counter_starts_from_the_given_sequences(self, project, states):
+        Issue.objects.create(name="First", project=project)
+        IssueSequence.objects.create(sequence=7, project=project)
+        IssueSequenceCounter.objects.filter(project=project).delete()
+
+        assert reserve_issue_sequences(project.id, 3) == 8
+        assert reserve_issue_sequences(project.id) == 11
+        assert IssueSequenceCounter.objects.get(project=project).last_sequence == 11
+
+    @pytest.mark.django_db
+    def test_save_takes_the_next_sequence_without_a_lock(self, project, states):
+        first = Issue.objects.create(name="First", project=project)
+        with CaptureQueriesContext(connection) as context:
+            second = Issue.objects.create(name="Second", project=project)
+
+        assert (first.sequence_id, second.sequence_id) == (1, 2)
+        assert second.sort_order == first.sort_order + 10000
+        assert IssueSequence.objects.filter(issue=second, sequence=2).exists()
+        statements = " ".join(query["sql"] for query in context.captured_queries)
+        assert "pg_advisory_xact_lock" not in statements
+        assert 'MAX("issue_sequences"' not in statements
+
+    @pytest.mark.django_db(transaction=True)
+    def test_concurrent_creates_get_distinct_sort_orders(self, project, states):
+        created = {}
+
+        def create_second():
+            try:
+                created["second"] = Issue.objects.create(name="Second", project=project)
+            finally:
+                connection.close()
+
+        with transaction.atomic():
+            first = Issue.objects.create(name="First", project=project)
+            thread = threading.Thread(target=create_second)
+            thread.start()
+            # The second create waits for the counter row locked by the first one
+            time.sleep(0.5)
+        thread.join()
+
+        assert created["second"].sequence_id == first.sequence_id + 1
+        assert created["second"].sort_order == first.sort_order + 10000
+
+
+@pytest.mark.unit
+class TestBulkCreateIssues:
+    """Test the creation of many issues at once"""
+
+    @pytest.mark.django_db
+    def test_bulk_create(self, project, states, create_user, django_capture_on_commit_callbacks):
+        existing = Issue.objects.create(name="Existing", project=project, state=states["backlog"])
+        label = Label.objects.create(name="Bug", project=project, workspace=project.workspace)
+        rows = [
+            {"name": "One", "label_ids": [label.id], "assignee_ids": [create_user.id]},
+            {"name": "Two", "state_id": states["completed"].id, "description_html": "<p>Done</p>"},
+            {"name": "Three"},
+        ]
+
+        with (
+            patch("plane.bgtasks.webhook_task.bulk_model_activity.delay") as bulk_model_activity,
+            django_capture_on_commit_callbacks(execute=True),
+        ):
+            issues = bulk_create_issues(project, rows, actor_id=create_user.id, origin="https://plane.so")
+
+        # The created events of the batch are sent by one task
+        bulk_model_activity.assert_called_once_with(
+            model_name="issue",
+            model_ids=[str(issue.id) for issue in issues],
+            actor_id=str(create_user.id),
+            slug=project.workspace.slug,
+            origin="https://plane.so",
+        )
+        assert [issue.sequence_id for issue in issues] == [2, 3, 4]
+        assert [issue.state_id for issue in issues] == [
+            states["backlog"].id,
+            states["completed"].id,
+            states["backlog"].id,
+        ]
+        # The issues follow the last one of their state
+        assert issues[0].sort_order == existing.sort_order + 10000
+        assert issues[2].sort_order == existing.sort_order + 20000
+        assert issues[1].completed_at is not None
+        assert issues[1].description_stripped == "Done"
+        assert issues[0].created_by_id == create_user.id
+        assert set(IssueSequence.objects.filter(project=project).values_list("sequence", flat=True)) == {1, 2, 3, 4}
+        assert IssueLabel.objects.filter(issue=issues[0], label=label).exists()
+        assert IssueAssignee.objects.filter(issue=issues[0], assignee=create_user).exists()
+        assert IssueActivity.objects.filter(issue__in=issues, verb="created").count() == 3
+        # The next single create goes on after the reserved range
+        assert Issue.objects.create(name="Next", project=project).sequence_id == 5
+
+    @pytest.mark.django_db
+    def test_bulk_create_queries_do_not_grow_with_the_issues(self, project, states, create_user):
+        # The counter of the project exists from the first reservation on
+        reserve_issue_sequences(project.id)
+        queries = []
+        for count in [2, 20]:
+            with CaptureQueriesContext(connection) as context:
+                bulk_create_issues(project, [{"name": f"Issue {index}"} for index in range(count)], create_user.id)
+            queries.append(len(context.captured_queries))
+        assert queries[0] == queries[1]
+
+    @pytest.mark.django_db
+    def test_validate_bulk_issues(self, project, states, create_user, workspace):
+        other = Project.objects.create(name="Other", identifier="OTH", workspace=workspace)
+        other_state = State.objects.create(name="Todo", group="unstarted", project=other, workspace=workspace)
+        other_label = Label.objects.create(name="Other", project=other, workspace=workspace)
+        rows = [
+            {"name": "Valid", "state_id": states["backlog"].id, "label_ids": [other_label.id]},
+            {"name": "Invalid", "state_id": other_state.id},
+        ]
+
+        errors = validate_bulk_issues(project.id, rows)
+
+        assert list(errors) == [1]
+        assert rows[0]["label_ids"] == []
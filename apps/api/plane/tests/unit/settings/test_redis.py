@@ -0,0 +1,83 @@
+from unittest.mock import patch
+
+import pytest
+import redis
+from django.test import override_settings
+
+from plane.settings.redis import (
+    acquire_lock,
+    redis_instance,
+    redis_pipeline,
+    release_lock,
+    renew_lock,
+    reset_redis_instance,
+)
+
+
+@pytest.fixture(autouse=True)
+def fresh_client():
+    """Start and end every test without a pooled client"""
+    reset_redis_instance()
+    yield
+    reset_redis_instance()
+
+
+@pytest.mark.unit
+class TestRedisInstance:
+    """Test the process wide pooled redis client"""
+
+    def test_client_is_shared(self):
+        """Every call returns the same client and connection pool"""
+        client = redis_instance()
+        assert redis_instance() is client
+        assert isinstance(client.connection_pool, redis.BlockingConnectionPool)
+
+    @override_settings(REDIS_MAX_CONNECTIONS=7, REDIS_HEALTH_CHECK_INTERVAL=15)
+    def test_pool_settings(self):
+        """The pool is sized and health checked from the settings"""
+        pool = redis_instance().connection_pool
+        assert pool.max_connections == 7
+        assert pool.connection_kwargs["health_check_interval"] == 15
+
+    def test_client_is_recreated_after_fork(self):
+        """A forked process gets its own client"""
+        client = redis_instance()
+        with patch("plane.settings.redis.os.getpid", return_value=-1):
+            assert redis_instance() is not client
+
+    def test_reset(self):
+        """Resetting drops the pooled client"""
+        client = redis_instance()
+        reset_redis_instance()
+        assert redis_instance() is not client
+
+    def test_pipeline(self):
+        """Commands of the block are sent together on exit"""
+        with redis_pipeline() as pipeline:
+            pipeline.set("redis-pipeline-test", "value", ex=10)
+            pipeline.expire("redis-pipeline-test", 20)
+            # Nothing is sent before the block ends
+            assert redis_instance().get("redis-pipeline-test") is None
+
+        client = redis_instance()
+        assert client.get("redis-pipeline-test") == b"value"
+        assert 10 < client.ttl("redis-pipeline-test") <= 20
+        client.delete("redis-pipeline-test")
+
+    def test_lock(self):
+        """A lock is renewed and released by the token holding it only"""
+        client = redis_instance()
+        client.delete("redis-lock-test")
+        token = acquire_lock("redis-lock-test", 10)
+        assert token is not None
+        assert acquire_lock("redis-lock-test", 10) is None
+
+        assert renew_lock("redis-lock-test", token, 20)
+        assert 10 < client.ttl("redis-lock-test") <= 20
+        assert not renew_lock("redis-lock-test", "other-token", 30)
+        release_lock("redis-lock-test", "other-token")
+        assert client.get("redis-lock-test") == token.encode()
+
+        release_lock("redis-lock-test", token)
+        assert client.get("redis-lock-test") is None
+        assert not renew_lock("redis-lock-test", token, 20)
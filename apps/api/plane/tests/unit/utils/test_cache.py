@@ -0,0 +1,97 @@
+import pytest
+from django.core.cache import cache
+from django.test import RequestFactory
+from rest_framework.response import Response
+
+from plane.settings.redis import redis_instance
+from plane.utils.cache import (
+    CACHE_STATS_KEY,
+    cache_response,
+    get_cache_stats,
+    invalidate_cache_directly,
+    invalidate_cache_tags,
+    workspace_cache_tag,
+)
+
+
+class CachedView:
+    """View counting how many times the cached response is computed"""
+
+    def __init__(self):
+        self.calls = 0
+
+    @cache_response(60)
+    def get(self, request, slug):
+        self.calls += 1
+        return Response({"calls": self.calls})
+
+
+def make_request(user, path="/api/workspaces/test-workspace/labels/"):
+    request = RequestFactory().get(path)
+    request.user = user
+    return request
+
+
+@pytest.fixture(autouse=True)
+def clean_cache(settings):
+    """Start every test with an empty cache and counters, responses are not cached in debug"""
+    settings.DEBUG = False
+    cache.clear()
+    redis_instance().flushdb()
+    yield
+    cache.clear()
+    redis_instance().flushdb()
+
+
+@pytest.mark.unit
+class TestTaggedCache:
+    """Test the tagged response cache"""
+
+    @pytest.mark.django_db
+    def test_hits_and_misses(self, create_user):
+        """Cached responses are served and counted"""
+        view = CachedView()
+        assert view.get(make_request(create_user), slug="test-workspace").data == {"calls": 1}
+        assert view.get(make_request(create_user), slug="test-workspace").data == {"calls": 1}
+
+        stats = get_cache_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["hit_rate"] == 0.5
+
+    @pytest.mark.django_db
+    def test_invalidate_multiple_by_path_tag(self, create_user):
+        """Every variant of the path is invalidated without scanning the keyspace"""
+        view = CachedView()
+        view.get(make_request(create_user), slug="test-workspace")
+        view.get(make_request(create_user, "/api/workspaces/test-workspace/labels/?fields=id"), slug="test-workspace")
+
+        invalidate_cache_directly(
+            path="api/workspaces/test-workspace/labels/",
+            user=False,
+            request=make_request(create_user),
+            multiple=True,
+        )
+
+        assert view.get(make_request(create_user), slug="test-workspace").data == {"calls": 3}
+        assert get_cache_stats()["evictions"] == 2
+
+    @pytest.mark.django_db
+    def test_invalidate_workspace_tag(self, create_user):
+        """Responses of a workspace are invalidated by its tag"""
+        view = CachedView()
+        view.get(make_request(create_user), slug="test-workspace")
+
+        assert invalidate_cache_tags(workspace_cache_tag("other-workspace")) == 0
+        assert view.get(make_request(create_user), slug="test-workspace").data == {"calls": 1}
+
+        assert invalidate_cache_tags(workspace_cache_tag("test-workspace")) == 1
+        assert view.get(make_request(create_user), slug="test-workspace").data == {"calls": 2}
+
+    @pytest.mark.django_db
+    def test_tags_expire_with_entries(self, create_user):
+        """Tag sets expire with the cached responses"""
+        CachedView().get(make_request(create_user), slug="test-workspace")
+        ri = redis_instance()
+        assert 0 < ri.ttl("cache_tag:workspace:test-workspace") <= 60
+        assert ri.hget(CACHE_STATS_KEY, "misses") == b"1"
@@ -0,0 +1,127 @@
+import pytest
+from django.test import RequestFactory
+from rest_framework.response import Response
+
+from plane.app.permissions import ROLE, ProjectEntityPermission, allow_permission
+from plane.db.models import Project, ProjectMember, User, Workspace, WorkspaceMember
+from plane.settings.redis import redis_instance
+from plane.utils.member_roles import MEMBER_ROLES_VERSION_KEY, get_member_roles
+
+
+class ProjectView:
+    """View guarded by the project roles, the way the app views are"""
+
+    workspace_slug = "test-workspace"
+    project_identifier = None
+
+    def __init__(self, project_id):
+        self.project_id = project_id
+
+    @allow_permission([ROLE.ADMIN, ROLE.MEMBER])
+    def post(self, request, slug, project_id):
+        return Response(status=201)
+
+
+@pytest.fixture
+def project(workspace, create_user):
+    project = Project.objects.create(name="Roles", identifier="ROLE", workspace=workspace, created_by=create_user)
+    ProjectMember.objects.create(project=project, member=create_user, workspace=workspace, role=ROLE.GUEST.value)
+    return project
+
+
+def make_request(user, method="get"):
+    request = getattr(RequestFactory(), method)("/")
+    request.user = user
+    return request
+
+
+@pytest.fixture
+def clean_roles():
+    redis_instance().delete(MEMBER_ROLES_VERSION_KEY.format(slug="test-workspace"))
+    yield
+    redis_instance().delete(MEMBER_ROLES_VERSION_KEY.format(slug="test-workspace"))
+
+
+@pytest.mark.unit
+class TestMemberRoles:
+    """Test the member roles resolved for the permission checks"""
+
+    @pytest.mark.django_db
+    def test_roles_are_loaded_once_per_request(self, project, create_user, django_assert_num_queries):
+        """Every permission check of a request shares the loaded roles"""
+        request = make_request(create_user)
+        view = ProjectView(project.id)
+
+        with django_assert_num_queries(1):
+            assert ProjectEntityPermission().has_permission(request, view)
+            assert get_member_roles(request, "test-workspace").project_role(project.id) == ROLE.GUEST.value
+            assert get_member_roles(request, "test-workspace").project_role_by_identifier("ROLE") == ROLE.GUEST.value
+        with django_assert_num_queries(1):
+            assert get_member_roles(request, "test-workspace").workspace_role == ROLE.ADMIN.value
+            assert get_member_roles(request, "test-workspace").workspace_role == ROLE.ADMIN.value
+
+    @pytest.mark.django_db
+    def test_allow_permission(self, project, create_user):
+        """Workspace admins who are part of the project are allowed regardless of their project role"""
+        view = ProjectView(project.id)
+        response = view.post(make_request(create_user, "post"), slug="test-workspace", project_id=project.id)
+        assert response.status_code == 201
+
+        WorkspaceMember.objects.filter(member=create_user).update(role=ROLE.MEMBER.value)
+        response = view.post(make_request(create_user, "post"), slug="test-workspace", project_id=project.id)
+        assert response.status_code == 403
+
+    @pytest.mark.django_db
+    def test_unknown_project(self, project, create_user):
+        """Users have no role in projects they are not part of"""
+        roles = get_member_roles(make_request(create_user), "test-workspace")
+        assert roles.project_role(None) is None
+        assert roles.project_role_by_identifier("OTHER") is None
+        assert get_member_roles(make_request(create_user), "other-workspace").workspace_role is None
+
+    @pytest.mark.django_db
+    def test_cached_roles_are_invalidated(
+        self, settings, clean_roles, project, create_user, django_assert_num_queries, django_capture_on_commit_callbacks
+    ):
+        """Cached roles are served until a membership changes"""
+        settings.MEMBER_ROLES_CACHE_TTL = 60
+        assert get_member_roles(make_request(create_user), "test-workspace").project_role(project.id) == 5
+
+        with django_assert_num_queries(0):
+            assert get_member_roles(make_request(create_user), "test-workspace").project_role(project.id) == 5
+
+        with django_capture_on_commit_callbacks(execute=True):
+            ProjectMember.objects.filter(project=project).update(role=ROLE.ADMIN.value)
+        assert get_member_roles(make_request(create_user), "test-workspace").project_role(project.id) == 20
+
+        with django_capture_on_commit_callbacks(execute=True):
+            ProjectMember.objects.get(project=project).delete()
+        assert get_member_roles(make_request(create_user), "test-workspace").project_role(project.id) is None
+
+    @pytest.mark.django_db
+    def test_cached_roles_outlive_other_changes(
+        self, settings, clean_roles, project, create_user, django_assert_num_queries, django_capture_on_commit_callbacks
+    ):
+        """Changes that leave the roles of the workspace as they are keep the cached roles"""
+        settings.MEMBER_ROLES_CACHE_TTL = 60
+        version_key = MEMBER_ROLES_VERSION_KEY.format(slug="test-workspace")
+        assert get_member_roles(make_request(create_user), "test-workspace").project_role(project.id) == 5
+
+        other_user = User.objects.create(email="other@plane.so", username="other")
+        other_workspace = Workspace.objects.create(name="Other", slug="other-workspace", owner=other_user)
+        with django_capture_on_commit_callbacks(execute=True):
+            member = ProjectMember.objects.get(project=project)
+            member.view_props = {"display_filters": {"layout": "kanban"}}
+            member.save()
+            ProjectMember.objects.filter(project=project).update(sort_order=1000)
+            WorkspaceMember.objects.create(workspace=other_workspace, member=other_user, role=20)
+        assert redis_instance().get(version_key) is None
+
+        with django_assert_num_queries(0):
+            assert get_member_roles(make_request(create_user), "test-workspace").project_role(project.id) == 5
+
+        with django_capture_on_commit_callbacks(execute=True):
+            member.role = ROLE.MEMBER.value
+            member.save()
+        assert int(redis_instance().get(version_key)) == 1
+        assert get_member_roles(make_request(create_user), "test-workspace").project_role(project.id) == 15
@@ -0,0 +1,154 @@
+import pytest
+from datetime import timedelta
+from uuid import uuid4
+
+from django.utils import timezone
+
+from plane.db.models import Issue, Project, State
+from plane.utils.paginator import (
+    BadPaginationError,
+    GroupedOffsetPaginator,
+    KeysetCursor,
+    OffsetPaginator,
+)
+
+
+@pytest.fixture
+def project(workspace, create_user):
+    """Create a project with a couple of states"""
+    project = Project.objects.create(
+        name="Keyset Project",
+        identifier="KEY",
+        workspace=workspace,
+        created_by=create_user,
+    )
+    State.objects.create(name="Todo", group="unstarted", project=project, workspace=workspace, default=True)
+    State.objects.create(name="Done", group="completed", project=project, workspace=workspace)
+    return project
+
+
+@pytest.fixture
+def issues(project):
+    """Create issues that share created_at values to exercise the tie breakers"""
+    now = timezone.now()
+    states = list(State.objects.filter(project=project).order_by("name"))
+    created = []
+    for index in range(9):
+        issue = Issue.objects.create(
+            name=f"Issue {index}",
+            project=project,
+            workspace=project.workspace,
+            state=states[index % 2],
+            priority=["high", "none", None][index % 3] or "none",
+            target_date=(now + timedelta(days=index)).date() if index % 3 else None,
+        )
+        # Make pairs of issues share the same created_at
+        Issue.objects.filter(pk=issue.pk).update(created_at=now - timedelta(minutes=index // 2))
+        created.append(issue)
+    return created
+
+
+def walk_pages(paginator, limit):
+    """Follow the next cursors and return the ids of every page"""
+    pages = []
+    cursor = KeysetCursor()
+    while True:
+        result = paginator.get_result(limit=limit, cursor=cursor)
+        pages.append([issue.id for issue in result.results])
+        if not result.next.has_results:
+            return pages, result
+        cursor = KeysetCursor.from_string(str(result.next))
+
+
+@pytest.mark.unit
+class TestKeysetCursor:
+    """Test the keyset cursor serialization"""
+
+    def test_round_trip(self):
+        """The cursor keeps full timestamp precision and uuids"""
+        value = [timezone.now().replace(microsecond=123456), str(uuid4())]
+        cursor = KeysetCursor.from_string(str(KeysetCursor(value, 0, True)))
+        assert cursor.value == [value[0].isoformat(), value[1]]
+        assert cursor.is_prev is True
+
+    def test_first_page_offset_cursor(self):
+        """The default offset cursor starts a keyset listing"""
+        cursor = KeysetCursor.from_string("100:0:0")
+        assert cursor.value is None
+        assert cursor.is_prev is False
+
+    def test_invalid_cursor(self):
+        """Offset cursors past the first page and garbage are rejected"""
+        with pytest.raises(ValueError):
+            KeysetCursor.from_string("100:2:0")
+        with pytest.raises(ValueError):
+            KeysetCursor.from_string("not-a-cursor")
+
+
+@pytest.mark.unit
+class TestKeysetPagination:
+    """Test keyset pagination against the offset pagination"""
+
+    @pytest.mark.django_db
+    @pytest.mark.parametrize("order_by", ["-created_at", "created_at", "target_date", "-target_date", "priority"])
+    def test_pages_cover_all_rows_in_order(self, project, issues, order_by):
+        """Walking the keyset pages returns every issue once in the full ordering"""
+        queryset = Issue.issue_objects.filter(project=project)
+        paginator = OffsetPaginator(queryset=queryset, order_by=order_by)
+
+        pages, last = walk_pages(paginator, limit=2)
+        walked = [issue_id for page in pages for issue_id in page]
+        expected = list(queryset.order_by(*paginator.get_keyset_ordering()).values_list("id", flat=True))
+
+        assert walked == expected
+        assert len(pages) == 5
+        assert last.hits == len(issues)
+
+    @pytest.mark.django_db
+    def test_previous_page(self, project, issues):
+        """The previous cursor returns the page before the current one"""
+        paginator = OffsetPaginator(queryset=Issue.issue_objects.filter(project=project), order_by="target_date")
+
+        first = paginator.get_result(limit=3, cursor=KeysetCursor())
+        second = paginator.get_result(limit=3, cursor=KeysetCursor.from_string(str(first.next)))
+        previous = paginator.get_result(limit=3, cursor=KeysetCursor.from_string(str(second.prev)))
+
+        assert [issue.id for issue in previous.results] == [issue.id for issue in first.results]
+        assert previous.prev.has_results is False
+        assert previous.next.has_results is True
+
+    @pytest.mark.django_db
+    def test_count_is_optional(self, project, issues):
+        """The total count is skipped when it is not requested"""
+        paginator = OffsetPaginator(
+            queryset=Issue.issue_objects.filter(project=project),
+            order_by="-created_at",
+            include_count=False,
+        )
+        result = paginator.get_result(limit=5, cursor=KeysetCursor())
+        assert result.hits is None
+        assert result.max_hits is None
+        assert len(result.results) == 5
+
+    @pytest.mark.django_db
+    def test_grouped_pages(self, project, issues):
+        """Every group moves forward with its own position"""
+        queryset = Issue.issue_objects.filter(project=project)
+        paginator = GroupedOffsetPaginator(
+            queryset=queryset,
+            order_by="-created_at",
+            group_by_field_name="state_id",
+            group_by_fields=list(State.objects.filter(project=project).values_list("id", flat=True)),
+            count_filter=None,
+        )
+
+        pages, _ = walk_pages(paginator, limit=2)
+        walked = [issue_id for page in pages for issue_id in page]
+
+        assert sorted(walked) == sorted(issue.id for issue in issues)
+        assert len(walked) == len(set(walked))
+        # The biggest group has five issues
+        assert len(pages) == 3
+
+        with pytest.raises(BadPaginationError):
+            paginator.get_result(limit=2, cursor=KeysetCursor(None, 0, True))
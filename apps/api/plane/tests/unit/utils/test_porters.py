@@ -0,0 +1,117 @@
+import io
+import zipfile
+from unittest.mock import patch
+
+import pytest
+from openpyxl import load_workbook
+
+from plane.bgtasks.export_task import issue_export_task
+from plane.db.models import ExporterHistory, Issue, IssueLabel, Label, Project, ProjectMember, State
+from plane.utils.porters import CSVFormatter, DataExporter, IssueExportSerializer, JSONFormatter, XLSXFormatter
+
+ROWS = [
+    {"name": "First", "labels": ["a", "b"], "state": {"name": "Todo", "group": "unstarted"}, "points": 1},
+    {"name": "Second, with a comma", "labels": [], "state": {"name": "Done", "group": "completed"}, "points": None},
+    {"name": 'Third "quoted"\nline', "labels": ["c"], "state": {"name": "Todo", "group": "unstarted"}, "points": 2.5},
+]
+
+
+def write(formatter, rows):
+    stream = io.BytesIO()
+    formatter.write(iter(rows), stream)
+    return stream.getvalue()
+
+
+@pytest.fixture
+def project(workspace, create_user):
+    project = Project.objects.create(name="Export", identifier="EXP", workspace=workspace, created_by=create_user)
+    ProjectMember.objects.create(project=project, workspace=workspace, member=create_user, role=20)
+    state = State.objects.create(name="Todo", group="unstarted", project=project, workspace=workspace, default=True)
+    label = Label.objects.create(name="Bug", project=project, workspace=workspace)
+    for index in range(7):
+        issue = Issue.objects.create(name=f"Issue {index}", project=project, workspace=workspace, state=state)
+        if index % 2:
+            IssueLabel.objects.create(issue=issue, label=label, project=project, workspace=workspace)
+    return project
+
+
+@pytest.mark.unit
+class TestStreamingFormatters:
+    """Test the formatters writing rows to a stream"""
+
+    @pytest.mark.parametrize(
+        "formatter",
+        [
+            JSONFormatter(),
+            JSONFormatter(indent=None),
+            CSVFormatter(),
+            CSVFormatter(prettify_headers=False, delimiter=";"),
+        ],
+    )
+    def test_write_matches_encode(self, formatter):
+        """The streamed content is the content encode() returns"""
+        assert write(formatter, ROWS).decode("utf-8") == formatter.encode(ROWS)
+        assert write(formatter, []).decode("utf-8") == formatter.encode([])
+
+    def test_write_xlsx(self):
+        """The write-only workbook holds the rows encode() would"""
+        formatter = XLSXFormatter()
+        assert formatter.decode(write(formatter, ROWS)) == formatter.decode(formatter.encode(ROWS))
+        assert formatter.decode(write(formatter, [])) == []
+
+    def test_write_leaves_the_stream_open(self):
+        stream = io.BytesIO()
+        CSVFormatter().write(iter(ROWS), stream)
+        assert not stream.closed
+
+
+@pytest.mark.unit
+class TestStreamingExport:
+    """Test the exports streamed chunk by chunk into the archive"""
+
+    @pytest.mark.django_db
+    def test_iter_rows_matches_serialize(self, project):
+        """The chunks serialize the rows of the whole queryset, in its order"""
+        exporter = DataExporter(IssueExportSerializer, format_type="json")
+        issues = Issue.objects.filter(project=project).prefetch_related("label_issue__label")
+        assert list(exporter.iter_rows(issues, chunk_size=3)) == list(exporter.serialize(issues))
+
+    @pytest.mark.django_db
+    @pytest.mark.parametrize("provider", ["csv", "json", "xlsx"])
+    def test_issue_export_task(self, workspace, project, create_user, provider, settings):
+        """The task uploads an archive with one file per project"""
+        settings.EXPORT_CHUNK_SIZE = 2
+        exporter_history = ExporterHistory.objects.create(
+            workspace=workspace,
+            project=[str(project.id)],
+            initiated_by=create_user,
+            provider=provider,
+            type="issue_exports",
+        )
+        uploaded = {}
+
+        def upload(zip_file, workspace_id, token_id, slug):
+            uploaded["content"] = zip_file.read()
+
+        with patch("plane.bgtasks.export_task.upload_to_s3", side_effect=upload):
+            issue_export_task(
+                provider=provider,
+                workspace_id=workspace.id,
+                project_ids=[str(project.id)],
+                token_id=exporter_history.token,
+                multiple=True,
+                slug=workspace.slug,
+            )
+
+        archive = zipfile.ZipFile(io.BytesIO(uploaded["content"]))
+        assert archive.namelist() == [f"{workspace.slug}-{project.id}.{provider}"]
+        content = archive.read(archive.namelist()[0])
+        if provider == "xlsx":
+            worksheet = load_workbook(io.BytesIO(content), read_only=True).active
+            rows = list(worksheet.iter_rows(values_only=True))
+            names = [row[rows[0].index("Name")] for row in rows[1:]]
+        else:
+            formatter = JSONFormatter() if provider == "json" else CSVFormatter()
+            rows = formatter.decode(content.decode("utf-8"))
+            names = [row["name"] for row in rows]
+        assert sorted(names) == [f"Issue {index}" for index in range(7)]
@@ -0,0 +1,97 @@
+import pytest
+
+from plane.db.models import Issue, Project, State
+from plane.utils.issue_search import search_issues
+from plane.utils.search_backend import (
+    IContainsSearchBackend,
+    PostgresSearchBackend,
+    get_search_backend,
+    issue_name_search_vector,
+)
+
+ISSUE_FIELDS = ["name", "sequence_id", "project__identifier"]
+
+
+@pytest.fixture
+def issues(workspace, create_user):
+    """Create issues whose names match the searches in different ways"""
+    project = Project.objects.create(
+        name="Search Project",
+        identifier="SRCH",
+        workspace=workspace,
+        created_by=create_user,
+    )
+    State.objects.create(name="Todo", group="unstarted", project=project, workspace=workspace, default=True)
+    names = ["Login page crashes", "Fix login", "Bug in the login form", "Logout button", "Crash report"]
+    return {
+        name: Issue.objects.create(name=name, project=project, workspace=workspace, sequence_id=index + 40)
+        for index, name in enumerate(names)
+    }
+
+
+def search(backend, query, document=True):
+    queryset = backend.search(
+        Issue.issue_objects.all(),
+        query,
+        ISSUE_FIELDS,
+        document=issue_name_search_vector() if document else None,
+    )
+    return list(queryset.order_by("-search_rank", "-created_at").values_list("name", flat=True))
+
+
+@pytest.mark.unit
+class TestSearchBackend:
+    """Test the pluggable search backends"""
+
+    @pytest.mark.django_db
+    def test_icontains_backend(self, issues):
+        """Substrings match and keep the ordering of the queryset"""
+        assert search(IContainsSearchBackend(), "login") == ["Bug in the login form", "Fix login", "Login page crashes"]
+
+    @pytest.mark.django_db
+    def test_empty_query_matches_everything(self, issues):
+        """An empty query does not filter"""
+        assert len(search(PostgresSearchBackend(), "")) == len(issues)
+
+    @pytest.mark.django_db
+    def test_prefix_words_match_in_any_order(self, issues):
+        """Every word of the query matches as the prefix of a word of the name"""
+        assert search(IContainsSearchBackend(), "crash log") == []
+        assert search(PostgresSearchBackend(), "crash log") == ["Login page crashes"]
+
+    @pytest.mark.django_db
+    def test_exact_and_prefix_matches_rank_first(self, issues):
+        """The exact name ranks first, then the names starting with the query"""
+        results = search(PostgresSearchBackend(), "fix login")
+        assert results[0] == "Fix login"
+
+        results = search(PostgresSearchBackend(), "login")
+        assert results[0] == "Login page crashes"
+        assert set(results) == {"Login page crashes", "Fix login", "Bug in the login form"}
+
+    @pytest.mark.django_db
+    def test_sequence_and_identifier_match(self, issues):
+        """Issues match by sequence id and by project identifier"""
+        sequence_id = issues["Bug in the login form"].sequence_id
+        assert search(PostgresSearchBackend(), f"SRCH-{sequence_id}") == ["Bug in the login form"]
+        assert len(search(PostgresSearchBackend(), "srch")) == len(issues)
+
+    @pytest.mark.django_db
+    def test_query_without_words(self, issues):
+        """Queries without words fall back to the substring match"""
+        assert search(PostgresSearchBackend(), "!!") == []
+
+    @pytest.mark.django_db
+    def test_search_issues(self, issues):
+        """search_issues ranks with the configured backend"""
+        results = search_issues("login", Issue.issue_objects.all())
+        assert results[0].name == "Login page crashes"
+
+    def test_backend_setting(self, settings):
+        """The backend is loaded from the SEARCH_BACKEND setting"""
+        get_search_backend.cache_clear()
+        settings.SEARCH_BACKEND = "plane.utils.search_backend.IContainsSearchBackend"
+        try:
+            assert type(get_search_backend()) is IContainsSearchBackend
+        finally:
+            get_search_backend.cache_clear()
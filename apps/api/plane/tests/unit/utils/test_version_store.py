@@ -0,0 +1,38 @@
+import pytest
+
+from plane.utils.version_store import BINARY, JSON, TEXT, apply_version_delta, encode_version_delta
+
+KINDS = {"description_html": TEXT, "description_json": JSON, "description_binary": BINARY}
+
+
+@pytest.mark.unit
+class TestVersionStore:
+    """Test the encoding of description versions as deltas of the previous one"""
+
+    def test_delta_round_trip(self):
+        """Changed, cleared and unchanged fields of every kind are rebuilt from the previous version"""
+        previous = {
+            "description_html": "<p>" + "lorem ipsum " * 500 + "</p>",
+            "description_json": {"type": "doc", "content": [{"type": "text", "text": "héllo"}]},
+            "description_binary": bytes(range(256)) * 20,
+        }
+        content = {
+            "description_html": previous["description_html"].replace("ipsum", "dolor ✓", 1),
+            "description_json": {"type": "doc", "content": [{"type": "text", "text": "héllo wörld"}]},
+            "description_binary": None,
+        }
+
+        delta = encode_version_delta(KINDS, previous, content)
+
+        assert apply_version_delta(KINDS, previous, delta) == content
+        assert len(delta) < 200
+
+    def test_delta_from_empty_version(self):
+        """A version following an empty one stores its whole description in the delta"""
+        previous = {"description_html": "", "description_json": {}, "description_binary": None}
+        content = {"description_html": "<p>new</p>", "description_json": {"a": 1}, "description_binary": b"\x00\x01"}
+
+        delta = encode_version_delta(KINDS, previous, content)
+
+        assert apply_version_delta(KINDS, previous, delta) == content
+        assert apply_version_delta(KINDS, content, encode_version_delta(KINDS, content, content)) == content
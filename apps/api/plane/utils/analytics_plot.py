@@ -1,5 +1,5 @@
 # Python imports
-from datetime import timedelta
+from datetime import date, timedelta
 from itertools import groupby
 
 # Django import
@@ -10,14 +10,10 @@ from django.db.models.functions import (
     Concat,
     ExtractMonth,
     ExtractYear,
-    TruncDate,
     Cast,
 )
 from django.utils import timezone
 
-# Module imports
-from plane.db.models import Issue, Project
-
 
 def annotate_with_monthly_dimension(queryset, field_name, attribute):
     # Get the year and the months
@@ -90,39 +86,21 @@ def build_graph_plot(queryset, x_axis, y_axis, segment=None):
     return sort_data(grouped_data, temp_axis)
 
 
-def burndown_plot(queryset, slug, project_id, plot_type, cycle_id=None, module_id=None):
-    # Total Issues in Cycle or Module
-    total_issues = queryset.total_issues
-    # check whether the estimate is a point or not
-    estimate_type = Project.objects.filter(
-        workspace__slug=slug,
-        pk=project_id,
-        estimate__isnull=False,
-        estimate__type="points",
-    ).exists()
-    if estimate_type and plot_type == "points" and cycle_id:
-        issue_estimates = Issue.issue_objects.filter(
-            workspace__slug=slug,
-            project_id=project_id,
-            issue_cycle__cycle_id=cycle_id,
-            issue_cycle__deleted_at__isnull=True,
-            estimate_point__isnull=False,
-        ).values_list("estimate_point__value", flat=True)
-
-        issue_estimates = [float(value) for value in issue_estimates]
-        total_estimate_points = sum(issue_estimates)
-
-    if estimate_type and plot_type == "points" and module_id:
-        issue_estimates = Issue.issue_objects.filter(
-            workspace__slug=slug,
-            project_id=project_id,
-            issue_module__module_id=module_id,
-            issue_module__deleted_at__isnull=True,
-            estimate_point__isnull=False,
-        ).values_list("estimate_point__value", flat=True)
-
-        issue_estimates = [float(value) for value in issue_estimates]
-        total_estimate_points = sum(issue_estimates)
+def burndown_plot(queryset, slug, project_id, plot_type, cycle_id=None, module_id=None, counters=None):
+    # Imported here as the progress counters depend on the analytics rollups, which depend on this module
+    from plane.utils.progress_counters import get_progress_counters
+
+    # Progress counters of the cycle or module, with the issues and estimate points completed by day
+    if counters is None:
+        counters = get_progress_counters(queryset)
+
+    if plot_type == "points":
+        total_pending = sum(counters["estimate_points"].values())
+        completed_key = "estimate_points"
+    else:
+        # Total Issues in Cycle or Module
+        total_pending = queryset.total_issues
+        completed_key = "issues"
 
     if cycle_id:
         if queryset.end_date and queryset.start_date:
@@ -134,37 +112,6 @@ def burndown_plot(queryset, slug, project_id, plot_type, cycle_id=None, module_i
         else:
             date_range = []
 
-        chart_data = {str(date): 0 for date in date_range}
-
-        if plot_type == "points":
-            completed_issues_estimate_point_distribution = (
-                Issue.issue_objects.filter(
-                    workspace__slug=slug,
-                    project_id=project_id,
-                    issue_cycle__cycle_id=cycle_id,
-                    issue_cycle__deleted_at__isnull=True,
-                    estimate_point__isnull=False,
-                )
-                .annotate(date=TruncDate("completed_at"))
-                .values("date")
-                .values("date", "estimate_point__value")
-                .order_by("date")
-            )
-        else:
-            completed_issues_distribution = (
-                Issue.issue_objects.filter(
-                    workspace__slug=slug,
-                    project_id=project_id,
-                    issue_cycle__cycle_id=cycle_id,
-                    issue_cycle__deleted_at__isnull=True,
-                )
-                .annotate(date=TruncDate("completed_at"))
-                .values("date")
-                .annotate(total_completed=Count("id"))
-                .values("date", "total_completed")
-                .order_by("date")
-            )
-
     if module_id:
         # Get all dates between the two dates
         date_range = [
@@ -172,64 +119,22 @@ def burndown_plot(queryset, slug, project_id, plot_type, cycle_id=None, module_i
             for x in range((queryset.target_date - queryset.start_date).days + 1)
         ]
 
-        chart_data = {str(date): 0 for date in date_range}
-
-        if plot_type == "points":
-            completed_issues_estimate_point_distribution = (
-                Issue.issue_objects.filter(
-                    workspace__slug=slug,
-                    project_id=project_id,
-                    issue_module__module_id=module_id,
-                    issue_module__deleted_at__isnull=True,
-                    estimate_point__isnull=False,
-                )
-                .annotate(date=TruncDate("completed_at"))
-                .values("date")
-                .values("date", "estimate_point__value")
-                .order_by("date")
-            )
+    chart_data = {str(chart_date): 0 for chart_date in date_range}
+
+    # Walk the dates and the days of completion together, both in ascending order
+    completed = sorted(
+        (date.fromisoformat(day), values[completed_key]) for day, values in counters["completed"].items()
+    )
+    total_completed = 0
+    index = 0
+    today = timezone.now().date()
+    for chart_date in date_range:
+        while index < len(completed) and completed[index][0] <= chart_date:
+            total_completed += completed[index][1]
+            index += 1
+        if chart_date > today:
+            chart_data[str(chart_date)] = None
         else:
-            completed_issues_distribution = (
-                Issue.issue_objects.filter(
-                    workspace__slug=slug,
-                    project_id=project_id,
-                    issue_module__module_id=module_id,
-                    issue_module__deleted_at__isnull=True,
-                )
-                .annotate(date=TruncDate("completed_at"))
-                .values("date")
-                .annotate(total_completed=Count("id"))
-                .values("date", "total_completed")
-                .order_by("date")
-            )
-
-    if plot_type == "points":
-        for date in date_range:
-            cumulative_pending_issues = total_estimate_points
-            total_completed = 0
-            total_completed = sum(
-                float(item["estimate_point__value"])
-                for item in completed_issues_estimate_point_distribution
-                if item["date"] is not None and item["date"] <= date
-            )
-            cumulative_pending_issues -= total_completed
-            if date > timezone.now().date():
-                chart_data[str(date)] = None
-            else:
-                chart_data[str(date)] = cumulative_pending_issues
-    else:
-        for date in date_range:
-            cumulative_pending_issues = total_issues
-            total_completed = 0
-            total_completed = sum(
-                item["total_completed"]
-                for item in completed_issues_distribution
-                if item["date"] is not None and item["date"] <= date
-            )
-            cumulative_pending_issues -= total_completed
-            if date > timezone.now().date():
-                chart_data[str(date)] = None
-            else:
-                chart_data[str(date)] = cumulative_pending_issues
+            chart_data[str(chart_date)] = total_pending - total_completed
 
     return chart_data
@@ -0,0 +1,338 @@
+# Python imports
+import uuid
+from itertools import groupby
+
+# Django imports
+from django.conf import settings
+from django.db import connection, models
+from django.db.models import Case, Count, F, FilteredRelation, FloatField, Q, Sum, Value, When
+from django.db.models.functions import Cast, Coalesce, Concat, TruncDate, TruncMonth
+
+# Module imports
+from plane.db.models import (
+    Cycle,
+    Issue,
+    IssueAnalyticsDimension,
+    IssueAnalyticsFact,
+    Label,
+    Module,
+    State,
+    StateGroup,
+    User,
+)
+from plane.settings.redis import redis_instance
+from plane.utils.analytics_plot import annotate_with_monthly_dimension, sort_data
+from plane.utils.exception_logger import log_exception
+from plane.utils.uuid import convert_uuid_to_integer
+
+# Issues changed since the last refresh of the facts
+ANALYTICS_DIRTY_ISSUES_KEY = "analytics:dirty_issues"
+
+# Relation and related field of the issues split by every dimension
+DIMENSION_RELATIONS = {
+    IssueAnalyticsDimension.ASSIGNEE: ("issue_assignee", "assignee_id"),
+    IssueAnalyticsDimension.LABEL: ("label_issue", "label_id"),
+    IssueAnalyticsDimension.CYCLE: ("issue_cycle", "cycle_id"),
+    IssueAnalyticsDimension.MODULE: ("issue_module", "module_id"),
+}
+
+# Dimension and fact field of the analytics axes served from the facts, None for the monthly created_at axis
+ROLLUP_AXES = {
+    "state_id": (IssueAnalyticsDimension.NONE, "state_id"),
+    "state__group": (IssueAnalyticsDimension.NONE, "state_group"),
+    "priority": (IssueAnalyticsDimension.NONE, "priority"),
+    "created_at": (IssueAnalyticsDimension.NONE, None),
+    "assignees__id": (IssueAnalyticsDimension.ASSIGNEE, "dimension_id"),
+    "labels__id": (IssueAnalyticsDimension.LABEL, "dimension_id"),
+    "issue_cycle__cycle_id": (IssueAnalyticsDimension.CYCLE, "dimension_id"),
+    "issue_module__module_id": (IssueAnalyticsDimension.MODULE, "dimension_id"),
+}
+
+# Estimates that are not numbers are left out of the sums instead of failing the cast
+NUMERIC_ESTIMATE = Case(
+    When(
+        estimate_point__value__regex=r"^\s*-?[0-9]+(\.[0-9]+)?\s*$",
+        then=Cast("estimate_point__value", FloatField()),
+    ),
+    default=Value(None),
+    output_field=FloatField(),
+)
+
+
+def mark_analytics_issues(issue_ids):
+    """Mark the issues changed without their activities for the refresh of the analytics facts"""
+    try:
+        redis_instance().sadd(ANALYTICS_DIRTY_ISSUES_KEY, *{str(issue_id) for issue_id in issue_ids})
+    except Exception as e:
+        log_exception(e)
+
+
+def use_analytics_rollups(request, filters=None):
+    """
+    Whether the analytics of the request are read from the facts. Ad-hoc issue filters are not kept in the
+    facts and are served from the issues, like every request with live=true.
+    """
+    return settings.ANALYTICS_ROLLUPS_ENABLED and not filters and request.GET.get("live", "false") != "true"
+
+
+def get_analytics_facts(**filters):
+    """Return the issue facts of the active projects"""
+    facts = IssueAnalyticsFact.objects.filter(project__deleted_at__isnull=True, project__archived_at__isnull=True)
+    return facts.filter(**filters)
+
+
+def get_fact_date_range(date_range):
+    """Return the fact filters of an analytics date range, whose bounds fall on day boundaries"""
+    if not date_range:
+        return {}
+    return {"date__gte": date_range["gte"].date(), "date__lte": date_range["lte"].date()}
+
+
+def count_fact_issues(queryset):
+    return queryset.filter(dimension=IssueAnalyticsDimension.NONE).aggregate(total=Sum("issue_count"))["total"] or 0
+
+
+def count_fact_issues_by_state_group(queryset):
+    """Return the total number of issues and the number of issues of every state group of the facts, in one query"""
+    return queryset.aggregate(
+        total=Coalesce(Sum("issue_count"), 0),
+        **{group: Coalesce(Sum("issue_count", filter=Q(state_group=group)), 0) for group in StateGroup.values},
+    )
+
+
+def get_fact_monthly_stats(queryset):
+    """Return the number of issues created and completed per month of creation, like the monthly issue stats"""
+    return (
+        queryset.filter(dimension=IssueAnalyticsDimension.NONE)
+        .annotate(month=TruncMonth("date"))
+        .values("month")
+        .annotate(
+            created_count=Coalesce(Sum("issue_count"), 0),
+            completed_count=Coalesce(Sum("issue_count", filter=Q(state_group=StateGroup.COMPLETED)), 0),
+        )
+        .order_by("month")
+    )
+
+
+def get_issue_fact_rows(queryset):
+    """
+    Aggregate the issues into fact rows, one query per dimension.
+    Args:
+        queryset: Issues of Issue.issue_objects
+    Returns:
+        list: The dimension and the values queryset of its fact rows
+    """
+    issues = queryset.annotate(fact_date=TruncDate("created_at"), fact_estimate=NUMERIC_ESTIMATE)
+    fact_rows = []
+    for dimension in [IssueAnalyticsDimension.NONE, *DIMENSION_RELATIONS]:
+        rows = issues
+        dimension_id = Value(None, output_field=models.UUIDField())
+        if dimension in DIMENSION_RELATIONS:
+            relation, field = DIMENSION_RELATIONS[dimension]
+            # Only the relations that are not removed, issues without any get a null dimension_id
+            rows = rows.annotate(
+                related=FilteredRelation(relation, condition=Q(**{f"{relation}__deleted_at__isnull": True}))
+            )
+            dimension_id = F(f"related__{field}")
+
+        rows = (
+            rows.values(
+                "workspace_id",
+                "project_id",
+                "state_id",
+                "priority",
+                date=F("fact_date"),
+                state_group=F("state__group"),
+                fact_dimension_id=dimension_id,
+            )
+            .annotate(issue_count=Count("id"), estimate=Sum("fact_estimate"))
+            .order_by()
+        )
+        fact_rows.append((dimension, rows))
+    return fact_rows
+
+
+def insert_issue_facts(queryset):
+    """
+    Write the facts of the issues with INSERT ... SELECT, the rows never leave the database.
+    Returns:
+        int: Number of facts written
+    """
+    written = 0
+    with connection.cursor() as cursor:
+        for dimension, rows in get_issue_fact_rows(queryset):
+            sql, params = rows.query.sql_with_params()
+            cursor.execute(
+                f"""
+                INSERT INTO {IssueAnalyticsFact._meta.db_table} (
+                    id, created_at, updated_at, workspace_id, project_id, date, state_id, state_group,
+                    priority, dimension, dimension_id, issue_count, estimate
+                )
+                SELECT
+                    gen_random_uuid(), now(), now(), workspace_id, project_id, date, state_id,
+                    COALESCE(state_group, ''), COALESCE(priority, ''), %s, fact_dimension_id::uuid,
+                    issue_count, estimate
+                FROM ({sql}) AS fact_rows
+                """,
+                [dimension, *params],
+            )
+            written += cursor.rowcount
+    return written
+
+
+def lock_project_facts(project_ids):
+    """Serialize the refreshes of the facts of the projects until the end of the transaction"""
+    with connection.cursor() as cursor:
+        for project_id in sorted(str(project_id) for project_id in project_ids):
+            # Keyed apart from the issue sequence lock of the project
+            lock_key = convert_uuid_to_integer(uuid.uuid5(uuid.NAMESPACE_OID, f"analytics:{project_id}"))
+            cursor.execute("SELECT pg_advisory_xact_lock(%s)", [lock_key])
+
+
+def refresh_analytics_facts(buckets):
+    """
+    Recompute the facts of the given days of the projects, must run inside a transaction.
+    Args:
+        buckets: Dates to recompute, by project id
+    Returns:
+        int: Number of facts written
+    """
+    buckets = {project_id: dates for project_id, dates in buckets.items() if dates}
+    if not buckets:
+        return 0
+
+    lock_project_facts(buckets)
+    fact_filter, issue_filter = Q(), Q()
+    for project_id, dates in buckets.items():
+        fact_filter |= Q(project_id=project_id, date__in=dates)
+        issue_filter |= Q(project_id=project_id, created_at__date__in=dates)
+
+    IssueAnalyticsFact.all_objects.filter(fact_filter).delete()
+    return insert_issue_facts(Issue.issue_objects.filter(issue_filter))
+
+
+def rebuild_project_facts(project_id):
+    """Recompute every fact of the project, must run inside a transaction"""
+    lock_project_facts([project_id])
+    IssueAnalyticsFact.all_objects.filter(project_id=project_id).delete()
+    return insert_issue_facts(Issue.issue_objects.filter(project_id=project_id))
+
+
+def _annotate_axis(queryset, axis, attribute):
+    field = ROLLUP_AXES[axis][1]
+    if field is None:
+        return annotate_with_monthly_dimension(queryset, "date", attribute)
+    return queryset.annotate(**{attribute: F(field)})
+
+
+def build_rollup_graph_plot(queryset, x_axis, y_axis, segment=None):
+    """
+    Build the build_graph_plot payload from the facts.
+    Returns:
+        dict: The payload, or None when the axes are not kept in the facts or split the issues by two
+        dimensions, which is left to build_graph_plot
+    """
+    if x_axis not in ROLLUP_AXES or (segment and segment not in ROLLUP_AXES):
+        return None
+    dimensions = {ROLLUP_AXES[axis][0] for axis in (x_axis, segment) if axis} - {IssueAnalyticsDimension.NONE}
+    if len(dimensions) > 1:
+        return None
+
+    queryset = queryset.filter(dimension=dimensions.pop() if dimensions else IssueAnalyticsDimension.NONE)
+    queryset = _annotate_axis(queryset, x_axis, "x_value").exclude(x_value__isnull=True)
+    group = ["x_value"]
+    if segment:
+        queryset = _annotate_axis(queryset, segment, "segment_value")
+        group.append("segment_value")
+
+    if y_axis == "issue_count":
+        queryset = queryset.values(*group).annotate(y_value=Sum("issue_count"))
+    else:
+        queryset = queryset.values(*group).annotate(y_value=Sum("estimate"))
+
+    y_key = "count" if y_axis == "issue_count" else "estimate"
+    result_values = [
+        {
+            "dimension": row["x_value"],
+            **({"segment": row["segment_value"]} if segment else {}),
+            y_key: row["y_value"],
+        }
+        for row in queryset.order_by(*group)
+    ]
+    grouped_data = {str(key): list(items) for key, items in groupby(result_values, key=lambda x: x["dimension"])}
+    return sort_data(grouped_data, x_axis)
+
+
+def _get_axis_ids(distribution, axes, x_axis, segment):
+    ids = set()
+    if x_axis in axes:
+        ids.update(row["dimension"] for rows in distribution.values() for row in rows)
+    if segment in axes:
+        ids.update(row["segment"] for rows in distribution.values() for row in rows)
+    ids.discard(None)
+    return ids
+
+
+def _prefix_keys(rows, prefix):
+    return [{f"{prefix}{key}": value for key, value in row.items()} for row in rows]
+
+
+def get_rollup_extras(distribution, x_axis, segment=None):
+    """Details of the states, assignees, labels, cycles and modules of a rollup distribution"""
+    extras = {
+        "state_details": {},
+        "assignee_details": {},
+        "label_details": {},
+        "cycle_details": {},
+        "module_details": {},
+    }
+
+    state_ids = _get_axis_ids(distribution, ["state_id"], x_axis, segment)
+    if state_ids:
+        extras["state_details"] = [
+            {"state_id": state["id"], "state__name": state["name"], "state__color": state["color"]}
+            for state in State.all_objects.filter(id__in=state_ids).order_by("id").values("id", "name", "color")
+        ]
+
+    assignee_ids = _get_axis_ids(distribution, ["assignees__id"], x_axis, segment)
+    if assignee_ids:
+        assignees = (
+            User.objects.filter(Q(avatar__isnull=False) | Q(avatar_asset__isnull=False), id__in=assignee_ids)
+            .annotate(
+                avatar_url=Case(
+                    # If `avatar_asset` exists, use it to generate the asset URL
+                    When(
+                        avatar_asset__isnull=False,
+                        then=Concat(Value("/api/assets/v2/static/"), "avatar_asset", Value("/")),
+                    ),
+                    # If `avatar_asset` is None, fall back to using `avatar` field directly
+                    When(avatar_asset__isnull=True, then="avatar"),
+                    default=Value(None),
+                    output_field=models.CharField(),
+                )
+            )
+            .order_by("id")
+            .values("avatar_url", "display_name", "first_name", "last_name", "id")
+        )
+        extras["assignee_details"] = _prefix_keys(assignees, "assignees__")
+
+    label_ids = _get_axis_ids(distribution, ["labels__id"], x_axis, segment)
+    if label_ids:
+        labels = Label.all_objects.filter(id__in=label_ids).order_by("id").values("id", "color", "name")
+        extras["label_details"] = _prefix_keys(labels, "labels__")
+
+    cycle_ids = _get_axis_ids(distribution, ["issue_cycle__cycle_id"], x_axis, segment)
+    if cycle_ids:
+        extras["cycle_details"] = [
+            {"issue_cycle__cycle_id": cycle["id"], "issue_cycle__cycle__name": cycle["name"]}
+            for cycle in Cycle.all_objects.filter(id__in=cycle_ids).order_by("id").values("id", "name")
+        ]
+
+    module_ids = _get_axis_ids(distribution, ["issue_module__module_id"], x_axis, segment)
+    if module_ids:
+        extras["module_details"] = [
+            {"issue_module__module_id": module["id"], "issue_module__module__name": module["name"]}
+            for module in Module.all_objects.filter(id__in=module_ids).order_by("id").values("id", "name")
+        ]
+
+    return extras
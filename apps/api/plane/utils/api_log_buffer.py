@@ -0,0 +1,119 @@
+# Python imports
+import atexit
+import logging
+import os
+import threading
+from collections import deque
+
+# Django imports
+from django.conf import settings
+from django.db import close_old_connections
+
+# Module imports
+from plane.bgtasks.logger_task import save_api_activity_logs
+
+logger = logging.getLogger("plane.api.request")
+
+
+class APIActivityLogBuffer:
+    """
+    Collect the API activity logs of a process and write them in bulk.
+
+    A background thread writes a batch of API_LOG_FLUSH_SIZE records as soon as that many
+    are buffered, and whatever is buffered every API_LOG_FLUSH_INTERVAL seconds. Requests
+    never wait for the sink: while it is slow or failing the buffer keeps filling up to
+    API_LOG_BUFFER_SIZE records, then the oldest records are dropped and counted.
+    """
+
+    def __init__(self, capacity, flush_size, flush_interval):
+        self.capacity = capacity
+        self.flush_size = flush_size
+        self.flush_interval = flush_interval
+        self.dropped = 0
+        self._pid = None
+        self._lock = threading.Lock()
+        self._reset()
+        atexit.register(self.flush)
+
+    def _reset(self):
+        # Forked processes start with an empty buffer and their own flusher thread
+        self._records = deque()
+        self._flush_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._thread = None
+        self._pid = os.getpid()
+
+    def _start(self):
+        if self._pid != os.getpid():
+            self._reset()
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="api-log-flusher", daemon=True)
+            self._thread.start()
+
+    def add(self, record):
+        with self._lock:
+            self._start()
+            if len(self._records) >= self.capacity:
+                self._records.popleft()
+                self.dropped += 1
+            self._records.append(record)
+            buffered = len(self._records)
+
+        if buffered >= self.flush_size:
+            self._wakeup.set()
+
+    def __len__(self):
+        return len(self._records)
+
+    def clear(self):
+        with self._lock:
+            self._records.clear()
+
+    def _run(self):
+        while True:
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            try:
+                self.flush()
+            finally:
+                # The thread holds its own database connection
+                close_old_connections()
+
+    def flush(self):
+        """
+        Write the buffered records in batches of API_LOG_FLUSH_SIZE.
+        Returns:
+            int: Number of records written
+        """
+        written = 0
+        with self._flush_lock:
+            while True:
+                with self._lock:
+                    batch = [self._records.popleft() for _ in range(min(self.flush_size, len(self._records)))]
+                    dropped, self.dropped = self.dropped, 0
+                if dropped:
+                    logger.warning(f"Dropped {dropped} API activity logs, the log sink is too slow")
+                if not batch:
+                    return written
+                # A failed batch is not retried so that the buffer drains
+                if save_api_activity_logs(batch):
+                    written += len(batch)
+
+
+_buffer = None
+_buffer_lock = threading.Lock()
+
+
+def get_api_log_buffer():
+    """Return the API activity log buffer of the current process"""
+    global _buffer
+
+    if _buffer is None:
+        with _buffer_lock:
+            if _buffer is None:
+                _buffer = APIActivityLogBuffer(
+                    capacity=settings.API_LOG_BUFFER_SIZE,
+                    flush_size=settings.API_LOG_FLUSH_SIZE,
+                    flush_interval=settings.API_LOG_FLUSH_INTERVAL,
+                )
+    return _buffer
@@ -0,0 +1,74 @@
+# Python imports
+import hashlib
+import json
+
+# Django imports
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+# Module imports
+from plane.settings.redis import redis_instance
+
+# Validated tokens, keyed by a digest so that the tokens themselves are not stored in redis
+API_TOKEN_CACHE_KEY = "api_token:{digest}"
+# Last use of every token since the last flush, by token id
+API_TOKEN_LAST_USED_KEY = "api_token:last_used"
+
+
+def api_token_cache_key(token):
+    return API_TOKEN_CACHE_KEY.format(digest=hashlib.sha256(token.encode()).hexdigest())
+
+
+def load_api_token(token):
+    from plane.db.models import APIToken
+
+    api_token = (
+        APIToken.objects.filter(token=token, is_active=True).values("id", "user_id", "is_service", "expired_at").first()
+    )
+    if api_token is None:
+        return None
+
+    return {
+        "id": str(api_token["id"]),
+        "user_id": str(api_token["user_id"]),
+        "is_service": api_token["is_service"],
+        "expired_at": api_token["expired_at"].isoformat() if api_token["expired_at"] else None,
+    }
+
+
+def get_valid_api_token(token):
+    """
+    Return the id, user_id and is_service of an active and unexpired token, None if the token is not valid.
+    Lookups are cached for API_TOKEN_CACHE_TTL seconds, unknown tokens included.
+    """
+    ttl = settings.API_TOKEN_CACHE_TTL
+    if ttl:
+        ri = redis_instance()
+        key = api_token_cache_key(token)
+        cached = ri.get(key)
+        if cached is None:
+            api_token = load_api_token(token)
+            ri.set(key, json.dumps(api_token), ex=ttl)
+        else:
+            api_token = json.loads(cached)
+    else:
+        api_token = load_api_token(token)
+
+    # Tokens expire while they are cached
+    if api_token is None or (api_token["expired_at"] and parse_datetime(api_token["expired_at"]) <= timezone.now()):
+        return None
+    return api_token
+
+
+def invalidate_api_token(token):
+    """Drop the cached lookup of the token, again on commit in case a concurrent request cached it meanwhile"""
+    key = api_token_cache_key(token)
+    redis_instance().delete(key)
+    transaction.on_commit(lambda: redis_instance().delete(key))
+
+
+def record_api_token_use(token_id):
+    """Record the use of a token, the last use of every token is written to the database by a periodic flush"""
+    redis_instance().hset(API_TOKEN_LAST_USED_KEY, str(token_id), timezone.now().isoformat())
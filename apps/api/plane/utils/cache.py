@@ -8,6 +8,14 @@ from django.core.cache import cache
 # Third party imports
 from rest_framework.response import Response
 
+# Module imports
+from plane.settings.redis import redis_instance, redis_pipeline
+
+# Redis set holding the cache keys registered under a tag
+CACHE_TAG_KEY = "cache_tag:{tag}"
+# Redis hash with the hit, miss and eviction counters of cached responses
+CACHE_STATS_KEY = "cache_response:stats"
+
 
 def generate_cache_key(custom_path, auth_header=None):
     """Generate a cache key with the given params"""
@@ -18,6 +26,71 @@ def generate_cache_key(custom_path, auth_header=None):
     return key_data
 
 
+def path_cache_tag(path, auth_header=None):
+    """Tag of every cached variant of a path, optionally for a single user"""
+    tag = f"path:{path.split('?')[0].strip('/')}"
+    return f"{tag}:user:{auth_header}" if auth_header else tag
+
+
+def workspace_cache_tag(slug):
+    return f"workspace:{slug}"
+
+
+def project_cache_tag(project_id):
+    return f"project:{project_id}"
+
+
+def user_cache_tag(user_id):
+    return f"user:{user_id}"
+
+
+def get_cache_tags(custom_path, auth_header=None, view_kwargs=None):
+    """Tags a cached response is registered under"""
+    view_kwargs = view_kwargs or {}
+    tags = [path_cache_tag(custom_path)]
+    if auth_header:
+        tags.extend([path_cache_tag(custom_path, auth_header), user_cache_tag(auth_header)])
+    if view_kwargs.get("slug"):
+        tags.append(workspace_cache_tag(view_kwargs["slug"]))
+    if view_kwargs.get("project_id"):
+        tags.append(project_cache_tag(view_kwargs["project_id"]))
+    return tags
+
+
+def tag_cache_key(key, tags, timeout):
+    """Register the cache key under the tags, the tags expire with the latest entry"""
+    with redis_pipeline() as pipeline:
+        for tag in tags:
+            tag_key = CACHE_TAG_KEY.format(tag=tag)
+            pipeline.sadd(tag_key, key)
+            # Only ever extend the ttl, gt skips keys without a ttl so nx sets the first one
+            pipeline.expire(tag_key, timeout, gt=True)
+            pipeline.expire(tag_key, timeout, nx=True)
+
+
+def invalidate_cache_tags(*tags):
+    """Delete every cached response registered under the tags"""
+    tag_keys = [CACHE_TAG_KEY.format(tag=tag) for tag in tags]
+    ri = redis_instance()
+    keys = {key.decode() for key in ri.sunion(tag_keys)} if tag_keys else set()
+    if keys:
+        cache.delete_many(keys=list(keys))
+    if tag_keys:
+        with redis_pipeline() as pipeline:
+            pipeline.delete(*tag_keys)
+            pipeline.hincrby(CACHE_STATS_KEY, "evictions", len(keys))
+    return len(keys)
+
+
+def get_cache_stats():
+    """Hit, miss and eviction counters of the cached responses"""
+    stats = {field.decode(): int(value) for field, value in redis_instance().hgetall(CACHE_STATS_KEY).items()}
+    stats = {name: stats.get(name, 0) for name in ("hits", "misses", "evictions")}
+    lookups = stats["hits"] + stats["misses"]
+    stats["hit_rate"] = round(stats["hits"] / lookups, 4) if lookups else 0
+    return stats
+
+
 def cache_response(timeout=60 * 60, path=None, user=True):
     """decorator to create cache per user"""
 
@@ -30,6 +103,7 @@ def cache_response(timeout=60 * 60, path=None, user=True):
             key = generate_cache_key(custom_path, auth_header)
             cached_result = cache.get(key)
 
+            redis_instance().hincrby(CACHE_STATS_KEY, "misses" if cached_result is None else "hits")
             if cached_result is not None:
                 return Response(cached_result["data"], status=cached_result["status"])
             response = view_func(instance, request, *args, **kwargs)
@@ -39,6 +113,7 @@ def cache_response(timeout=60 * 60, path=None, user=True):
                     {"data": response.data, "status": response.status_code},
                     timeout,
                 )
+                tag_cache_key(key, get_cache_tags(custom_path, auth_header, kwargs), timeout)
 
             return response
 
@@ -60,9 +135,10 @@ def invalidate_cache_directly(path=None, url_params=False, user=True, request=No
     key = generate_cache_key(custom_path, auth_header)
 
     if multiple:
-        cache.delete_many(keys=cache.keys(f"*{key}*"))
-    else:
-        cache.delete(key)
+        # Every variant of the path is tagged, no need to scan the keyspace
+        invalidate_cache_tags(path_cache_tag(custom_path, auth_header))
+    elif cache.delete(key):
+        redis_instance().hincrby(CACHE_STATS_KEY, "evictions")
 
 
 def invalidate_cache(path=None, url_params=False, user=True, multiple=False):
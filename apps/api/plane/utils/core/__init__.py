@@ -1,7 +1,7 @@
 """
 Core utilities for Plane database routing and request scoping.
-This package contains essential components for managing read replica routing
-and request-scoped context in the Plane application.
+This package contains essential components for managing read replica routing,
+replication lag checks and request-scoped context in the Plane application.
 """
 
 from .dbrouters import ReadReplicaRouter
@@ -11,6 +11,14 @@ from .request_scope import (
     should_use_read_replica,
     clear_read_replica_context,
 )
+from .replica_routing import (
+    get_replica_lag,
+    replica_is_lagging,
+    pin_to_primary,
+    is_pinned_to_primary,
+    record_routing_decision,
+    get_routing_stats,
+)
 
 __all__ = [
     "ReadReplicaRouter",
@@ -18,4 +26,10 @@ __all__ = [
     "set_use_read_replica",
     "should_use_read_replica",
     "clear_read_replica_context",
+    "get_replica_lag",
+    "replica_is_lagging",
+    "pin_to_primary",
+    "is_pinned_to_primary",
+    "record_routing_decision",
+    "get_routing_stats",
 ]
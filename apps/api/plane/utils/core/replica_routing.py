@@ -0,0 +1,169 @@
+"""
+Replication lag and read-your-writes checks for read replica routing.
+These helpers let ReadReplicaRoutingMiddleware send a read to the replica only
+when it is safe to do so:
+- Clients that just wrote are pinned to the primary for READ_REPLICA_STICKY_SECONDS
+- The replica is skipped while its lag exceeds READ_REPLICA_MAX_LAG seconds
+Every routing decision is counted per view to find the views that can move to
+the replica and those that keep falling back to the primary.
+"""
+
+import hashlib
+import logging
+import threading
+import time
+from typing import Optional
+
+from django.conf import settings
+from django.db import DatabaseError, connections
+from django.http import HttpRequest
+
+from plane.settings.redis import redis_instance
+
+logger = logging.getLogger("plane.db")
+
+__all__ = [
+    "REPLICA_ROUTING_STATS_KEY",
+    "get_replica_lag",
+    "replica_is_lagging",
+    "pin_to_primary",
+    "is_pinned_to_primary",
+    "record_routing_decision",
+    "get_routing_stats",
+]
+
+# Clients pinned to the primary after a write, by digest of their session or API key
+PRIMARY_PIN_KEY = "db_routing:primary:{digest}"
+# Routing decisions, by "<view>:<decision>"
+REPLICA_ROUTING_STATS_KEY = "db_routing:decisions"
+
+# Seconds behind the primary, 0 when the replica replayed everything it received
+REPLICA_LAG_SQL = """
+SELECT CASE
+    WHEN NOT pg_is_in_recovery() OR pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+    ELSE EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp())
+END
+"""
+
+# Lag measured by this process, refreshed every READ_REPLICA_LAG_CHECK_INTERVAL seconds
+_replica_lag = {"lag": None, "checked_at": None}
+_replica_lag_lock = threading.Lock()
+
+
+def measure_replica_lag() -> float:
+    """
+    Query the replication lag of the replica.
+    Returns:
+        float: Seconds the replica is behind the primary, infinity if it cannot be measured
+    """
+    try:
+        with connections["replica"].cursor() as cursor:
+            cursor.execute(REPLICA_LAG_SQL)
+            lag = cursor.fetchone()[0]
+    except DatabaseError as e:
+        logger.warning(f"Could not measure the replica lag: {e}")
+        return float("inf")
+
+    # No transaction was replayed yet since the replica started
+    return float("inf") if lag is None else float(lag)
+
+
+def get_replica_lag() -> float:
+    """
+    Return the replication lag, measured at most once per READ_REPLICA_LAG_CHECK_INTERVAL per process.
+    Returns:
+        float: Seconds the replica is behind the primary
+    """
+    now = time.monotonic()
+    checked_at = _replica_lag["checked_at"]
+    if checked_at is None or now - checked_at >= settings.READ_REPLICA_LAG_CHECK_INTERVAL:
+        with _replica_lag_lock:
+            # Another thread may have measured it while this one waited for the lock
+            checked_at = _replica_lag["checked_at"]
+            if checked_at is None or now - checked_at >= settings.READ_REPLICA_LAG_CHECK_INTERVAL:
+                _replica_lag["lag"] = measure_replica_lag()
+                _replica_lag["checked_at"] = time.monotonic()
+                logger.debug(f"Replica lag is {_replica_lag['lag']}s")
+    return _replica_lag["lag"]
+
+
+def replica_is_lagging() -> bool:
+    """
+    Check if the replica is too far behind the primary to serve reads.
+    Returns:
+        bool: True if the lag exceeds READ_REPLICA_MAX_LAG, always False when the check is disabled
+    """
+    max_lag = settings.READ_REPLICA_MAX_LAG
+    return bool(max_lag) and get_replica_lag() > max_lag
+
+
+def _client_digest(request: HttpRequest) -> Optional[str]:
+    """Identify the client of the request by its API key or session, None for anonymous clients"""
+    credential = request.headers.get("X-Api-Key") or request.COOKIES.get(settings.SESSION_COOKIE_NAME)
+    if not credential:
+        return None
+    return hashlib.sha256(credential.encode()).hexdigest()
+
+
+def pin_to_primary(request: HttpRequest) -> None:
+    """
+    Route the reads of the client of the request to the primary for READ_REPLICA_STICKY_SECONDS,
+    so that it reads its own writes while they are replicated.
+    Args:
+        request: A request that wrote to the primary
+    """
+    sticky_seconds = settings.READ_REPLICA_STICKY_SECONDS
+    digest = _client_digest(request)
+    if not sticky_seconds or digest is None:
+        return
+
+    try:
+        redis_instance().set(PRIMARY_PIN_KEY.format(digest=digest), 1, ex=sticky_seconds)
+    except Exception as e:
+        logger.warning(f"Could not pin the client to the primary database: {e}")
+
+
+def is_pinned_to_primary(request: HttpRequest) -> bool:
+    """
+    Check if the client of the request wrote within the last READ_REPLICA_STICKY_SECONDS.
+    Args:
+        request: A read request
+    Returns:
+        bool: True if the reads of the client must go to the primary
+    """
+    digest = _client_digest(request)
+    if not settings.READ_REPLICA_STICKY_SECONDS or digest is None:
+        return False
+
+    try:
+        return bool(redis_instance().exists(PRIMARY_PIN_KEY.format(digest=digest)))
+    except Exception as e:
+        # Reading from the primary is always safe
+        logger.warning(f"Could not check the primary pin of the client: {e}")
+        return True
+
+
+def record_routing_decision(view_name: str, decision: str) -> None:
+    """
+    Count a routing decision of a view.
+    Args:
+        view_name: Dotted path of the view
+        decision: Database chosen for the request and why, e.g. "replica" or "primary_lag"
+    """
+    try:
+        redis_instance().hincrby(REPLICA_ROUTING_STATS_KEY, f"{view_name}:{decision}")
+    except Exception as e:
+        logger.debug(f"Could not record the routing decision of {view_name}: {e}")
+
+
+def get_routing_stats() -> dict:
+    """
+    Routing decisions counted per view.
+    Returns:
+        dict: Count of every decision, by view name
+    """
+    stats = {}
+    for field, count in redis_instance().hgetall(REPLICA_ROUTING_STATS_KEY).items():
+        view_name, decision = field.decode().rsplit(":", 1)
+        stats.setdefault(view_name, {})[decision] = int(count)
+    return stats
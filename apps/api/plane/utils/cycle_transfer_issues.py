@@ -12,7 +12,7 @@ from django.db.models import (
     Value,
     When,
 )
-from django.db import models
+from django.db import models, transaction
 from django.db.models.functions import Cast, Concat
 from django.utils import timezone
 
@@ -22,10 +22,12 @@ from plane.db.models import (
     CycleIssue,
     Issue,
     Project,
+    refresh_issue_counters,
 )
 from plane.utils.analytics_plot import burndown_plot
 from plane.bgtasks.issue_activities_task import issue_activity
 from plane.utils.host import base_host
+from plane.utils.progress_counters import refresh_progress_counters
 
 
 def transfer_cycle_issues(
@@ -143,6 +145,9 @@ def transfer_cycle_issues(
             "error": "Source cycle not found",
         }
 
+    # Recount the progress of the cycle for the snapshot, its stored counters can trail the latest changes
+    counters = refresh_progress_counters(Cycle, [old_cycle.id])[str(old_cycle.id)]
+
     # Check if project uses estimates
     estimate_type = Project.objects.filter(
         workspace__slug=slug,
@@ -264,6 +269,7 @@ def transfer_cycle_issues(
             project_id=project_id,
             plot_type="points",
             cycle_id=cycle_id,
+            counters=counters,
         )
         # Label estimate distribution serialization
         label_estimate_distribution = [
@@ -398,6 +404,7 @@ def transfer_cycle_issues(
         project_id=project_id,
         plot_type="issues",
         cycle_id=cycle_id,
+        counters=counters,
     )
 
     # Get the current cycle and save progress snapshot
@@ -451,7 +458,9 @@ def transfer_cycle_issues(
         )
 
     # Bulk update cycle issues
-    cycle_issues = CycleIssue.objects.bulk_update(updated_cycles, ["cycle_id"], batch_size=100)
+    with transaction.atomic():
+        cycle_issues = CycleIssue.objects.bulk_update(updated_cycles, ["cycle_id"], batch_size=100)
+        refresh_issue_counters(cycle_issue.issue_id for cycle_issue in updated_cycles)
 
     # Capture Issue Activity
     issue_activity.delay(
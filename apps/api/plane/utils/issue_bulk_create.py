@@ -0,0 +1,200 @@
+# Django imports
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Max
+from django.utils import timezone
+
+# Module imports
+from plane.db.models import (
+    EstimatePoint,
+    Issue,
+    IssueActivity,
+    IssueAssignee,
+    IssueLabel,
+    IssueSequence,
+    Label,
+    ProjectMember,
+    State,
+    record_issue_changes,
+    refresh_issue_counters,
+    reserve_issue_sequences,
+)
+from plane.utils.analytics_rollup import mark_analytics_issues
+from plane.utils.html_processor import strip_tags
+
+
+def validate_bulk_issues(project_id, rows):
+    """
+    Check the related ids of the issues to create with one query per relation. The assignees that are not
+    active members and the labels of other projects are dropped, as the single create does.
+    Returns:
+        dict: error message by index of the invalid rows
+    """
+    state_ids = {row["state_id"] for row in rows if row.get("state_id")}
+    parent_ids = {row["parent_id"] for row in rows if row.get("parent_id")}
+    estimate_point_ids = {row["estimate_point_id"] for row in rows if row.get("estimate_point_id")}
+    label_ids = {label_id for row in rows for label_id in row.get("label_ids") or []}
+    assignee_ids = {assignee_id for row in rows for assignee_id in row.get("assignee_ids") or []}
+
+    valid_states = set(State.objects.filter(project_id=project_id, pk__in=state_ids).values_list("id", flat=True))
+    valid_parents = set(Issue.objects.filter(project_id=project_id, pk__in=parent_ids).values_list("id", flat=True))
+    valid_estimate_points = set(
+        EstimatePoint.objects.filter(project_id=project_id, pk__in=estimate_point_ids).values_list("id", flat=True)
+    )
+    valid_labels = set(Label.objects.filter(project_id=project_id, pk__in=label_ids).values_list("id", flat=True))
+    valid_assignees = set(
+        ProjectMember.objects.filter(
+            project_id=project_id, role__gte=15, is_active=True, member_id__in=assignee_ids
+        ).values_list("member_id", flat=True)
+    )
+
+    errors = {}
+    for index, row in enumerate(rows):
+        if row.get("state_id") and row["state_id"] not in valid_states:
+            errors[index] = "State is not valid please pass a valid state_id"
+        elif row.get("parent_id") and row["parent_id"] not in valid_parents:
+            errors[index] = "Parent is not valid issue_id please pass a valid issue_id"
+        elif row.get("estimate_point_id") and row["estimate_point_id"] not in valid_estimate_points:
+            errors[index] = "Estimate point is not valid please pass a valid estimate_point_id"
+        if row.get("label_ids"):
+            row["label_ids"] = [label_id for label_id in row["label_ids"] if label_id in valid_labels]
+        if row.get("assignee_ids"):
+            row["assignee_ids"] = [assignee_id for assignee_id in row["assignee_ids"] if assignee_id in valid_assignees]
+    return errors
+
+
+def get_default_state_id(project_id):
+    state = State.objects.filter(project_id=project_id, default=True).first()
+    if state is None:
+        state = State.objects.filter(project_id=project_id).first()
+    return state.id if state else None
+
+
+def bulk_create_issues(project, rows, actor_id, epoch=None, origin=None):
+    """
+    Create the issues of the project at once, as Issue.save and the created activity do one by one.
+    The sequence ids are reserved as one range, and the sort orders follow the largest one of each state.
+    The issues, their sequences, assignees, labels and created activities are inserted in batches of
+    ISSUE_BULK_CREATE_BATCH_SIZE rows, and the created webhook events are sent once for all of them.
+    Args:
+        project: the project of the issues
+        rows: the validated values of each issue, with the assignee_ids and label_ids to set
+        actor_id: the user creating the issues
+        origin: the site the request came from, sent with the webhook events
+    Returns:
+        list: the created issues, in the order of the rows
+    """
+    # Imported here, the serializers the task imports validate the issues with this module
+    from plane.bgtasks.webhook_task import bulk_model_activity
+
+    batch_size = settings.ISSUE_BULK_CREATE_BATCH_SIZE
+    epoch = epoch or int(timezone.now().timestamp())
+    now = timezone.now()
+    audit = {"created_by_id": actor_id, "updated_by_id": actor_id}
+    scope = {"project_id": project.id, "workspace_id": project.workspace_id}
+
+    default_state_id = None
+    if any(not row.get("state_id") for row in rows):
+        default_state_id = get_default_state_id(project.id)
+    default_assignee_id = project.default_assignee_id
+    if (
+        default_assignee_id is not None
+        and not ProjectMember.objects.filter(
+            project_id=project.id, member_id=default_assignee_id, role__gte=15, is_active=True
+        ).exists()
+    ):
+        default_assignee_id = None
+
+    issues = []
+    assignees = []
+    labels = []
+    for row in rows:
+        row = dict(row)
+        assignees.append(row.pop("assignee_ids", None) or ([default_assignee_id] if default_assignee_id else []))
+        labels.append(row.pop("label_ids", None) or [])
+        issue = Issue(**row, **scope, **audit)
+        if issue.state_id is None:
+            issue.state_id = default_state_id
+        # Strip the html tags using html parser
+        issue.description_stripped = (
+            None
+            if (issue.description_html == "" or issue.description_html is None)
+            else strip_tags(issue.description_html)
+        )
+        issues.append(issue)
+
+    state_ids = {issue.state_id for issue in issues}
+    state_groups = dict(State.all_state_objects.filter(pk__in=state_ids).values_list("id", "group"))
+    for issue in issues:
+        issue.completed_at = now if state_groups.get(issue.state_id) == "completed" else None
+
+    with transaction.atomic():
+        # Reserved right before the inserts, the counter row of the project stays locked until the commit
+        first_sequence = reserve_issue_sequences(project.id, len(issues))
+        # Each issue goes after the last one of its state, as with Issue.save, read under the lock of the
+        # counter row so that the issues created at the same time do not get the same sort order
+        sort_orders = dict(
+            Issue.objects.filter(project_id=project.id, state_id__in=state_ids)
+            .values("state_id")
+            .annotate(largest=Max("sort_order"))
+            .values_list("state_id", "largest")
+        )
+        for index, issue in enumerate(issues):
+            issue.sequence_id = first_sequence + index
+            largest = sort_orders.get(issue.state_id)
+            if largest is not None:
+                issue.sort_order = largest + 10000
+            sort_orders[issue.state_id] = issue.sort_order
+        Issue.objects.bulk_create(issues, batch_size=batch_size)
+
+        IssueSequence.objects.bulk_create(
+            [IssueSequence(issue=issue, sequence=issue.sequence_id, **scope, **audit) for issue in issues],
+            batch_size=batch_size,
+        )
+        IssueAssignee.objects.bulk_create(
+            [
+                IssueAssignee(issue=issue, assignee_id=assignee_id, **scope, **audit)
+                for issue, assignee_ids in zip(issues, assignees)
+                for assignee_id in assignee_ids
+            ],
+            batch_size=batch_size,
+            ignore_conflicts=True,
+        )
+        IssueLabel.objects.bulk_create(
+            [
+                IssueLabel(issue=issue, label_id=label_id, **scope, **audit)
+                for issue, label_ids in zip(issues, labels)
+                for label_id in label_ids
+            ],
+            batch_size=batch_size,
+            ignore_conflicts=True,
+        )
+        IssueActivity.objects.bulk_create(
+            [
+                IssueActivity(
+                    issue=issue,
+                    comment="created the issue",
+                    verb="created",
+                    actor_id=actor_id,
+                    epoch=epoch,
+                    **scope,
+                )
+                for issue in issues
+            ],
+            batch_size=batch_size,
+        )
+        refresh_issue_counters(issue.parent_id for issue in issues)
+        record_issue_changes(issue.id for issue in issues)
+        issue_ids = [issue.id for issue in issues]
+        transaction.on_commit(lambda: mark_analytics_issues(issue_ids))
+        transaction.on_commit(
+            lambda: bulk_model_activity.delay(
+                model_name="issue",
+                model_ids=[str(issue_id) for issue_id in issue_ids],
+                actor_id=str(actor_id),
+                slug=project.workspace.slug,
+                origin=origin,
+            )
+        )
+
+    return issues
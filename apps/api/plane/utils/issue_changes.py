@@ -0,0 +1,89 @@
+# Django imports
+from django.db.models import Q
+from django.db.models.expressions import RawSQL
+
+# Module imports
+from plane.settings.redis import redis_instance
+
+# Changes read by one page of a change feed
+ISSUE_CHANGES_PAGE_SIZE = 1000
+# Transaction id from which the changes are kept, the ones before are purged by delete_issue_changes
+ISSUE_CHANGES_HORIZON_KEY = "issue_changes:horizon"
+
+
+class IssueChangeCursorExpired(Exception):
+    """The changes after the cursor were purged, the client has to download the issues again"""
+
+
+def get_issue_changes_horizon():
+    """Transaction id of the oldest change kept, 0 before the first purge"""
+    horizon = redis_instance().get(ISSUE_CHANGES_HORIZON_KEY)
+    return int(horizon) if horizon is not None else 0
+
+
+def set_issue_changes_horizon(transaction_id):
+    """Move the horizon forward to the transaction id, never back"""
+    redis_instance().set(ISSUE_CHANGES_HORIZON_KEY, max(transaction_id, get_issue_changes_horizon()))
+
+
+def ended_transactions():
+    """
+    The id of the oldest transaction running when the query reads, the changes logged by the transactions
+    before it are committed or rolled back, and the ones logged by the transactions after it are all later
+    """
+    return RawSQL("pg_snapshot_xmin(pg_current_snapshot())::text::bigint", [])
+
+
+def parse_issue_change_cursor(cursor):
+    """Return the transaction id and the id of the last change read from the cursor of a change feed"""
+    try:
+        transaction_id, change_id = (int(value) for value in cursor.split(":"))
+    except (AttributeError, ValueError) as e:
+        raise ValueError(f"Invalid cursor format: {e}")
+    return transaction_id, change_id
+
+
+def read_issue_changes(changes, cursor=None, limit=ISSUE_CHANGES_PAGE_SIZE):
+    """
+    Read the changes of the issues after the cursor, in the order of the transactions logging them. Only the
+    changes of the ended transactions are read, so that no change committed later lands before the cursor.
+    Without a cursor no change is read, the cursor of the latest one is returned for the clients to follow
+    the changes from, before they download the issues.
+    The changes are kept ISSUE_CHANGES_RETENTION_DAYS days, a client that has not read the feed for longer
+    gets IssueChangeCursorExpired for its cursor, and downloads the issues again from a new cursor.
+    Args:
+        changes: the IssueChange queryset of the feed
+        cursor: the cursor returned by the previous read
+        limit: the number of changes read at most
+    Returns:
+        tuple: the ids of the changed issues, the cursor of the last change read, and whether more changes follow
+    Raises:
+        IssueChangeCursorExpired: the changes after the cursor were purged
+    """
+    changes = changes.filter(transaction_id__lt=ended_transactions())
+    horizon = get_issue_changes_horizon()
+
+    if cursor is None:
+        latest = changes.order_by("-transaction_id", "-id").values_list("transaction_id", "id").first()
+        transaction_id, change_id = latest or (horizon, 0)
+        return [], f"{transaction_id}:{change_id}", False
+
+    transaction_id, change_id = parse_issue_change_cursor(cursor)
+    if transaction_id < horizon:
+        raise IssueChangeCursorExpired(f"Changes before transaction {horizon} were purged")
+    rows = list(
+        changes.filter(
+            Q(transaction_id__gt=transaction_id) | Q(transaction_id=transaction_id, id__gt=change_id),
+            transaction_id__gte=transaction_id,
+        )
+        .order_by("transaction_id", "id")
+        .values_list("transaction_id", "id", "issue_id")[: limit + 1]
+    )
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    if rows:
+        transaction_id, change_id, _ = rows[-1]
+
+    # An issue changed several times is read once
+    issue_ids = list(dict.fromkeys(str(issue_id) for _, _, issue_id in rows))
+    return issue_ids, f"{transaction_id}:{change_id}", has_more
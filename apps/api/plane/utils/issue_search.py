@@ -1,20 +1,14 @@
-# Python imports
-import re
-
-# Django imports
-from django.db.models import Q
-
 # Module imports
+from plane.utils.search_backend import get_search_backend, issue_name_search_vector
 
 
 def search_issues(query, queryset):
     fields = ["name", "sequence_id", "project__identifier"]
-    q = Q()
-    for field in fields:
-        if field == "sequence_id" and len(query) <= 20:
-            sequences = re.findall(r"\b\d+\b", query)
-            for sequence_id in sequences:
-                q |= Q(**{"sequence_id": sequence_id})
-        else:
-            q |= Q(**{f"{field}__icontains": query})
-    return queryset.filter(q).distinct()
+    if len(query) > 20:
+        fields.remove("sequence_id")
+    return (
+        get_search_backend()
+        .search(queryset, query, fields, document=issue_name_search_vector())
+        .order_by("-search_rank", "-created_at")
+        .distinct()
+    )
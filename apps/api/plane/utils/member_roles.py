@@ -0,0 +1,136 @@
+# Python imports
+import json
+
+# Django imports
+from django.conf import settings
+from django.db import transaction
+
+# Module imports
+from plane.settings.redis import redis_instance, redis_pipeline
+
+# Bumped when a membership of the workspace changes, roles cached for an older version are never read again
+MEMBER_ROLES_VERSION_KEY = "member_roles:version:{slug}"
+MEMBER_ROLES_KEY = "member_roles:{version}:{user_id}:{slug}:{scope}"
+
+# Fields of the memberships the roles are read from, besides the member and the workspace or project
+MEMBER_ROLE_FIELDS = {"role", "is_active", "deleted_at"}
+
+_UNSET = object()
+
+
+def bump_member_roles_version(workspace_ids):
+    """Invalidate the cached roles of the members of the workspaces once the current transaction commits"""
+    if not settings.MEMBER_ROLES_CACHE_TTL:
+        return
+    workspace_ids = {str(workspace_id) for workspace_id in workspace_ids if workspace_id}
+    if not workspace_ids:
+        return
+
+    def bump():
+        from plane.db.models import Workspace
+
+        slugs = Workspace.all_objects.filter(pk__in=workspace_ids).values_list("slug", flat=True)
+        with redis_pipeline() as pipeline:
+            for slug in slugs:
+                pipeline.incr(MEMBER_ROLES_VERSION_KEY.format(slug=slug))
+
+    transaction.on_commit(bump)
+
+
+def invalidate_member_roles(instance, created=False):
+    """Invalidate the cached roles of the workspace of a membership created, deleted or saved with new roles"""
+    if created or not MEMBER_ROLE_FIELDS.isdisjoint(getattr(instance, "_changes_on_save", MEMBER_ROLE_FIELDS)):
+        bump_member_roles_version([instance.workspace_id])
+
+
+class MemberRoles:
+    """
+    Active roles of a user in a workspace and in the projects of the workspace.
+    Each is loaded on first use with one query, and cached in redis when MEMBER_ROLES_CACHE_TTL is set.
+    """
+
+    def __init__(self, user_id, slug):
+        self.user_id = user_id
+        self.slug = slug
+        self._workspace_role = _UNSET
+        self._project_roles = None
+        self._identifier_roles = None
+
+    @property
+    def workspace_role(self):
+        if self._workspace_role is _UNSET:
+            self._workspace_role = self._cached("workspace", self._load_workspace_role)
+        return self._workspace_role
+
+    @property
+    def project_roles(self):
+        """Role of the user by project id"""
+        if self._project_roles is None:
+            self._set_project_roles()
+        return self._project_roles
+
+    def project_role(self, project_id):
+        return self.project_roles.get(str(project_id))
+
+    def project_role_by_identifier(self, identifier):
+        if self._identifier_roles is None:
+            self._set_project_roles()
+        return self._identifier_roles.get(identifier)
+
+    def _set_project_roles(self):
+        memberships = self._cached("projects", self._load_project_memberships)
+        self._project_roles = {project_id: role for project_id, _, role in memberships}
+        self._identifier_roles = {identifier: role for _, identifier, role in memberships}
+
+    def _load_workspace_role(self):
+        from plane.db.models import WorkspaceMember
+
+        if self.user_id is None:
+            return None
+        return (
+            WorkspaceMember.objects.filter(member_id=self.user_id, workspace__slug=self.slug, is_active=True)
+            .values_list("role", flat=True)
+            .first()
+        )
+
+    def _load_project_memberships(self):
+        from plane.db.models import ProjectMember
+
+        if self.user_id is None:
+            return []
+        return [
+            (str(project_id), identifier, role)
+            for project_id, identifier, role in ProjectMember.objects.filter(
+                member_id=self.user_id, workspace__slug=self.slug, is_active=True
+            ).values_list("project_id", "project__identifier", "role")
+        ]
+
+    def _cached(self, scope, load):
+        ttl = settings.MEMBER_ROLES_CACHE_TTL
+        if not ttl or self.user_id is None:
+            return load()
+
+        ri = redis_instance()
+        version = int(ri.get(MEMBER_ROLES_VERSION_KEY.format(slug=self.slug)) or 0)
+        key = MEMBER_ROLES_KEY.format(version=version, user_id=self.user_id, slug=self.slug, scope=scope)
+        cached = ri.get(key)
+        if cached is not None:
+            return json.loads(cached)
+
+        value = load()
+        ri.set(key, json.dumps(value), ex=ttl)
+        return value
+
+
+def get_member_roles(request, slug):
+    """Roles of the request user in the workspace, shared by every permission check of the request"""
+    # DRF wraps the Django request, keep the roles on the wrapped one so that both see them
+    http_request = getattr(request, "_request", request)
+    member_roles = getattr(http_request, "_member_roles", None)
+    if member_roles is None:
+        member_roles = http_request._member_roles = {}
+
+    user_id = request.user.id if request.user.is_authenticated else None
+    if (user_id, slug) not in member_roles:
+        member_roles[(user_id, slug)] = MemberRoles(user_id, slug)
+    return member_roles[(user_id, slug)]
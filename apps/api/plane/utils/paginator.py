@@ -1,11 +1,35 @@
 # Python imports
+import base64
+import datetime
+import decimal
+import hashlib
+import json
 import math
+import uuid
 from collections import defaultdict
 from collections.abc import Sequence
+from functools import reduce
+from operator import or_
 
 # Django imports
-from django.db.models import Count, F, Window
-from django.db.models.functions import RowNumber
+from django.core.cache import cache
+from django.core.exceptions import EmptyResultSet
+from django.db.models import (
+    Case,
+    Count,
+    Exists,
+    ExpressionWrapper,
+    F,
+    IntegerField,
+    Max,
+    OuterRef,
+    Q,
+    Sum,
+    Value,
+    When,
+    Window,
+)
+from django.db.models.functions import DenseRank, RowNumber
 
 # Third party imports
 from rest_framework.exceptions import ParseError
@@ -54,16 +78,75 @@ class Cursor:
             raise ValueError(f"Invalid cursor format: {e}")
 
 
+class KeysetCursor(Cursor):
+    """
+    Cursor for keyset (seek) pagination.
+
+    The value holds the ordering key of the row the page boundary sits on, as a
+    list of `(order_by field, created_at, id)` values. Grouped paginators store a
+    list of `[group values, key values]` entries instead, one per group that
+    still has results. The cursor is serialized as url safe base64 encoded JSON.
+    """
+
+    def __init__(self, value=None, offset=0, is_prev=False, has_results=None):
+        super().__init__(value, offset, is_prev, has_results)
+
+    # Return the cursor value in string format
+    def __str__(self):
+        payload = json.dumps(
+            {"v": self.value, "p": int(self.is_prev)},
+            default=self._encode_value,
+            separators=(",", ":"),
+        )
+        return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+    # Return the representation of the cursor
+    def __repr__(self):
+        return f"{(type(self).__name__,)}: value={self.value} is_prev={int(self.is_prev)}"
+
+    @staticmethod
+    def _encode_value(value):
+        # Keep the full precision of timestamps as the values are compared again
+        if isinstance(value, (datetime.datetime, datetime.date, datetime.time)):
+            return value.isoformat()
+        if isinstance(value, (uuid.UUID, decimal.Decimal)):
+            return str(value)
+        raise TypeError(f"Object of type {type(value).__name__} is not cursor serializable")
+
+    @classmethod
+    def from_string(cls, value):
+        """Return the cursor value from string format"""
+        # The offset cursor of the first page is the default cursor for
+        # all the clients so treat it as the start of the keyset
+        bits = value.split(":")
+        if len(bits) == 3:
+            if bits[1] != "0" or bits[2] != "0":
+                raise ValueError("Offset cursors cannot be used with keyset pagination")
+            return cls()
+
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(value + "=" * (-len(value) % 4)))
+            if not isinstance(payload, dict) or not isinstance(payload.get("v"), (list, type(None))):
+                raise ValueError("Cursor payload is malformed")
+            return cls(payload["v"], 0, bool(payload.get("p", 0)))
+        except (TypeError, ValueError, KeyError, json.JSONDecodeError) as e:
+            raise ValueError(f"Invalid cursor format: {e}")
+
+
 class CursorResult(Sequence):
-    def __init__(self, results, next, prev, hits=None, max_hits=None):
+    def __init__(self, results, next, prev, hits=None, max_hits=None, count=None):
         self.results = results
         self.next = next
         self.prev = prev
         self.hits = hits
         self.max_hits = max_hits
+        # Known page length, saves evaluating the results again
+        self.count = count
 
     def __len__(self):
         # Return the length of the results
+        if self.count is not None:
+            return self.count
         return len(self.results)
 
     def __iter__(self):
@@ -81,6 +164,9 @@ class CursorResult(Sequence):
 
 MAX_LIMIT = 1000
 
+# Seconds the total count of a keyset paginated listing is reused across pages
+KEYSET_COUNT_CACHE_TIMEOUT = 300
+
 
 class BadPaginationError(Exception):
     pass
@@ -102,6 +188,7 @@ class OffsetPaginator:
         max_offset=None,
         on_results=None,
         total_count_queryset=None,
+        include_count=True,
     ):
         # Key tuple and remove `-` if descending order by
         self.key = (
@@ -116,6 +203,115 @@ class OffsetPaginator:
         self.max_offset = max_offset
         self.on_results = on_results
         self.total_count_queryset = total_count_queryset
+        # Only used by keyset pagination, offset pages always count
+        self.include_count = include_count
+
+    def get_keyset_fields(self):
+        # The ordering tuple as (field, descending) - created_at and id break ties
+        fields = []
+        if self.key:
+            fields.append((self.key[0], self.desc))
+        if not self.key or self.key[0] != "created_at":
+            fields.append(("created_at", True))
+        fields.append(("id", True))
+        return fields
+
+    def get_keyset_ordering(self, reverse=False):
+        # Nulls always sort last in the forward direction
+        nulls = {"nulls_first": True} if reverse else {"nulls_last": True}
+        return [
+            F(field).desc(**nulls) if desc != reverse else F(field).asc(**nulls)
+            for field, desc in self.get_keyset_fields()
+        ]
+
+    def get_keyset_filter(self, values, reverse=False):
+        # Build `(a, b, c) > (x, y, z)` as a disjunction so that mixed
+        # directions and nullable order by fields are supported
+        fields = self.get_keyset_fields()
+        if len(values) != len(fields):
+            raise BadPaginationError("Cursor does not match the ordering")
+
+        clauses = []
+        equal = Q()
+        for (field, desc), value in zip(fields, values):
+            if value is None:
+                # Nulls are at the end, nothing follows them in this field
+                if reverse:
+                    clauses.append(equal & Q(**{f"{field}__isnull": False}))
+                equal &= Q(**{f"{field}__isnull": True})
+                continue
+
+            lookup = "gt" if desc == reverse else "lt"
+            seek = Q(**{f"{field}__{lookup}": value})
+            if not reverse:
+                seek |= Q(**{f"{field}__isnull": True})
+            clauses.append(equal & seek)
+            equal &= Q(**{field: value})
+
+        if not clauses:
+            raise BadPaginationError("Cursor is already at the end of the results")
+        return reduce(or_, clauses)
+
+    def get_cached_count(self, name, queryset, compute, cached=False):
+        # Reuse the counts computed on the first page for the following pages
+        try:
+            query = str(queryset.query)
+        except EmptyResultSet:
+            return 0
+
+        cache_key = f"paginator:{name}:{hashlib.sha256(query.encode()).hexdigest()}"
+        if cached:
+            count = cache.get(cache_key)
+            if count is not None:
+                return count
+
+        count = compute(queryset)
+        cache.set(cache_key, count, timeout=KEYSET_COUNT_CACHE_TIMEOUT)
+        return count
+
+    def get_keyset_result(self, limit, cursor):
+        fields = [field for field, _ in self.get_keyset_fields()]
+        queryset = self.queryset.order_by(*self.get_keyset_ordering(reverse=cursor.is_prev))
+        if cursor.value:
+            queryset = queryset.filter(self.get_keyset_filter(cursor.value, reverse=cursor.is_prev))
+
+        # Fetch only the keys for one extra row to know if there is a next page
+        keys = [list(row) for row in queryset.values_list(*fields)[: limit + 1]]
+        has_more = len(keys) > limit
+        keys = keys[:limit]
+        if cursor.is_prev:
+            keys.reverse()
+
+        # Load the page rows by primary key in the forward order
+        results = self.queryset.filter(pk__in=[key[-1] for key in keys]).order_by(*self.get_keyset_ordering())
+
+        if cursor.is_prev:
+            next_cursor = KeysetCursor(keys[-1] if keys else cursor.value, 0, False, True)
+            prev_cursor = KeysetCursor(keys[0] if keys else None, 0, True, has_more)
+        else:
+            next_cursor = KeysetCursor(keys[-1] if keys else None, 0, False, has_more)
+            prev_cursor = KeysetCursor(keys[0] if keys else cursor.value, 0, True, bool(cursor.value))
+
+        if self.on_results:
+            results = self.on_results(results)
+
+        count = max_hits = None
+        if self.include_count:
+            count = self.get_cached_count(
+                "count",
+                self.total_count_queryset if self.total_count_queryset is not None else self.queryset,
+                lambda queryset: queryset.count(),
+                cached=bool(cursor.value),
+            )
+            max_hits = math.ceil(count / limit)
+
+        return CursorResult(
+            results=results,
+            next=next_cursor,
+            prev=prev_cursor,
+            hits=count,
+            max_hits=max_hits,
+        )
 
     def get_result(self, limit=1000, cursor=None):
         # offset is page #
@@ -126,6 +322,9 @@ class OffsetPaginator:
         # Get the min from limit and max limit
         limit = min(limit, self.max_limit)
 
+        if isinstance(cursor, KeysetCursor):
+            return self.get_keyset_result(limit, cursor)
+
         # queryset
         queryset = self.queryset
         if self.key:
@@ -187,7 +386,259 @@ class OffsetPaginator:
         raise NotImplementedError
 
 
-class GroupedOffsetPaginator(OffsetPaginator):
+class WindowCombination(ExpressionWrapper):
+    """Arithmetic over window functions, which must stay out of the GROUP BY of aggregated querysets"""
+
+    def get_group_by_cols(self):
+        return [
+            column
+            for expression in self.expression.flatten()
+            if isinstance(expression, Window)
+            for column in expression.get_group_by_cols()
+        ]
+
+
+def windowed_distinct_count(field, partition_by, nullable=False):
+    """
+    COUNT(DISTINCT field) OVER (PARTITION BY ...), which postgres does not support.
+    The ascending and the descending dense rank of any row add up to the number
+    of distinct values in its partition plus one.
+    """
+    count = (
+        Window(DenseRank(), partition_by=partition_by, order_by=F(field).asc())
+        + Window(DenseRank(), partition_by=partition_by, order_by=F(field).desc())
+        - 1
+    )
+    if nullable:
+        # Nulls are ranked as one more distinct value
+        count -= Window(
+            Max(Case(When(**{f"{field}__isnull": True}, then=1), default=0)),
+            partition_by=partition_by,
+        )
+    return WindowCombination(count, output_field=IntegerField())
+
+
+class GroupedPaginatorMixin:
+    """
+    Pagination engine shared by the grouped paginators.
+
+    A single window query over the light columns of the queryset returns the
+    rows of the page for every group, the filtered total of every group and
+    sub group and the number of rows in each of them. The page rows are then
+    loaded by primary key so that the annotations of the queryset are only
+    computed for the page.
+
+    In keyset mode every group keeps its own position in the cursor, so a page
+    returns the next `limit` rows of each group that still has results.
+    Grouped keyset pages only move forward.
+    """
+
+    group_totals = None
+    page_keys = None
+
+    def get_group_by_field_names(self):
+        raise NotImplementedError
+
+    def get_group_ordering(self, keyset=False):
+        if keyset:
+            return self.get_keyset_ordering()
+        return (
+            (F(*self.key).desc(nulls_last=True) if self.desc else F(*self.key).asc(nulls_last=True)),
+            F("created_at").desc(),
+        )
+
+    def get_group_page_start(self, group_aliases, cursor):
+        # Number of rows of each group before the keyset cursor position
+        if not cursor.value:
+            return None
+
+        clauses = []
+        for entry in cursor.value:
+            if not isinstance(entry, list) or len(entry) != 2 or len(entry[0]) != len(group_aliases):
+                raise BadPaginationError("Cursor does not match the grouping")
+            group_values, key = entry
+            clauses.append(
+                Q(
+                    *[
+                        Q(**{f"{alias}__isnull": True}) if value is None else Q(**{alias: value})
+                        for alias, value in zip(group_aliases, group_values)
+                    ]
+                )
+                & self.get_keyset_filter(key)
+            )
+
+        # Groups missing from the cursor have no results left
+        return Window(
+            Sum(Case(When(reduce(or_, clauses), then=0), default=1)),
+            partition_by=[F(alias) for alias in group_aliases],
+        )
+
+    def load_group_page(self, limit=None, offset=0, cursor=None):
+        """Load the group totals and the page rows of every group in one query"""
+        group_by_field_names = self.get_group_by_field_names()
+        keyset = cursor is not None
+        fields = [field for field, _ in self.get_keyset_fields()] if keyset else []
+
+        # Alias the group values so that every window and filter reuses the
+        # joins of the group by fields instead of joining m2m relations again
+        group_aliases = [f"group_{index}" for index in range(len(group_by_field_names))]
+        queryset = self.queryset.annotate(
+            **{alias: F(field_name) for alias, field_name in zip(group_aliases, group_by_field_names)}
+        )
+
+        # Evaluate the count filter in a subquery so its joins cannot duplicate rows
+        if self.count_filter is None:
+            queryset = queryset.annotate(counted_id=F("id"))
+        else:
+            queryset = queryset.annotate(
+                counted_id=Case(
+                    When(
+                        Exists(self.queryset.model._base_manager.filter(self.count_filter, pk=OuterRef("pk"))),
+                        then=F("id"),
+                    ),
+                    default=None,
+                )
+            )
+
+        partitions = [[F(alias) for alias in group_aliases[: depth + 1]] for depth in range(len(group_aliases))]
+        queryset = queryset.annotate(
+            row_number=Window(
+                expression=RowNumber(),
+                partition_by=partitions[-1],
+                order_by=self.get_group_ordering(keyset=keyset),
+            ),
+            partition_results=Window(Count("id"), partition_by=partitions[-1]),
+            **{
+                f"total_{depth}": windowed_distinct_count("counted_id", partition, nullable=True)
+                for depth, partition in enumerate(partitions)
+            },
+        )
+
+        # Keyset pages start at a different row in every group
+        page_start = self.get_group_page_start(group_aliases, cursor) if keyset else None
+        queryset = queryset.annotate(page_start=Value(offset) if page_start is None else page_start)
+
+        # The first row of every group carries the totals even when the group has no rows in the page
+        page_filter = Q(row_number=1)
+        if limit is not None:
+            page_filter |= Q(row_number__gt=F("page_start"), row_number__lte=F("page_start") + limit)
+
+        totals = [{} for _ in group_aliases]
+        partition_results = {}
+        page_starts = {}
+        positions = {}
+        self.page_keys = set()
+
+        total_aliases = [f"total_{depth}" for depth in range(len(group_aliases))]
+        # Select every column once, the page query loses columns selected twice
+        columns = dict.fromkeys(
+            [*group_aliases, "id", "page_start", "row_number", "partition_results", *total_aliases, *fields]
+        )
+        for row in queryset.filter(page_filter).values(*columns):
+            groups = tuple(row[alias] for alias in group_aliases)
+            for depth, alias in enumerate(total_aliases):
+                totals[depth][tuple(str(group) for group in groups[: depth + 1])] = row[alias]
+            partition_results[groups] = row["partition_results"]
+            page_starts[groups] = row["page_start"]
+
+            page_row = row["row_number"] - row["page_start"]
+            if limit is not None and 0 < page_row <= limit:
+                self.page_keys.add((str(row["id"]), *[str(group) for group in groups]))
+                if page_row == limit:
+                    positions[groups] = [row[field] for field in fields]
+
+        self.group_totals = totals
+        return partition_results, page_starts, positions
+
+    def get_group_totals(self):
+        # The totals are loaded with the page, load them on their own otherwise
+        if self.group_totals is None:
+            self.load_group_page()
+        return self.group_totals
+
+    def is_page_row(self, result):
+        # Rows of m2m groups are loaded for all the groups of a page issue
+        if self.page_keys is None:
+            return True
+        return (
+            str(result["id"]),
+            *[str(result.get(field_name)) for field_name in self.get_group_by_field_names()],
+        ) in self.page_keys
+
+    def get_page_results(self, keyset=False):
+        return self.queryset.filter(pk__in={key[0] for key in self.page_keys}).order_by(
+            *self.get_group_ordering(keyset=keyset)
+        )
+
+    def get_grouped_offset_result(self, limit, cursor):
+        page = cursor.offset
+        offset = cursor.offset * cursor.value
+        page_size = cursor.value or limit
+
+        # Check if the offset is greater than the max offset
+        if self.max_offset is not None and offset >= self.max_offset:
+            raise BadPaginationError("Pagination offset too large")
+
+        # Check if the offset is less than 0
+        if offset < 0:
+            raise BadPaginationError("Pagination offset cannot be negative")
+
+        partition_results, _, _ = self.load_group_page(limit=page_size, offset=offset)
+
+        # Adjust cursors based on the grouped results for pagination
+        next_cursor = Cursor(
+            limit,
+            page + 1,
+            False,
+            any(count > offset + page_size for count in partition_results.values()),
+        )
+        # Add previous cursors
+        prev_cursor = Cursor(limit, page - 1, True, page > 0)
+
+        max_hits = 0
+        if self.page_keys:
+            max_hits = math.ceil(max(self.group_totals[0].values()) / limit)
+
+        return CursorResult(
+            results=self.get_page_results(),
+            next=next_cursor,
+            prev=prev_cursor,
+            hits=sum(partition_results.values()),
+            max_hits=max_hits,
+            count=len(self.page_keys),
+        )
+
+    def get_grouped_keyset_result(self, limit, cursor):
+        if cursor.is_prev:
+            raise BadPaginationError("Grouped keyset pagination cannot go backwards")
+
+        partition_results, page_starts, positions = self.load_group_page(limit=limit, cursor=cursor)
+
+        # The last row of a group is its next position when the group has more rows
+        next_value = [
+            [list(groups), key]
+            for groups, key in positions.items()
+            if partition_results[groups] > page_starts[groups] + limit
+        ]
+        next_cursor = KeysetCursor(next_value or None, 0, False, bool(next_value))
+        prev_cursor = KeysetCursor(None, 0, True, False)
+
+        count = max_hits = None
+        if self.include_count:
+            count = sum(partition_results.values())
+            max_hits = math.ceil(max(self.group_totals[0].values(), default=0) / limit)
+
+        return CursorResult(
+            results=self.get_page_results(keyset=True),
+            next=next_cursor,
+            prev=prev_cursor,
+            hits=count,
+            max_hits=max_hits,
+            count=len(self.page_keys),
+        )
+
+
+class GroupedOffsetPaginator(GroupedPaginatorMixin, OffsetPaginator):
     # Field mappers - list m2m fields here
     FIELD_MAPPER = {
         "labels__id": "label_ids",
@@ -216,6 +667,9 @@ class GroupedOffsetPaginator(OffsetPaginator):
         # to calculate the counts with the filters
         self.count_filter = count_filter
 
+    def get_group_by_field_names(self):
+        return [self.group_by_field_name]
+
     def get_result(self, limit=50, cursor=None):
         # offset is page #
         # value is page limit
@@ -224,87 +678,16 @@ class GroupedOffsetPaginator(OffsetPaginator):
 
         limit = min(limit, self.max_limit)
 
-        # Adjust the initial offset and stop based on the cursor and limit
-        queryset = self.queryset
-
-        page = cursor.offset
-        offset = cursor.offset * cursor.value
-        stop = offset + (cursor.value or limit) + 1
-
-        # Check if the offset is greater than the max offset
-        if self.max_offset is not None and offset >= self.max_offset:
-            raise BadPaginationError("Pagination offset too large")
-
-        # Check if the offset is less than 0
-        if offset < 0:
-            raise BadPaginationError("Pagination offset cannot be negative")
-
-        # Compute the results
-        results = {}
-        # Create window for all the groups
-        queryset = queryset.annotate(
-            row_number=Window(
-                expression=RowNumber(),
-                partition_by=[F(self.group_by_field_name)],
-                order_by=(
-                    (
-                        F(*self.key).desc(nulls_last=True)  # order by desc if desc is set
-                        if self.desc
-                        else F(*self.key).asc(nulls_last=True)  # Order by asc if set
-                    ),
-                    F("created_at").desc(),
-                ),
-            )
-        )
-        # Filter the results by row number
-        results = queryset.filter(row_number__gt=offset, row_number__lt=stop).order_by(
-            (F(*self.key).desc(nulls_last=True) if self.desc else F(*self.key).asc(nulls_last=True)),
-            F("created_at").desc(),
-        )
-
-        # Adjust cursors based on the grouped results for pagination
-        next_cursor = Cursor(limit, page + 1, False, queryset.filter(row_number__gte=stop).exists())
-
-        # Add previous cursors
-        prev_cursor = Cursor(limit, page - 1, True, page > 0)
+        if isinstance(cursor, KeysetCursor):
+            return self.get_grouped_keyset_result(limit, cursor)
 
-        # Count the queryset
-        count = queryset.count()
-
-        # Optionally, calculate the total count and max_hits if needed
-        # This might require adjustments based on specific use cases
-        if results:
-            max_hits = math.ceil(
-                queryset.values(self.group_by_field_name)
-                .annotate(count=Count("id", filter=self.count_filter, distinct=True))
-                .order_by("-count")[0]["count"]
-                / limit
-            )
-        else:
-            max_hits = 0
-        return CursorResult(
-            results=results,
-            next=next_cursor,
-            prev=prev_cursor,
-            hits=count,
-            max_hits=max_hits,
-        )
-
-    def __get_total_queryset(self):
-        # Get total items for each group
-        return (
-            self.queryset.values(self.group_by_field_name)
-            .annotate(count=Count("id", filter=self.count_filter, distinct=True))
-            .order_by()
-        )
+        return self.get_grouped_offset_result(limit, cursor)
 
     def __get_total_dict(self):
         # Convert the total into dictionary of keys as group name and value as the total
         total_group_dict = {}
-        for group in self.__get_total_queryset():
-            total_group_dict[str(group.get(self.group_by_field_name))] = total_group_dict.get(
-                str(group.get(self.group_by_field_name)), 0
-            ) + (1 if group.get("count") == 0 else group.get("count"))
+        for (group,), count in self.get_group_totals()[0].items():
+            total_group_dict[group] = total_group_dict.get(group, 0) + (1 if count == 0 else count)
         return total_group_dict
 
     def __get_field_dict(self):
@@ -372,6 +755,7 @@ class GroupedOffsetPaginator(OffsetPaginator):
 
     def process_results(self, results):
         # Process results
+        results = [result for result in results if self.is_page_row(result)]
         if results:
             if self.group_by_field_name in self.FIELD_MAPPER:
                 processed_results = self.__query_multi_grouper(results=results)
@@ -382,7 +766,7 @@ class GroupedOffsetPaginator(OffsetPaginator):
         return processed_results
 
 
-class SubGroupedOffsetPaginator(OffsetPaginator):
+class SubGroupedOffsetPaginator(GroupedPaginatorMixin, OffsetPaginator):
     # Field mappers this are the fields that are m2m
     FIELD_MAPPER = {
         "labels__id": "label_ids",
@@ -417,6 +801,9 @@ class SubGroupedOffsetPaginator(OffsetPaginator):
         # to be passed to calculate the counts with the filters
         self.count_filter = count_filter
 
+    def get_group_by_field_names(self):
+        return [self.group_by_field_name, self.sub_group_by_field_name]
+
     def get_result(self, limit=30, cursor=None):
         # offset is page #
         # value is page limit
@@ -426,118 +813,23 @@ class SubGroupedOffsetPaginator(OffsetPaginator):
         # get the minimum value
         limit = min(limit, self.max_limit)
 
-        # Adjust the initial offset and stop based on the cursor and limit
-        queryset = self.queryset
-
-        # the current page
-        page = cursor.offset
-
-        # the offset
-        offset = cursor.offset * cursor.value
-
-        # the stop
-        stop = offset + (cursor.value or limit) + 1
-
-        if self.max_offset is not None and offset >= self.max_offset:
-            raise BadPaginationError("Pagination offset too large")
-        if offset < 0:
-            raise BadPaginationError("Pagination offset cannot be negative")
+        if isinstance(cursor, KeysetCursor):
+            return self.get_grouped_keyset_result(limit, cursor)
 
-        # Compute the results
-        results = {}
-
-        # Create windows for group and sub group field name
-        queryset = queryset.annotate(
-            row_number=Window(
-                expression=RowNumber(),
-                partition_by=[
-                    F(self.group_by_field_name),
-                    F(self.sub_group_by_field_name),
-                ],
-                order_by=(
-                    (F(*self.key).desc(nulls_last=True) if self.desc else F(*self.key).asc(nulls_last=True)),
-                    "-created_at",
-                ),
-            )
-        )
-
-        # Filter the results
-        results = queryset.filter(row_number__gt=offset, row_number__lt=stop).order_by(
-            (F(*self.key).desc(nulls_last=True) if self.desc else F(*self.key).asc(nulls_last=True)),
-            F("created_at").desc(),
-        )
-
-        # Adjust cursors based on the grouped results for pagination
-        next_cursor = Cursor(limit, page + 1, False, queryset.filter(row_number__gte=stop).exists())
-
-        # Add previous cursors
-        prev_cursor = Cursor(limit, page - 1, True, page > 0)
-
-        # Count the queryset
-        count = queryset.count()
-
-        # Optionally, calculate the total count and max_hits if needed
-        # This might require adjustments based on specific use cases
-        if results:
-            max_hits = math.ceil(
-                queryset.values(self.group_by_field_name)
-                .annotate(count=Count("id", filter=self.count_filter, distinct=True))
-                .order_by("-count")[0]["count"]
-                / limit
-            )
-        else:
-            max_hits = 0
-        return CursorResult(
-            results=results,
-            next=next_cursor,
-            prev=prev_cursor,
-            hits=count,
-            max_hits=max_hits,
-        )
-
-    def __get_group_total_queryset(self):
-        # Get group totals
-        return (
-            self.queryset.order_by(self.group_by_field_name)
-            .values(self.group_by_field_name)
-            .annotate(count=Count("id", filter=self.count_filter, distinct=True))
-            .distinct()
-        )
-
-    def __get_subgroup_total_queryset(self):
-        # Get subgroup totals
-        return (
-            self.queryset.values(self.group_by_field_name, self.sub_group_by_field_name)
-            .annotate(count=Count("id", filter=self.count_filter, distinct=True))
-            .order_by()
-            .values(self.group_by_field_name, self.sub_group_by_field_name, "count")
-        )
+        return self.get_grouped_offset_result(limit, cursor)
 
     def __get_total_dict(self):
         # Use the above to convert to dictionary of 2D objects
         total_group_dict = {}
         total_sub_group_dict = {}
-        for group in self.__get_group_total_queryset():
-            total_group_dict[str(group.get(self.group_by_field_name))] = total_group_dict.get(
-                str(group.get(self.group_by_field_name)), 0
-            ) + (1 if group.get("count") == 0 else group.get("count"))
+        group_totals, sub_group_totals = self.get_group_totals()
+        for (group,), count in group_totals.items():
+            total_group_dict[group] = total_group_dict.get(group, 0) + (1 if count == 0 else count)
 
         # Sub group total values
-        for item in self.__get_subgroup_total_queryset():
-            group = str(item[self.group_by_field_name])
-            subgroup = str(item[self.sub_group_by_field_name])
-            count = item["count"]
-
-            # Create a dictionary of group and sub group
-            if group not in total_sub_group_dict:
-                total_sub_group_dict[str(group)] = {}
-
-            # Create a dictionary of sub group
-            if subgroup not in total_sub_group_dict[group]:
-                total_sub_group_dict[str(group)][str(subgroup)] = {}
-
+        for (group, subgroup), count in sub_group_totals.items():
             # Create a nested dictionary of group and sub group
-            total_sub_group_dict[group][subgroup] = count
+            total_sub_group_dict.setdefault(group, {})[subgroup] = count
 
         return total_group_dict, total_sub_group_dict
 
@@ -616,6 +908,7 @@ class SubGroupedOffsetPaginator(OffsetPaginator):
         return processed_results
 
     def process_results(self, results):
+        results = [result for result in results if self.is_page_row(result)]
         if results:
             if self.group_by_field_name in self.FIELD_MAPPER or self.sub_group_by_field_name in self.FIELD_MAPPER:
                 # if the grouping is done through m2m then
@@ -634,6 +927,9 @@ class BasePaginator:
     # cursor query parameter name
     cursor_name = "cursor"
 
+    # pagination mode query parameter name, `?pagination=keyset` opts in to keyset pagination
+    pagination_mode_name = "pagination"
+
     # get the per page parameter from request
     def get_per_page(self, request, default_per_page=1000, max_per_page=1000):
         try:
@@ -647,6 +943,10 @@ class BasePaginator:
 
         return per_page
 
+    # check if the client asked for keyset pagination
+    def is_keyset_pagination(self, request):
+        return request.GET.get(self.pagination_mode_name) == "keyset"
+
     def paginate(
         self,
         request,
@@ -664,10 +964,17 @@ class BasePaginator:
         sub_group_by_fields=None,
         count_filter=None,
         total_count_queryset=None,
+        allow_keyset=False,
         **paginator_kwargs,
     ):
         """Paginate the request"""
         per_page = self.get_per_page(request, default_per_page, max_per_page)
+
+        # Keyset pagination is opted in by both the view and the client
+        if allow_keyset and self.is_keyset_pagination(request):
+            cursor_cls = KeysetCursor
+            paginator_kwargs["include_count"] = request.GET.get("count", "true") != "false"
+
         # Convert the cursor value to integer and float from string
         input_cursor = None
         try:
@@ -1,4 +1,5 @@
-from plane.db.models import ProjectMember, Page
+from plane.db.models import Page
+from plane.utils.member_roles import get_member_roles
 from plane.app.permissions import ROLE
 
 
@@ -52,16 +53,7 @@ class ProjectPagePermission(BasePermission):
         """
         Check if the user is a project member.
         """
-        return (
-            ProjectMember.objects.filter(
-                member=request.user,
-                workspace__slug=slug,
-                is_active=True,
-                project_id=project_id,
-            )
-            .values_list("role", flat=True)
-            .first()
-        )
+        return get_member_roles(request, slug).project_role(project_id)
 
     def _check_access_and_get_role(self, request, slug, project_id):
         """
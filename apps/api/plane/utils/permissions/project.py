@@ -2,8 +2,8 @@
 from rest_framework.permissions import SAFE_METHODS, BasePermission
 
 # Module import
-from plane.db.models import ProjectMember, WorkspaceMember
 from plane.db.models.project import ROLE
+from plane.utils.member_roles import get_member_roles
 
 
 class ProjectBasePermission(BasePermission):
@@ -11,42 +11,24 @@ class ProjectBasePermission(BasePermission):
         if request.user.is_anonymous:
             return False
 
+        member_roles = get_member_roles(request, view.workspace_slug)
+
         ## Safe Methods -> Handle the filtering logic in queryset
         if request.method in SAFE_METHODS:
-            return WorkspaceMember.objects.filter(
-                workspace__slug=view.workspace_slug, member=request.user, is_active=True
-            ).exists()
+            return member_roles.workspace_role is not None
 
         ## Only workspace owners or admins can create the projects
         if request.method == "POST":
-            return WorkspaceMember.objects.filter(
-                workspace__slug=view.workspace_slug,
-                member=request.user,
-                role__in=[ROLE.ADMIN.value, ROLE.MEMBER.value],
-                is_active=True,
-            ).exists()
-
-        project_member_qs = ProjectMember.objects.filter(
-            workspace__slug=view.workspace_slug,
-            member=request.user,
-            project_id=view.project_id,
-            is_active=True,
-        )
+            return member_roles.workspace_role in [ROLE.ADMIN.value, ROLE.MEMBER.value]
+
+        project_role = member_roles.project_role(view.project_id)
 
         ## Only project admins or workspace admin who is part of the project can access
 
-        if project_member_qs.filter(role=ROLE.ADMIN.value).exists():
+        if project_role == ROLE.ADMIN.value:
             return True
         else:
-            return (
-                project_member_qs.exists()
-                and WorkspaceMember.objects.filter(
-                    member=request.user,
-                    workspace__slug=view.workspace_slug,
-                    role=ROLE.ADMIN.value,
-                    is_active=True,
-                ).exists()
-            )
+            return project_role is not None and member_roles.workspace_role == ROLE.ADMIN.value
 
 
 class ProjectMemberPermission(BasePermission):
@@ -54,28 +36,17 @@ class ProjectMemberPermission(BasePermission):
         if request.user.is_anonymous:
             return False
 
+        member_roles = get_member_roles(request, view.workspace_slug)
+
         ## Safe Methods -> Handle the filtering logic in queryset
         if request.method in SAFE_METHODS:
-            return ProjectMember.objects.filter(
-                workspace__slug=view.workspace_slug, member=request.user, is_active=True
-            ).exists()
+            return bool(member_roles.project_roles)
         ## Only workspace owners or admins can create the projects
         if request.method == "POST":
-            return WorkspaceMember.objects.filter(
-                workspace__slug=view.workspace_slug,
-                member=request.user,
-                role__in=[ROLE.ADMIN.value, ROLE.MEMBER.value],
-                is_active=True,
-            ).exists()
+            return member_roles.workspace_role in [ROLE.ADMIN.value, ROLE.MEMBER.value]
 
         ## Only Project Admins can update project attributes
-        return ProjectMember.objects.filter(
-            workspace__slug=view.workspace_slug,
-            member=request.user,
-            role__in=[ROLE.ADMIN.value, ROLE.MEMBER.value],
-            project_id=view.project_id,
-            is_active=True,
-        ).exists()
+        return member_roles.project_role(view.project_id) in [ROLE.ADMIN.value, ROLE.MEMBER.value]
 
 
 class ProjectEntityPermission(BasePermission):
@@ -83,33 +54,19 @@ class ProjectEntityPermission(BasePermission):
         if request.user.is_anonymous:
             return False
 
+        member_roles = get_member_roles(request, view.workspace_slug)
+
         # Handle requests based on project__identifier
         if hasattr(view, "project_identifier") and view.project_identifier:
             if request.method in SAFE_METHODS:
-                return ProjectMember.objects.filter(
-                    workspace__slug=view.workspace_slug,
-                    member=request.user,
-                    project__identifier=view.project_identifier,
-                    is_active=True,
-                ).exists()
+                return member_roles.project_role_by_identifier(view.project_identifier) is not None
 
         ## Safe Methods -> Handle the filtering logic in queryset
         if request.method in SAFE_METHODS:
-            return ProjectMember.objects.filter(
-                workspace__slug=view.workspace_slug,
-                member=request.user,
-                project_id=view.project_id,
-                is_active=True,
-            ).exists()
+            return member_roles.project_role(view.project_id) is not None
 
         ## Only project members or admins can create and edit the project attributes
-        return ProjectMember.objects.filter(
-            workspace__slug=view.workspace_slug,
-            member=request.user,
-            role__in=[ROLE.ADMIN.value, ROLE.MEMBER.value],
-            project_id=view.project_id,
-            is_active=True,
-        ).exists()
+        return member_roles.project_role(view.project_id) in [ROLE.ADMIN.value, ROLE.MEMBER.value]
 
 
 class ProjectAdminPermission(BasePermission):
@@ -117,13 +74,7 @@ class ProjectAdminPermission(BasePermission):
         if request.user.is_anonymous:
             return False
 
-        return ProjectMember.objects.filter(
-            workspace__slug=view.workspace_slug,
-            member=request.user,
-            role=ROLE.ADMIN.value,
-            project_id=view.project_id,
-            is_active=True,
-        ).exists()
+        return get_member_roles(request, view.workspace_slug).project_role(view.project_id) == ROLE.ADMIN.value
 
 
 class ProjectLitePermission(BasePermission):
@@ -131,9 +82,4 @@ class ProjectLitePermission(BasePermission):
         if request.user.is_anonymous:
             return False
 
-        return ProjectMember.objects.filter(
-            workspace__slug=view.workspace_slug,
-            member=request.user,
-            project_id=view.project_id,
-            is_active=True,
-        ).exists()
+        return get_member_roles(request, view.workspace_slug).project_role(view.project_id) is not None
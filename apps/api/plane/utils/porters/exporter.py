@@ -1,4 +1,4 @@
-from typing import Dict, List, Union
+from typing import IO, Dict, Iterator, List, Union
 from .formatters import BaseFormatter, CSVFormatter, JSONFormatter, XLSXFormatter
 
 
@@ -11,6 +11,10 @@ class DataExporter:
         exporter = DataExporter(BookSerializer, format_type='csv')
         filename, content = exporter.export('books_export', queryset)
 
+        # Streaming interface, for querysets too large to hold in memory
+        exporter = DataExporter(BookSerializer, format_type='csv')
+        exporter.write(queryset, stream, chunk_size=1000)
+
         # Legacy interface (still supported)
         exporter = DataExporter(BookSerializer)
         csv_string = exporter.to_string(queryset, CSVFormatter())
@@ -62,6 +66,36 @@ class DataExporter:
         )
         return serializer.data
 
+    def iter_rows(self, queryset, chunk_size: int = 1000) -> Iterator[Dict]:
+        """
+        QuerySet → dicts, fetched, prefetched and serialized one chunk at a time.
+        """
+        chunk = []
+        for instance in queryset.iterator(chunk_size=chunk_size):
+            chunk.append(instance)
+            if len(chunk) >= chunk_size:
+                yield from self.serialize(chunk)
+                chunk = []
+        if chunk:
+            yield from self.serialize(chunk)
+
+    def write(self, queryset, stream: IO[bytes], chunk_size: int = 1000) -> None:
+        """
+        Export queryset to a binary stream with configured format, without holding all of its rows in memory.
+
+        Args:
+            queryset: Django QuerySet to export
+            stream: Binary file-like object the formatted content is written to
+            chunk_size: Number of rows fetched and serialized at a time
+
+        Raises:
+            ValueError: If format_type was not provided during initialization
+        """
+        if not self.formatter:
+            raise ValueError("format_type must be provided during initialization to use write() method")
+
+        self.formatter.write(self.iter_rows(queryset, chunk_size=chunk_size), stream)
+
     def export(self, filename: str, queryset) -> tuple[str, Union[str, bytes]]:
         """
         Export queryset to file with configured format.
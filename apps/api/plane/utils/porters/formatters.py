@@ -8,18 +8,35 @@ Importer: File/String → Formatter → Serializer → Models
 import csv
 import json
 from abc import ABC, abstractmethod
-from io import BytesIO, StringIO
-from typing import Any, Dict, List, Union
+from contextlib import contextmanager
+from io import BytesIO, StringIO, TextIOWrapper
+from typing import IO, Any, Dict, Iterable, List, Union
 
 from openpyxl import Workbook, load_workbook
 
 
+@contextmanager
+def text_stream(stream: IO[bytes]):
+    """Write text to a binary stream, which is left open"""
+    text = TextIOWrapper(stream, encoding="utf-8", newline="")
+    try:
+        yield text
+    finally:
+        text.flush()
+        text.detach()
+
+
 class BaseFormatter(ABC):
     @abstractmethod
     def encode(self, data: List[Dict]) -> Union[str, bytes]:
         """Data → formatted string/bytes"""
         pass
 
+    def write(self, rows: Iterable[Dict], stream: IO[bytes]) -> None:
+        """Rows → formatted bytes written to the stream, the whole data held in memory by default"""
+        content = self.encode(list(rows))
+        stream.write(content.encode("utf-8") if isinstance(content, str) else content)
+
     @abstractmethod
     def decode(self, content: Union[str, bytes]) -> List[Dict]:
         """Formatted string/bytes → data"""
@@ -38,6 +55,23 @@ class JSONFormatter(BaseFormatter):
     def encode(self, data: List[Dict]) -> str:
         return json.dumps(data, indent=self.indent, default=str)
 
+    def write(self, rows: Iterable[Dict], stream: IO[bytes]) -> None:
+        """Write the array of the rows one row at a time, as encode() would"""
+        if self.indent is None:
+            opening, separator, closing, prefix = "[", ", ", "]", ""
+        else:
+            opening, separator, closing, prefix = "[\n", ",\n", "\n]", " " * self.indent
+
+        with text_stream(stream) as text:
+            empty = True
+            for row in rows:
+                text.write(opening if empty else separator)
+                item = json.dumps(row, indent=self.indent, default=str)
+                text.write("\n".join(prefix + line for line in item.split("\n")))
+                empty = False
+            # An empty array has no line breaks
+            text.write("[]" if empty else closing)
+
     def decode(self, content: str) -> List[Dict]:
         return json.loads(content)
 
@@ -132,6 +166,25 @@ class CSVFormatter(BaseFormatter):
 
         return output.getvalue()
 
+    def write(self, rows: Iterable[Dict], stream: IO[bytes]) -> None:
+        """
+        Write the rows one at a time, as encode() would for rows with the same fields.
+        The columns are the fields of the first row, the fields only found in later rows are left out.
+        """
+        with text_stream(stream) as text:
+            writer = csv.writer(text, delimiter=self.delimiter)
+            fieldnames = None
+            for row in rows:
+                if self.flatten:
+                    row = self._flatten(row)
+                if fieldnames is None:
+                    fieldnames = list(row.keys())
+                    if self.prettify_headers:
+                        writer.writerow([self._prettify_header(key) for key in fieldnames])
+                    else:
+                        writer.writerow(fieldnames)
+                writer.writerow([row.get(key, "") for key in fieldnames])
+
     def decode(self, content: str, normalize_headers: bool = True) -> List[Dict]:
         """
         Decode CSV content to list of dicts.
@@ -221,6 +274,23 @@ class XLSXFormatter(BaseFormatter):
         output.seek(0)
         return output.getvalue()
 
+    def write(self, rows: Iterable[Dict], stream: IO[bytes]) -> None:
+        """
+        Write the rows one at a time through a write-only workbook, which keeps them out of memory.
+        The columns are the fields of the first row, the fields only found in later rows are left out.
+        """
+        wb = Workbook(write_only=True)
+        ws = wb.create_sheet("Sheet")
+
+        fieldnames = None
+        for row in rows:
+            if fieldnames is None:
+                fieldnames = list(row.keys())
+                ws.append([self._prettify_header(key) for key in fieldnames] if self.prettify_headers else fieldnames)
+            ws.append([self._format_value(row.get(key, "")) for key in fieldnames])
+
+        wb.save(stream)
+
     def decode(self, content: bytes, normalize_headers: bool = True) -> List[Dict]:
         """
         Decode XLSX bytes to list of dicts.
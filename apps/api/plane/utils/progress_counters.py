@@ -0,0 +1,247 @@
+# Python imports
+import json
+import uuid
+
+# Django imports
+from django.db import connection, transaction
+from django.db.models import Count, F, Q, Sum
+from django.db.models.functions import TruncDate
+
+# Module imports
+from plane.db.models import Cycle, CycleIssue, CycleProgress, Issue, Module, ModuleIssue, ModuleProgress
+from plane.utils.analytics_rollup import NUMERIC_ESTIMATE
+from plane.utils.uuid import convert_uuid_to_integer
+
+STATE_GROUPS = ["backlog", "unstarted", "started", "completed", "cancelled"]
+
+# Issue updates that change the counters of the cycles and modules of the issue, by the fields they change
+PROGRESS_EVENTS = {"issue.activity.updated", "issue_draft.activity.updated"}
+PROGRESS_FIELDS = {"state_id", "state", "estimate_point", "archived_at", "closed_to", "is_draft"}
+
+# Cycles or modules recounted together by reconcile_progress_counters
+RECONCILE_BATCH_SIZE = 500
+
+# Progress model, its container field and the issue lookup of the container, by container model
+PROGRESS_MODELS = {
+    Cycle: (CycleProgress, "cycle", {"issue_cycle__deleted_at__isnull": True}, "issue_cycle__cycle_id"),
+    Module: (ModuleProgress, "module", {"issue_module__deleted_at__isnull": True}, "issue_module__module_id"),
+}
+
+
+def get_empty_counters():
+    return {
+        "total_issues": 0,
+        "issues": {group: 0 for group in STATE_GROUPS},
+        "estimate_points": {group: 0 for group in STATE_GROUPS},
+        "completed": {},
+    }
+
+
+def compute_progress_counters(model, container_ids):
+    """
+    Count the issues of the cycles or modules from scratch.
+    Returns:
+        dict: Counters by container id, with the total issue count, the issue counts and the points of the
+        estimates of type points by state group, and the number and estimate points of the issues completed by day
+    """
+    _, _, relation_filter, container_field = PROGRESS_MODELS[model]
+    counters = {str(container_id): get_empty_counters() for container_id in container_ids}
+    if not counters:
+        return counters
+
+    issues = Issue.issue_objects.filter(**{f"{container_field}__in": list(counters)}, **relation_filter)
+    by_state_group = issues.values(container_field, "state__group").annotate(
+        issue_count=Count("id"),
+        estimate_points=Sum(NUMERIC_ESTIMATE, filter=Q(estimate_point__estimate__type="points")),
+    )
+    for row in by_state_group.order_by():
+        container = counters[str(row[container_field])]
+        # Issues without a state only count in the total
+        container["total_issues"] += row["issue_count"]
+        if row["state__group"] in container["issues"]:
+            container["issues"][row["state__group"]] = row["issue_count"]
+            container["estimate_points"][row["state__group"]] = row["estimate_points"] or 0
+
+    completed = (
+        issues.filter(completed_at__isnull=False)
+        .annotate(completed_date=TruncDate("completed_at"))
+        .values(container_field, "completed_date")
+        .annotate(
+            issue_count=Count("id"),
+            estimate_points=Sum(NUMERIC_ESTIMATE, filter=Q(estimate_point__estimate__type="points")),
+        )
+    )
+    for row in completed.order_by(container_field, "completed_date"):
+        counters[str(row[container_field])]["completed"][row["completed_date"].isoformat()] = {
+            "issues": row["issue_count"],
+            "estimate_points": row["estimate_points"] or 0,
+        }
+    return counters
+
+
+def lock_progress(container_ids):
+    """Serialize the refreshes of the counters of the containers until the end of the transaction"""
+    with connection.cursor() as cursor:
+        for container_id in sorted(str(container_id) for container_id in container_ids):
+            lock_key = convert_uuid_to_integer(uuid.uuid5(uuid.NAMESPACE_OID, f"progress:{container_id}"))
+            cursor.execute("SELECT pg_advisory_xact_lock(%s)", [lock_key])
+
+
+def refresh_progress_counters(model, container_ids):
+    """
+    Recount and store the counters of the cycles or modules.
+    Returns:
+        dict: The stored counters by container id
+    """
+    progress_model, container_name, _, _ = PROGRESS_MODELS[model]
+    with transaction.atomic():
+        # Counted once the previous refresh is stored, so that the latest stored counters are the latest counted
+        lock_progress(container_ids)
+        containers = model.all_objects.filter(pk__in=container_ids).values_list("id", "project_id", "workspace_id")
+        counters = compute_progress_counters(model, [container_id for container_id, _, _ in containers])
+        progress_model.all_objects.bulk_create(
+            [
+                progress_model(
+                    **{f"{container_name}_id": container_id},
+                    project_id=project_id,
+                    workspace_id=workspace_id,
+                    counters=counters[str(container_id)],
+                )
+                for container_id, project_id, workspace_id in containers
+            ],
+            update_conflicts=True,
+            unique_fields=[container_name],
+            update_fields=["counters", "updated_at"],
+        )
+    return counters
+
+
+def get_progress_counters(container):
+    """Return the counters of a cycle or module, counted and stored on the first read"""
+    progress_model, container_name, _, _ = PROGRESS_MODELS[type(container)]
+    progress = progress_model.all_objects.filter(**{container_name: container}).values_list("counters", flat=True)
+    counters = progress.first()
+    if counters is None:
+        counters = refresh_progress_counters(type(container), [container.id])[str(container.id)]
+    return counters
+
+
+def reconcile_progress_counters(project_ids=None, fix=True):
+    """
+    Compare the stored counters of the cycles and modules with a recount of their issues, catching up on the
+    changes that do not go through the issue activity. The recounts that differ are stored when fix is set.
+    Returns:
+        list: the container name and id of the cycles and modules whose counters differ
+    """
+    mismatches = []
+    for model, (progress_model, container_name, _, _) in PROGRESS_MODELS.items():
+        progress = progress_model.all_objects.all()
+        if project_ids:
+            progress = progress.filter(project_id__in=project_ids)
+        stored = {
+            str(container_id): counters
+            for container_id, counters in progress.values_list(f"{container_name}_id", "counters")
+        }
+
+        container_ids = list(stored)
+        for start in range(0, len(container_ids), RECONCILE_BATCH_SIZE):
+            batch = container_ids[start : start + RECONCILE_BATCH_SIZE]
+            changed = [
+                container_id
+                for container_id, counters in compute_progress_counters(model, batch).items()
+                if counters != stored[container_id]
+            ]
+            if fix and changed:
+                refresh_progress_counters(model, changed)
+            mismatches.extend((container_name, container_id) for container_id in changed)
+    return mismatches
+
+
+def get_issue_containers(issue_ids):
+    """Return the ids of the cycles and modules the issues are in"""
+    cycle_ids = CycleIssue.objects.filter(issue_id__in=issue_ids).values_list("cycle_id", flat=True)
+    module_ids = ModuleIssue.objects.filter(issue_id__in=issue_ids).values_list("module_id", flat=True)
+    return {str(cycle_id) for cycle_id in cycle_ids}, {str(module_id) for module_id in module_ids}
+
+
+def refresh_containers_progress(cycle_ids, module_ids):
+    """Recount the cycles and modules, after a change of their issues in bulk that sends no issue activity"""
+    if cycle_ids:
+        refresh_progress_counters(Cycle, cycle_ids)
+    if module_ids:
+        refresh_progress_counters(Module, module_ids)
+
+
+def _load(data):
+    if isinstance(data, str):
+        try:
+            return json.loads(data)
+        except ValueError:
+            return None
+    return data
+
+
+def _named_containers(container_name, requested_data, current_instance):
+    """Return the ids of the containers a cycle or module event adds the issues to or removes them from"""
+    container_ids = set()
+    if requested_data.get(f"{container_name}_id"):
+        container_ids.add(str(requested_data[f"{container_name}_id"]))
+    # Issues moved from another container keep their membership, the previous container is only in the event
+    for moved in current_instance.get(f"updated_{container_name}_issues") or []:
+        container_ids.update(
+            str(moved[key]) for key in [f"old_{container_name}_id", f"new_{container_name}_id"] if moved.get(key)
+        )
+    # Memberships created by the bulk endpoints, serialized by django
+    created = _load(current_instance.get(f"created_{container_name}_issues"))
+    for record in created if isinstance(created, list) else []:
+        if record.get("fields", {}).get(container_name):
+            container_ids.add(str(record["fields"][container_name]))
+    return container_ids
+
+
+def get_changed_containers(events):
+    """
+    Return the ids of the cycles and modules whose counters the issue activity events change: the old and
+    the new containers of the cycle and module events, the containers of the issues whose state, estimate,
+    archive or draft changed, and for the deleted issues the containers they were in when deleted.
+    """
+    issue_ids, deleted_issue_ids, cycle_ids, module_ids = set(), set(), set(), set()
+    for event in events:
+        requested_data = _load(event.get("requested_data"))
+        current_instance = _load(event.get("current_instance"))
+        if not isinstance(requested_data, dict):
+            requested_data = {}
+        if not isinstance(current_instance, dict):
+            current_instance = {}
+
+        if event["type"].startswith("cycle.activity."):
+            cycle_ids.update(_named_containers("cycle", requested_data, current_instance))
+        elif event["type"].startswith("module.activity."):
+            module_ids.update(_named_containers("module", requested_data, current_instance))
+        elif not event.get("issue_id"):
+            continue
+        elif event["type"] == "issue.activity.deleted":
+            deleted_issue_ids.add(str(event["issue_id"]))
+        elif event["type"] in PROGRESS_EVENTS and not PROGRESS_FIELDS.isdisjoint(requested_data):
+            issue_ids.add(str(event["issue_id"]))
+
+    if issue_ids:
+        issue_cycle_ids, issue_module_ids = get_issue_containers(issue_ids)
+        cycle_ids.update(issue_cycle_ids)
+        module_ids.update(issue_module_ids)
+    if deleted_issue_ids:
+        # The memberships of a deleted issue are soft deleted along with it, possibly before the event
+        deleted_with_issue = Q(deleted_at__isnull=True) | Q(deleted_at__gte=F("issue__deleted_at"))
+        cycle_ids.update(
+            str(cycle_id)
+            for cycle_id in CycleIssue.all_objects.filter(
+                deleted_with_issue, issue_id__in=deleted_issue_ids
+            ).values_list("cycle_id", flat=True)
+        )
+        module_ids.update(
+            str(module_id)
+            for module_id in ModuleIssue.all_objects.filter(
+                deleted_with_issue, issue_id__in=deleted_issue_ids
+            ).values_list("module_id", flat=True)
+        )
+    return cycle_ids, module_ids
@@ -0,0 +1,92 @@
+# Python imports
+import json
+import uuid
+from datetime import datetime, timezone
+
+# Module imports
+from plane.settings.redis import redis_instance
+
+# Latest visits of a user in a workspace, scored by the time of the visit
+RECENT_VISITS_KEY = "recent_visits:{slug}:{user_id}"
+# Keys of the sorted sets visited since the last flush
+RECENT_VISITS_DIRTY_KEY = "recent_visits:dirty"
+RECENT_VISITS_LIMIT = 20
+# Idle sorted sets expire, they are seeded again from the flushed visits on the next visit
+RECENT_VISITS_TTL = 30 * 24 * 60 * 60
+
+
+def get_recent_visits_key(slug, user_id):
+    return RECENT_VISITS_KEY.format(slug=slug, user_id=user_id)
+
+
+def parse_recent_visits_key(key):
+    """Return the workspace slug and the user id of a sorted set key"""
+    _, slug, user_id = key.rsplit(":", 2)
+    return slug, user_id
+
+
+def get_recent_visit_member(entity_name, entity_identifier, project_id):
+    """Sorted set member of a visit, the same for every visit of an entity"""
+    return json.dumps(
+        {
+            "entity_name": entity_name,
+            "entity_identifier": str(entity_identifier) if entity_identifier else None,
+            "project_id": str(project_id) if project_id else None,
+        },
+        sort_keys=True,
+    )
+
+
+def get_recent_visit_id(key, member):
+    """Stable id of a visit, shared by the entry served from redis and the row it is flushed to"""
+    return uuid.uuid5(uuid.NAMESPACE_URL, f"{key}:{member}")
+
+
+def record_recent_visit(slug, user_id, entity_name, entity_identifier, project_id, visited_at, seed=None):
+    """
+    Add the visit to the sorted set of the user, keeping the latest RECENT_VISITS_LIMIT visits.
+    Returns False without recording it when the sorted set does not exist and seed is None, so that the
+    caller seeds it with the visits stored in the database and records the visit again.
+    Args:
+        seed: The (entity_name, entity_identifier, project_id, visited_at) of the stored visits
+    """
+    key = get_recent_visits_key(slug, user_id)
+    ri = redis_instance()
+    if seed is None and not ri.exists(key):
+        return False
+
+    visits = {get_recent_visit_member(*visit[:3]): visit[3].timestamp() for visit in seed or []}
+    visits[get_recent_visit_member(entity_name, entity_identifier, project_id)] = visited_at.timestamp()
+
+    pipeline = ri.pipeline()
+    pipeline.zadd(key, visits)
+    pipeline.zremrangebyrank(key, 0, -RECENT_VISITS_LIMIT - 1)
+    pipeline.expire(key, RECENT_VISITS_TTL)
+    pipeline.sadd(RECENT_VISITS_DIRTY_KEY, key)
+    pipeline.execute()
+    return True
+
+
+def get_recent_visits(slug, user_id):
+    """
+    Return the visits of the user, latest first, or None when they are not cached.
+    Returns:
+        list: Dicts with the id, entity_name, entity_identifier, project_id and visited_at of every visit
+    """
+    key = get_recent_visits_key(slug, user_id)
+    members = redis_instance().zrevrange(key, 0, -1, withscores=True)
+    if not members:
+        return None
+    return [
+        {
+            **json.loads(member),
+            "id": get_recent_visit_id(key, member.decode()),
+            "visited_at": datetime.fromtimestamp(score, tz=timezone.utc),
+        }
+        for member, score in members
+    ]
+
+
+def forget_recent_visits(key, members):
+    if members:
+        redis_instance().zrem(key, *members)
@@ -0,0 +1,95 @@
+# Python imports
+import re
+from functools import lru_cache
+
+# Django imports
+from django.conf import settings
+from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVector
+from django.db.models import Case, F, FloatField, Q, Value, When
+from django.utils.module_loading import import_string
+
+# Text search configuration of the name search indexes, names are not stemmed
+SEARCH_CONFIG = "simple"
+
+
+def issue_name_search_vector():
+    """Document of the issue name, the expression of the issue_name_search_idx index"""
+    return SearchVector("name", config=SEARCH_CONFIG)
+
+
+def search_sequences(query):
+    """Whole integers of the query (exclude decimal numbers)"""
+    return re.findall(r"\b\d+\b", query)
+
+
+class IContainsSearchBackend:
+    """
+    Match the query as a case insensitive substring of any of the fields.
+    Results are annotated with a search_rank of 0 and keep the ordering of the queryset.
+    """
+
+    def filter(self, query, fields):
+        q = Q()
+        for field in fields:
+            if field == "sequence_id":
+                for sequence_id in search_sequences(query):
+                    q |= Q(sequence_id=sequence_id)
+            else:
+                q |= Q(**{f"{field}__icontains": query})
+        return q
+
+    def rank(self, query, fields):
+        return Value(0.0, output_field=FloatField())
+
+    def search(self, queryset, query, fields, document=None):
+        """
+        Filter the queryset by the query and annotate the rank of every result as search_rank.
+        document is an optional SearchVector of the full text indexed fields of the queryset.
+        """
+        if not query:
+            return queryset.annotate(search_rank=Value(0.0, output_field=FloatField()))
+
+        return queryset.filter(self.filter(query, fields)).annotate(search_rank=self.rank(query, fields))
+
+
+class PostgresSearchBackend(IContainsSearchBackend):
+    """
+    Rank and match with the Postgres full text and trigram indexes.
+    The substring match is served by the pg_trgm indexes on UPPER(field), the one icontains compiles to,
+    and a prefix match of every word of the query is served by the index on the document.
+    Exact and prefix matches of the first field rank first, then the full text rank of the document.
+    """
+
+    def prefix_query(self, query):
+        words = re.findall(r"\w+", query)
+        if not words:
+            return None
+        return SearchQuery(" & ".join(f"{word}:*" for word in words), search_type="raw", config=SEARCH_CONFIG)
+
+    def rank(self, query, fields):
+        field = fields[0]
+        return Case(
+            When(**{f"{field}__iexact": query}, then=Value(2.0)),
+            When(**{f"{field}__istartswith": query}, then=Value(1.0)),
+            default=Value(0.0),
+            output_field=FloatField(),
+        )
+
+    def search(self, queryset, query, fields, document=None):
+        search_query = self.prefix_query(query) if query and document is not None else None
+        if search_query is None:
+            return super().search(queryset, query, fields)
+
+        return (
+            queryset.alias(search_document=document)
+            .filter(Q(search_document=search_query) | self.filter(query, fields))
+            .annotate(
+                search_rank=self.rank(query, fields) + SearchRank(F("search_document"), search_query),
+            )
+        )
+
+
+@lru_cache(maxsize=None)
+def get_search_backend():
+    """Search backend configured by the SEARCH_BACKEND setting"""
+    return import_string(settings.SEARCH_BACKEND)()
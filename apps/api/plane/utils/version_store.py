@@ -0,0 +1,124 @@
+# Python imports
+import json
+import zlib
+
+# Django imports
+from django.db import models
+
+# Kinds of the versioned description fields, each diffed as a str or bytes sequence
+TEXT = "text"
+JSON = "json"
+BINARY = "binary"
+
+
+def get_field_kind(model, field_name):
+    field = model._meta.get_field(field_name)
+    if isinstance(field, models.BinaryField):
+        return BINARY
+    if isinstance(field, models.JSONField):
+        return JSON
+    return TEXT
+
+
+def _to_sequence(kind, value):
+    if value is None:
+        return None
+    if kind == BINARY:
+        return bytes(value)
+    if kind == JSON:
+        return json.dumps(value)
+    return value
+
+
+def _from_sequence(kind, sequence):
+    if sequence is None:
+        return None
+    if kind == JSON:
+        return json.loads(sequence)
+    return sequence
+
+
+def _common_prefix_length(old, new, limit):
+    # Binary search over slice comparisons, which run in C, instead of comparing item by item
+    low, high = 0, limit
+    while low < high:
+        middle = (low + high + 1) // 2
+        if old[:middle] == new[:middle]:
+            low = middle
+        else:
+            high = middle - 1
+    return low
+
+
+def _common_suffix_length(old, new, limit):
+    low, high = 0, limit
+    while low < high:
+        middle = (low + high + 1) // 2
+        if old[len(old) - middle :] == new[len(new) - middle :]:
+            low = middle
+        else:
+            high = middle - 1
+    return low
+
+
+def encode_version_delta(kinds, previous, content):
+    """
+    Encode the changes of the content from the previous version.
+    Args:
+        kinds: Kind of every versioned field, by field name
+        previous: Values of the previous version, by field name
+        content: Values of the new version, by field name
+    Returns:
+        bytes: zlib compressed JSON header followed by the replaced parts of the changed fields.
+        The header maps every changed field to null when it was cleared, or to the lengths of the prefix and
+        suffix it shares with the previous value and of its replaced middle part.
+    """
+    header = {}
+    middles = []
+    for field, kind in kinds.items():
+        old = _to_sequence(kind, previous.get(field))
+        new = _to_sequence(kind, content.get(field))
+        if old == new:
+            continue
+        if new is None:
+            header[field] = None
+            continue
+
+        old = old or new[:0]
+        prefix = _common_prefix_length(old, new, min(len(old), len(new)))
+        suffix = _common_suffix_length(old, new, min(len(old), len(new)) - prefix)
+        middle = new[prefix : len(new) - suffix]
+        if kind != BINARY:
+            middle = middle.encode("utf-8", "surrogatepass")
+        header[field] = [prefix, suffix, len(middle)]
+        middles.append(middle)
+
+    return zlib.compress(json.dumps(header).encode() + b"\n" + b"".join(middles))
+
+
+def apply_version_delta(kinds, previous, delta):
+    """
+    Rebuild the content of a version from the values of the previous version and its delta.
+    Returns:
+        dict: Values of the version, by field name
+    """
+    header, _, middles = zlib.decompress(bytes(delta)).partition(b"\n")
+    header = json.loads(header)
+
+    content = dict(previous)
+    offset = 0
+    for field, change in header.items():
+        if change is None:
+            content[field] = None
+            continue
+
+        kind = kinds[field]
+        prefix, suffix, length = change
+        middle = middles[offset : offset + length]
+        offset += length
+        if kind != BINARY:
+            middle = middle.decode("utf-8", "surrogatepass")
+
+        old = _to_sequence(kind, previous.get(field)) or middle[:0]
+        content[field] = _from_sequence(kind, old[:prefix] + middle + old[len(old) - suffix :])
+    return content
@@ -0,0 +1,199 @@
+# Python imports
+import asyncio
+import json
+import time
+import uuid
+from urllib.parse import urlsplit
+
+# Third party imports
+import httpx
+
+# Django imports
+from django.conf import settings
+
+# Module imports
+from plane.settings.redis import redis_instance, redis_pipeline
+
+# Sorted set of the pending deliveries, scored by the time they are due
+WEBHOOK_DELIVERY_QUEUE_KEY = "webhook:deliveries"
+# Consecutive failed deliveries, by webhook id
+WEBHOOK_FAILURES_KEY = "webhook:failures"
+# Time until which the deliveries of a webhook are paused after repeated failures, by webhook id
+WEBHOOK_CIRCUIT_KEY = "webhook:circuit"
+
+
+def queue_webhook_deliveries(deliveries, due=None):
+    """Queue the deliveries to be sent at the due timestamp, now by default"""
+    if not deliveries:
+        return
+    due = time.time() if due is None else due
+    # Every queued delivery is a distinct member, retries included
+    redis_instance().zadd(
+        WEBHOOK_DELIVERY_QUEUE_KEY,
+        {json.dumps({**delivery, "id": uuid.uuid4().hex}): due for delivery in deliveries},
+    )
+
+
+def pop_due_webhook_deliveries(limit):
+    """Remove and return up to limit deliveries that are due, oldest first"""
+    ri = redis_instance()
+    members = ri.zrangebyscore(WEBHOOK_DELIVERY_QUEUE_KEY, "-inf", time.time(), start=0, num=limit)
+    if members:
+        ri.zrem(WEBHOOK_DELIVERY_QUEUE_KEY, *members)
+    return [json.loads(member) for member in members]
+
+
+def has_due_webhook_deliveries():
+    return bool(redis_instance().zcount(WEBHOOK_DELIVERY_QUEUE_KEY, "-inf", time.time()))
+
+
+def get_open_webhook_circuits(webhook_ids):
+    """Return the time until which the deliveries of each paused webhook are paused"""
+    webhook_ids = list(webhook_ids)
+    if not webhook_ids:
+        return {}
+    now = time.time()
+    open_until = redis_instance().hmget(WEBHOOK_CIRCUIT_KEY, webhook_ids)
+    return {
+        webhook_id: float(until) for webhook_id, until in zip(webhook_ids, open_until) if until and float(until) > now
+    }
+
+
+def record_webhook_results(succeeded_ids, failed_ids):
+    """
+    Reset the failures of the webhooks that were delivered and count those of the others.
+    Webhooks reaching WEBHOOK_CIRCUIT_FAILURES consecutive failures are paused for WEBHOOK_CIRCUIT_COOLDOWN seconds.
+    Returns the ids of the webhooks paused by these results.
+    """
+    succeeded_ids = list(set(succeeded_ids))
+    failed_ids = list(failed_ids)
+    if succeeded_ids:
+        with redis_pipeline() as pipeline:
+            pipeline.hdel(WEBHOOK_FAILURES_KEY, *succeeded_ids)
+            pipeline.hdel(WEBHOOK_CIRCUIT_KEY, *succeeded_ids)
+    if not failed_ids:
+        return []
+
+    pipeline = redis_instance().pipeline(transaction=False)
+    for webhook_id in failed_ids:
+        pipeline.hincrby(WEBHOOK_FAILURES_KEY, webhook_id)
+    failures = dict(zip(failed_ids, pipeline.execute()))
+
+    paused_ids = [webhook_id for webhook_id, count in failures.items() if count >= settings.WEBHOOK_CIRCUIT_FAILURES]
+    if paused_ids:
+        open_until = time.time() + settings.WEBHOOK_CIRCUIT_COOLDOWN
+        with redis_pipeline() as pipeline:
+            pipeline.hset(WEBHOOK_CIRCUIT_KEY, mapping={webhook_id: open_until for webhook_id in paused_ids})
+            # The first delivery after the cooldown decides whether the circuit closes or opens again
+            pipeline.hset(
+                WEBHOOK_FAILURES_KEY,
+                mapping={webhook_id: settings.WEBHOOK_CIRCUIT_FAILURES - 1 for webhook_id in paused_ids},
+            )
+    return paused_ids
+
+
+class WebhookCircuits:
+    """
+    Circuits of the webhooks of a batch, read once for the batch and opened as its deliveries fail, so that
+    a webhook failing in the middle of a batch is sent no more of it.
+    """
+
+    def __init__(self, webhook_ids):
+        webhook_ids = list(webhook_ids)
+        self.open_until = get_open_webhook_circuits(webhook_ids)
+        failures = redis_instance().hmget(WEBHOOK_FAILURES_KEY, webhook_ids) if webhook_ids else []
+        self.failures = {webhook_id: int(count or 0) for webhook_id, count in zip(webhook_ids, failures)}
+
+    def is_open(self, webhook_id):
+        return webhook_id in self.open_until
+
+    def record(self, webhook_id, failed):
+        """Count the result of a delivery, the circuit opens as record_webhook_results opens it"""
+        if not failed:
+            self.failures[webhook_id] = 0
+            return
+        self.failures[webhook_id] = self.failures.get(webhook_id, 0) + 1
+        if self.failures[webhook_id] >= settings.WEBHOOK_CIRCUIT_FAILURES:
+            self.open_until[webhook_id] = time.time() + settings.WEBHOOK_CIRCUIT_COOLDOWN
+
+
+class WebhookSender:
+    """
+    Send the requests of the webhook deliveries concurrently from a synchronous caller.
+    The event loop and its HTTP client live as long as the sender, so that the keep-alive connections
+    to every host are reused by the following batches, at most WEBHOOK_HOST_CONCURRENCY per host.
+    """
+
+    def __init__(self):
+        self.loop = asyncio.new_event_loop()
+        self.client = None
+        self.host_semaphores = {}
+        self.circuits = None
+        self.deadline = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        if self.client is not None:
+            self.loop.run_until_complete(self.client.aclose())
+        self.loop.close()
+
+    def send(self, requests, circuits=None, deadline=None, keepalive=None):
+        """
+        POST the (webhook_id, url, headers, body) requests.
+        Args:
+            circuits: the WebhookCircuits of the batch, checked right before every request is sent
+            deadline: time.monotonic() after which no more request is sent, those sent finish within their timeout
+            keepalive: called every WEBHOOK_DELIVERY_TIMEOUT / 2 seconds while the requests run, no more request
+                is sent once it returns False
+        Returns:
+            list: the response of every request, the httpx.HTTPError raised by it, or None if it was not sent
+            because its circuit opened or the deadline passed
+        """
+        return self.loop.run_until_complete(self._send_all(requests, circuits, deadline, keepalive))
+
+    async def _send_all(self, requests, circuits, deadline, keepalive):
+        if self.client is None:
+            # Created in the running loop it is bound to. Redirects are followed, as requests did for the webhooks
+            self.client = httpx.AsyncClient(
+                timeout=settings.WEBHOOK_DELIVERY_TIMEOUT,
+                limits=httpx.Limits(max_keepalive_connections=None, max_connections=None),
+                follow_redirects=True,
+            )
+        self.circuits = circuits
+        self.deadline = deadline
+        keepalive_task = asyncio.ensure_future(self._keepalive(keepalive)) if keepalive else None
+        try:
+            return await asyncio.gather(
+                *(self._send(webhook_id, url, headers, body) for webhook_id, url, headers, body in requests)
+            )
+        finally:
+            if keepalive_task is not None:
+                keepalive_task.cancel()
+
+    async def _keepalive(self, keepalive):
+        while True:
+            await asyncio.sleep(settings.WEBHOOK_DELIVERY_TIMEOUT / 2)
+            if not keepalive():
+                self.deadline = time.monotonic()
+
+    async def _send(self, webhook_id, url, headers, body):
+        host = urlsplit(url).netloc
+        semaphore = self.host_semaphores.setdefault(host, asyncio.Semaphore(settings.WEBHOOK_HOST_CONCURRENCY))
+        async with semaphore:
+            # Waiting for the host can outlast the batch, or the other requests of the webhook can open its circuit
+            if self.deadline is not None and time.monotonic() >= self.deadline:
+                return None
+            if self.circuits is not None and self.circuits.is_open(webhook_id):
+                return None
+            try:
+                response = await self.client.post(url, headers=headers, content=body)
+            except httpx.HTTPError as e:
+                response = e
+            if self.circuits is not None:
+                self.circuits.record(webhook_id, isinstance(response, Exception))
+            return response